@@ -11,9 +11,13 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from code_forge.tools.scheduler import is_read_only_tool, run_scheduled
+
 from .result import AgentResult
 
 if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
     from code_forge.langchain import OpenRouterLLM
     from code_forge.tools import ToolRegistry
 
@@ -49,6 +53,9 @@ class AgentExecutor:
         """
         self.llm = llm
         self.tool_registry = tool_registry
+        # LLMs with tools bound, by tool names, for one registry generation
+        self._bound_llms: dict[tuple[str, ...], Any] = {}
+        self._bound_generation: int | None = None
 
     async def execute(self, agent: Agent) -> AgentResult:
         """Execute an agent task.
@@ -122,6 +129,7 @@ class AgentExecutor:
         """
         limits = agent.config.limits
         final_response = ""
+        lc_messages: list[BaseMessage] = []
 
         while not agent.is_cancelled:
             # Check resource limits
@@ -144,6 +152,7 @@ class AgentExecutor:
                 messages=messages,
                 tools=tools,
                 agent=agent,
+                lc_messages=lc_messages,
             )
 
             # Store messages for history
@@ -202,6 +211,7 @@ class AgentExecutor:
         messages: list[dict[str, Any]],
         tools: list[Any],
         agent: Agent,
+        lc_messages: list[BaseMessage] | None = None,
     ) -> dict[str, Any]:
         """Make LLM API call.
 
@@ -209,65 +219,33 @@ class AgentExecutor:
             messages: Message history.
             tools: Available tools.
             agent: Agent for tracking.
+            lc_messages: LangChain messages converted from a prefix of
+                ``messages`` by earlier calls; extended in place.
 
         Returns:
             LLM response dict with content and/or tool_calls.
         """
         model = agent.config.model
 
-        # Convert messages to format expected by LLM
-        # The OpenRouterLLM expects LangChain message format
-        from langchain_core.messages import (
-            AIMessage,
-            BaseMessage,
-            HumanMessage,
-            SystemMessage,
-            ToolMessage,
+        # Convert messages to format expected by LLM. The history only
+        # grows during a run, so only messages added since the last call
+        # are converted.
+        if lc_messages is None:
+            lc_messages = []
+        lc_messages.extend(
+            self._to_langchain_message(msg) for msg in messages[len(lc_messages):]
         )
-
-        lc_messages: list[BaseMessage] = []
-        for msg in messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "user":
-                lc_messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                tool_calls = msg.get("tool_calls", [])
-                if tool_calls:
-                    # Convert to LangChain tool call format
-                    lc_tool_calls = []
-                    for tc in tool_calls:
-                        lc_tool_calls.append({
-                            "id": tc.get("id", ""),
-                            "name": tc.get("name", ""),
-                            "args": tc.get("arguments", {}),
-                        })
-                    lc_messages.append(AIMessage(
-                        content=content,
-                        tool_calls=lc_tool_calls,
-                    ))
-                else:
-                    lc_messages.append(AIMessage(content=content))
-            elif role == "tool":
-                lc_messages.append(ToolMessage(
-                    content=content,
-                    tool_call_id=msg.get("tool_call_id", ""),
-                ))
+        request_messages = list(lc_messages)
 
         # Bind tools if available
-        llm = self.llm
-        if tools:
-            llm = llm.bind_tools(tools)
+        llm = self._bind_tools(tools) if tools else self.llm
 
         # Make the call
         if model:
             # Override model if specified
-            response = await llm.ainvoke(lc_messages, model=model)
+            response = await llm.ainvoke(request_messages, model=model)
         else:
-            response = await llm.ainvoke(lc_messages)
+            response = await llm.ainvoke(request_messages)
 
         # Track token usage if available
         if hasattr(response, "usage_metadata") and response.usage_metadata:
@@ -294,6 +272,76 @@ class AgentExecutor:
 
         return result
 
+    def _bind_tools(self, tools: list[Any]) -> Any:
+        """Get the LLM with tools bound, reusing it for the same toolset.
+
+        The LLM's model is fixed and per-agent models are passed when
+        invoking, so bound LLMs are keyed by toolset only.
+
+        Args:
+            tools: Tools to bind.
+
+        Returns:
+            LLM with the tools bound.
+        """
+        generation = self.tool_registry.generation
+        if generation != self._bound_generation:
+            self._bound_llms = {}
+            self._bound_generation = generation
+
+        key = tuple(tool.name for tool in tools)
+        llm = self._bound_llms.get(key)
+        if llm is None:
+            llm = self._bound_llms[key] = self.llm.bind_tools(tools)
+        return llm
+
+    @staticmethod
+    def _to_langchain_message(msg: dict[str, Any]) -> BaseMessage:
+        """Convert a message dict to a LangChain message.
+
+        Messages with a role other than system, assistant or tool are
+        sent as user messages.
+
+        Args:
+            msg: Message with role, content and optional tool fields.
+
+        Returns:
+            Equivalent LangChain message.
+        """
+        # The OpenRouterLLM expects LangChain message format
+        from langchain_core.messages import (
+            AIMessage,
+            HumanMessage,
+            SystemMessage,
+            ToolMessage,
+        )
+
+        role = msg.get("role", "")
+        content = msg.get("content", "")
+
+        if role == "system":
+            return SystemMessage(content=content)
+        if role == "assistant":
+            tool_calls = msg.get("tool_calls", [])
+            if tool_calls:
+                # Convert to LangChain tool call format
+                lc_tool_calls = [
+                    {
+                        "id": tc.get("id", ""),
+                        "name": tc.get("name", ""),
+                        "args": tc.get("arguments", {}),
+                    }
+                    for tc in tool_calls
+                ]
+                return AIMessage(content=content, tool_calls=lc_tool_calls)
+            return AIMessage(content=content)
+        if role == "tool":
+            return ToolMessage(
+                content=content,
+                tool_call_id=msg.get("tool_call_id", ""),
+            )
+        return HumanMessage(content=content)
+
     async def _execute_tools(
         self,
         tool_calls: list[dict[str, Any]],
@@ -301,61 +349,82 @@ class AgentExecutor:
     ) -> list[dict[str, Any]]:
         """Execute tool calls.
 
+        Read-only tools run concurrently; mutating tools run alone, in
+        call order.
+
         Args:
             tool_calls: Tool calls from LLM.
             agent: Agent for tracking.
 
         Returns:
-            Tool result messages.
+            Tool result messages, in call order.
         """
-        results = []
 
-        for call in tool_calls:
-            agent._usage.tool_calls += 1
+        async def execute(call: dict[str, Any]) -> dict[str, Any]:
+            return await self._execute_tool_call(call, agent)
 
-            tool_name = call.get("name", "")
-            tool_args = call.get("arguments", {})
-            tool_id = call.get("id", "")
+        def is_read_only(call: dict[str, Any]) -> bool:
+            return is_read_only_tool(self.tool_registry.get(call.get("name", "")))
 
-            # Track execution timing and status
-            start_time = time.time()
-            success = False
-            error_msg: str | None = None
+        return await run_scheduled(tool_calls, execute, is_read_only)
 
-            try:
-                tool = self.tool_registry.get(tool_name)
-                if tool is None:
-                    result = f"Tool not found: {tool_name}"
-                    error_msg = "Tool not found"
-                else:
-                    # Execute the tool
-                    tool_result = await tool.execute(**tool_args)
-                    if hasattr(tool_result, "output"):
-                        result = tool_result.output
-                    else:
-                        result = str(tool_result)
-                    success = True
-            except Exception as e:
-                logger.warning(f"Tool execution error for {tool_name}: {e}")
-                result = f"Tool error: {e}"
-                error_msg = str(e)
-
-            duration = time.time() - start_time
-
-            results.append({
-                "role": "tool",
-                "tool_call_id": tool_id,
-                "content": str(result),
-                # Metadata for debugging
-                "_metadata": {
-                    "tool_name": tool_name,
-                    "success": success,
-                    "duration_ms": round(duration * 1000, 2),
-                    "error": error_msg,
-                },
-            })
+    async def _execute_tool_call(
+        self,
+        call: dict[str, Any],
+        agent: Agent,
+    ) -> dict[str, Any]:
+        """Execute one tool call.
+
+        Args:
+            call: Tool call from LLM.
+            agent: Agent for tracking.
+
+        Returns:
+            Tool result message.
+        """
+        agent._usage.tool_calls += 1
 
-        return results
+        tool_name = call.get("name", "")
+        tool_args = call.get("arguments", {})
+        tool_id = call.get("id", "")
+
+        # Track execution timing and status
+        start_time = time.time()
+        success = False
+        error_msg: str | None = None
+
+        try:
+            tool = self.tool_registry.get(tool_name)
+            if tool is None:
+                result = f"Tool not found: {tool_name}"
+                error_msg = "Tool not found"
+            else:
+                # Execute the tool
+                tool_result = await tool.execute(**tool_args)
+                if hasattr(tool_result, "output"):
+                    result = tool_result.output
+                else:
+                    result = str(tool_result)
+                success = True
+        except Exception as e:
+            logger.warning(f"Tool execution error for {tool_name}: {e}")
+            result = f"Tool error: {e}"
+            error_msg = str(e)
+
+        duration = time.time() - start_time
+
+        return {
+            "role": "tool",
+            "tool_call_id": tool_id,
+            "content": str(result),
+            # Metadata for debugging
+            "_metadata": {
+                "tool_name": tool_name,
+                "success": success,
+                "duration_ms": round(duration * 1000, 2),
+                "error": error_msg,
+            },
+        }
 
     def _build_prompt(self, agent: Agent) -> str:
         """Build system prompt for agent.
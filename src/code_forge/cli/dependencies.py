@@ -144,12 +144,18 @@ class Dependencies:
             CommandContext as CmdContext,
             register_builtin_commands,
         )
+        from code_forge.config import ResponseCacheMode
         from code_forge.context.manager import ContextManager as CtxMgr, TruncationMode
         from code_forge.context.tracker import SessionContextTracker as SessCtxTracker
         from code_forge.langchain.agent import CodeForgeAgent
         from code_forge.langchain.llm import OpenRouterLLM
+        from code_forge.langchain.memory import ContextMemory
         from code_forge.langchain.tools import adapt_tools_for_langchain
         from code_forge.llm import OpenRouterClient
+        from code_forge.llm.cache import ResponseCache
+        from code_forge.llm.latency import LatencyTable
+        from code_forge.llm.routing import HedgeSettings
+        from code_forge.llm.transport import PoolSettings
         from code_forge.modes import setup_modes
         from code_forge.rag.config import RAGConfig as RAGConfigFull
         from code_forge.rag.manager import RAGManager
@@ -159,13 +165,35 @@ class Dependencies:
 
         logger = logging.getLogger(__name__)
 
+        # Replay identical requests from disk (CI and eval reruns)
+        response_cache = None
+        if config.model.response_cache != ResponseCacheMode.OFF:
+            response_cache = ResponseCache(
+                ResponseCache.get_default_path(),
+                ttl=config.model.response_cache_ttl_hours * 3600,
+                max_bytes=config.model.response_cache_max_mb * 1024 * 1024,
+                deterministic_only=config.model.response_cache == ResponseCacheMode.DETERMINISTIC,
+            )
+
         # Create or use provided client
-        actual_client = client or OpenRouterClient(api_key=api_key)
+        actual_client = client or OpenRouterClient(
+            api_key=api_key,
+            pool_settings=PoolSettings(http2=config.model.http2),
+            hedging=HedgeSettings(
+                enabled=config.model.hedging,
+                alternates=tuple(config.model.hedge_models),
+            ),
+            latency_table=LatencyTable(LatencyTable.get_default_path()),
+            response_cache=response_cache,
+        )
 
         # Create or use provided LLM
         actual_llm = llm or OpenRouterLLM(
             client=actual_client,
             model=config.model.default,
+            temperature=config.model.temperature,
+            max_tokens=config.model.max_tokens,
+            prompt_caching=config.model.prompt_caching,
         )
 
         # Create or use provided session manager (needed early for undo manager)
@@ -174,6 +202,10 @@ class Dependencies:
         # Create or use provided mode manager
         actual_mode_manager = mode_manager or setup_modes()
 
+        # Create session context tracker for conversational context
+        actual_session_context_tracker = SessCtxTracker()
+        logger.info("Session context tracker created")
+
         # Create context manager with configured thresholds
         context_mode = TruncationMode(config.context.default_mode)
         actual_context_manager = CtxMgr(
@@ -181,13 +213,10 @@ class Dependencies:
             mode=context_mode,
             warning_threshold=config.context.warning_threshold,
             critical_threshold=config.context.critical_threshold,
+            session_tracker=actual_session_context_tracker,
         )
         logger.info("Context manager created with warning thresholds")
 
-        # Create session context tracker for conversational context
-        actual_session_context_tracker = SessCtxTracker()
-        logger.info("Session context tracker created")
-
         # Create or use provided tool registry
         if tool_registry is None:
             register_all_tools()
@@ -217,10 +246,24 @@ class Dependencies:
         )
 
         # Create agent with tools (pass context for undo support)
-        raw_tools = [tool_registry.get(name) for name in tool_registry.list_names()]
-        raw_tools = [t for t in raw_tools if t is not None]
+        raw_tools = [
+            t
+            for name in tool_registry.list_names()
+            if (t := tool_registry.get(name)) is not None
+        ]
         tools = adapt_tools_for_langchain(raw_tools, context=tool_context)
-        agent = CodeForgeAgent(llm=actual_llm, tools=tools)
+        # Count the schemas sent with every request in the context budget
+        actual_context_manager.set_tool_definitions(
+            [t.to_openai_schema() for t in raw_tools]
+        )
+        # The context manager stores the agent's history, so what it
+        # counts and truncates is exactly what the model is sent
+        agent = CodeForgeAgent(
+            llm=actual_llm,
+            tools=tools,
+            memory=ContextMemory(actual_context_manager),
+            native_streaming=config.model.native_streaming,
+        )
 
         # Register commands and create executor
         register_builtin_commands()
@@ -7,7 +7,7 @@ import json
 import os
 import re
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from code_forge import __version__
 from code_forge.cli.conversation import ErrorExplainer
@@ -19,6 +19,9 @@ from code_forge.core import get_logger, setup_logging
 from code_forge.core.logging import DEFAULT_LOG_DIR
 
 if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.status import Status
+
     from code_forge.config import CodeForgeConfig
 
 # Initialize logging early - before any logger is used
@@ -176,12 +179,25 @@ async def run_with_agent(
         Exit code.
     """
     from code_forge.langchain.tools import adapt_tools_for_langchain
+    from code_forge.llm import OpenRouterClient
+    from code_forge.llm.transport import close_shared_pools
     from code_forge.modes import ModeName, ModeContext
+    from code_forge.tools.file.cache import get_file_cache
 
     # Create dependencies if not provided (allows injection for testing)
     if deps is None:
         deps = Dependencies.create(config, api_key)
 
+    # Connect to the API while the REPL initializes
+    warmup_task: asyncio.Task[bool] | None = None
+    if config.model.connection_warmup and isinstance(deps.client, OpenRouterClient):
+        warmup_task = asyncio.create_task(deps.client.warmup())
+
+    # Drop cached file contents as soon as files change on disk
+    file_cache = get_file_cache() if config.tools.watch_file_cache else None
+    if file_cache is not None:
+        file_cache.watch(os.getcwd())
+
     # Show welcome message first (without help hint if we'll show indexing status)
     needs_indexing = False
     if deps.rag_manager is not None and config.rag.auto_index:
@@ -228,6 +244,15 @@ async def run_with_agent(
     session_context_tracker = deps.session_context_tracker
     context_manager = deps.context_manager
 
+    # When the agent's memory is a view of the context manager, messages
+    # reach the context manager through the agent and are not added here
+    from code_forge.langchain.memory import ContextMemory
+
+    shared_context = (
+        isinstance(agent.memory, ContextMemory)
+        and agent.memory.context_manager is context_manager
+    )
+
     # Add repl to command context so commands can update status bar
     command_context.repl = repl
 
@@ -371,7 +396,7 @@ async def run_with_agent(
 
             # Initialize spinners before try block to avoid NameError in except/finally
             spinner = None
-            tool_spinner = None
+            tool_spinners = _ToolSpinners(repl._console)
 
             # Track tool calls for JSON output
             tool_calls_log: list[dict] = []
@@ -393,7 +418,7 @@ async def run_with_agent(
 
                 # Add user message to session and context manager
                 session_manager.add_message("user", text)
-                if context_manager is not None:
+                if context_manager is not None and not shared_context:
                     context_manager.add_message({"role": "user", "content": text})
 
                 # Augment query with RAG context if applicable
@@ -403,6 +428,12 @@ async def run_with_agent(
                         try:
                             context = await rag_augmenter.get_context_for_query(text)
                             if context:
+                                # With a shared context the augmented query
+                                # is stored as the user message
+                                if context_manager is not None:
+                                    context_manager.record_augmentation(
+                                        context, in_next_message=shared_context
+                                    )
                                 # Prepend context to the user query
                                 augmented_text = (
                                     f"<relevant_context>\n{context}\n</relevant_context>\n\n"
@@ -418,8 +449,11 @@ async def run_with_agent(
                 # Stream agent execution with real-time output
                 accumulated_output = ""
                 current_tool = None
+                # Concurrent tool calls start before any of them ends
+                running_tools: dict[str, dict[str, Any]] = {}
                 iteration_count = 0
                 first_content_received = False
+                limit_warned = False
 
                 if not is_json_mode:
                     repl.output.print("")  # Start on new line
@@ -439,6 +473,9 @@ async def run_with_agent(
 
                     if event.type == AgentEventType.LLM_START:
                         iteration_count = event.data.get("iteration", 0)
+                        limit_warned = False
+                        if context_manager is not None:
+                            context_manager.begin_stream(config.model.max_tokens)
                         if iteration_count > 1:
                             repl._status.set_status(f"Thinking (iteration {iteration_count})...")
 
@@ -467,8 +504,29 @@ async def run_with_agent(
                                         repl._console.print(chunk, end="")
                                 accumulated_output += chunk
 
+                                # Live output token accounting
+                                if context_manager is not None:
+                                    context_manager.add_stream_delta(chunk)
+                                    repl._status.set_tokens(context_manager.token_usage)
+                                    # The provider enforces max_tokens; the
+                                    # estimate only warns once it is reached
+                                    if (
+                                        context_manager.stream_limit_reached
+                                        and not limit_warned
+                                    ):
+                                        limit_warned = True
+                                        if not is_json_mode:
+                                            repl.output.print("")
+                                            repl.output.print_warning(
+                                                "Response has reached max_tokens "
+                                                f"({config.model.max_tokens:,}, estimated)"
+                                            )
+
                     elif event.type == AgentEventType.LLM_END:
-                        pass  # Content already streamed
+                        # Content already streamed; the agent adds the exact
+                        # response to the shared context next
+                        if shared_context and context_manager is not None:
+                            context_manager.end_stream()
 
                     elif event.type == AgentEventType.TOOL_START:
                         # Stop thinking spinner if still running
@@ -477,9 +535,11 @@ async def run_with_agent(
                                 spinner.stop()
                             first_content_received = True
 
+                        call_id = str(event.data.get("id") or "")
                         tool_name = event.data.get("name", "unknown")
                         tool_args = event.data.get("arguments", {})
                         current_tool = {"name": tool_name, "arguments": tool_args}
+                        running_tools[call_id] = current_tool
 
                         # Capture file content before Edit for diff display (if enabled)
                         if (
@@ -506,25 +566,29 @@ async def run_with_agent(
                             )
                             repl._status.set_status(f"Running {tool_name}...")
 
-                            # Start a tool execution spinner
-                            tool_spinner = Status(
-                                f"[dim]⏳ Running {tool_name}...[/dim]",
-                                console=repl._console,
-                                spinner="dots"
-                            )
-                            tool_spinner.start()
+                            # Show the tool execution spinner
+                            tool_spinners.start(call_id, tool_name)
 
                     elif event.type == AgentEventType.TOOL_END:
-                        # Stop tool spinner
-                        if tool_spinner:
-                            tool_spinner.stop()
-                            tool_spinner = None
+                        call_id = str(event.data.get("id") or "")
+                        tool_spinners.stop(call_id)
+                        current_tool = running_tools.pop(call_id, None)
 
                         tool_name = event.data.get("name", "unknown")
                         result = event.data.get("result", "")
                         success = event.data.get("success", True)
                         duration = event.data.get("duration", 0)
 
+                        # Attribute tool results in the context profile
+                        if context_manager is not None and current_tool and not shared_context:
+                            context_manager.add_tool_exchange(
+                                str(event.data.get("id") or f"call_{len(tool_calls_log)}"),
+                                tool_name,
+                                current_tool.get("arguments", {}),
+                                str(result),
+                                success=success,
+                            )
+
                         # Log tool call for JSON output
                         if current_tool and isinstance(current_tool, dict):
                             tool_calls_log.append({
@@ -626,6 +690,12 @@ async def run_with_agent(
                         # Update status bar with context window usage (not cumulative API tokens)
                         # ContextManager tracks actual context being sent to model
                         if context_manager is not None:
+                            if prompt_tokens > 0:
+                                context_manager.record_usage(
+                                    prompt_tokens,
+                                    cached_tokens=event.data.get("cached_tokens", 0),
+                                    cache_write_tokens=event.data.get("cache_write_tokens", 0),
+                                )
                             repl._status.set_tokens(
                                 context_manager.token_usage,
                                 context_manager.tracker.limits.effective_limit,
@@ -679,15 +749,20 @@ async def run_with_agent(
                 # Add assistant message to session and context manager
                 session_manager.add_message("assistant", processed_output)
                 if context_manager is not None:
-                    context_manager.add_message({"role": "assistant", "content": processed_output})
+                    context_manager.end_stream()
+                    if not shared_context:
+                        context_manager.add_message(
+                            {"role": "assistant", "content": processed_output}
+                        )
 
             except Exception as e:
                 logger.exception("Agent error")
+                if context_manager is not None:
+                    context_manager.end_stream()
                 # Stop spinners if still running
                 if spinner and not first_content_received:
                     spinner.stop()
-                if tool_spinner:
-                    tool_spinner.stop()
+                tool_spinners.stop_all()
                 if is_json_mode:
                     print(json.dumps({"error": str(e)}, indent=2))
                 else:
@@ -704,23 +779,98 @@ async def run_with_agent(
                         spinner.stop()
                     except Exception:
                         pass
-                if tool_spinner:
-                    try:
-                        tool_spinner.stop()
-                    except Exception:
-                        pass
+                try:
+                    tool_spinners.stop_all()
+                except Exception:
+                    pass
                 repl._status.set_status("Ready")
 
     repl.on_input(handle_input)
 
-    # Handle stdin input (batch mode)
-    if stdin_input:
-        logger.info("Processing stdin input in batch mode")
-        await handle_input(stdin_input)
-        return 0  # Exit after processing stdin
+    try:
+        # Handle stdin input (batch mode)
+        if stdin_input:
+            logger.info("Processing stdin input in batch mode")
+            await handle_input(stdin_input)
+            return 0  # Exit after processing stdin
+
+        # Run REPL (interactive mode)
+        return await repl.run(skip_welcome=True)
+    finally:
+        if warmup_task is not None:
+            warmup_task.cancel()
+        if file_cache is not None:
+            file_cache.stop_watching()
+        try:
+            session_manager.shutdown()
+        except Exception as e:
+            logger.warning(f"Error saving session on exit: {e}")
+        try:
+            await close_shared_pools()
+        except Exception as e:
+            logger.debug(f"Error closing connection pools: {e}")
+
 
-    # Run REPL (interactive mode)
-    return await repl.run(skip_welcome=True)
+class _ToolSpinners:
+    """One spinner for all running tool calls.
+
+    Read-only tool calls run concurrently, so several TOOL_START events can
+    arrive before the first TOOL_END. Rich allows a single live display
+    at a time, so the spinner is shared and stopped once every call ended.
+    """
+
+    def __init__(self, console: Console) -> None:
+        """Initialize spinners.
+
+        Args:
+            console: Console the spinner is shown on.
+        """
+        self._console = console
+        self._running: dict[str, str] = {}
+        self._status: Status | None = None
+
+    def start(self, call_id: str, tool_name: str) -> None:
+        """Show a tool call as running.
+
+        Args:
+            call_id: ID of the tool call.
+            tool_name: Name of the tool.
+        """
+        from rich.status import Status
+
+        self._running[call_id] = tool_name
+        if self._status is None:
+            self._status = Status(self._message(), console=self._console, spinner="dots")
+            self._status.start()
+        else:
+            self._status.update(self._message())
+
+    def stop(self, call_id: str) -> None:
+        """Show a tool call as finished.
+
+        Args:
+            call_id: ID of the tool call.
+        """
+        self._running.pop(call_id, None)
+        if self._status is None:
+            return
+        if self._running:
+            self._status.update(self._message())
+        else:
+            self.stop_all()
+
+    def stop_all(self) -> None:
+        """Stop the spinner, forgetting running calls."""
+        self._running.clear()
+        if self._status is not None:
+            status, self._status = self._status, None
+            status.stop()
+
+    def _message(self) -> str:
+        names = list(self._running.values())
+        if len(names) == 1:
+            return f"[dim]⏳ Running {names[0]}...[/dim]"
+        return f"[dim]⏳ Running {len(names)} tools ({', '.join(names)})...[/dim]"
 
 
 def _format_tool_args(args: dict) -> str:
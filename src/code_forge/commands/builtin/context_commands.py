@@ -95,12 +95,22 @@ class ContextModeCommand(Command):
     arguments = [
         CommandArgument(
             name="mode",
-            description="Truncation mode (sliding_window, token_budget, smart, summarize)",
+            description=(
+                "Truncation mode (sliding_window, token_budget, smart, summarize, "
+                "cache_aware, relevance)"
+            ),
             required=True,
         ),
     ]
 
-    VALID_MODES = ["sliding_window", "token_budget", "smart", "summarize"]
+    VALID_MODES = [
+        "sliding_window",
+        "token_budget",
+        "smart",
+        "summarize",
+        "cache_aware",
+        "relevance",
+    ]
 
     async def execute(
         self,
@@ -127,7 +137,9 @@ class ContextModeCommand(Command):
             # Convert string to TruncationMode enum
             mode_enum = TruncationMode(mode)
             context.context_manager.mode = mode_enum
-            context.context_manager.strategy = get_strategy(mode_enum)
+            context.context_manager.strategy = get_strategy(
+                mode_enum, context.context_manager.session_tracker
+            )
             return CommandResult.ok(f"Truncation mode set to: {mode}")
         except ValueError:
             valid_modes = ", ".join(self.VALID_MODES)
@@ -136,6 +148,79 @@ class ContextModeCommand(Command):
             return CommandResult.fail(f"Failed to set mode: {e}")
 
 
+class ContextProfileCommand(Command):
+    """Show per-turn context token attribution."""
+
+    name = "profile"
+    description = "Show where context tokens go per turn"
+    usage = "/context profile [--turns N] [--json] [--output PATH]"
+
+    async def execute(
+        self,
+        parsed: ParsedCommand,
+        context: CommandContext,
+    ) -> CommandResult:
+        """Show context profile."""
+        if context.context_manager is None:
+            return CommandResult.fail("Context manager not available")
+
+        profiler = context.context_manager.profiler
+
+        output_path = parsed.get_kwarg("output")
+        if output_path:
+            try:
+                path = profiler.export_json(output_path)
+            except OSError as e:
+                return CommandResult.fail(f"Failed to write profile: {e}")
+            return CommandResult.ok(f"Context profile written to {path}")
+
+        report = profiler.get_report()
+        if parsed.has_flag("json"):
+            return CommandResult.ok(profiler.to_json(), data=report)
+
+        turns_str = parsed.get_kwarg("turns", "10") or "10"
+        try:
+            max_turns = max(1, int(turns_str))
+        except ValueError:
+            return CommandResult.fail(f"Invalid turns: {turns_str}")
+
+        static = report["static"]
+        totals = report["totals"]
+        lines = [
+            "Context Profile:",
+            f"  System Prompt: {static['system_prompt']:,} tokens",
+            f"  Tool Schemas: {static['tool_schemas']:,} tokens",
+            "",
+            "Totals:",
+            f"  User: {totals['user']:,}",
+            f"  RAG: {totals['rag']:,}",
+            f"  Assistant: {totals['assistant']:,}",
+        ]
+        for tool_name, tokens in totals["tools"].items():
+            lines.append(f"  Tool {tool_name}: {tokens:,}")
+        if totals["compressions"]:
+            lines.append(
+                f"  Removed: {totals['tokens_removed']:,} tokens "
+                f"({totals['compressions']} compressions)"
+            )
+
+        turns = report["turns"][-max_turns:]
+        if turns:
+            lines.append("")
+            lines.append(
+                f"{'Turn':>5} {'User':>8} {'RAG':>8} {'Tools':>8} "
+                f"{'Asst':>8} {'Removed':>8}"
+            )
+            for turn in turns:
+                tools_total = sum(turn["tools"].values())
+                lines.append(
+                    f"{turn['turn']:>5} {turn['user']:>8,} {turn['rag']:>8,} "
+                    f"{tools_total:>8,} {turn['assistant']:>8,} {turn['tokens_removed']:>8,}"
+                )
+
+        return CommandResult.ok("\n".join(lines), data=report)
+
+
 class ContextCommand(SubcommandHandler):
     """Context management."""
 
@@ -148,6 +233,7 @@ class ContextCommand(SubcommandHandler):
         "compact": ContextCompactCommand(),
         "reset": ContextResetCommand(),
         "mode": ContextModeCommand(),
+        "profile": ContextProfileCommand(),
     }
 
     async def execute_default(
@@ -200,17 +286,63 @@ class ContextCommand(SubcommandHandler):
                 lines.append(f"  Size: {cache_stats.get('size', 0)} entries")
                 lines.append(f"  Hit Rate: {cache_stats.get('hit_rate_percent', 0):.1f}%")
 
+            prompt_cache = stats.get("prompt_cache")
+            if prompt_cache and prompt_cache.get("requests", 0) > 0:
+                lines.append("")
+                lines.append("Prompt Cache:")
+                lines.append(f"  Cached Tokens: {prompt_cache.get('cached_tokens', 0):,}")
+                lines.append(
+                    f"  Hit Rate: {prompt_cache.get('hit_rate_percent', 0):.1f}%"
+                )
+
+            dedup = stats.get("deduplication")
+            if dedup and dedup.get("results_replaced", 0) > 0:
+                lines.append("")
+                lines.append("Deduplicated Reads:")
+                lines.append(f"  Results Replaced: {dedup.get('results_replaced', 0)}")
+                lines.append(f"  Tokens Saved: {dedup.get('tokens_saved', 0):,}")
+
+            lines.extend(_connection_lines(context))
+
             lines.append("")
             lines.append("Commands:")
             lines.append("  /context compact  - Summarize older messages")
             lines.append("  /context reset    - Clear all context")
             lines.append("  /context mode <m> - Set truncation mode")
+            lines.append("  /context profile  - Per-turn token attribution")
 
             return CommandResult.ok("\n".join(lines))
         except Exception as e:
             return CommandResult.fail(f"Failed to get context stats: {e}")
 
 
+def _connection_lines(context: CommandContext) -> list[str]:
+    """Format connection reuse of the session's LLM client for /context.
+
+    Returns:
+        Lines of the Connections section, empty when there is no client
+        or it has not sent a request yet.
+    """
+    from code_forge.llm import OpenRouterClient
+
+    client = getattr(context.llm, "client", None)
+    if not isinstance(client, OpenRouterClient):
+        return []
+    stats = client.get_connection_stats()
+    if stats.get("requests", 0) == 0:
+        return []
+    return [
+        "",
+        "Connections:",
+        f"  Requests: {stats['requests']}",
+        f"  Reused: {stats.get('reused_connections', 0)}"
+        f" ({stats.get('reuse_rate', 0.0) * 100:.1f}%)",
+        f"  New: {stats.get('new_connections', 0)}",
+        f"  HTTP/2: {stats.get('http2_requests', 0)}",
+        f"  Handshake Time: {stats.get('connect_ms', 0.0):.0f} ms",
+    ]
+
+
 def get_commands() -> list[Command]:
     """Get all context commands."""
     return [ContextCommand()]
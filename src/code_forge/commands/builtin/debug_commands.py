@@ -131,15 +131,15 @@ class HistoryCommand(Command):
         except ValueError:
             return CommandResult.fail(f"Invalid limit: {limit_str}")
 
-        messages = session.messages
-        total = len(messages)
+        # Counts and pages include messages of a resumed session not loaded yet
+        total = session.message_count
 
         if total == 0:
             return CommandResult.ok("No messages in history.")
 
         # Show last N messages
-        display_messages = messages[-limit:] if limit < total else messages
         start_idx = max(0, total - limit)
+        display_messages = session.get_messages(start_idx)
 
         lines = [f"Message History ({total} messages):", ""]
 
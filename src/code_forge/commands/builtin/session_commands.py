@@ -319,6 +319,7 @@ class SessionCleanupCommand(Command):
         deleted_sessions = storage.cleanup_old_sessions(
             max_age_days=max_age_days,
             keep_minimum=keep_minimum,
+            index=context.session_manager.index,
         )
         deleted_backups = storage.cleanup_old_backups()
 
@@ -385,6 +386,16 @@ class SessionCommand(SubcommandHandler):
         if session.tags:
             lines.append(f"Tags: {', '.join(session.tags)}")
 
+        from code_forge.sessions.autosave import SaveMetrics
+
+        metrics = getattr(context.session_manager, "save_metrics", None)
+        if isinstance(metrics, SaveMetrics) and metrics.saves:
+            lines.append(
+                f"Auto-save: {metrics.saves} writes "
+                f"(last {metrics.last_ms:.1f}ms, mean {metrics.mean_ms:.1f}ms, "
+                f"max {metrics.max_ms:.1f}ms), {metrics.coalesced} changes coalesced"
+            )
+
         return CommandResult.ok("\n".join(lines))
 
 
@@ -31,8 +31,10 @@ from code_forge.config.models import (
     ModelConfig,
     CodeForgeConfig,
     PermissionConfig,
+    ResponseCacheMode,
     RoutingVariant,
     SessionConfig,
+    ToolsConfig,
     TransportType,
 )
 from code_forge.config.sources import (
@@ -55,8 +57,10 @@ __all__ = [
     "ModelConfig",
     "CodeForgeConfig",
     "PermissionConfig",
+    "ResponseCacheMode",
     "RoutingVariant",
     "SessionConfig",
+    "ToolsConfig",
     "TransportType",
     "YamlFileSource",
 ]
@@ -29,6 +29,14 @@ class RoutingVariant(str, Enum):
     ONLINE = "online"
 
 
+class ResponseCacheMode(str, Enum):  # noqa: UP042
+    """Which LLM requests are replayed from the response cache."""
+
+    OFF = "off"
+    DETERMINISTIC = "deterministic"  # Requests with temperature 0
+    ALL = "all"
+
+
 class HookType(str, Enum):
     """Hook execution type."""
 
@@ -45,6 +53,15 @@ class ModelConfig(BaseModel):
         max_tokens: Maximum tokens for completion (1-200000).
         temperature: Sampling temperature (0.0-2.0).
         routing_variant: OpenRouter routing variant.
+        prompt_caching: Emit cache_control breakpoints for provider prompt caching.
+        http2: Use HTTP/2 for API connections.
+        connection_warmup: Connect to the API in the background at startup.
+        hedging: Race slow requests against a backup request to another route.
+        hedge_models: Models to hedge with (default: other route variants).
+        native_streaming: Stream raw chunks to the agent, bypassing LangChain.
+        response_cache: Replay identical requests from an on-disk cache.
+        response_cache_ttl_hours: Hours a cached response stays valid.
+        response_cache_max_mb: Cache size above which old responses are evicted.
     """
 
     model_config = ConfigDict(validate_assignment=True)
@@ -54,6 +71,15 @@ class ModelConfig(BaseModel):
     max_tokens: int = Field(default=8192, ge=1, le=200000)
     temperature: float = Field(default=1.0, ge=0.0, le=2.0)
     routing_variant: RoutingVariant | None = None
+    prompt_caching: bool = False
+    http2: bool = True
+    connection_warmup: bool = True
+    hedging: bool = False
+    hedge_models: list[str] = Field(default_factory=list)
+    native_streaming: bool = False
+    response_cache: ResponseCacheMode = ResponseCacheMode.OFF
+    response_cache_ttl_hours: float = Field(default=168.0, gt=0)
+    response_cache_max_mb: int = Field(default=512, ge=1)
 
     @field_validator("default")
     @classmethod
@@ -365,13 +391,34 @@ class ContextConfig(BaseModel):
     @classmethod
     def validate_mode(cls, v: str) -> str:
         """Validate truncation mode."""
-        valid_modes = {"sliding_window", "token_budget", "smart", "summarize"}
+        valid_modes = {
+            "sliding_window",
+            "token_budget",
+            "smart",
+            "summarize",
+            "cache_aware",
+            "relevance",
+        }
         v = v.strip().lower()
         if v not in valid_modes:
             raise ValueError(f"Invalid mode: {v}. Valid: {', '.join(valid_modes)}")
         return v
 
 
+class ToolsConfig(BaseModel):
+    """Tool configuration.
+
+    Attributes:
+        watch_file_cache: Watch the working directory and drop cached file
+            contents as soon as files change (uses an inotify watch per
+            directory, so it is off by default).
+    """
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    watch_file_cache: bool = False
+
+
 class CodeForgeConfig(BaseModel):
     """Root configuration model.
 
@@ -389,6 +436,7 @@ class CodeForgeConfig(BaseModel):
         rag: RAG (Retrieval-Augmented Generation) settings.
         undo: Undo system settings.
         context: Context management settings.
+        tools: Tool settings.
         api_key: OpenRouter API key (sensitive).
     """
 
@@ -406,6 +454,7 @@ class CodeForgeConfig(BaseModel):
     rag: RAGConfig = Field(default_factory=RAGConfig)
     undo: UndoConfig = Field(default_factory=UndoConfig)
     context: ContextConfig = Field(default_factory=ContextConfig)
+    tools: ToolsConfig = Field(default_factory=ToolsConfig)
 
     # Sensitive - use SecretStr to prevent logging
     api_key: SecretStr | None = None
@@ -168,6 +168,7 @@ class EnvironmentSource(IConfigSource):
         "FORGE_THEME": ("display", "theme"),
         "FORGE_VIM_MODE": ("display", "vim_mode"),
         "FORGE_STREAMING": ("display", "streaming"),
+        "FORGE_RESPONSE_CACHE": ("model", "response_cache"),
     }
 
     def __init__(self, environ: dict[str, str] | None = None) -> None:
@@ -227,7 +228,7 @@ class EnvironmentSource(IConfigSource):
     })
     FLOAT_KEYS: ClassVar[frozenset[str]] = frozenset({"temperature"})
     STRING_KEYS: ClassVar[frozenset[str]] = frozenset({
-        "api_key", "default", "theme"  # Known string keys
+        "api_key", "default", "theme", "response_cache"  # Known string keys
     })
 
     def _convert_value(self, value: str, path: str | tuple[str, str]) -> Any:
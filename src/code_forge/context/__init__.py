@@ -26,7 +26,9 @@ Example:
     messages = manager.get_context_for_request()
 """
 
+from .cache import PromptCacheStats
 from .compaction import ContextCompactor, ToolResultCompactor
+from .dedup import FileReadDeduplicator
 from .events import (
     CompressionEvent,
     CompressionEventType,
@@ -36,8 +38,11 @@ from .events import (
 )
 from .limits import ContextBudget, ContextLimits, ContextTracker
 from .manager import ContextManager, TruncationMode, get_strategy
+from .profiler import ContextProfiler, TurnProfile
 from .strategies import (
+    CacheAwareTruncationStrategy,
     CompositeStrategy,
+    RelevanceEvictionStrategy,
     SelectiveTruncationStrategy,
     SlidingWindowStrategy,
     SmartTruncationStrategy,
@@ -76,6 +81,7 @@ from .tracker import (
 
 __all__ = [
     "ApproximateCounter",
+    "CacheAwareTruncationStrategy",
     "CachingCounter",
     "CompositeStrategy",
     "CompressionEvent",
@@ -85,11 +91,15 @@ __all__ = [
     "ContextCompactor",
     "ContextLimits",
     "ContextManager",
+    "ContextProfiler",
     "ContextTracker",
+    "FileReadDeduplicator",
     "LanguageProfile",
     "ProjectInfo",
     "ProjectType",
     "ProjectTypeDetector",
+    "PromptCacheStats",
+    "RelevanceEvictionStrategy",
     "SelectiveTruncationStrategy",
     "SlidingWindowStrategy",
     "SmartTruncationStrategy",
@@ -99,6 +109,7 @@ __all__ = [
     "ToolResultCompactor",
     "TruncationMode",
     "TruncationStrategy",
+    "TurnProfile",
     "WarningLevel",
     "detect_project",
     "EntityType",
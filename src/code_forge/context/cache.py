@@ -0,0 +1,81 @@
+"""Provider prompt caching support.
+
+Anthropic (directly or through OpenRouter) caches the longest request
+prefix that ends at a ``cache_control`` breakpoint. A cached prefix is only
+reused if every byte before the breakpoint is identical to the previous
+request, so context layout has to keep the front of the conversation
+stable and mark where the stable part ends. Breakpoints are emitted by
+``CompletionRequest`` (see ``code_forge.llm.models``).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class PromptCacheStats:
+    """Cached-token hit rate tracking from provider usage payloads.
+
+    Thread-safe; updated once per completed request.
+    """
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(
+        self,
+        prompt_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> None:
+        """Record usage from one request.
+
+        Args:
+            prompt_tokens: Total prompt tokens billed for the request.
+            cached_tokens: Prompt tokens served from the provider cache.
+            cache_write_tokens: Prompt tokens written to the provider cache.
+        """
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += max(0, prompt_tokens)
+            self.cached_tokens += max(0, cached_tokens)
+            self.cache_write_tokens += max(0, cache_write_tokens)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of prompt tokens served from cache (0.0-1.0)."""
+        with self._lock:
+            if self.prompt_tokens == 0:
+                return 0.0
+            return min(1.0, self.cached_tokens / self.prompt_tokens)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with requests, prompt_tokens, cached_tokens,
+            cache_write_tokens and hit_rate_percent.
+        """
+        hit_rate = self.hit_rate
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "cache_write_tokens": self.cache_write_tokens,
+                "hit_rate_percent": hit_rate * 100,
+            }
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.requests = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.cache_write_tokens = 0
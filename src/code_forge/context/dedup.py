@@ -0,0 +1,262 @@
+"""Deduplication of repeated file reads in context.
+
+Agents frequently ``Read`` the same file several times in a session and
+every copy stays in context as its own tool message. Only the most recent
+copy is useful: earlier copies are either identical to it or stale. This
+module replaces such earlier copies with a short back-reference to the
+later read that holds the current content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from .tool_calls import ToolCallRef, index_tool_calls
+
+# Prefix of every stub written by the deduplicator
+DEDUP_MARKER = "[Deduplicated"
+
+# Read arguments that select a slice of the file
+RANGE_ARG_KEYS = ("offset", "limit")
+
+# Lines a Read returns without a limit (ReadTool.DEFAULT_LIMIT)
+READ_DEFAULT_LIMIT = 2000
+
+
+@dataclass
+class IndexedRead:
+    """A file read result kept in the deduplicator's index.
+
+    Attributes:
+        ref: Tool call that produced the result.
+        read_range: Lines the read covers (see :func:`read_range`).
+        digest: Content hash of the result.
+    """
+
+    ref: ToolCallRef
+    read_range: tuple[Any, ...]
+    digest: str
+
+
+@dataclass
+class DedupResult:
+    """Outcome of a deduplication pass.
+
+    Attributes:
+        messages: Messages with earlier copies replaced by stubs.
+        replaced: Number of tool results replaced.
+    """
+
+    messages: list[dict[str, Any]]
+    replaced: int = 0
+
+
+def content_hash(content: Any) -> str:
+    """Hash tool result content for equality checks.
+
+    Args:
+        content: Message content (string or content parts).
+
+    Returns:
+        Hex digest of the content.
+    """
+    text = content if isinstance(content, str) else repr(content)
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+def is_dedup_stub(message: dict[str, Any]) -> bool:
+    """Check whether a message was already replaced by a stub.
+
+    Args:
+        message: Message dictionary.
+
+    Returns:
+        True if the content is a deduplication stub.
+    """
+    content = message.get("content")
+    return isinstance(content, str) and content.startswith(DEDUP_MARKER)
+
+
+def read_range(ref: ToolCallRef) -> tuple[Any, ...]:
+    """Lines a Read call covers, as a ``(first, end)`` half-open range.
+
+    Missing arguments take the Read tool's defaults, so a Read without a
+    limit covers the first ``READ_DEFAULT_LIMIT`` lines, not the whole
+    file. Arguments that are not line numbers are returned as they are.
+    """
+    offset, limit = (ref.arguments.get(key) for key in RANGE_ARG_KEYS)
+    offset = 1 if offset is None else offset
+    limit = READ_DEFAULT_LIMIT if limit is None else limit
+    if not isinstance(offset, int) or not isinstance(limit, int):
+        return (offset, limit)
+    return (offset, offset + limit)
+
+
+def covers_range(outer: tuple[Any, ...], inner: tuple[Any, ...]) -> bool:
+    """Whether a read range contains another (see :func:`read_range`)."""
+    if not all(isinstance(bound, int) for bound in (*outer, *inner)):
+        return False
+    return bool(outer[0] <= inner[0] and outer[1] >= inner[1])
+
+
+def is_error_result(message: dict[str, Any]) -> bool:
+    """Whether a tool result reports a failure (see ToolResult.to_display)."""
+    content = message.get("content")
+    return isinstance(content, str) and content.startswith("Error:")
+
+
+class FileReadDeduplicator:
+    """Replaces redundant file read results with back-reference stubs.
+
+    An earlier ``Read`` result is redundant when a later call makes it
+    obsolete:
+
+    - a later read of the same file and range (identical content is a
+      duplicate, different content means the file changed),
+    - a later read of a range of the file containing its range.
+
+    A read is only replaced when a later read covers it, so the latest
+    read of each file stays in context even after the file is edited.
+    With ``supersede_on_edit`` a later ``Write`` or ``Edit`` of the file
+    also makes a read stale; the model then has to read the file again.
+
+    Messages are indexed as they are added: each file keeps the reads
+    not yet superseded, with their content hashes, so a new result is
+    only compared against earlier reads of the same file.
+    """
+
+    def __init__(self, supersede_on_edit: bool = False) -> None:
+        """Initialize deduplicator.
+
+        Args:
+            supersede_on_edit: Treat reads followed by a Write/Edit of the
+                same file as stale, even when no later read covers them.
+        """
+        self.supersede_on_edit = supersede_on_edit
+        self._calls: dict[str, ToolCallRef] = {}
+        self._reads: dict[str, list[IndexedRead]] = {}
+
+    def add(self, message: dict[str, Any]) -> dict[str, str]:
+        """Index a message and find the earlier reads it makes redundant.
+
+        Assistant messages register their tool calls; tool results are
+        matched against the earlier reads of their file.
+
+        Args:
+            message: Message appended to the conversation.
+
+        Returns:
+            Mapping of tool call ID of each redundant earlier result to
+            the stub that replaces it.
+        """
+        role = message.get("role")
+        if role == "assistant":
+            if message.get("tool_calls"):
+                self._calls.update(index_tool_calls([message]))
+            return {}
+        if role != "tool":
+            return {}
+
+        ref = self._calls.pop(message.get("tool_call_id", ""), None)
+        if ref is None or ref.file_path is None:
+            return {}
+        path = ref.file_path
+
+        if ref.is_file_write:
+            # A failed write leaves the file (and earlier reads) unchanged
+            if not self.supersede_on_edit or is_error_result(message):
+                return {}
+            return {
+                read.ref.id: (
+                    f"{DEDUP_MARKER}: {read.ref.name} result for {path} is stale "
+                    f"after {ref.name} {ref.id}]"
+                )
+                for read in self._reads.pop(path, [])
+            }
+        if not ref.is_file_read or is_dedup_stub(message) or is_error_result(message):
+            return {}
+
+        new = IndexedRead(ref, read_range(ref), content_hash(message.get("content")))
+        stubs: dict[str, str] = {}
+        kept: list[IndexedRead] = []
+        for read in self._reads.get(path, []):
+            stub = self._stub_for(read, new)
+            if stub is None:
+                kept.append(read)
+            else:
+                stubs[read.ref.id] = stub
+        kept.append(new)
+        self._reads[path] = kept
+        return stubs
+
+    def reset(self) -> None:
+        """Forget all indexed tool calls and reads."""
+        self._calls.clear()
+        self._reads.clear()
+
+    def deduplicate(self, messages: list[dict[str, Any]]) -> DedupResult:
+        """Replace redundant read results in a message list.
+
+        Uses a fresh index, so this deduplicator's own index is left as
+        it is. The input list and its messages are not modified.
+
+        Args:
+            messages: Messages to deduplicate.
+
+        Returns:
+            DedupResult with the new message list.
+        """
+        index = FileReadDeduplicator(self.supersede_on_edit)
+        stubs: dict[str, str] = {}
+        for msg in messages:
+            stubs.update(index.add(msg))
+        if not stubs:
+            return DedupResult(messages=messages)
+        return apply_stubs(messages, stubs)
+
+    @staticmethod
+    def _stub_for(earlier: IndexedRead, later: IndexedRead) -> str | None:
+        """Build the stub for an earlier read, or None if it must be kept."""
+        name = earlier.ref.name
+        path = earlier.ref.file_path or ""
+        if earlier.read_range == later.read_range and earlier.digest == later.digest:
+            return (
+                f"{DEDUP_MARKER}: {name} result for {path} is identical "
+                f"to later call {later.ref.id}]"
+            )
+        if earlier.read_range == later.read_range or covers_range(
+            later.read_range, earlier.read_range
+        ):
+            return (
+                f"{DEDUP_MARKER}: {name} result for {path} superseded by "
+                f"later read {later.ref.id}]"
+            )
+        return None
+
+
+def apply_stubs(messages: list[dict[str, Any]], stubs: dict[str, str]) -> DedupResult:
+    """Replace tool results by their stubs.
+
+    Args:
+        messages: Messages to update; not modified.
+        stubs: Stub text by tool call ID, as returned by
+            ``FileReadDeduplicator.add``.
+
+    Returns:
+        DedupResult with the new message list.
+    """
+    result = list(messages)
+    replaced = 0
+    for idx, msg in enumerate(messages):
+        if msg.get("role") != "tool":
+            continue
+        stub = stubs.get(msg.get("tool_call_id", ""))
+        if stub is not None and not is_dedup_stub(msg):
+            result[idx] = {**msg, "content": stub}
+            replaced += 1
+
+    if not replaced:
+        return DedupResult(messages=messages)
+    return DedupResult(messages=result, replaced=replaced)
@@ -181,6 +181,8 @@ class ContextTracker:
     messages: list[dict[str, Any]] = field(default_factory=list)
     system_prompt: str = ""
     tool_definitions: list[dict[str, Any]] = field(default_factory=list)
+    # Output tokens of a response still being streamed
+    streaming_tokens: int = 0
 
     def __post_init__(self) -> None:
         """Initialize budget with limits."""
@@ -269,10 +271,42 @@ class ContextTracker:
     def current_tokens(self) -> int:
         """Get current total token usage.
 
+        Includes output tokens of an in-progress streamed response.
+
         Returns:
             Total tokens in use.
         """
-        return self.budget.system_prompt + self.budget.conversation + self.budget.tools
+        return (
+            self.budget.system_prompt
+            + self.budget.conversation
+            + self.budget.tools
+            + self.streaming_tokens
+        )
+
+    def add_stream_tokens(self, tokens: int) -> int:
+        """Add output tokens from a stream delta.
+
+        Args:
+            tokens: Tokens in the delta.
+
+        Returns:
+            Output tokens streamed so far.
+        """
+        self.streaming_tokens += max(0, tokens)
+        return self.streaming_tokens
+
+    def end_stream(self) -> int:
+        """Stop counting streamed output.
+
+        The final message should then be added with add_message, which
+        counts it exactly.
+
+        Returns:
+            Output tokens counted while streaming.
+        """
+        tokens = self.streaming_tokens
+        self.streaming_tokens = 0
+        return tokens
 
     def exceeds_limit(self) -> bool:
         """Check if context exceeds limit.
@@ -317,4 +351,5 @@ class ContextTracker:
     def reset(self) -> None:
         """Reset all messages."""
         self.messages = []
+        self.streaming_tokens = 0
         self.budget.update_conversation(0)
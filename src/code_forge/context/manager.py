@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from .cache import PromptCacheStats
 from .compaction import ContextCompactor, LLMProtocol, ToolResultCompactor
+from .dedup import FileReadDeduplicator, apply_stubs
 from .events import (
     CompressionEvent,
     CompressionEventType,
@@ -15,14 +18,29 @@ from .events import (
     get_warning_level,
 )
 from .limits import ContextTracker
+from .profiler import (
+    CATEGORY_ASSISTANT,
+    CATEGORY_OTHER,
+    CATEGORY_RAG,
+    CATEGORY_TOOL,
+    CATEGORY_USER,
+    CompressionRecord,
+    ContextProfiler,
+)
 from .strategies import (
+    CacheAwareTruncationStrategy,
     CompositeStrategy,
+    RelevanceEvictionStrategy,
     SlidingWindowStrategy,
     SmartTruncationStrategy,
     TokenBudgetStrategy,
     TruncationStrategy,
 )
 from .tokens import TokenCounter, get_counter
+from .tool_calls import drop_incomplete_tool_groups, index_tool_calls
+
+if TYPE_CHECKING:
+    from .tracker import SessionContextTracker
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +52,19 @@ class TruncationMode(str, Enum):
     TOKEN_BUDGET = "token_budget"
     SMART = "smart"
     SUMMARIZE = "summarize"
+    CACHE_AWARE = "cache_aware"
+    RELEVANCE = "relevance"
 
 
-def get_strategy(mode: TruncationMode) -> TruncationStrategy:
+def get_strategy(
+    mode: TruncationMode,
+    session_tracker: SessionContextTracker | None = None,
+) -> TruncationStrategy:
     """Get truncation strategy for mode.
 
     Args:
         mode: Truncation mode.
+        session_tracker: Session context tracker for relevance scoring.
 
     Returns:
         TruncationStrategy instance.
@@ -59,6 +83,10 @@ def get_strategy(mode: TruncationMode) -> TruncationStrategy:
                 TokenBudgetStrategy(),
             ]
         )
+    elif mode == TruncationMode.CACHE_AWARE:
+        return CacheAwareTruncationStrategy()
+    elif mode == TruncationMode.RELEVANCE:
+        return RelevanceEvictionStrategy(session_tracker)
     else:
         return SmartTruncationStrategy()
 
@@ -70,6 +98,13 @@ class ContextManager:
     to keep context within model limits.
     """
 
+    # Profiler category for each message role
+    _PROFILE_CATEGORIES: ClassVar[dict[str, str]] = {
+        "user": CATEGORY_USER,
+        "assistant": CATEGORY_ASSISTANT,
+        "tool": CATEGORY_TOOL,
+    }
+
     def __init__(
         self,
         model: str,
@@ -78,6 +113,10 @@ class ContextManager:
         auto_truncate: bool = True,
         warning_threshold: float = 80.0,
         critical_threshold: float = 90.0,
+        *,
+        session_tracker: SessionContextTracker | None = None,
+        dedupe_reads: bool = True,
+        dedupe_batch_tokens: int = 2048,
     ) -> None:
         """Initialize context manager.
 
@@ -88,29 +127,50 @@ class ContextManager:
             auto_truncate: Automatically truncate on overflow.
             warning_threshold: Usage percentage for caution warning (default 80).
             critical_threshold: Usage percentage for critical warning (default 90).
+            session_tracker: Session context tracker for relevance eviction.
+            dedupe_reads: Replace redundant file read results with stubs.
+            dedupe_batch_tokens: Tokens the pending stubs must save before
+                earlier history is rewritten; they are also applied before
+                truncation.
         """
         self.model = model
         self.mode = mode
         self.auto_truncate = auto_truncate
         self.warning_threshold = warning_threshold
         self.critical_threshold = critical_threshold
+        self.session_tracker = session_tracker
 
         # Initialize components
         self.counter: TokenCounter = get_counter(model)
         self.tracker: ContextTracker = ContextTracker.for_model(model)
-        self.strategy: TruncationStrategy = get_strategy(mode)
+        self.strategy: TruncationStrategy = get_strategy(mode, session_tracker)
 
         # Optional compactors
         self.compactor: ContextCompactor | None = (
             ContextCompactor(llm) if llm else None
         )
         self.tool_compactor: ToolResultCompactor = ToolResultCompactor()
+        self.deduplicator: FileReadDeduplicator | None = (
+            FileReadDeduplicator() if dedupe_reads else None
+        )
 
         # Internal state
         self._messages: list[dict[str, Any]] = []
         self._system_prompt: str = ""
         self._observers: list[CompressionObserver] = []
         self._last_warning_level: WarningLevel = WarningLevel.NONE
+        self.prompt_cache: PromptCacheStats = PromptCacheStats()
+        self.dedupe_batch_tokens = dedupe_batch_tokens
+        self._dedup_pending: dict[str, str] = {}
+        self._dedup_pending_tokens: int = 0
+        self._dedup_replaced: int = 0
+        self._dedup_tokens_saved: int = 0
+        self._stream_tokens: int = 0
+        self._stream_limit: int | None = None
+        self.profiler: ContextProfiler = ContextProfiler()
+        self._tool_names: dict[str, str] = {}
+        self._revision: int = 0
+        self._pending_augmentation: int = 0
 
     def set_system_prompt(self, prompt: str) -> int:
         """Set the system prompt.
@@ -122,7 +182,9 @@ class ContextManager:
             Token count for prompt.
         """
         self._system_prompt = prompt
-        return self.tracker.set_system_prompt(prompt)
+        tokens = self.tracker.set_system_prompt(prompt)
+        self.profiler.set_system_prompt(tokens)
+        return tokens
 
     def set_tool_definitions(self, tools: list[dict[str, Any]]) -> int:
         """Set tool definitions.
@@ -133,7 +195,9 @@ class ContextManager:
         Returns:
             Token count for tools.
         """
-        return self.tracker.set_tool_definitions(tools)
+        tokens = self.tracker.set_tool_definitions(tools)
+        self.profiler.set_tool_schemas(tokens)
+        return tokens
 
     def add_message(self, message: dict[str, Any]) -> None:
         """Add a message to context.
@@ -144,16 +208,50 @@ class ContextManager:
         Args:
             message: Message to add.
         """
+        role = message.get("role")
+        tool_name: str | None = None
+
+        if role == "user":
+            self.profiler.begin_turn()
+        elif role == "assistant" and message.get("tool_calls"):
+            for call_id, ref in index_tool_calls([message]).items():
+                self._tool_names[call_id] = ref.name
+
         # Compact tool results if needed
-        if message.get("role") == "tool":
-            message = self.tool_compactor.compact_message(message, self.counter)
+        if role == "tool":
+            tool_name = self._tool_names.get(message.get("tool_call_id", ""))
+            compacted = self.tool_compactor.compact_message(message, self.counter)
+            if compacted is not message:
+                self.profiler.record_compression(
+                    CompressionRecord(
+                        kind="tool_result",
+                        tokens_before=self.counter.count_message(message),
+                        tokens_after=self.counter.count_message(compacted),
+                        messages_before=1,
+                        messages_after=1,
+                        detail=tool_name,
+                    )
+                )
+            message = compacted
 
         self._messages.append(message)
-        self.tracker.add_message(message)
+        tokens = self.tracker.add_message(message)
+        category = self._PROFILE_CATEGORIES.get(str(role), CATEGORY_OTHER)
+        if role == "user" and self._pending_augmentation:
+            # The message carries RAG context recorded just before it
+            rag_tokens = min(tokens, self._pending_augmentation)
+            self._pending_augmentation = 0
+            self.profiler.record(CATEGORY_RAG, rag_tokens)
+            self.profiler.record(category, tokens - rag_tokens)
+        else:
+            self.profiler.record(category, tokens, tool_name)
+
+        if self.deduplicator is not None:
+            self._queue_dedup(self.deduplicator.add(message))
 
         # Check for overflow
         if self.auto_truncate and self.tracker.exceeds_limit():
-            self._truncate()
+            self.truncate()
 
         # Check warning thresholds after adding message
         self._check_warning_threshold()
@@ -167,6 +265,40 @@ class ContextManager:
         for message in messages:
             self.add_message(message)
 
+    def add_tool_exchange(
+        self,
+        call_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        result: str,
+        success: bool = True,
+    ) -> None:
+        """Add a tool call and its result.
+
+        Args:
+            call_id: Tool call ID.
+            name: Tool name.
+            arguments: Tool arguments.
+            result: Tool output.
+            success: Whether the tool succeeded.
+        """
+        if not success and not result.startswith("Error:"):
+            result = f"Error: {result}"
+        self.add_message(
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": name, "arguments": json.dumps(arguments)},
+                    }
+                ],
+            }
+        )
+        self.add_message({"role": "tool", "tool_call_id": call_id, "content": result})
+
     def get_messages(self) -> list[dict[str, Any]]:
         """Get current message list.
 
@@ -175,14 +307,47 @@ class ContextManager:
         """
         return list(self._messages)
 
+    @property
+    def revision(self) -> int:
+        """Counter of history rewrites.
+
+        Incremented whenever messages are removed or replaced
+        (truncation, compaction, deduplication, reset). Adding messages
+        does not change it, so views of the history only need to
+        convert new messages while it stays the same.
+        """
+        return self._revision
+
+    def replace_messages(self, messages: list[dict[str, Any]]) -> None:
+        """Replace the conversation history.
+
+        Args:
+            messages: New message list.
+        """
+        self._messages = list(messages)
+        self.tracker.update(self._messages)
+        self._revision += 1
+        self._dedup_pending = {}
+        self._dedup_pending_tokens = 0
+        if self.deduplicator is not None:
+            # Index the new history; its earlier copies are kept as given
+            self.deduplicator.reset()
+            for message in self._messages:
+                self.deduplicator.add(message)
+        self._check_warning_threshold()
+
     def get_context_for_request(self) -> list[dict[str, Any]]:
         """Get messages ready for LLM request.
 
-        Includes system prompt as first message.
+        Includes system prompt as first message. In cache-aware mode the
+        system prompt, the end of the stable prefix and the latest message
+        are marked as prompt cache breakpoints.
 
         Returns:
             Messages for LLM request.
         """
+        from code_forge.llm.models import MAX_CACHE_BREAKPOINTS, Message
+
         messages: list[dict[str, Any]] = []
 
         if self._system_prompt:
@@ -193,9 +358,130 @@ class ContextManager:
                 }
             )
 
+        offset = len(messages)
         messages.extend(self._messages)
+
+        if isinstance(self.strategy, CacheAwareTruncationStrategy) and messages:
+            breakpoints = {len(messages) - 1}
+            if offset:
+                breakpoints.add(0)
+            prefix_end = self.cache_breakpoint()
+            if prefix_end is not None:
+                breakpoints.add(offset + prefix_end)
+            for idx in sorted(breakpoints)[-MAX_CACHE_BREAKPOINTS:]:
+                marked = Message.from_dict(messages[idx])
+                marked.cache_control = True
+                messages[idx] = marked.to_dict()
+
         return messages
 
+    def cache_breakpoint(self) -> int | None:
+        """Get the index of the last message of the stable history prefix.
+
+        In cache-aware mode the pinned early turns (and the omission
+        marker after them) stay byte-identical between requests, so a
+        prompt cache breakpoint there lets the provider reuse the prefix
+        even while the rest of the history changes.
+
+        Returns:
+            Index into ``get_messages()``, or None outside cache-aware
+            mode or without a history.
+        """
+        if not isinstance(self.strategy, CacheAwareTruncationStrategy):
+            return None
+        prefix = self.strategy.prefix_length(self._messages)
+        return prefix - 1 if prefix else None
+
+    def record_augmentation(self, text: str, *, in_next_message: bool = False) -> int:
+        """Attribute injected RAG context to the current turn.
+
+        By default augmentation is sent with the request but not kept in
+        the conversation, so it only affects the profile. When the
+        augmented query is itself added as the next user message, that
+        message's tokens are split between RAG and user instead.
+
+        Args:
+            text: Context text added to the user message.
+            in_next_message: Whether the next user message added contains
+                the text.
+
+        Returns:
+            Token count for the text.
+        """
+        tokens = self.counter.count(text) if text else 0
+        if in_next_message:
+            self._pending_augmentation = tokens
+        else:
+            self.profiler.record(CATEGORY_RAG, tokens)
+        return tokens
+
+    def begin_stream(self, max_output_tokens: int | None = None) -> None:
+        """Start accounting for a streamed completion.
+
+        Output tokens are counted as deltas arrive and included in
+        token_usage until end_stream is called. Streamed output of
+        successive completions in one agent run accumulates.
+
+        Args:
+            max_output_tokens: Output token budget for this completion.
+        """
+        self._stream_tokens = 0
+        self._stream_limit = max_output_tokens
+
+    def add_stream_delta(self, text: str) -> int:
+        """Count a streamed output delta.
+
+        Args:
+            text: Delta text (content, reasoning or tool arguments).
+
+        Returns:
+            Output tokens streamed so far in the current completion.
+        """
+        if not text:
+            return self._stream_tokens
+        tokens = self.counter.count(text)
+        self._stream_tokens += tokens
+        self.tracker.add_stream_tokens(tokens)
+        return self._stream_tokens
+
+    @property
+    def stream_tokens(self) -> int:
+        """Output tokens streamed in the current completion."""
+        return self._stream_tokens
+
+    @property
+    def stream_limit_reached(self) -> bool:
+        """Whether the current completion reached its output token budget."""
+        return self._stream_limit is not None and self._stream_tokens >= self._stream_limit
+
+    def end_stream(self) -> int:
+        """Stop streamed output accounting.
+
+        Add the final assistant message afterwards so it is counted
+        exactly.
+
+        Returns:
+            Output tokens counted while streaming.
+        """
+        self._stream_tokens = 0
+        self._stream_limit = None
+        return self.tracker.end_stream()
+
+    def record_usage(
+        self,
+        prompt_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> None:
+        """Record provider usage for prompt cache hit tracking.
+
+        Args:
+            prompt_tokens: Prompt tokens reported for the request.
+            cached_tokens: Prompt tokens read from the provider cache.
+            cache_write_tokens: Prompt tokens written to the provider cache.
+        """
+        self.prompt_cache.record(prompt_tokens, cached_tokens, cache_write_tokens)
+
     def add_observer(self, observer: CompressionObserver) -> None:
         """Add a compression event observer.
 
@@ -220,6 +506,7 @@ class ContextManager:
         Args:
             event: Event to broadcast.
         """
+        self.profiler.on_compression_event(event)
         for observer in self._observers:
             try:
                 observer.on_compression_event(event)
@@ -250,28 +537,108 @@ class ContextManager:
                 self._notify_observers(event)
             self._last_warning_level = current_level
 
-    def _truncate(self) -> None:
+    def _queue_dedup(self, stubs: dict[str, str]) -> None:
+        """Queue stubs for redundant read results.
+
+        Replacing a result rewrites earlier history, which invalidates the
+        provider prompt cache from that message on, so stubs are applied
+        in batches once they save ``dedupe_batch_tokens``.
+
+        Args:
+            stubs: Stub text by tool call ID of the redundant results.
+        """
+        if not stubs:
+            return
+
+        remaining = len(stubs)
+        for msg in reversed(self._messages):
+            if not remaining:
+                break
+            if msg.get("role") != "tool":
+                continue
+            stub = stubs.get(msg.get("tool_call_id", ""))
+            if stub is None:
+                continue
+            remaining -= 1
+            saved = self.counter.count_message(msg) - self.counter.count_message(
+                {**msg, "content": stub}
+            )
+            self._dedup_pending_tokens += max(0, saved)
+        self._dedup_pending.update(stubs)
+
+        if self._dedup_pending_tokens >= self.dedupe_batch_tokens:
+            self._deduplicate()
+
+    def _deduplicate(self) -> None:
+        """Replace the queued redundant file read results with stubs."""
+        if not self._dedup_pending:
+            return
+
+        result = apply_stubs(self._messages, self._dedup_pending)
+        self._dedup_pending = {}
+        self._dedup_pending_tokens = 0
+        if not result.replaced:
+            return
+
+        tokens_before = self.token_usage
+        self._messages = result.messages
+        self._revision += 1
+        tokens_after = self.tracker.update(result.messages)
+        self._dedup_replaced += result.replaced
+        self._dedup_tokens_saved += max(0, tokens_before - tokens_after)
+        self.profiler.record_compression(
+            CompressionRecord(
+                kind="deduplication",
+                tokens_before=tokens_before,
+                tokens_after=tokens_after,
+                messages_before=len(result.messages),
+                messages_after=len(result.messages),
+            )
+        )
+        logger.debug(
+            f"Deduplicated {result.replaced} file read result(s), "
+            f"{tokens_before} -> {tokens_after} tokens"
+        )
+
+    def truncate(self, target_tokens: int | None = None) -> None:
         """Truncate messages to fit within limit.
 
         Validates that truncated result fits within budget.
         Logs warning if truncation was insufficient.
-        Emits CompressionEvent when messages are removed.
+        Emits CompressionEvent when messages are removed or replaced.
+
+        Args:
+            target_tokens: Conversation token budget. Defaults to the
+                budget left by the model limit.
         """
+        # History is rewritten anyway, so queued stubs cost no cache
+        self._deduplicate()
+
         tokens_before = self.token_usage
         messages_before = len(self._messages)
-        target_tokens = self.tracker.budget.conversation_budget
+        if target_tokens is None:
+            target_tokens = self.tracker.budget.conversation_budget
+
+        # Tool calls and their results are kept or dropped together
+        truncated = drop_incomplete_tool_groups(
+            self.strategy.truncate(
+                self._messages,
+                target_tokens,
+                self.counter,
+            )
+        )
 
-        truncated = self.strategy.truncate(
-            self._messages,
-            target_tokens,
-            self.counter,
+        # Strategies may shrink messages in place (e.g. stub tool results)
+        changed = len(truncated) < len(self._messages) or any(
+            new is not old for new, old in zip(truncated, self._messages, strict=False)
         )
 
-        if len(truncated) < len(self._messages):
+        if changed:
             logger.info(
                 f"Truncated context: {len(self._messages)} -> {len(truncated)} messages"
             )
             self._messages = truncated
+            self._revision += 1
             self.tracker.update(truncated)
 
             # Emit truncation event
@@ -331,6 +698,7 @@ class ContextManager:
 
         if len(compacted) < len(self._messages):
             self._messages = compacted
+            self._revision += 1
             self.tracker.update(compacted)
 
             # Emit compaction event
@@ -391,7 +759,17 @@ class ContextManager:
         messages_before = len(self._messages)
 
         self._messages = []
+        self._revision += 1
         self.tracker.reset()
+        self._stream_tokens = 0
+        self._stream_limit = None
+        self._tool_names = {}
+        self._pending_augmentation = 0
+        self._dedup_pending = {}
+        self._dedup_pending_tokens = 0
+        if self.deduplicator is not None:
+            self.deduplicator.reset()
+        self.profiler.reset()
         self._last_warning_level = WarningLevel.NONE
 
         # Emit cleared event if there were messages
@@ -421,6 +799,11 @@ class ContextManager:
             "usage_percentage": self.usage_percentage,
             "max_tokens": self.tracker.limits.max_tokens,
             "effective_limit": self.tracker.limits.effective_limit,
+            "prompt_cache": self.prompt_cache.get_stats(),
+            "deduplication": {
+                "results_replaced": self._dedup_replaced,
+                "tokens_saved": self._dedup_tokens_saved,
+            },
         }
 
     def get_cache_stats(self) -> dict[str, int] | None:
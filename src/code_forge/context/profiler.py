@@ -0,0 +1,282 @@
+"""Per-turn context token attribution.
+
+Records where context tokens come from (system prompt, tool schemas, user
+input, RAG augmentation, tool results by tool name, assistant output) and
+what each truncation or compaction cost, so compactor limits and RAG
+budgets can be tuned from data.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .events import CompressionEvent, CompressionEventType
+
+# Attribution categories
+CATEGORY_USER = "user"
+CATEGORY_RAG = "rag"
+CATEGORY_ASSISTANT = "assistant"
+CATEGORY_TOOL = "tool"
+CATEGORY_OTHER = "other"
+
+
+@dataclass
+class CompressionRecord:
+    """Cost of one truncation, compaction or tool result compaction.
+
+    Attributes:
+        kind: Event type (truncation, compaction, tool_result, deduplication).
+        tokens_before: Conversation tokens before.
+        tokens_after: Conversation tokens after.
+        messages_before: Messages before.
+        messages_after: Messages after.
+        detail: Strategy or tool name.
+    """
+
+    kind: str
+    tokens_before: int
+    tokens_after: int
+    messages_before: int = 0
+    messages_after: int = 0
+    detail: str | None = None
+
+    @property
+    def tokens_removed(self) -> int:
+        """Tokens removed from context."""
+        return max(0, self.tokens_before - self.tokens_after)
+
+
+@dataclass
+class TurnProfile:
+    """Token attribution for one conversation turn.
+
+    A turn starts with a user message and includes everything added
+    until the next user message.
+
+    Attributes:
+        turn: Turn number (1-based, 0 for messages before the first turn).
+        user: Tokens of user input.
+        rag: Tokens of RAG context injected into the request.
+        assistant: Tokens of assistant output.
+        tools: Tool result tokens by tool name.
+        other: Tokens of messages with other roles.
+        compressions: Truncations and compactions during the turn.
+    """
+
+    turn: int
+    user: int = 0
+    rag: int = 0
+    assistant: int = 0
+    tools: dict[str, int] = field(default_factory=dict)
+    other: int = 0
+    compressions: list[CompressionRecord] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Tokens added during the turn."""
+        return self.user + self.rag + self.assistant + self.other + sum(self.tools.values())
+
+    @property
+    def tokens_removed(self) -> int:
+        """Tokens removed by compression during the turn."""
+        return sum(record.tokens_removed for record in self.compressions)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        return {
+            "turn": self.turn,
+            "user": self.user,
+            "rag": self.rag,
+            "assistant": self.assistant,
+            "tools": dict(self.tools),
+            "other": self.other,
+            "total": self.total,
+            "tokens_removed": self.tokens_removed,
+            "compressions": [
+                {**asdict(record), "tokens_removed": record.tokens_removed}
+                for record in self.compressions
+            ],
+        }
+
+
+class ContextProfiler:
+    """Attributes context tokens per turn.
+
+    Implements CompressionObserver so it can be attached to a
+    ContextManager to record truncation and compaction costs.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_turns: int = 500) -> None:
+        """Initialize profiler.
+
+        Args:
+            max_turns: Maximum turns kept; oldest are dropped first.
+        """
+        self.max_turns = max_turns
+        self.system_prompt_tokens = 0
+        self.tool_schema_tokens = 0
+        self._turns: list[TurnProfile] = []
+        self._turn_count = 0
+        self._lock = threading.Lock()
+
+    def _current(self) -> TurnProfile:
+        """Get the current turn, creating turn 0 if none started."""
+        if not self._turns:
+            self._turns.append(TurnProfile(turn=self._turn_count))
+        return self._turns[-1]
+
+    def set_system_prompt(self, tokens: int) -> None:
+        """Record system prompt size.
+
+        Args:
+            tokens: System prompt tokens.
+        """
+        with self._lock:
+            self.system_prompt_tokens = max(0, tokens)
+
+    def set_tool_schemas(self, tokens: int) -> None:
+        """Record tool definition size.
+
+        Args:
+            tokens: Tool schema tokens.
+        """
+        with self._lock:
+            self.tool_schema_tokens = max(0, tokens)
+
+    def begin_turn(self) -> None:
+        """Start a new turn."""
+        with self._lock:
+            self._turn_count += 1
+            self._turns.append(TurnProfile(turn=self._turn_count))
+            if len(self._turns) > self.max_turns:
+                del self._turns[: len(self._turns) - self.max_turns]
+
+    def record(self, category: str, tokens: int, tool_name: str | None = None) -> None:
+        """Attribute tokens to a category in the current turn.
+
+        Args:
+            category: One of user, rag, assistant, tool or other.
+            tokens: Token count.
+            tool_name: Tool name for tool results.
+        """
+        tokens = max(0, tokens)
+        with self._lock:
+            turn = self._current()
+            if category == CATEGORY_USER:
+                turn.user += tokens
+            elif category == CATEGORY_RAG:
+                turn.rag += tokens
+            elif category == CATEGORY_ASSISTANT:
+                turn.assistant += tokens
+            elif category == CATEGORY_TOOL:
+                name = tool_name or "unknown"
+                turn.tools[name] = turn.tools.get(name, 0) + tokens
+            else:
+                turn.other += tokens
+
+    def record_compression(self, record: CompressionRecord) -> None:
+        """Record a compression in the current turn.
+
+        Args:
+            record: Compression cost.
+        """
+        with self._lock:
+            self._current().compressions.append(record)
+
+    def on_compression_event(self, event: CompressionEvent) -> None:
+        """Record truncation and compaction events.
+
+        Args:
+            event: Compression event from the context manager.
+        """
+        if event.event_type not in (
+            CompressionEventType.TRUNCATION,
+            CompressionEventType.COMPACTION,
+        ):
+            return
+        self.record_compression(
+            CompressionRecord(
+                kind=event.event_type.value,
+                tokens_before=event.tokens_before,
+                tokens_after=event.tokens_after,
+                messages_before=event.messages_before,
+                messages_after=event.messages_after,
+                detail=event.strategy,
+            )
+        )
+
+    def get_turns(self) -> list[TurnProfile]:
+        """Get recorded turns.
+
+        Returns:
+            Turn profiles, oldest first.
+        """
+        with self._lock:
+            return list(self._turns)
+
+    def get_report(self) -> dict[str, Any]:
+        """Build the attribution report.
+
+        Returns:
+            Dictionary with static costs, per-turn attribution and totals.
+        """
+        with self._lock:
+            turns = [turn.to_dict() for turn in self._turns]
+            static = {
+                "system_prompt": self.system_prompt_tokens,
+                "tool_schemas": self.tool_schema_tokens,
+            }
+
+        tools: dict[str, int] = {}
+        for turn in turns:
+            for name, tokens in turn["tools"].items():
+                tools[name] = tools.get(name, 0) + tokens
+
+        totals = {
+            "user": sum(t["user"] for t in turns),
+            "rag": sum(t["rag"] for t in turns),
+            "assistant": sum(t["assistant"] for t in turns),
+            "tools": dict(sorted(tools.items(), key=lambda item: -item[1])),
+            "other": sum(t["other"] for t in turns),
+            "tokens_removed": sum(t["tokens_removed"] for t in turns),
+            "compressions": sum(len(t["compressions"]) for t in turns),
+        }
+
+        return {"static": static, "turns": turns, "totals": totals}
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize the report as JSON.
+
+        Args:
+            indent: JSON indentation.
+
+        Returns:
+            JSON string.
+        """
+        return json.dumps(self.get_report(), indent=indent)
+
+    def export_json(self, path: str | Path) -> Path:
+        """Write the report to a JSON file.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            Resolved output path.
+        """
+        output = Path(path).expanduser().resolve()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(self.to_json(), encoding="utf-8")
+        return output
+
+    def reset(self) -> None:
+        """Clear recorded turns (static costs are kept)."""
+        with self._lock:
+            self._turns = []
+            self._turn_count = 0
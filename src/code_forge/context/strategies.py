@@ -1,10 +1,17 @@
 """Context truncation strategies."""
 
+from __future__ import annotations
+
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .dedup import covers_range, is_error_result, read_range
+from .tool_calls import ToolCallRef, index_tool_calls
 
-from .tokens import TokenCounter
+if TYPE_CHECKING:
+    from .tokens import TokenCounter
+    from .tracker import SessionContextTracker
 
 logger = logging.getLogger(__name__)
 
@@ -249,9 +256,10 @@ class SmartTruncationStrategy(TruncationStrategy):
         # Calculate omitted count
         omitted_count = len(other_messages) - total_preserve
 
-        # Add truncation marker
+        # Add truncation marker (a user message: providers reject system
+        # messages in the middle of the history)
         truncation_marker: dict[str, Any] = {
-            "role": "system",
+            "role": "user",
             "content": f"[{omitted_count} messages omitted]",
         }
 
@@ -352,6 +360,419 @@ class SelectiveTruncationStrategy(TruncationStrategy):
         return [msg for _, msg in result]
 
 
+class CacheAwareTruncationStrategy(TruncationStrategy):
+    """Truncate behind a stable prefix so provider prompt caches survive.
+
+    System messages, the first N messages and a fixed omission marker
+    form a prefix that never changes between truncations. When the
+    budget is exceeded, the oldest messages after that prefix are dropped
+    down to a low-water mark, cutting only at user-turn boundaries, so
+    subsequent turns append for a while without truncating again. Within
+    a single long agent turn the user message is kept and the cut falls
+    between tool call groups instead.
+    """
+
+    OMITTED_MARKER = "[Earlier conversation omitted]"
+
+    def __init__(
+        self,
+        preserve_first: int = 2,
+        headroom: float = 0.25,
+        preserve_system: bool = True,
+    ) -> None:
+        """Initialize cache-aware strategy.
+
+        Args:
+            preserve_first: First N messages pinned in the stable prefix.
+            headroom: Fraction of the budget freed on each truncation.
+            preserve_system: Whether to preserve system messages.
+        """
+        if not 0.0 <= headroom < 1.0:
+            raise ValueError("headroom must be in [0.0, 1.0)")
+        self.preserve_first = preserve_first
+        self.headroom = headroom
+        self.preserve_system = preserve_system
+
+    def is_marker(self, message: dict[str, Any]) -> bool:
+        """Check whether a message is the omission marker."""
+        return (
+            message.get("role") == "user"
+            and message.get("content") == self.OMITTED_MARKER
+        )
+
+    def prefix_length(self, messages: list[dict[str, Any]]) -> int:
+        """Get the number of leading messages that form the stable prefix.
+
+        Args:
+            messages: Messages as kept by this strategy.
+
+        Returns:
+            Length of the prefix up to and including the marker, or the
+            pinned messages if nothing has been truncated yet.
+        """
+        for idx, msg in enumerate(messages):
+            if self.is_marker(msg):
+                return idx + 1
+
+        pinned = 0
+        for idx, msg in enumerate(messages):
+            if self.preserve_system and msg.get("role") == "system":
+                continue
+            pinned += 1
+            if pinned >= self.preserve_first:
+                return idx + 1
+        return 0
+
+    def truncate(
+        self,
+        messages: list[dict[str, Any]],
+        target_tokens: int,
+        counter: TokenCounter,
+    ) -> list[dict[str, Any]]:
+        """Truncate at turn boundaries behind the stable prefix.
+
+        Args:
+            messages: Messages to truncate.
+            target_tokens: Maximum tokens allowed.
+            counter: Token counter.
+
+        Returns:
+            Truncated messages.
+        """
+        if not messages:
+            return []
+
+        if self._count_messages(messages, counter) <= target_tokens:
+            return messages
+
+        system_messages: list[dict[str, Any]] = []
+        other_messages: list[dict[str, Any]] = []
+        marker: dict[str, Any] | None = None
+
+        for msg in messages:
+            if self.is_marker(msg):
+                # Reuse the existing marker so the prefix stays byte-identical
+                marker = msg
+            elif self.preserve_system and msg.get("role") == "system":
+                system_messages.append(msg)
+            else:
+                other_messages.append(msg)
+
+        if marker is None:
+            # A user message: providers reject mid-history system messages
+            marker = {"role": "user", "content": self.OMITTED_MARKER}
+
+        pinned = other_messages[: self.preserve_first]
+        tail = other_messages[self.preserve_first :]
+        prefix = system_messages + pinned + [marker]
+
+        goal = int(target_tokens * (1.0 - self.headroom))
+        available = goal - self._count_messages(prefix, counter)
+
+        last_user: int | None = None
+        for idx in range(len(tail) - 1, -1, -1):
+            if tail[idx].get("role") == "user":
+                last_user = idx
+                break
+
+        start = self._cut_index(tail, available, counter)
+        if last_user is not None and start <= last_user:
+            # Only cut at a user turn so tool calls keep their results
+            while tail[start].get("role") != "user":
+                start += 1
+            kept = tail[start:]
+        else:
+            kept = self._truncate_current_turn(tail, last_user, available, counter)
+
+        result = prefix + kept
+
+        logger.debug(
+            f"Cache-aware truncation: {len(messages)} -> {len(result)} messages"
+        )
+
+        return result
+
+    def _cut_index(
+        self,
+        messages: list[dict[str, Any]],
+        available: int,
+        counter: TokenCounter,
+    ) -> int:
+        """Get the index from which the messages fit in ``available`` tokens."""
+        tokens = self._count_messages(messages, counter)
+        start = 0
+        while start < len(messages) and tokens > available:
+            tokens -= counter.count_message(messages[start])
+            start += 1
+        return start
+
+    def _truncate_current_turn(
+        self,
+        tail: list[dict[str, Any]],
+        last_user: int | None,
+        available: int,
+        counter: TokenCounter,
+    ) -> list[dict[str, Any]]:
+        """Truncate inside the current turn of a long agent loop.
+
+        The user message that started the turn is always kept. The tool
+        work after it is cut before an assistant message, so each tool
+        call group stays whole, keeping at least the latest group.
+        """
+        request = [] if last_user is None else [tail[last_user]]
+        turn = tail[0 if last_user is None else last_user + 1 :]
+
+        budget = available - self._count_messages(request, counter)
+        start = self._cut_index(turn, budget, counter)
+        while start < len(turn) and turn[start].get("role") != "assistant":
+            start += 1
+
+        if start == len(turn):
+            start = 0
+            for idx in range(len(turn) - 1, -1, -1):
+                if turn[idx].get("role") == "assistant":
+                    start = idx
+                    break
+
+        return request + turn[start:]
+
+
+class RelevanceEvictionStrategy(TruncationStrategy):
+    """Evict the least valuable messages first.
+
+    Each message is scored by recency, overlap with entities from the
+    current turn (via SessionContextTracker), role, and staleness: a file
+    read whose file was later re-read or modified no longer reflects the
+    file and scores near zero. Messages are evicted in ascending score
+    order, larger ones first on ties, until the budget is met.
+
+    Tool results are replaced with a short stub rather than removed so
+    the assistant tool calls that produced them stay valid. The current
+    user message, the last few messages and system messages are never
+    evicted.
+    """
+
+    ROLE_WEIGHTS: ClassVar[dict[str, float]] = {"user": 1.0, "assistant": 0.7, "tool": 0.4}
+    STALE_PENALTY = 0.1
+
+    def __init__(
+        self,
+        session_tracker: SessionContextTracker | None = None,
+        *,
+        preserve_last: int = 4,
+        recency_weight: float = 0.4,
+        entity_weight: float = 0.3,
+        role_weight: float = 0.3,
+        preserve_system: bool = True,
+    ) -> None:
+        """Initialize relevance eviction strategy.
+
+        Args:
+            session_tracker: Tracker providing current-turn entities.
+            preserve_last: Last N messages never evicted.
+            recency_weight: Weight of message position in the score.
+            entity_weight: Weight of current-entity overlap in the score.
+            role_weight: Weight of message role in the score.
+            preserve_system: Whether to preserve system messages.
+        """
+        self.session_tracker = session_tracker
+        self.preserve_last = preserve_last
+        self.recency_weight = recency_weight
+        self.entity_weight = entity_weight
+        self.role_weight = role_weight
+        self.preserve_system = preserve_system
+
+    def _current_entities(self) -> list[str]:
+        """Get entity values relevant to the current turn."""
+        if self.session_tracker is None:
+            return []
+
+        values = [e.value for e in self.session_tracker.get_current_entities()]
+        active = self.session_tracker.active_file
+        if active and active not in values:
+            values.append(active)
+        return values
+
+    def _stale_results(
+        self,
+        messages: list[dict[str, Any]],
+        refs: dict[str, ToolCallRef],
+    ) -> dict[int, str]:
+        """Find file tool results superseded by a later operation.
+
+        A read result is superseded by a later successful write of the
+        file or a later successful read whose range covers it; a write
+        result only by a later successful write. Failed calls and
+        narrower reads leave earlier results current.
+
+        Returns:
+            Mapping of message index to the superseded file path.
+        """
+        later_reads: dict[str, list[tuple[Any, ...]]] = {}
+        later_write: set[str] = set()
+        stale: dict[int, str] = {}
+        for idx in range(len(messages) - 1, -1, -1):
+            msg = messages[idx]
+            if msg.get("role") != "tool":
+                continue
+            ref = refs.get(msg.get("tool_call_id", ""))
+            if ref is None or not ref.file_path:
+                continue
+            path = ref.file_path
+            ok = not is_error_result(msg)
+            if ref.is_file_read:
+                lines = read_range(ref)
+                if path in later_write or any(
+                    later == lines or covers_range(later, lines)
+                    for later in later_reads.get(path, ())
+                ):
+                    stale[idx] = path
+                if ok:
+                    later_reads.setdefault(path, []).append(lines)
+            elif ref.is_file_write:
+                if path in later_write:
+                    stale[idx] = path
+                if ok:
+                    later_write.add(path)
+        return stale
+
+    def score(
+        self,
+        index: int,
+        total: int,
+        message: dict[str, Any],
+        entities: list[str],
+        *,
+        stale: bool,
+        ref: ToolCallRef | None = None,
+    ) -> float:
+        """Score a message's value for keeping it in context.
+
+        Args:
+            index: Message position.
+            total: Number of messages.
+            message: The message.
+            entities: Current-turn entity values.
+            stale: Whether the message was superseded.
+            ref: Tool call that produced the message, for tool results.
+
+        Returns:
+            Score in [0, 1]; higher is more valuable.
+        """
+        recency = index / (total - 1) if total > 1 else 1.0
+
+        overlap = 0.0
+        if entities:
+            content = message.get("content")
+            text = content if isinstance(content, str) else str(content or "")
+            if ref is not None:
+                text = f"{text} {ref.arguments}"
+            hits = sum(1 for value in entities if value and value in text)
+            overlap = min(1.0, hits / min(len(entities), 3))
+
+        role = self.ROLE_WEIGHTS.get(message.get("role", ""), 0.5)
+
+        value = (
+            self.recency_weight * recency
+            + self.entity_weight * overlap
+            + self.role_weight * role
+        )
+        if stale:
+            value *= self.STALE_PENALTY
+        return value
+
+    def truncate(
+        self,
+        messages: list[dict[str, Any]],
+        target_tokens: int,
+        counter: TokenCounter,
+    ) -> list[dict[str, Any]]:
+        """Evict lowest-value messages until within budget.
+
+        Args:
+            messages: Messages to truncate.
+            target_tokens: Maximum tokens allowed.
+            counter: Token counter.
+
+        Returns:
+            Messages with low-value entries evicted.
+        """
+        if not messages:
+            return []
+
+        tokens = [counter.count_message(msg) for msg in messages]
+        total_tokens = sum(tokens)
+        if total_tokens <= target_tokens:
+            return messages
+
+        # The current request and the latest messages are never evicted;
+        # older tool results of the current turn are stubbed like any other
+        protected_from = max(0, len(messages) - self.preserve_last)
+        request: int | None = None
+        for idx in range(len(messages) - 1, -1, -1):
+            if messages[idx].get("role") == "user":
+                request = idx
+                break
+
+        refs = index_tool_calls(messages)
+        stale = self._stale_results(messages, refs)
+        entities = self._current_entities()
+
+        candidates: list[tuple[float, int, int]] = []
+        for idx, msg in enumerate(messages[:protected_from]):
+            role = msg.get("role")
+            if idx == request or (self.preserve_system and role == "system"):
+                continue
+            # Assistant tool calls must stay paired with their results
+            if role == "assistant" and msg.get("tool_calls"):
+                continue
+            ref = refs.get(msg.get("tool_call_id", "")) if role == "tool" else None
+            value = self.score(
+                idx, len(messages), msg, entities, stale=idx in stale, ref=ref
+            )
+            candidates.append((value, -tokens[idx], idx))
+
+        candidates.sort()
+
+        result: list[dict[str, Any] | None] = list(messages)
+        for _, _, idx in candidates:
+            if total_tokens <= target_tokens:
+                break
+            msg = messages[idx]
+            if msg.get("role") == "tool":
+                ref = refs.get(msg.get("tool_call_id", ""))
+                stub = dict(msg)
+                stub["content"] = self._stub_text(ref, stale.get(idx))
+                stub_tokens = counter.count_message(stub)
+                if stub_tokens >= tokens[idx]:
+                    continue
+                result[idx] = stub
+                total_tokens -= tokens[idx] - stub_tokens
+            else:
+                result[idx] = None
+                total_tokens -= tokens[idx]
+
+        final = [msg for msg in result if msg is not None]
+
+        logger.debug(
+            f"Relevance eviction: {len(messages)} -> {len(final)} messages, "
+            f"{sum(tokens)} -> {total_tokens} tokens"
+        )
+
+        return final
+
+    @staticmethod
+    def _stub_text(ref: ToolCallRef | None, superseded: str | None) -> str:
+        """Build replacement text for an evicted tool result."""
+        if superseded:
+            return f"[{ref.name if ref else 'Tool'} result for {superseded} evicted: superseded]"
+        if ref is not None:
+            target = ref.file_path or ""
+            suffix = f" for {target}" if target else ""
+            return f"[{ref.name} result{suffix} evicted to save context]"
+        return "[Tool result evicted to save context]"
+
+
 class CompositeStrategy(TruncationStrategy):
     """Chain multiple strategies.
 
@@ -0,0 +1,160 @@
+"""Tool call introspection for context messages.
+
+Tool result messages only carry a ``tool_call_id``; the tool name and
+arguments live on the assistant message that issued the call. These
+helpers join the two so context strategies can reason about which file
+a tool result refers to.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+# Argument keys that name the file a tool operates on
+FILE_ARG_KEYS = ("file_path", "path", "notebook_path")
+
+# Tools whose results are a snapshot of a file's content
+FILE_READ_TOOLS = frozenset({"Read"})
+
+# Tools that change a file's content
+FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+
+
+@dataclass
+class ToolCallRef:
+    """A tool call issued by an assistant message.
+
+    Attributes:
+        id: Tool call ID matched by the tool result message.
+        name: Tool name.
+        arguments: Parsed tool arguments.
+        message_index: Index of the assistant message that issued the call.
+    """
+
+    id: str
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+    message_index: int = 0
+
+    @property
+    def file_path(self) -> str | None:
+        """File path the call operates on, if any."""
+        for key in FILE_ARG_KEYS:
+            value = self.arguments.get(key)
+            if isinstance(value, str) and value:
+                return value
+        return None
+
+    @property
+    def is_file_read(self) -> bool:
+        """Whether the call reads a file's content."""
+        return self.name in FILE_READ_TOOLS and self.file_path is not None
+
+    @property
+    def is_file_write(self) -> bool:
+        """Whether the call modifies a file."""
+        return self.name in FILE_WRITE_TOOLS and self.file_path is not None
+
+
+def _parse_arguments(raw: Any) -> dict[str, Any]:
+    """Parse tool call arguments from a JSON string or dict."""
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, str) and raw:
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+        if isinstance(parsed, dict):
+            return parsed
+    return {}
+
+
+def index_tool_calls(messages: list[dict[str, Any]]) -> dict[str, ToolCallRef]:
+    """Index tool calls in a message list by tool call ID.
+
+    Handles both OpenAI-style calls (``function.name`` /
+    ``function.arguments``) and LangChain-style calls (``name`` / ``args``).
+
+    Args:
+        messages: Message dictionaries.
+
+    Returns:
+        Mapping of tool call ID to ToolCallRef.
+    """
+    refs: dict[str, ToolCallRef] = {}
+
+    for idx, msg in enumerate(messages):
+        if msg.get("role") != "assistant":
+            continue
+        for call in msg.get("tool_calls") or []:
+            if not isinstance(call, dict) or not call.get("id"):
+                continue
+            function = call.get("function")
+            if isinstance(function, dict):
+                name = function.get("name", "")
+                arguments = _parse_arguments(function.get("arguments"))
+            else:
+                name = call.get("name", "")
+                arguments = _parse_arguments(call.get("args"))
+            refs[call["id"]] = ToolCallRef(
+                id=call["id"],
+                name=name or "",
+                arguments=arguments,
+                message_index=idx,
+            )
+
+    return refs
+
+
+def drop_incomplete_tool_groups(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Remove tool calls that lost their results, and results that lost their call.
+
+    An assistant message with tool calls and the tool results following it
+    form a group that providers only accept whole. Truncation can cut a
+    group apart, so incomplete groups are dropped together. A group at the
+    end of the history is kept as it is: its tools may still be running.
+
+    Args:
+        messages: Message dictionaries.
+
+    Returns:
+        The messages, or a copy without incomplete groups.
+    """
+    result: list[dict[str, Any]] = []
+    dropped = False
+    i = 0
+    while i < len(messages):
+        msg = messages[i]
+        role = msg.get("role")
+        if role == "tool":
+            # Result whose assistant message was removed
+            dropped = True
+            i += 1
+            continue
+        if role != "assistant" or not msg.get("tool_calls"):
+            result.append(msg)
+            i += 1
+            continue
+
+        end = i + 1
+        while end < len(messages) and messages[end].get("role") == "tool":
+            end += 1
+        call_ids = {
+            call.get("id") for call in msg["tool_calls"] if isinstance(call, dict)
+        }
+        results = [
+            m for m in messages[i + 1 : end] if m.get("tool_call_id") in call_ids
+        ]
+        answered = {m.get("tool_call_id") for m in results}
+        if call_ids <= answered or end == len(messages):
+            result.append(msg)
+            result.extend(results)
+            dropped = dropped or len(results) < end - i - 1
+        else:
+            dropped = True
+        i = end
+
+    return result if dropped else messages
@@ -390,6 +390,23 @@ class SessionContextTracker:
         )
         return [e.value for e in file_entities[:limit]]
 
+    def get_current_entities(self, window: int = 1) -> list[TrackedEntity]:
+        """Get entities mentioned in the most recent turns.
+
+        Args:
+            window: Number of previous turns to include besides the current one.
+
+        Returns:
+            Entities last mentioned within the window, most mentioned first.
+        """
+        since = self._context.turn_count - window
+        entities = [
+            e for e in self._context.entities.values()
+            if e.last_mentioned >= since
+        ]
+        entities.sort(key=lambda e: e.mention_count, reverse=True)
+        return entities
+
     def get_recent_operations(
         self,
         limit: int = 10,
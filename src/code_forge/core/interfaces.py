@@ -6,6 +6,7 @@ They enable dependency injection, testing with mocks, and loose coupling.
 Interface Implementation Status:
 - IConfigLoader: Implemented by config.loader.ConfigLoader
 - ISessionRepository: Implemented by sessions.repository.SessionRepository
+  and sessions.sqlite_store.SQLiteSessionRepository
 - IModelProvider: Interface for LLM providers (OpenRouterClient is compatible)
 - ITool: Defines the tool contract (BaseTool provides full implementation)
 
@@ -16,7 +17,7 @@ The interfaces define the minimum contract for polymorphism and testing.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -25,7 +26,6 @@ if TYPE_CHECKING:
     from code_forge.core.types import (
         CompletionRequest,
         CompletionResponse,
-        Session,
         SessionId,
         ToolParameter,
         ToolResult,
@@ -188,17 +188,21 @@ class IConfigLoader(ABC):
         ...
 
 
-class ISessionRepository(ABC):
+SessionT = TypeVar("SessionT")
+
+
+class ISessionRepository(ABC, Generic[SessionT]):
     """Abstract base class for session persistence.
 
     Implemented by sessions.repository.SessionRepository which wraps
-    the sync SessionStorage with an async interface.
+    the sync SessionStorage with an async interface. Generic over the
+    session type the implementation persists.
 
     McCabe Complexity Target: All methods <= 5
     """
 
     @abstractmethod
-    async def save(self, session: Session) -> None:
+    async def save(self, session: SessionT) -> None:
         """Persist session to storage.
 
         Args:
@@ -207,7 +211,7 @@ class ISessionRepository(ABC):
         ...
 
     @abstractmethod
-    async def load(self, session_id: SessionId) -> Session | None:
+    async def load(self, session_id: SessionId) -> SessionT | None:
         """Load session by ID.
 
         Args:
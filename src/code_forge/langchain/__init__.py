@@ -46,6 +46,7 @@ from code_forge.langchain.callbacks import (
 )
 from code_forge.langchain.llm import OpenRouterLLM
 from code_forge.langchain.memory import (
+    ContextMemory,
     ConversationMemory,
     SlidingWindowMemory,
     SummaryMemory,
@@ -71,6 +72,7 @@ __all__ = [
     "AgentEventType",
     "AgentResult",
     "CompositeCallback",
+    "ContextMemory",
     "ConversationMemory",
     "LangChainToolAdapter",
     "LoggingCallback",
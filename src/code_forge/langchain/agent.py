@@ -16,10 +16,19 @@ from langchain_core.messages import AIMessage
 from code_forge.core.logging import get_logger
 from code_forge.langchain.memory import ConversationMemory
 from code_forge.langchain.tools import LangChainToolAdapter
+from code_forge.tools.execution.output import output_listener
+from code_forge.tools.scheduler import (
+    DEFAULT_MAX_CONCURRENCY,
+    is_read_only_tool,
+    plan_batches,
+    run_batch,
+)
 
 logger = get_logger("agent")
 
 if TYPE_CHECKING:
+    from langchain_core.messages import ToolCall
+
     from code_forge.langchain.llm import OpenRouterLLM
     from code_forge.llm.models import Message, TokenUsage
 
@@ -32,6 +41,7 @@ class AgentEventType(str, Enum):
     LLM_END = "llm_end"
     TOOL_START = "tool_start"
     TOOL_END = "tool_end"
+    TOOL_OUTPUT = "tool_output"
     AGENT_END = "agent_end"
     ERROR = "error"
 
@@ -112,6 +122,10 @@ class CodeForgeAgent:
         iteration_timeout: float = 60.0,
         tool_timeout: float = 30.0,
         tool_max_retries: int = 2,
+        *,
+        native_streaming: bool = False,
+        max_parallel_tools: int = DEFAULT_MAX_CONCURRENCY,
+        stream_tool_output: bool = False,
     ) -> None:
         """
         Initialize agent.
@@ -125,6 +139,11 @@ class CodeForgeAgent:
             iteration_timeout: Timeout per iteration in seconds
             tool_timeout: Timeout for individual tool execution in seconds
             tool_max_retries: Max retries for transient tool failures (default 2)
+            native_streaming: Stream Code-Forge chunks from the LLM instead of
+                LangChain message chunks when no callbacks are given
+            max_parallel_tools: Maximum read-only tool calls run concurrently
+            stream_tool_output: Yield TOOL_OUTPUT events from ``stream`` for
+                each line of output tools report while running
         """
         self.llm = llm
         self.tools = tools
@@ -134,6 +153,9 @@ class CodeForgeAgent:
         self.iteration_timeout = iteration_timeout
         self.tool_timeout = tool_timeout
         self.tool_max_retries = tool_max_retries
+        self.native_streaming = native_streaming
+        self.max_parallel_tools = max_parallel_tools
+        self.stream_tool_output = stream_tool_output
 
         # Create tool lookup
         self._tool_map: dict[str, Any] = {}
@@ -226,6 +248,77 @@ class CodeForgeAgent:
         logger.error(error_msg)
         return error_msg, False
 
+    def _is_read_only_call(self, tool_call: ToolCall) -> bool:
+        """Check whether a tool call may run concurrently with other reads."""
+        return is_read_only_tool(self._tool_map.get(tool_call["name"]))
+
+    async def _run_tool_call(self, tool_call: ToolCall) -> ToolCallRecord:
+        """Validate and execute one tool call.
+
+        Args:
+            tool_call: Tool call from the LLM response
+
+        Returns:
+            Record of the call; failures are recorded, not raised
+        """
+        tool_start = time.time()
+        tool_name = tool_call["name"]
+        tool_args: Any = tool_call.get("args", {})
+        tool_id = tool_call["id"] or ""
+
+        # Validate tool_args is a dict (security: LLM could send other types)
+        if not isinstance(tool_args, dict):
+            return ToolCallRecord(
+                id=tool_id,
+                name=tool_name,
+                arguments={"_raw": str(tool_args)[:100]},
+                result=f"Invalid arguments for {tool_name}: expected dict, got {type(tool_args).__name__}",
+                success=False,
+                duration=time.time() - tool_start,
+            )
+
+        tool = self._tool_map.get(tool_name)
+        if tool is None:
+            result = f"Unknown tool: {tool_name}"
+            success = False
+            logger.error(f"Unknown tool requested: {tool_name}")
+        elif validation_error := self._validate_tool_args(tool, tool_args):
+            result = f"Invalid arguments for {tool_name}: {validation_error}"
+            success = False
+        else:
+            # Execute tool with retry logic
+            result, success = await self._execute_tool_with_retry(
+                tool, tool_name, tool_args
+            )
+
+        tool_duration = time.time() - tool_start
+
+        # Log tool result
+        if success:
+            logger.debug(f"Tool {tool_name} completed in {tool_duration:.1f}s")
+        else:
+            logger.error(f"Tool {tool_name} failed after {tool_duration:.1f}s: {result}")
+
+        return ToolCallRecord(
+            id=tool_id,
+            name=tool_name,
+            arguments=tool_args,
+            result=result,
+            success=success,
+            duration=tool_duration,
+        )
+
+    @staticmethod
+    def _validate_tool_args(tool: Any, tool_args: dict[str, Any]) -> Exception | None:
+        """Validate arguments against the tool schema, if available."""
+        if isinstance(tool, LangChainToolAdapter) and tool.args_schema:
+            try:
+                # Pydantic validation
+                tool.args_schema(**tool_args)
+            except Exception as validation_error:
+                return validation_error
+        return None
+
     async def run(
         self,
         input: str,
@@ -295,96 +388,16 @@ class CodeForgeAgent:
 
                     self.memory.add_message(langchain_to_forge(response))
 
-                    # Execute tools
-                    for tool_call in response.tool_calls:
-                        tool_start = time.time()
-                        tool_name = tool_call["name"]
-                        tool_args = tool_call.get("args", {})
-                        tool_id = tool_call["id"]
-
-                        # Validate tool_args is a dict (security: LLM could send other types)
-                        if not isinstance(tool_args, dict):
-                            result = f"Invalid arguments for {tool_name}: expected dict, got {type(tool_args).__name__}"
-                            success = False
-                            tool_duration = time.time() - tool_start
-                            tool_call_records.append(
-                                ToolCallRecord(
-                                    id=tool_id or "",
-                                    name=tool_name,
-                                    arguments={"_raw": str(tool_args)[:100]},
-                                    result=result,
-                                    success=success,
-                                    duration=tool_duration,
-                                )
-                            )
+                    # Execute tools, read-only ones concurrently
+                    for batch in plan_batches(response.tool_calls, self._is_read_only_call):
+                        records = await run_batch(
+                            batch, self._run_tool_call, self.max_parallel_tools
+                        )
+                        for record in records:
+                            tool_call_records.append(record)
                             self.memory.add_message(
-                                Message.tool_result(tool_id or "", result)
+                                Message.tool_result(record.id, record.result)
                             )
-                            continue
-
-                        tool = self._tool_map.get(tool_name)
-                        if tool:
-                            # Validate arguments against tool schema (if available)
-                            if isinstance(tool, LangChainToolAdapter) and tool.args_schema:
-                                try:
-                                    # Pydantic validation
-                                    tool.args_schema(**tool_args)
-                                except Exception as validation_error:
-                                    result = f"Invalid arguments for {tool_name}: {validation_error}"
-                                    success = False
-                                    tool_duration = time.time() - tool_start
-                                    tool_call_records.append(
-                                        ToolCallRecord(
-                                            id=tool_id or "",
-                                            name=tool_name,
-                                            arguments=tool_args,
-                                            result=result,
-                                            success=success,
-                                            duration=tool_duration,
-                                        )
-                                    )
-                                    self.memory.add_message(
-                                        Message.tool_result(tool_id or "", result)
-                                    )
-                                    continue
-
-                            # Execute tool with retry logic
-                            result, success = await self._execute_tool_with_retry(
-                                tool, tool_name, tool_args
-                            )
-                        else:
-                            result = f"Unknown tool: {tool_name}"
-                            success = False
-                            logger.error(f"Unknown tool requested: {tool_name}")
-
-                        tool_duration = time.time() - tool_start
-
-                        # Log tool result
-                        if success:
-                            logger.debug(
-                                f"Tool {tool_name} completed in {tool_duration:.1f}s"
-                            )
-                        else:
-                            logger.error(
-                                f"Tool {tool_name} failed after {tool_duration:.1f}s: {result}"
-                            )
-
-                        # Record tool call
-                        tool_call_records.append(
-                            ToolCallRecord(
-                                id=tool_id or "",
-                                name=tool_name,
-                                arguments=tool_args,
-                                result=result,
-                                success=success,
-                                duration=tool_duration,
-                            )
-                        )
-
-                        # Add tool result to memory
-                        self.memory.add_message(
-                            Message.tool_result(tool_id or "", result)
-                        )
 
                 else:
                     # No tool calls - agent is done
@@ -523,6 +536,129 @@ class CodeForgeAgent:
 
         return tool_calls
 
+    async def _stream_llm(
+        self,
+        messages: list[Any],
+        callbacks: list[BaseCallbackHandler] | None,
+    ) -> AsyncIterator[tuple[str, str, list[dict[str, Any]], Any]]:
+        """Stream one LLM response as deltas.
+
+        With ``native_streaming`` and no callbacks, Code-Forge chunks are
+        read straight from the client, skipping LangChain's per-token
+        message chunk objects and callback dispatch.
+
+        Args:
+            messages: LangChain messages to send
+            callbacks: Optional callback handlers
+
+        Yields:
+            Tuples of (content, reasoning, tool call chunks, usage metadata)
+        """
+        from code_forge.langchain.llm import (
+            OpenRouterLLM,
+            to_tool_call_chunks,
+            to_usage_metadata,
+        )
+
+        if self.native_streaming and not callbacks and isinstance(self._bound_llm, OpenRouterLLM):
+            async for forge_chunk in self._bound_llm.astream_native(messages):
+                delta = forge_chunk.delta
+                yield (
+                    delta.content or "",
+                    delta.reasoning_content or "",
+                    to_tool_call_chunks(delta),
+                    to_usage_metadata(forge_chunk.usage),
+                )
+            return
+
+        async for chunk in self._bound_llm.astream(
+            messages,
+            config={"callbacks": callbacks} if callbacks else None,
+        ):
+            reasoning_content = None
+            if hasattr(chunk, "additional_kwargs"):
+                reasoning_content = chunk.additional_kwargs.get("reasoning_content")
+
+            chunk_content: Any = ""
+            if hasattr(chunk, "content") and chunk.content:
+                chunk_content = chunk.content
+                if isinstance(chunk_content, list):
+                    chunk_content = "".join(
+                        p.get("text", "") if isinstance(p, dict) else str(p)
+                        for p in chunk_content
+                    )
+
+            tool_call_chunks: list[dict[str, Any]] = []
+            if hasattr(chunk, "tool_call_chunks") and chunk.tool_call_chunks:
+                tool_call_chunks = list(chunk.tool_call_chunks)
+
+            usage = None
+            if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
+                usage = chunk.usage_metadata
+
+            yield (
+                str(chunk_content) if chunk_content else "",
+                str(reasoning_content) if reasoning_content else "",
+                tool_call_chunks,
+                usage,
+            )
+
+    async def _run_batch_with_output(
+        self, batch: list[ToolCall], records: list[ToolCallRecord]
+    ) -> AsyncIterator[AgentEvent]:
+        """Run a batch of tool calls, yielding their output as it arrives.
+
+        Each call runs with an ``output_listener`` that queues a TOOL_OUTPUT
+        event per line the tool reports.
+
+        Args:
+            batch: Tool calls to run
+            records: Receives the records of the calls, in call order
+
+        Yields:
+            TOOL_OUTPUT events
+        """
+        queue: asyncio.Queue[AgentEvent] = asyncio.Queue()
+
+        async def run_with_listener(tool_call: ToolCall) -> ToolCallRecord:
+            def listener(stream: str, line: str) -> None:
+                queue.put_nowait(
+                    AgentEvent(
+                        type=AgentEventType.TOOL_OUTPUT,
+                        data={
+                            "id": tool_call["id"],
+                            "name": tool_call["name"],
+                            "stream": stream,
+                            "line": line,
+                        },
+                    )
+                )
+
+            token = output_listener.set(listener)
+            try:
+                return await self._run_tool_call(tool_call)
+            finally:
+                output_listener.reset(token)
+
+        batch_task = asyncio.ensure_future(
+            run_batch(batch, run_with_listener, self.max_parallel_tools)
+        )
+        try:
+            while not batch_task.done():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    {getter, batch_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            while not queue.empty():
+                yield queue.get_nowait()
+            records.extend(batch_task.result())
+        finally:
+            batch_task.cancel()
+
     async def stream(
         self,
         input: str,
@@ -547,6 +683,8 @@ class CodeForgeAgent:
         # Track totals across ALL iterations
         total_prompt_tokens = 0
         total_completion_tokens = 0
+        total_cached_tokens = 0
+        total_cache_write_tokens = 0
 
         # Add user message
         self.memory.add_message(Message.user(input))
@@ -567,6 +705,8 @@ class CodeForgeAgent:
                 # Some providers send cumulative usage on every chunk
                 iteration_prompt_tokens = 0
                 iteration_completion_tokens = 0
+                iteration_cached_tokens = 0
+                iteration_cache_write_tokens = 0
 
                 # Yield LLM start event
                 yield AgentEvent(
@@ -580,49 +720,41 @@ class CodeForgeAgent:
                 accumulated_reasoning = ""
                 tool_call_chunks: list[dict] = []
 
-                async for chunk in self._bound_llm.astream(
-                    messages,
-                    config={"callbacks": callbacks} if callbacks else None,
+                async for content, reasoning, chunks, usage in self._stream_llm(
+                    messages, callbacks
                 ):
                     # Accumulate reasoning content (DeepSeek/Kimi thinking tokens)
-                    reasoning_content = None
-                    if hasattr(chunk, "additional_kwargs"):
-                        reasoning_content = chunk.additional_kwargs.get("reasoning_content")
-                    if reasoning_content:
-                        accumulated_reasoning += str(reasoning_content)
+                    if reasoning:
+                        accumulated_reasoning += reasoning
                         yield AgentEvent(
                             type=AgentEventType.LLM_CHUNK,
-                            data={"content": reasoning_content, "is_reasoning": True},
+                            data={"content": reasoning, "is_reasoning": True},
                         )
 
                     # Accumulate content
-                    if hasattr(chunk, "content") and chunk.content:
-                        chunk_content = chunk.content
-                        if isinstance(chunk_content, list):
-                            chunk_content = "".join(
-                                p.get("text", "") if isinstance(p, dict) else str(p)
-                                for p in chunk_content
-                            )
-                        accumulated_content += str(chunk_content)
+                    if content:
+                        accumulated_content += content
                         yield AgentEvent(
                             type=AgentEventType.LLM_CHUNK,
-                            data={"content": chunk_content},
+                            data={"content": content},
                         )
 
                     # Accumulate tool call chunks
-                    if hasattr(chunk, "tool_call_chunks") and chunk.tool_call_chunks:
-                        tool_call_chunks.extend(chunk.tool_call_chunks)
+                    if chunks:
+                        tool_call_chunks.extend(chunks)
 
                     # Track token usage from streaming chunks
                     # IMPORTANT: Take LAST value, don't accumulate within iteration
                     # Some providers (DeepSeek, Kimi) send cumulative usage on every chunk
-                    if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
-                        usage = chunk.usage_metadata
+                    if usage:
                         # Handle both dict and object access patterns
                         if isinstance(usage, dict):
                             # Replace, don't add - usage is cumulative within the iteration
                             iteration_prompt_tokens = usage.get("input_tokens", 0)
                             iteration_completion_tokens = usage.get("output_tokens", 0)
+                            details = usage.get("input_token_details") or {}
+                            iteration_cached_tokens = details.get("cache_read", 0)
+                            iteration_cache_write_tokens = details.get("cache_creation", 0)
                         else:
                             if hasattr(usage, "input_tokens"):
                                 iteration_prompt_tokens = usage.input_tokens
@@ -632,6 +764,8 @@ class CodeForgeAgent:
                 # Add this iteration's final usage to the totals
                 total_prompt_tokens += iteration_prompt_tokens
                 total_completion_tokens += iteration_completion_tokens
+                total_cached_tokens += iteration_cached_tokens
+                total_cache_write_tokens += iteration_cache_write_tokens
 
                 # Yield LLM end event
                 yield AgentEvent(
@@ -663,65 +797,41 @@ class CodeForgeAgent:
 
                     self.memory.add_message(langchain_to_forge(response))
 
-                    for tool_call in response.tool_calls:
-                        tool_name = tool_call["name"]
-                        tool_args = tool_call["args"]
-                        tool_id = tool_call["id"]
-
-                        yield AgentEvent(
-                            type=AgentEventType.TOOL_START,
-                            data={"name": tool_name, "arguments": tool_args},
-                        )
-
-                        tool_start = time.time()
-                        tool = self._tool_map.get(tool_name)
-
-                        if tool:
-                            # Execute tool with retry logic
-                            result, success = await self._execute_tool_with_retry(
-                                tool, tool_name, tool_args
+                    # Execute tools, read-only ones concurrently
+                    for batch in plan_batches(response.tool_calls, self._is_read_only_call):
+                        for tool_call in batch:
+                            yield AgentEvent(
+                                type=AgentEventType.TOOL_START,
+                                data={
+                                    "id": tool_call["id"],
+                                    "name": tool_call["name"],
+                                    "arguments": tool_call["args"],
+                                },
                             )
-                        else:
-                            result = f"Unknown tool: {tool_name}"
-                            success = False
-                            logger.error(f"Unknown tool requested: {tool_name}")
 
-                        tool_duration = time.time() - tool_start
-
-                        # Log tool result
-                        if success:
-                            logger.debug(
-                                f"Tool {tool_name} completed in {tool_duration:.1f}s"
-                            )
+                        records: list[ToolCallRecord] = []
+                        if self.stream_tool_output:
+                            async for event in self._run_batch_with_output(batch, records):
+                                yield event
                         else:
-                            logger.error(
-                                f"Tool {tool_name} failed after {tool_duration:.1f}s: {result}"
+                            records = await run_batch(
+                                batch, self._run_tool_call, self.max_parallel_tools
                             )
-
-                        yield AgentEvent(
-                            type=AgentEventType.TOOL_END,
-                            data={
-                                "name": tool_name,
-                                "result": result,
-                                "success": success,
-                                "duration": tool_duration,
-                            },
-                        )
-
-                        tool_call_records.append(
-                            ToolCallRecord(
-                                id=tool_id or "",
-                                name=tool_name,
-                                arguments=tool_args,
-                                result=result,
-                                success=success,
-                                duration=tool_duration,
+                        for record in records:
+                            yield AgentEvent(
+                                type=AgentEventType.TOOL_END,
+                                data={
+                                    "id": record.id,
+                                    "name": record.name,
+                                    "result": record.result,
+                                    "success": record.success,
+                                    "duration": record.duration,
+                                },
+                            )
+                            tool_call_records.append(record)
+                            self.memory.add_message(
+                                Message.tool_result(record.id, record.result)
                             )
-                        )
-
-                        self.memory.add_message(
-                            Message.tool_result(tool_id or "", result)
-                        )
                 else:
                     # No tool calls - done
                     self.memory.add_message(Message.assistant(full_content))
@@ -737,6 +847,8 @@ class CodeForgeAgent:
                     "prompt_tokens": total_prompt_tokens,
                     "completion_tokens": total_completion_tokens,
                     "total_tokens": total_prompt_tokens + total_completion_tokens,
+                    "cached_tokens": total_cached_tokens,
+                    "cache_write_tokens": total_cache_write_tokens,
                 },
             )
 
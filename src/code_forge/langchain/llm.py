@@ -23,7 +23,56 @@ from code_forge.langchain.messages import (
 )
 
 if TYPE_CHECKING:
-    from code_forge.llm.models import CompletionRequest
+    from code_forge.llm.models import CompletionRequest, StreamChunk, StreamDelta, TokenUsage
+
+
+def to_tool_call_chunks(delta: StreamDelta) -> list[dict[str, Any]]:
+    """Convert streamed tool call deltas to LangChain tool call chunks.
+
+    Args:
+        delta: Streaming delta
+
+    Returns:
+        Tool call chunks (index, id, name, args)
+    """
+    if not delta.tool_calls:
+        return []
+    chunks = []
+    for tc in delta.tool_calls:
+        function = tc.get("function", {})
+        chunks.append(
+            {
+                "index": tc.get("index", 0),
+                "id": tc.get("id"),
+                "name": function.get("name"),
+                "args": function.get("arguments", ""),
+            }
+        )
+    return chunks
+
+
+def to_usage_metadata(usage: TokenUsage | None) -> dict[str, Any] | None:
+    """Convert token usage to LangChain usage metadata.
+
+    Args:
+        usage: Token usage (OpenRouter sends it on the final chunk)
+
+    Returns:
+        Usage metadata, or None without usage
+    """
+    if not usage:
+        return None
+    metadata: dict[str, Any] = {
+        "input_tokens": usage.prompt_tokens,
+        "output_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+    if usage.cached_tokens or usage.cache_write_tokens:
+        metadata["input_token_details"] = {
+            "cache_read": usage.cached_tokens,
+            "cache_creation": usage.cache_write_tokens,
+        }
+    return metadata
 
 
 class OpenRouterLLM(BaseChatModel):
@@ -55,6 +104,7 @@ class OpenRouterLLM(BaseChatModel):
     frequency_penalty: float = 0.0
     presence_penalty: float = 0.0
     stop: list[str] | None = None
+    prompt_caching: bool = False
 
     # Internal state - use PrivateAttr to avoid mutable default issues
     _bound_tools: list[Any] = PrivateAttr(default_factory=list)
@@ -115,6 +165,7 @@ class OpenRouterLLM(BaseChatModel):
             stop=all_stops if all_stops else None,
             tools=tools,
             stream=stream,
+            prompt_caching=self.prompt_caching,
         )
 
     def _generate(
@@ -195,6 +246,8 @@ class OpenRouterLLM(BaseChatModel):
                     "prompt_tokens": response.usage.prompt_tokens,
                     "completion_tokens": response.usage.completion_tokens,
                     "total_tokens": response.usage.total_tokens,
+                    "cached_tokens": response.usage.cached_tokens,
+                    "cache_write_tokens": response.usage.cache_write_tokens,
                 },
             },
         )
@@ -292,27 +345,8 @@ class OpenRouterLLM(BaseChatModel):
             # Convert delta to message chunk
             content = chunk.delta.content or ""
             reasoning_content = chunk.delta.reasoning_content or ""
-            tool_call_chunks = []
-
-            if chunk.delta.tool_calls:
-                for tc in chunk.delta.tool_calls:
-                    tool_call_chunks.append(
-                        {
-                            "index": tc.get("index", 0),
-                            "id": tc.get("id"),
-                            "name": tc.get("function", {}).get("name"),
-                            "args": tc.get("function", {}).get("arguments", ""),
-                        }
-                    )
-
-            # Build usage metadata if available (OpenRouter sends on final chunk)
-            usage_metadata = None
-            if chunk.usage:
-                usage_metadata = {
-                    "input_tokens": chunk.usage.prompt_tokens,
-                    "output_tokens": chunk.usage.completion_tokens,
-                    "total_tokens": chunk.usage.total_tokens,
-                }
+            tool_call_chunks = to_tool_call_chunks(chunk.delta)
+            usage_metadata = to_usage_metadata(chunk.usage)
 
             # Include reasoning_content in additional_kwargs for models like DeepSeek/Kimi
             additional_kwargs = {}
@@ -321,7 +355,7 @@ class OpenRouterLLM(BaseChatModel):
 
             message_chunk = AIMessageChunk(
                 content=content,
-                tool_call_chunks=tool_call_chunks if tool_call_chunks else [],  # type: ignore[arg-type]
+                tool_call_chunks=tool_call_chunks,  # type: ignore[arg-type]
                 usage_metadata=usage_metadata,  # type: ignore[arg-type]
                 additional_kwargs=additional_kwargs if additional_kwargs else {},
             )
@@ -341,6 +375,31 @@ class OpenRouterLLM(BaseChatModel):
                 if token_text:
                     await run_manager.on_llm_new_token(token_text)
 
+    def astream_native(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream Code-Forge chunks without LangChain wrapping.
+
+        Skips building an AIMessageChunk and ChatGenerationChunk per delta
+        and LangChain's callback dispatch. For callers that consume deltas
+        directly and need no callbacks, like the native agent loop.
+
+        Args:
+            messages: List of messages to send
+            stop: Optional stop sequences
+            **kwargs: Additional parameters
+
+        Returns:
+            Iterator of StreamChunk for each streamed piece
+        """
+        request = self._build_request(messages, stop, stream=True, **kwargs)
+        stream: AsyncIterator[StreamChunk] = self.client.stream(request)
+        return stream
+
     def bind_tools(
         self,
         tools: Sequence[Any],
@@ -363,6 +422,7 @@ class OpenRouterLLM(BaseChatModel):
             ValueError: If too many tools are provided (max: MAX_BOUND_TOOLS)
         """
         from code_forge.llm.models import ToolDefinition
+        from code_forge.tools.registry import cached_for_tool
 
         # Check tool count limit
         if len(tools) > self.MAX_BOUND_TOOLS:
@@ -384,7 +444,7 @@ class OpenRouterLLM(BaseChatModel):
                 schema = getattr(tool, "args_schema", None)
                 params: dict[str, Any] = {}
                 if schema:
-                    params = schema.model_json_schema()
+                    params = cached_for_tool(schema, "json_schema", schema.model_json_schema)
                 converted_tools.append(
                     ToolDefinition(
                         name=tool.name,
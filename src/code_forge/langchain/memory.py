@@ -15,6 +15,7 @@ from code_forge.langchain.messages import (
 )
 
 if TYPE_CHECKING:
+    from code_forge.context.manager import ContextManager
     from code_forge.llm.models import Message
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,11 @@ class ConversationMemory:
     Supports message windowing, token-based truncation, and
     conversion between Code-Forge and LangChain message formats.
 
+    Converted LangChain messages are cached, so the agent loop only
+    converts messages added since the previous call. History is treated
+    as append-only: the cache is dropped when messages are trimmed,
+    replaced, or the system message changes.
+
     Example:
         ```python
         memory = ConversationMemory(max_messages=100)
@@ -46,6 +52,9 @@ class ConversationMemory:
     max_messages: int | None = None
     max_tokens: int | None = None
     _token_counter: Callable[[Message], int] | None = None
+    # Source messages of the cached LangChain messages, in parallel
+    _lc_sources: list[Message] = field(default_factory=list, init=False, repr=False, compare=False)
+    _lc_cache: list[BaseMessage] = field(default_factory=list, init=False, repr=False, compare=False)
 
     def add_message(self, message: Message) -> None:
         """
@@ -62,6 +71,7 @@ class ConversationMemory:
         # Don't add system messages to history, use set_system_message
         if message.role == MessageRole.SYSTEM:
             self.system_message = message
+            self.invalidate_cache()
             return
 
         self.messages.append(message)
@@ -143,15 +153,27 @@ class ConversationMemory:
             message = Msg.system(content or "")
 
         self.system_message = message
+        self.invalidate_cache()
 
     def clear(self) -> None:
         """Clear all messages (including system message)."""
         self.messages = []
         self.system_message = None
+        self.invalidate_cache()
 
     def clear_history(self) -> None:
         """Clear conversation history but keep system message."""
         self.messages = []
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached LangChain messages.
+
+        Needed only after modifying earlier messages in place; trimming
+        and system message changes invalidate the cache themselves.
+        """
+        self._lc_sources = []
+        self._lc_cache = []
 
     def _trim_to_count(self, max_count: int) -> None:
         """
@@ -164,6 +186,7 @@ class ConversationMemory:
         """
         if len(self.messages) > max_count:
             self.messages = self.messages[-max_count:]
+            self.invalidate_cache()
 
     def trim(self, max_tokens: int) -> None:
         """
@@ -195,18 +218,43 @@ class ConversationMemory:
         total = sum(self._token_counter(m) for m in self.messages)
 
         # Trim from front until under budget (O(n) total)
-        while self.messages and total > available:
-            removed = self.messages.pop(0)
-            total -= self._token_counter(removed)
+        trimmed = 0
+        while trimmed < len(self.messages) and total > available:
+            total -= self._token_counter(self.messages[trimmed])
+            trimmed += 1
+        if trimmed:
+            del self.messages[:trimmed]
+            self.invalidate_cache()
 
     def to_langchain_messages(self) -> list[BaseMessage]:
         """
         Convert all messages to LangChain format.
 
+        Only messages appended since the last call are converted; earlier
+        ones come from the cache.
+
         Returns:
             List of LangChain BaseMessage instances
         """
-        return forge_messages_to_langchain(self.get_messages())
+        messages = self.get_messages()
+        sources = self._lc_sources
+        cached = len(sources)
+        # The cache is a valid prefix if its first and last source
+        # messages are still in place (catches reassigned histories)
+        if cached and not (
+            len(messages) >= cached
+            and messages[0] is sources[0]
+            and messages[cached - 1] is sources[-1]
+        ):
+            self.invalidate_cache()
+            sources = self._lc_sources
+            cached = 0
+
+        if len(messages) > cached:
+            new = messages[cached:]
+            sources.extend(new)
+            self._lc_cache.extend(forge_messages_to_langchain(new))
+        return list(self._lc_cache)
 
     def from_langchain_messages(self, messages: list[BaseMessage]) -> None:
         """
@@ -219,6 +267,7 @@ class ConversationMemory:
 
         self.messages = []
         self.system_message = None
+        self.invalidate_cache()
 
         for msg in messages:
             forge_msg = langchain_to_forge(msg)
@@ -236,6 +285,175 @@ class ConversationMemory:
         return iter(self.get_messages())
 
 
+class ContextMemory(ConversationMemory):
+    """
+    Memory view over a ContextManager.
+
+    The context manager is the single store of the conversation:
+    messages added here are stored, token counted and truncated there,
+    and the history read back reflects its truncation, compaction and
+    deduplication. The agent therefore sends the model exactly the
+    history the context manager accounts for, and /clear or compaction
+    applied to the context manager applies to the agent too.
+
+    Messages are converted to and from the context manager's dicts once;
+    the view is rebuilt only when the context manager rewrites history.
+
+    Example:
+        ```python
+        context = ContextManager(model="anthropic/claude-3.5-sonnet")
+        agent = CodeForgeAgent(llm=llm, tools=tools, memory=ContextMemory(context))
+        ```
+    """
+
+    def __init__(self, context_manager: ContextManager) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            context_manager: Context manager that stores the history
+        """
+        self.context_manager = context_manager
+        self._view_revision = context_manager.revision
+        # Stored dicts and their converted messages, in parallel
+        self._view_sources: list[dict[str, Any]] = []
+        self._view: list[Message] = []
+        super().__init__(messages=self.messages)
+
+    @property
+    def messages(self) -> list[Message]:
+        """Conversation history (excluding system) as stored by the context manager."""
+        from code_forge.llm.models import Message
+
+        if self.context_manager.revision != self._view_revision:
+            self._view_revision = self.context_manager.revision
+            self._view_sources = []
+            self._view = []
+
+        stored = self.context_manager.get_messages()
+        if len(stored) > len(self._view):
+            new = stored[len(self._view):]
+            self._view_sources.extend(new)
+            self._view.extend(Message.from_dict(msg) for msg in new)
+        return list(self._view)
+
+    @messages.setter
+    def messages(self, value: list[Message]) -> None:
+        """Replace the stored history."""
+        current = self.messages
+        if len(value) == len(current) and all(
+            a is b for a, b in zip(value, current, strict=True)
+        ):
+            return
+        # Keep the stored dicts of messages that came from the view
+        sources = {id(m): d for m, d in zip(self._view, self._view_sources, strict=True)}
+        self.context_manager.replace_messages(
+            [sources.get(id(m)) or m.to_dict() for m in value]
+        )
+
+    def add_message(self, message: Message) -> None:
+        """
+        Add a message to the context manager.
+
+        Args:
+            message: Message to add
+        """
+        from code_forge.llm.models import MessageRole
+
+        if message.role == MessageRole.SYSTEM:
+            self.set_system_message(message)
+            return
+
+        in_sync = (
+            self.context_manager.revision == self._view_revision
+            and len(self._view) == len(self.context_manager.get_messages())
+        )
+        data = message.to_dict()
+        self.context_manager.add_message(data)
+
+        # Reuse the message itself if it was stored unchanged
+        stored = self.context_manager.get_messages()
+        if (
+            in_sync
+            and self.context_manager.revision == self._view_revision
+            and stored
+            and stored[-1] is data
+        ):
+            self._view_sources.append(data)
+            self._view.append(message)
+
+        if self.max_messages and len(stored) > self.max_messages:
+            self._trim_to_count(self.max_messages)
+
+    def to_langchain_messages(self) -> list[BaseMessage]:
+        """
+        Convert all messages to LangChain format.
+
+        The end of the context manager's stable prefix (see
+        ``ContextManager.cache_breakpoint``) is marked with a
+        ``cache_control`` flag, which becomes a prompt cache breakpoint in
+        the completion request.
+
+        Returns:
+            List of LangChain BaseMessage instances
+        """
+        messages = super().to_langchain_messages()
+        index = self.context_manager.cache_breakpoint()
+        if index is None:
+            return messages
+        if self.system_message:
+            index += 1
+        if index < len(messages):
+            msg = messages[index]
+            messages[index] = msg.model_copy(
+                update={"additional_kwargs": {**msg.additional_kwargs, "cache_control": True}}
+            )
+        return messages
+
+    def set_system_message(self, message: Message) -> None:
+        """
+        Set the system message and count it in the context manager.
+
+        Args:
+            message: System message to set
+        """
+        super().set_system_message(message)
+        content = self.system_message.content if self.system_message else ""
+        self.context_manager.set_system_prompt(content if isinstance(content, str) else "")
+
+    def clear(self) -> None:
+        """Clear all messages (including system message)."""
+        self.clear_history()
+        self.system_message = None
+        self.context_manager.set_system_prompt("")
+
+    def clear_history(self) -> None:
+        """Clear conversation history but keep system message."""
+        self.context_manager.reset()
+        self.invalidate_cache()
+
+    def trim(self, max_tokens: int) -> None:
+        """
+        Truncate the history with the context manager's strategy.
+
+        Args:
+            max_tokens: Maximum total tokens allowed, including the system message
+        """
+        system_tokens = self.context_manager.tracker.budget.system_prompt
+        self.context_manager.truncate(max(0, max_tokens - system_tokens))
+
+    def from_langchain_messages(self, messages: list[BaseMessage]) -> None:
+        """
+        Replace history with LangChain messages.
+
+        Args:
+            messages: LangChain messages to set
+        """
+        self.clear()
+        for msg in messages:
+            self.add_message(langchain_to_forge(msg))
+
+
 @dataclass
 class SlidingWindowMemory(ConversationMemory):
     """
@@ -259,6 +477,7 @@ class SlidingWindowMemory(ConversationMemory):
         # Simply keep the most recent messages
         if len(self.messages) > max_messages:
             self.messages = self.messages[-max_messages:]
+            self.invalidate_cache()
 
 
 @dataclass
@@ -281,6 +500,7 @@ class SummaryMemory(ConversationMemory):
     recent_messages_to_keep: int = 10  # Keep this many recent messages unsummarized
     summary: str | None = None
     summarizer: Any = None  # LLM to use for summarization
+    _summary_message: Message | None = field(default=None, init=False, repr=False, compare=False)
 
     def get_messages(self) -> list[Message]:
         """Get messages with summary prepended if available."""
@@ -292,11 +512,13 @@ class SummaryMemory(ConversationMemory):
         if self.system_message:
             result.append(self.system_message)
 
-        # Add summary as a system note if available
+        # Add summary as a system note if available. The note is reused
+        # while the summary is unchanged so converted messages stay cached.
         if self.summary:
-            result.append(
-                Message.system(f"[Previous conversation summary: {self.summary}]")
-            )
+            content = f"[Previous conversation summary: {self.summary}]"
+            if self._summary_message is None or self._summary_message.content != content:
+                self._summary_message = Message.system(content)
+            result.append(self._summary_message)
 
         # Add recent messages
         result.extend(self.messages)
@@ -339,3 +561,4 @@ class SummaryMemory(ConversationMemory):
                 self.summary = response.content
 
             self.messages = to_keep
+            self.invalidate_cache()
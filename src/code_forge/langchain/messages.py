@@ -26,18 +26,20 @@ def langchain_to_forge(message: BaseMessage) -> Message:
         message: LangChain message to convert
 
     Returns:
-        Equivalent Code-Forge Message
+        Equivalent Code-Forge Message; a ``cache_control`` flag in the
+        message's ``additional_kwargs`` marks it as a prompt cache breakpoint
 
     Raises:
         ValueError: If message type is not supported
     """
     from code_forge.llm.models import Message, ToolCall
 
+    result: Message
     if isinstance(message, SystemMessage):
-        return Message.system(str(message.content))
+        result = Message.system(str(message.content))
 
     elif isinstance(message, HumanMessage):
-        return Message.user(str(message.content))
+        result = Message.user(str(message.content))
 
     elif isinstance(message, AIMessage):
         tool_calls = None
@@ -57,10 +59,10 @@ def langchain_to_forge(message: BaseMessage) -> Message:
                 for tc in message.tool_calls
             ]
         content = str(message.content) if message.content else None
-        return Message.assistant(content=content, tool_calls=tool_calls)
+        result = Message.assistant(content=content, tool_calls=tool_calls)
 
     elif isinstance(message, ToolMessage):
-        return Message.tool_result(
+        result = Message.tool_result(
             tool_call_id=message.tool_call_id,
             content=str(message.content),
         )
@@ -68,6 +70,10 @@ def langchain_to_forge(message: BaseMessage) -> Message:
     else:
         raise ValueError(f"Unsupported message type: {type(message).__name__}")
 
+    if message.additional_kwargs.get("cache_control"):
+        result.cache_control = True
+    return result
+
 
 def forge_to_langchain(message: Message) -> BaseMessage:
     """
@@ -11,6 +11,8 @@ from langchain_core.tools import BaseTool as LangChainBaseTool
 from pydantic import BaseModel, Field, create_model
 from pydantic.fields import FieldInfo
 
+from code_forge.tools.registry import cached_for_tool
+
 
 class LangChainToolAdapter(LangChainBaseTool):
     """
@@ -52,8 +54,12 @@ class LangChainToolAdapter(LangChainBaseTool):
         if self.forge_tool:
             object.__setattr__(self, "name", self.forge_tool.name)
             object.__setattr__(self, "description", self.forge_tool.description)
-            # Generate args_schema from parameters
-            object.__setattr__(self, "args_schema", self._generate_args_schema())
+            # Generate args_schema from parameters, once per tool
+            object.__setattr__(
+                self,
+                "args_schema",
+                cached_for_tool(self.forge_tool, "args_schema", self._generate_args_schema),
+            )
 
     def _generate_args_schema(self) -> type[BaseModel]:
         """
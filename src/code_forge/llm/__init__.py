@@ -1,5 +1,6 @@
 """LLM client package for Code-Forge."""
 
+from code_forge.llm.cache import ResponseCache
 from code_forge.llm.client import OpenRouterClient
 from code_forge.llm.errors import (
     AuthenticationError,
@@ -10,6 +11,7 @@ from code_forge.llm.errors import (
     ProviderError,
     RateLimitError,
 )
+from code_forge.llm.latency import LatencyTable
 from code_forge.llm.models import (
     CompletionChoice,
     CompletionRequest,
@@ -23,8 +25,9 @@ from code_forge.llm.models import (
     ToolCall,
     ToolDefinition,
 )
-from code_forge.llm.routing import MODEL_ALIASES, RouteVariant, apply_variant
+from code_forge.llm.routing import MODEL_ALIASES, HedgeSettings, RouteVariant, apply_variant
 from code_forge.llm.streaming import StreamCollector
+from code_forge.llm.transport import ConnectionStats, PoolSettings
 
 __all__ = [
     "MODEL_ALIASES",
@@ -32,16 +35,21 @@ __all__ = [
     "CompletionChoice",
     "CompletionRequest",
     "CompletionResponse",
+    "ConnectionStats",
     "ContentPart",
     "ContentPolicyError",
     "ContextLengthError",
+    "HedgeSettings",
     "LLMError",
+    "LatencyTable",
     "Message",
     "MessageRole",
     "ModelNotFoundError",
     "OpenRouterClient",
+    "PoolSettings",
     "ProviderError",
     "RateLimitError",
+    "ResponseCache",
     "RouteVariant",
     "StreamChunk",
     "StreamCollector",
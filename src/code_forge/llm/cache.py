@@ -0,0 +1,276 @@
+"""On-disk cache of LLM responses.
+
+Headless runs in CI and evaluation harnesses send the same requests over
+and over. With the cache enabled, a response is stored under a hash of
+the canonical request payload and replayed for identical requests:
+completions as the response JSON, streams as the raw SSE data payloads,
+so a replayed stream is chunked exactly like the original.
+
+Entries expire a TTL after they were written (their mtime) and the
+least recently used entries (by atime, set on every hit) are evicted
+once the cache grows past its size limit. A cache directory can
+also be checked in as a record/replay fixture for offline tests.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from code_forge.core.logging import get_logger
+
+logger = get_logger("llm")
+
+COMPLETION_EXTENSION = ".json"
+STREAM_EXTENSION = ".sse"
+
+
+@dataclass
+class ResponseCacheStats:
+    """Response cache statistics.
+
+    Attributes:
+        hits: Requests answered from the cache.
+        misses: Cacheable requests sent to the API.
+        writes: Responses stored.
+        evictions: Entries removed for age or size.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {**dataclasses.asdict(self), "hit_rate": self.hit_rate}
+
+
+class ResponseCache:
+    """Content-addressed, size-bounded store of LLM responses.
+
+    Thread-safe.
+    """
+
+    DEFAULT_TTL = 7 * 24 * 3600.0
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        root: Path,
+        ttl: float | None = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        deterministic_only: bool = True,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            root: Directory to store entries in.
+            ttl: Seconds an entry stays valid. None keeps entries until evicted.
+            max_bytes: Total size above which old entries are evicted.
+            deterministic_only: Only cache requests with temperature 0.
+        """
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.deterministic_only = deterministic_only
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    @classmethod
+    def get_default_path(cls) -> Path:
+        """Get the default cache directory.
+
+        Returns:
+            Path under the forge cache directory.
+        """
+        # Use XDG_CACHE_HOME if available, else ~/.cache
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        return base / "forge" / "responses"
+
+    def key(self, payload: dict[str, Any]) -> str | None:
+        """Get the cache key of a request.
+
+        Args:
+            payload: API request payload.
+
+        Returns:
+            Hex digest of the canonical payload, or None if the request
+            is not cacheable.
+        """
+        if self.deterministic_only and payload.get("temperature") != 0:
+            return None
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, extension: str) -> Path:
+        return self.root / key[:2] / f"{key}{extension}"
+
+    def _read(self, path: Path) -> bytes | None:
+        """Read a live entry, counting the hit or miss."""
+        try:
+            stat = path.stat()
+            expired = self.ttl is not None and time.time() - stat.st_mtime > self.ttl
+            if expired:
+                self._remove(path)
+                data = None
+            else:
+                data = path.read_bytes()
+                # Mark as recently used for eviction; the mtime keeps the
+                # write time the TTL counts from
+                os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            data = None
+        with self._lock:
+            if data is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return data
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Atomically write an entry and evict if over the size limit."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                Path(temp_path).replace(path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(temp_path).unlink()
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry: {e}")
+            return
+
+        with self._lock:
+            self.stats.writes += 1
+            if self._size is not None:
+                self._size += len(data)
+            over_limit = self._size is None or self._size > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self.stats.evictions += 1
+            if self._size is not None:
+                self._size -= size
+
+    def get_completion(self, key: str) -> dict[str, Any] | None:
+        """Get a cached completion response.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Response JSON, or None on a miss.
+        """
+        data = self._read(self._path(key, COMPLETION_EXTENSION))
+        if data is None:
+            return None
+        try:
+            response: dict[str, Any] = json.loads(data)
+        except ValueError:
+            return None
+        return response
+
+    def put_completion(self, key: str, response: dict[str, Any]) -> None:
+        """Store a completion response.
+
+        Args:
+            key: Cache key.
+            response: Response JSON.
+        """
+        self._write(self._path(key, COMPLETION_EXTENSION), json.dumps(response).encode("utf-8"))
+
+    def get_stream(self, key: str) -> list[bytes] | None:
+        """Get the SSE data payloads of a cached stream.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Payloads in the order received, or None on a miss.
+        """
+        data = self._read(self._path(key, STREAM_EXTENSION))
+        return None if data is None else data.split(b"\n")
+
+    def put_stream(self, key: str, payloads: list[bytes]) -> None:
+        """Store the SSE data payloads of a complete stream.
+
+        Args:
+            key: Cache key.
+            payloads: Payloads in the order received (single-line JSON).
+        """
+        self._write(self._path(key, STREAM_EXTENSION), b"\n".join(payloads))
+
+    def _entries(self) -> list[tuple[float, float, int, Path]]:
+        """List entries as (last used, written, size, path) tuples."""
+        entries = []
+        for path in self.root.glob("??/*"):
+            if path.suffix not in (COMPLETION_EXTENSION, STREAM_EXTENSION):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Remove expired entries, then least recently used ones over the limit.
+
+        Returns:
+            Number of entries removed.
+        """
+        entries = sorted(self._entries())
+        now = time.time()
+        total = sum(size for _, _, size, _ in entries)
+        removed = 0
+        for _, mtime, size, path in entries:
+            expired = self.ttl is not None and now - mtime > self.ttl
+            if not expired and total <= self.max_bytes:
+                continue
+            self._remove(path)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._size = total
+        if removed:
+            logger.debug(f"Evicted {removed} response cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for _, _, _, path in self._entries():
+            with contextlib.suppress(OSError):
+                path.unlink()
+        with self._lock:
+            self._size = 0
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import random
 import threading
+import time
 import warnings
 import weakref
-from collections.abc import AsyncIterator
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 
@@ -23,16 +25,50 @@ from code_forge.llm.errors import (
     ProviderError,
     RateLimitError,
 )
+from code_forge.llm.latency import COMPLETION, LatencyTable
 from code_forge.llm.models import (
     CompletionRequest,
     CompletionResponse,
     StreamChunk,
     TokenUsage,
 )
-from code_forge.llm.routing import resolve_model_alias
+from code_forge.llm.routing import HedgeSettings, hedge_candidates, resolve_model_alias
+from code_forge.llm.sse import DONE, iter_sse_data, loads
+from code_forge.llm.transport import PooledTransport, PoolSettings
+
+if TYPE_CHECKING:
+    from code_forge.llm.cache import ResponseCache
 
 logger = get_logger("llm")
 
+T = TypeVar("T")
+
+
+class _OpenStream:
+    """Streaming response that has delivered its first data payload."""
+
+    def __init__(
+        self,
+        stack: contextlib.AsyncExitStack,
+        events: AsyncIterator[bytes],
+        first: bytes | None,
+    ) -> None:
+        self._stack = stack
+        self._events = events
+        self._first = first
+
+    async def iter_data(self) -> AsyncIterator[bytes]:
+        """Iterate over all SSE data payloads, starting with the first."""
+        if self._first is None:
+            return
+        yield self._first
+        async for data in self._events:
+            yield data
+
+    async def aclose(self) -> None:
+        """Close the response."""
+        await self._stack.aclose()
+
 
 class OpenRouterClient:
     """
@@ -41,6 +77,21 @@ class OpenRouterClient:
     Provides unified access to 400+ AI models through OpenRouter's
     OpenAI-compatible API interface.
 
+    Requests go through a connection pool shared by all clients on the
+    event loop, with HTTP/2 enabled, so concurrent clients (subagents,
+    workflow steps) reuse connections instead of each opening their own.
+
+    With hedging enabled, a streamed chat completion whose first byte is
+    slower than the model's observed p90 is raced against a backup request
+    to an alternate route, chosen by the per-model latency/error table.
+
+    Streaming responses are framed from raw bytes and decoded with orjson
+    when it is installed (see ``code_forge.llm.sse``).
+
+    With a response cache, completions and streams of cacheable requests
+    are stored on disk and replayed for identical requests without
+    calling the API (see ``code_forge.llm.cache``).
+
     IMPORTANT: This client manages HTTP connections that must be closed.
     Always use as an async context manager or call close() explicitly:
 
@@ -77,6 +128,12 @@ class OpenRouterClient:
         timeout: float = 120.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        *,
+        pool_settings: PoolSettings | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        hedging: HedgeSettings | None = None,
+        latency_table: LatencyTable | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialize OpenRouter client.
@@ -89,6 +146,12 @@ class OpenRouterClient:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             retry_delay: Initial delay between retries
+            pool_settings: Shared connection pool configuration
+            transport: Send requests through this transport instead of
+                the shared pool
+            hedging: Request hedging configuration (disabled by default)
+            latency_table: Per-model latency/error table; in-memory if None
+            response_cache: Replay identical requests from this cache
         """
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
@@ -100,6 +163,12 @@ class OpenRouterClient:
 
         self._client: httpx.AsyncClient | None = None
         self._closed = False
+        self._transport = PooledTransport(pool_settings, pool=transport)
+        self.hedging = hedging or HedgeSettings()
+        self.latency = latency_table or LatencyTable()
+        self._hedges = 0
+        self._hedge_wins = 0
+        self.response_cache = response_cache
 
         # Usage tracking (protected by lock for thread safety)
         # NOTE: threading.Lock is intentional here - quick counter updates don't
@@ -108,6 +177,8 @@ class OpenRouterClient:
         self._usage_lock = threading.Lock()
         self._total_prompt_tokens = 0
         self._total_completion_tokens = 0
+        self._total_cached_tokens = 0
+        self._total_cache_write_tokens = 0
         self._total_requests = 0
 
         # Register for tracking
@@ -122,9 +193,33 @@ class OpenRouterClient:
                 base_url=self.base_url,
                 headers=self._get_headers(),
                 timeout=httpx.Timeout(self.timeout),
+                transport=self._transport,
             )
         return self._client
 
+    async def warmup(self, timeout: float = 10.0) -> bool:
+        """Open a connection to the API ahead of the first request.
+
+        Completes the TCP and TLS handshakes (and HTTP/2 negotiation) so
+        the first completion does not pay for them. Intended to run in
+        the background during startup.
+
+        Args:
+            timeout: Maximum seconds to wait for the connection.
+
+        Returns:
+            True if the API responded, False on any error.
+        """
+        try:
+            client = await self._get_client()
+            # Any response will do; HEAD on /models has no body
+            await client.head("/models", timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Connection warmup failed: {e}")
+            return False
+        self._transport.record_warmup()
+        return True
+
     def _get_headers(self) -> dict[str, str]:
         """Get request headers."""
         return {
@@ -156,17 +251,23 @@ class OpenRouterClient:
 
         logger.debug(f"Completion request: model={request.model}")
 
+        cache = self.response_cache
+        cache_key = cache.key(payload) if cache is not None else None
+        if cache is not None and cache_key is not None:
+            cached = cache.get_completion(cache_key)
+            if cached is not None:
+                logger.debug("Completion replayed from response cache")
+                return CompletionResponse.from_dict(cached)
+
         response_data = await self._make_request(
             client, "POST", "/chat/completions", payload
         )
 
         response = CompletionResponse.from_dict(response_data)
+        if cache is not None and cache_key is not None:
+            cache.put_completion(cache_key, response_data)
 
-        # Track usage (thread-safe)
-        with self._usage_lock:
-            self._total_prompt_tokens += response.usage.prompt_tokens
-            self._total_completion_tokens += response.usage.completion_tokens
-            self._total_requests += 1
+        self._add_usage(response.usage)
 
         logger.debug(f"Completion response: tokens={response.usage.total_tokens}")
 
@@ -194,55 +295,64 @@ class OpenRouterClient:
 
         logger.debug(f"Streaming request: model={request.model}")
 
-        async with client.stream("POST", "/chat/completions", json=payload) as response:
-            await self._check_response(response)
-
+        cache = self.response_cache
+        cache_key = cache.key(payload) if cache is not None else None
+        if cache is not None and cache_key is not None:
+            replay = cache.get_stream(cache_key)
+            if replay is not None:
+                logger.debug("Stream replayed from response cache")
+                for data in replay:
+                    yield StreamChunk.from_dict(loads(data))
+                return
+        # Payloads of a stream being recorded for the cache
+        recorded: list[bytes] | None = [] if cache_key is not None else None
+        completed = False
+
+        opened = await self._hedge(
+            request.model,
+            lambda model: self._open_stream(client, {**payload, "model": model}),
+            discard=lambda stream: stream.aclose(),
+        )
+        try:
             # Track streaming stats for error detection
             chunks_received = 0
             parse_errors = 0
 
             # Track per-stream usage (take LAST value, not cumulative)
             # Some providers send usage on every chunk with cumulative values
-            stream_prompt_tokens = 0
-            stream_completion_tokens = 0
-
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                if line.startswith("data: "):
-                    data = line[6:]
-                    if data == "[DONE]":
-                        break
-                    try:
-                        chunk_data = json.loads(data)
-                        chunk = StreamChunk.from_dict(chunk_data)
-                        chunks_received += 1
-
-                        # Track usage - REPLACE (not add) to get final value
-                        if chunk.usage:
-                            stream_prompt_tokens = chunk.usage.prompt_tokens
-                            stream_completion_tokens = chunk.usage.completion_tokens
-
-                        yield chunk
-                    except json.JSONDecodeError as e:
-                        parse_errors += 1
-                        logger.warning(
-                            f"Failed to parse streaming chunk {chunks_received + parse_errors}: "
-                            f"{e} - data: {data[:100]}..."
-                        )
-                    except (KeyError, TypeError) as e:
-                        parse_errors += 1
-                        logger.warning(
-                            f"Invalid chunk structure at position {chunks_received + parse_errors}: "
-                            f"{e} - data: {data[:100]}..."
-                        )
+            stream_usage: TokenUsage | None = None
+
+            async for data in opened.iter_data():
+                if data == DONE:
+                    completed = True
+                    break
+                try:
+                    chunk = StreamChunk.from_dict(loads(data))
+                    chunks_received += 1
+                    if recorded is not None:
+                        recorded.append(data)
+
+                    # Track usage - REPLACE (not add) to get final value
+                    if chunk.usage:
+                        stream_usage = chunk.usage
+
+                    yield chunk
+                except json.JSONDecodeError as e:
+                    parse_errors += 1
+                    logger.warning(
+                        f"Failed to parse streaming chunk {chunks_received + parse_errors}: "
+                        f"{e} - data: {data[:100]!r}..."
+                    )
+                except (KeyError, TypeError) as e:
+                    parse_errors += 1
+                    logger.warning(
+                        f"Invalid chunk structure at position {chunks_received + parse_errors}: "
+                        f"{e} - data: {data[:100]!r}..."
+                    )
 
             # Add this stream's final usage to cumulative totals (thread-safe)
-            if stream_prompt_tokens > 0 or stream_completion_tokens > 0:
-                with self._usage_lock:
-                    self._total_prompt_tokens += stream_prompt_tokens
-                    self._total_completion_tokens += stream_completion_tokens
-                    self._total_requests += 1
+            if stream_usage and (stream_usage.prompt_tokens or stream_usage.completion_tokens):
+                self._add_usage(stream_usage)
 
             # Log summary if there were errors (visible indicator of incomplete stream)
             if parse_errors > 0:
@@ -253,6 +363,54 @@ class OpenRouterClient:
                     f"Response may be incomplete. Received {chunks_received} valid chunks."
                 )
 
+            # Only complete, cleanly parsed streams are replayable
+            if (
+                cache is not None
+                and cache_key is not None
+                and recorded
+                and completed
+                and not parse_errors
+            ):
+                cache.put_stream(cache_key, recorded)
+        finally:
+            await opened.aclose()
+
+    async def _open_stream(self, client: httpx.AsyncClient, payload: dict[str, Any]) -> _OpenStream:
+        """
+        Start a streaming request and wait for its first data payload.
+
+        Args:
+            client: HTTP client
+            payload: Request payload
+
+        Returns:
+            The open stream
+
+        Raises:
+            LLMError: On API errors
+        """
+        model = payload["model"]
+        start = time.monotonic()
+        stack = contextlib.AsyncExitStack()
+        try:
+            response = await stack.enter_async_context(
+                client.stream("POST", "/chat/completions", json=payload)
+            )
+            await self._check_response(response)
+            # Keep-alive comments sent while the provider is queued are skipped
+            events = iter_sse_data(response.aiter_bytes())
+            first = await anext(events, None)
+        except asyncio.CancelledError:
+            # A loser of a hedge race is recorded by _hedge as a lower bound
+            await stack.aclose()
+            raise
+        except BaseException:
+            await stack.aclose()
+            self.latency.record(model, None, ok=False)
+            raise
+        self.latency.record(model, time.monotonic() - start, ok=True)
+        return _OpenStream(stack, events, first)
+
     async def list_models(self) -> list[dict[str, Any]]:
         """
         List available models.
@@ -298,8 +456,13 @@ class OpenRouterClient:
 
         for attempt in range(self.max_retries):
             try:
-                response = await client.request(method, path, json=payload)
-                await self._check_response(response)
+                # Not hedged: without a first byte to wait for, a slow
+                # response cannot be told from a long one
+                if isinstance(payload.get("model"), str):
+                    response = await self._send(client, method, path, payload)
+                else:
+                    response = await client.request(method, path, json=payload)
+                    await self._check_response(response)
                 result: dict[str, Any] = response.json()
                 return result
 
@@ -331,6 +494,148 @@ class OpenRouterClient:
 
         raise last_error or LLMError("Request failed after retries")
 
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        payload: dict[str, Any],
+    ) -> httpx.Response:
+        """
+        Send one model request and record its latency.
+
+        Args:
+            client: HTTP client
+            method: HTTP method
+            path: API path
+            payload: Request payload with a model
+
+        Returns:
+            Successful response
+
+        Raises:
+            LLMError: On API errors
+            httpx.HTTPError: On transport errors
+        """
+        start = time.monotonic()
+        try:
+            response = await client.request(method, path, json=payload)
+            await self._check_response(response)
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            self.latency.record(payload["model"], None, ok=False, series=COMPLETION)
+            raise
+        self.latency.record(
+            payload["model"], time.monotonic() - start, ok=True, series=COMPLETION
+        )
+        return response
+
+    async def _hedge(
+        self,
+        model: str,
+        attempt: Callable[[str], Awaitable[T]],
+        discard: Callable[[T], Awaitable[None]] | None = None,
+    ) -> T:
+        """
+        Run a request, hedging with an alternate model if it is slow.
+
+        Without hedging, enough latency samples or an alternate, this is
+        just ``await attempt(model)``.
+
+        Args:
+            model: Primary model ID
+            attempt: Sends the request to a given model
+            discard: Releases the result of a request that lost the race
+
+        Returns:
+            Result of the first request to succeed
+
+        Raises:
+            Exception: The first error, if every request failed
+        """
+        settings = self.hedging
+        delay = None
+        alternate = None
+        if settings.enabled:
+            delay = self.latency.hedge_delay(
+                model, settings.percentile, settings.min_samples, settings.min_delay
+            )
+            candidates = hedge_candidates(model, settings.alternates)
+            if candidates:
+                alternate = self.latency.rank(candidates)[0]
+        if delay is None or alternate is None:
+            return await attempt(model)
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(attempt(model))
+        tasks = {primary}
+        winner: asyncio.Future[T] | None = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                logger.debug(
+                    f"No response from {model} after {delay:.1f}s, hedging with {alternate}"
+                )
+                tasks.add(asyncio.ensure_future(attempt(alternate)))
+                with self._usage_lock:
+                    self._hedges += 1
+
+            error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and winner is None:
+                        winner = task
+                    elif task.exception() is not None and error is None:
+                        error = task.exception()
+                if winner is not None:
+                    break
+            if winner is None:
+                raise error or LLMError("Hedged request failed")
+            if winner is not primary:
+                with self._usage_lock:
+                    self._hedge_wins += 1
+            return winner.result()
+        finally:
+            elapsed = time.monotonic() - started
+            for task in tasks:
+                if task is not winner:
+                    task.cancel()
+            for task in tasks:
+                if task is winner:
+                    continue
+                with contextlib.suppress(BaseException):
+                    result = await task
+                    if discard is not None:
+                        await discard(result)
+            if len(tasks) > 1 and primary.cancelled():
+                # The primary lost the race: its first byte took at least this
+                # long, and dropping the sample would pull the percentile down
+                self.latency.record_censored(model, max(elapsed, delay))
+
+    def get_response_cache_stats(self) -> dict[str, Any]:
+        """Get response cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, writes, evictions and hit_rate;
+            empty without a response cache.
+        """
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.stats.to_dict()
+
+    def get_hedge_stats(self) -> dict[str, int]:
+        """Get hedging statistics (thread-safe).
+
+        Returns:
+            Dictionary with hedges (backup requests sent) and wins
+            (backups that answered first).
+        """
+        with self._usage_lock:
+            return {"hedges": self._hedges, "wins": self._hedge_wins}
+
     async def _check_response(self, response: httpx.Response) -> None:
         """
         Check response for errors.
@@ -376,6 +681,15 @@ class OpenRouterClient:
         else:
             raise ProviderError(error_msg)
 
+    def _add_usage(self, usage: TokenUsage) -> None:
+        """Add a request's usage to the cumulative totals (thread-safe)."""
+        with self._usage_lock:
+            self._total_prompt_tokens += usage.prompt_tokens
+            self._total_completion_tokens += usage.completion_tokens
+            self._total_cached_tokens += usage.cached_tokens
+            self._total_cache_write_tokens += usage.cache_write_tokens
+            self._total_requests += 1
+
     def get_usage(self) -> TokenUsage:
         """Get cumulative token usage (thread-safe)."""
         with self._usage_lock:
@@ -383,17 +697,48 @@ class OpenRouterClient:
                 prompt_tokens=self._total_prompt_tokens,
                 completion_tokens=self._total_completion_tokens,
                 total_tokens=self._total_prompt_tokens + self._total_completion_tokens,
+                cached_tokens=self._total_cached_tokens,
+                cache_write_tokens=self._total_cache_write_tokens,
             )
 
+    def get_cache_stats(self) -> dict[str, float]:
+        """Get cumulative provider prompt cache statistics (thread-safe).
+
+        Returns:
+            Dictionary with cached_tokens, cache_write_tokens, prompt_tokens
+            and hit_rate_percent.
+        """
+        with self._usage_lock:
+            prompt = self._total_prompt_tokens
+            cached = self._total_cached_tokens
+            return {
+                "cached_tokens": cached,
+                "cache_write_tokens": self._total_cache_write_tokens,
+                "prompt_tokens": prompt,
+                "hit_rate_percent": (cached / prompt * 100) if prompt else 0.0,
+            }
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """Get connection reuse statistics of this client.
+
+        Returns:
+            Dictionary with requests, new_connections, reused_connections,
+            http2_requests, connect_ms, warmups and reuse_rate.
+        """
+        return self._transport.stats.to_dict()
+
     def reset_usage(self) -> None:
         """Reset usage counters (thread-safe)."""
         with self._usage_lock:
             self._total_prompt_tokens = 0
             self._total_completion_tokens = 0
+            self._total_cached_tokens = 0
+            self._total_cache_write_tokens = 0
             self._total_requests = 0
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and save latency statistics."""
+        self.latency.save_if_due(force=True)
         if self._client and not self._closed:
             await self._client.aclose()
             self._client = None
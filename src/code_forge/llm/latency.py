@@ -0,0 +1,290 @@
+"""Per-model latency and error statistics.
+
+The table keeps a rolling window of recent latency samples and outcomes
+for every model (including route variants, which are served by different
+providers). Streamed requests record time to first byte and non-streamed
+ones the time to the whole response, in separate series so one never
+skews the percentiles of the other. It is persisted across sessions so
+hedging and routing decisions start from what was observed before, and
+is used to decide when to hedge a request and which alternate to hedge
+with.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from code_forge.core.logging import get_logger
+
+logger = get_logger("llm")
+
+# Latency series: time to first byte of a stream, time to a full response
+TTFB = "ttfb"
+COMPLETION = "completion"
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of unsorted samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class ModelLatency:
+    """Rolling statistics of one model.
+
+    Attributes:
+        samples: Recent latency samples in seconds.
+        outcomes: Recent request outcomes (True for success).
+    """
+
+    window: int = 50
+    samples: deque[float] = field(default_factory=deque)
+    outcomes: deque[bool] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        self.samples = deque(self.samples, maxlen=self.window)
+        self.outcomes = deque(self.outcomes, maxlen=self.window)
+
+    def percentile(self, q: float) -> float | None:
+        """Get a latency percentile, or None without samples."""
+        if not self.samples:
+            return None
+        return _percentile(list(self.samples), q)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of recent requests that failed."""
+        if not self.outcomes:
+            return 0.0
+        return sum(not ok for ok in self.outcomes) / len(self.outcomes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "samples": [round(s, 4) for s in self.samples],
+            "outcomes": [int(ok) for ok in self.outcomes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], window: int) -> ModelLatency:
+        """Create from dictionary."""
+        return cls(
+            window=window,
+            samples=deque(float(s) for s in data.get("samples", [])),
+            outcomes=deque(bool(ok) for ok in data.get("outcomes", [])),
+        )
+
+
+class LatencyTable:
+    """Rolling per-model latency and error table, persisted as JSON.
+
+    Statistics are kept per model and series (``TTFB`` or ``COMPLETION``).
+    Thread-safe.
+    """
+
+    DEFAULT_FILE_NAME = "llm_latency.json"
+    VERSION = 2
+    # Minimum seconds between writes of the table
+    SAVE_INTERVAL = 30.0
+
+    def __init__(self, path: Path | None = None, window: int = 50) -> None:
+        """Initialize table, loading saved statistics.
+
+        Args:
+            path: File to persist to. None keeps the table in memory.
+            window: Samples and outcomes kept per model.
+        """
+        self.path = path
+        self.window = window
+        self._models: dict[tuple[str, str], ModelLatency] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    @classmethod
+    def get_default_path(cls) -> Path:
+        """Get the default table location.
+
+        Returns:
+            Path under the forge data directory.
+        """
+        # Use XDG_DATA_HOME if available, else ~/.local/share
+        xdg_data = os.environ.get("XDG_DATA_HOME")
+        base = Path(xdg_data) if xdg_data else Path.home() / ".local" / "share"
+        return base / "forge" / cls.DEFAULT_FILE_NAME
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            # Version 1 tables mixed both series and are not reused
+            if data.get("version") != self.VERSION:
+                return
+            self._models = {
+                (model, series): ModelLatency.from_dict(stats, self.window)
+                for model, by_series in data.get("models", {}).items()
+                for series, stats in by_series.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable latency table {self.path}: {e}")
+
+    def record(
+        self, model: str, seconds: float | None, ok: bool, series: str = TTFB
+    ) -> None:
+        """Record a request outcome.
+
+        Args:
+            model: Model ID, including any route variant.
+            seconds: Latency of the request, or None if it failed first.
+            ok: Whether the request succeeded.
+            series: What ``seconds`` measures (``TTFB`` or ``COMPLETION``).
+        """
+        key = (model, series)
+        with self._lock:
+            stats = self._models.get(key)
+            if stats is None:
+                stats = self._models[key] = ModelLatency(window=self.window)
+            if seconds is not None:
+                stats.samples.append(seconds)
+            stats.outcomes.append(ok)
+            self._dirty = True
+        self.save_if_due()
+
+    def record_censored(self, model: str, seconds: float, series: str = TTFB) -> None:
+        """Record a request cancelled before it completed.
+
+        The request took at least ``seconds``. Keeping that lower bound as
+        a sample stops slow requests that lose a hedge race from dropping
+        out of the percentiles. No outcome is recorded.
+
+        Args:
+            model: Model ID, including any route variant.
+            seconds: Time the request ran before it was cancelled.
+            series: What ``seconds`` measures (``TTFB`` or ``COMPLETION``).
+        """
+        key = (model, series)
+        with self._lock:
+            stats = self._models.get(key)
+            if stats is None:
+                stats = self._models[key] = ModelLatency(window=self.window)
+            stats.samples.append(seconds)
+            self._dirty = True
+        self.save_if_due()
+
+    def get(self, model: str, series: str = TTFB) -> ModelLatency | None:
+        """Get the statistics of a model in one series."""
+        with self._lock:
+            return self._models.get((model, series))
+
+    def hedge_delay(
+        self, model: str, q: float, min_samples: int, floor: float
+    ) -> float | None:
+        """Get how long to wait for a first byte before hedging.
+
+        Only time-to-first-byte samples are used.
+
+        Args:
+            model: Model ID.
+            q: Latency percentile to wait for.
+            min_samples: Samples needed before hedging.
+            floor: Minimum delay in seconds.
+
+        Returns:
+            Delay in seconds, or None if there are too few samples.
+        """
+        with self._lock:
+            stats = self._models.get((model, TTFB))
+            if stats is None or len(stats.samples) < min_samples:
+                return None
+            value = stats.percentile(q)
+        return None if value is None else max(value, floor)
+
+    def score(self, model: str) -> float:
+        """Get the expected cost of sending a request to a model.
+
+        Median time to first byte inflated by the error rate; models
+        without samples score 0 so they get tried.
+
+        Args:
+            model: Model ID.
+
+        Returns:
+            Score in seconds, lower is better.
+        """
+        with self._lock:
+            stats = self._models.get((model, TTFB))
+            if stats is None:
+                return 0.0
+            median = stats.percentile(0.5) or 0.0
+            return median / max(1.0 - stats.error_rate, 0.05)
+
+    def rank(self, models: list[str]) -> list[str]:
+        """Order models from best to worst score.
+
+        Args:
+            models: Candidate model IDs.
+
+        Returns:
+            Models sorted by score (stable for ties).
+        """
+        return sorted(models, key=self.score)
+
+    def to_dict(self, series: str = TTFB) -> dict[str, dict[str, Any]]:
+        """Summarize one series of the table for display."""
+        with self._lock:
+            return {
+                model: {
+                    "requests": len(stats.outcomes),
+                    "p50": stats.percentile(0.5),
+                    "p90": stats.percentile(0.9),
+                    "error_rate": stats.error_rate,
+                }
+                for (model, kind), stats in self._models.items()
+                if kind == series
+            }
+
+    def save_if_due(self, force: bool = False) -> None:
+        """Write the table if it changed and the save interval has passed.
+
+        Args:
+            force: Ignore the save interval.
+        """
+        if self.path is None or not self._dirty:
+            return
+        if not force and time.monotonic() - self._last_save < self.SAVE_INTERVAL:
+            return
+
+        with self._lock:
+            models: dict[str, dict[str, Any]] = {}
+            for (model, series), stats in self._models.items():
+                models.setdefault(model, {})[series] = stats.to_dict()
+            data = json.dumps({"version": self.VERSION, "models": models})
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(data)
+                Path(temp_path).replace(self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(temp_path).unlink()
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save latency table: {e}")
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Anthropic accepts at most four cache breakpoints per request.
+MAX_CACHE_BREAKPOINTS = 4
+
 
 class MessageRole(str, Enum):
     """Role of a message in conversation."""
@@ -26,13 +29,18 @@ class ContentPart:
     type: str  # "text" or "image_url"
     text: str | None = None
     image_url: dict[str, str] | None = None
+    cache_control: dict[str, str] | None = None  # Prompt cache breakpoint
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to API format."""
+        part: dict[str, Any]
         if self.type == "text":
-            return {"type": "text", "text": self.text}
+            part = {"type": "text", "text": self.text}
         else:
-            return {"type": "image_url", "image_url": self.image_url}
+            part = {"type": "image_url", "image_url": self.image_url}
+        if self.cache_control:
+            part["cache_control"] = self.cache_control
+        return part
 
 
 @dataclass
@@ -70,15 +78,33 @@ class Message:
     name: str | None = None
     tool_call_id: str | None = None
     tool_calls: list[ToolCall] | None = None
+    cache_control: bool = False  # Mark as prompt cache breakpoint
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to API format."""
+        """Convert to API format.
+
+        Messages marked with cache_control are emitted with content parts,
+        the last of which carries an ephemeral cache_control marker.
+        """
         msg: dict[str, Any] = {"role": self.role.value}
 
-        if isinstance(self.content, str):
+        if isinstance(self.content, str) and self.cache_control and self.content:
+            msg["content"] = [
+                {
+                    "type": "text",
+                    "text": self.content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        elif isinstance(self.content, str):
             msg["content"] = self.content
         elif isinstance(self.content, list):
-            msg["content"] = [p.to_dict() for p in self.content]
+            # Content from from_dict() is still in API format
+            msg["content"] = [
+                p.to_dict() if isinstance(p, ContentPart) else dict(p) for p in self.content
+            ]
+            if self.cache_control and msg["content"]:
+                msg["content"][-1]["cache_control"] = {"type": "ephemeral"}
         elif self.content is None and self.tool_calls:
             msg["content"] = None
         elif self.content is None:
@@ -184,12 +210,29 @@ class CompletionRequest:
     # OpenRouter-specific
     transforms: list[str] | None = None
     route: str | None = None
+    # Emit cache_control breakpoints for provider prompt caching
+    prompt_caching: bool = False
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to API payload."""
+        """Convert to API payload.
+
+        With prompt_caching enabled, cache breakpoints are placed on the
+        tool definitions, the last system message, any messages explicitly
+        marked with cache_control and the final message, keeping the
+        latest MAX_CACHE_BREAKPOINTS of them. With it disabled, no
+        cache_control markers are sent, including ones already present
+        in content parts.
+        """
+        tools_breakpoint = False
+        if self.prompt_caching:
+            messages, tools_breakpoint = self._apply_cache_breakpoints()
+            message_dicts = [m.to_dict() for m in messages]
+        else:
+            message_dicts = self._messages_without_cache_control()
+
         payload: dict[str, Any] = {
             "model": self.model,
-            "messages": [m.to_dict() for m in self.messages],
+            "messages": message_dicts,
             "temperature": self.temperature,
             "stream": self.stream,
         }
@@ -198,6 +241,11 @@ class CompletionRequest:
             payload["tools"] = [
                 t.to_dict() if hasattr(t, "to_dict") else t for t in self.tools
             ]
+            if tools_breakpoint:
+                payload["tools"][-1] = {
+                    **payload["tools"][-1],
+                    "cache_control": {"type": "ephemeral"},
+                }
         if self.tool_choice:
             payload["tool_choice"] = self.tool_choice
         if self.max_tokens:
@@ -217,22 +265,77 @@ class CompletionRequest:
 
         return payload
 
+    def _apply_cache_breakpoints(self) -> tuple[list[Message], bool]:
+        """Choose prompt cache breakpoints for this request.
 
-@dataclass
+        Returns:
+            Tuple of (messages with cache_control set, whether the tool
+            definitions get a breakpoint).
+        """
+        breakpoints = {i for i, m in enumerate(self.messages) if m.cache_control}
+        system_indices = [
+            i for i, m in enumerate(self.messages) if m.role == MessageRole.SYSTEM
+        ]
+        if system_indices:
+            breakpoints.add(system_indices[-1])
+        if self.messages:
+            breakpoints.add(len(self.messages) - 1)
+
+        # Tools precede messages in the provider's cache prefix order
+        budget = MAX_CACHE_BREAKPOINTS - (1 if self.tools else 0)
+        selected = set(sorted(breakpoints)[-budget:]) if budget > 0 else set()
+
+        messages: list[Message] = []
+        for i, msg in enumerate(self.messages):
+            marked = i in selected
+            messages.append(
+                replace(msg, cache_control=marked) if msg.cache_control != marked else msg
+            )
+        return messages, bool(self.tools)
+
+    def _messages_without_cache_control(self) -> list[dict[str, Any]]:
+        """Serialize messages with every cache_control marker removed."""
+        message_dicts = []
+        for msg in self.messages:
+            data = replace(msg, cache_control=False).to_dict()
+            if isinstance(data["content"], list):
+                for part in data["content"]:
+                    part.pop("cache_control", None)
+            message_dicts.append(data)
+        return message_dicts
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage statistics."""
 
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    cached_tokens: int = 0  # Prompt tokens read from provider cache
+    cache_write_tokens: int = 0  # Prompt tokens written to provider cache
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TokenUsage:
-        """Create from API response."""
+        """Create from API response.
+
+        Cached token counts are read from the OpenAI-style
+        ``prompt_tokens_details`` or Anthropic-style ``cache_*_input_tokens``
+        fields, whichever the provider sends.
+        """
+        details = data.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens") or data.get("cache_read_input_tokens") or 0
+        cache_write = (
+            details.get("cache_write_tokens")
+            or data.get("cache_creation_input_tokens")
+            or 0
+        )
         return cls(
             prompt_tokens=data.get("prompt_tokens", 0),
             completion_tokens=data.get("completion_tokens", 0),
             total_tokens=data.get("total_tokens", 0),
+            cached_tokens=cached,
+            cache_write_tokens=cache_write,
         )
 
 
@@ -278,7 +381,7 @@ class CompletionResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamDelta:
     """Delta in a streaming chunk."""
 
@@ -321,7 +424,7 @@ class StreamDelta:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """A chunk from streaming response."""
 
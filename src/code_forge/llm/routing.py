@@ -1,5 +1,6 @@
 """Model routing and variants for OpenRouter."""
 
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -54,6 +55,56 @@ def parse_model_id(model_id: str) -> tuple[str, RouteVariant | None]:
     return model_id, None
 
 
+@dataclass(frozen=True)
+class HedgeSettings:
+    """Request hedging configuration.
+
+    When the first byte of a response has not arrived by the observed
+    latency percentile of the model, a backup request is sent to an
+    alternate route and whichever answers first is used.
+
+    Attributes:
+        enabled: Send hedged requests.
+        percentile: Latency percentile after which to hedge.
+        min_samples: Requests observed for a model before hedging it.
+        min_delay: Minimum seconds to wait before hedging.
+        alternates: Models to hedge with. Empty uses other route variants
+            of the same model (default and nitro providers).
+    """
+
+    enabled: bool = False
+    percentile: float = 0.9
+    min_samples: int = 20
+    min_delay: float = 1.0
+    alternates: tuple[str, ...] = ()
+
+
+def hedge_candidates(model_id: str, alternates: tuple[str, ...] = ()) -> list[str]:
+    """
+    Get the models a request for a model may be hedged with.
+
+    Args:
+        model_id: Model ID of the primary request
+        alternates: Configured alternates; defaults to route variants
+
+    Returns:
+        Candidate model IDs, excluding the primary
+
+    Example:
+        hedge_candidates("anthropic/claude-3-opus")
+        # Returns: ["anthropic/claude-3-opus:nitro"]
+    """
+    if alternates:
+        candidates = [resolve_model_alias(m) for m in alternates]
+    else:
+        base, variant = parse_model_id(model_id)
+        if variant not in (None, RouteVariant.NITRO):
+            # Other variants change behavior (web search, reasoning)
+            return []
+        candidates = [base, apply_variant(base, RouteVariant.NITRO)]
+    return [m for m in dict.fromkeys(candidates) if m != model_id]
+
+
 # Common model aliases
 MODEL_ALIASES: dict[str, str] = {
     # Claude models
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 from code_forge.llm.models import (
     Message,
@@ -12,26 +14,112 @@ from code_forge.llm.models import (
     ToolCall,
 )
 
+# Average characters per token used when no token counter is supplied
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count from character length.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Approximate token count.
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class _ToolCallBuffer:
+    """Accumulates one streamed tool call."""
+
+    id: str = ""
+    type: str = "function"
+    name: str = ""
+    argument_parts: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, str | dict[str, str]]:
+        """Convert to OpenAI tool call format."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "function": {
+                "name": self.name,
+                "arguments": "".join(self.argument_parts),
+            },
+        }
+
 
 @dataclass
 class StreamCollector:
     """
     Collects streaming chunks into a complete response.
 
+    Deltas are buffered in lists and joined once when ``content`` or
+    ``tool_calls`` is read, so collecting is linear in response size.
+    Output tokens are counted as deltas arrive; set ``max_output_tokens``
+    to stop consuming a stream once ``budget_exceeded`` turns true.
+
     Usage:
         collector = StreamCollector()
         async for chunk in client.stream(request):
-            collector.add_chunk(chunk)
-            print(collector.content, end="", flush=True)
+            new_text = collector.add_chunk(chunk)
+            if new_text:
+                print(new_text, end="", flush=True)
+            if collector.budget_exceeded:
+                break
         message = collector.get_message()
     """
 
-    content: str = ""
-    tool_calls: list[dict[str, str | dict[str, str]]] = field(default_factory=list)
     usage: TokenUsage | None = None
     model: str = ""
     finish_reason: str | None = None
+    max_output_tokens: int | None = None
+    token_counter: Callable[[str], int] | None = field(default=None, repr=False)
+    _content_parts: list[str] = field(default_factory=list, repr=False)
+    _content_cache: str | None = field(default=None, repr=False)
+    _tool_buffers: list[_ToolCallBuffer] = field(default_factory=list, repr=False)
     _tool_call_index: int = -1
+    _streamed_tokens: int = 0
+
+    @property
+    def content(self) -> str:
+        """Text content received so far."""
+        if self._content_cache is None:
+            self._content_cache = "".join(self._content_parts)
+            # Collapse the buffer so later reads and joins stay cheap
+            self._content_parts = [self._content_cache] if self._content_cache else []
+        return self._content_cache
+
+    @property
+    def tool_calls(self) -> list[dict[str, str | dict[str, str]]]:
+        """Tool calls received so far, in OpenAI dictionary format."""
+        return [buffer.to_dict() for buffer in self._tool_buffers]
+
+    @property
+    def output_tokens(self) -> int:
+        """Output tokens so far.
+
+        Uses the provider's completion token count once a usage chunk
+        has been received, otherwise the incremental estimate.
+        """
+        if self.usage is not None and self.usage.completion_tokens:
+            return self.usage.completion_tokens
+        return self._streamed_tokens
+
+    @property
+    def budget_exceeded(self) -> bool:
+        """Whether output tokens have reached ``max_output_tokens``."""
+        return (
+            self.max_output_tokens is not None
+            and self.output_tokens >= self.max_output_tokens
+        )
+
+    def _count(self, text: str) -> None:
+        """Add the tokens of a streamed delta to the running count."""
+        counter = self.token_counter or estimate_tokens
+        self._streamed_tokens += counter(text)
 
     def add_chunk(self, chunk: StreamChunk) -> str | None:
         """
@@ -68,43 +156,45 @@ class StreamCollector:
 
         # Handle content (validate delta has content attribute)
         if hasattr(delta, "content") and delta.content:
-            self.content += delta.content
+            self._content_parts.append(delta.content)
+            self._content_cache = None
+            self._count(delta.content)
             new_content = delta.content
 
         # Handle tool calls (validate delta has tool_calls attribute)
         if not hasattr(delta, "tool_calls") or not delta.tool_calls:
             return new_content
 
-        if delta.tool_calls:
-            for tc in delta.tool_calls:
-                index = tc.get("index", 0)
-
-                if index > self._tool_call_index:
-                    # New tool call
-                    self._tool_call_index = index
-                    self.tool_calls.append(
-                        {
-                            "id": tc.get("id", ""),
-                            "type": tc.get("type", "function"),
-                            "function": {
-                                "name": tc.get("function", {}).get("name", ""),
-                                "arguments": tc.get("function", {}).get("arguments", ""),
-                            },
-                        }
-                    )
-                elif self.tool_calls:
-                    # Continue existing tool call
-                    current = self.tool_calls[-1]
-                    func = tc.get("function", {})
-                    if "arguments" in func:
-                        current_func = current.get("function", {})
-                        if isinstance(current_func, dict):
-                            current_func["arguments"] = (
-                                current_func.get("arguments", "") + func["arguments"]
-                            )
+        for tc in delta.tool_calls:
+            self._add_tool_call_delta(tc)
 
         return new_content
 
+    def _add_tool_call_delta(self, tc: dict[str, Any]) -> None:
+        """Merge one tool call delta into the buffers."""
+        index = tc.get("index", 0)
+        func = tc.get("function") or {}
+        arguments = func.get("arguments") or ""
+
+        if index > self._tool_call_index:
+            # New tool call
+            self._tool_call_index = index
+            buffer = _ToolCallBuffer(
+                id=tc.get("id", ""),
+                type=tc.get("type", "function"),
+                name=func.get("name", ""),
+            )
+            self._tool_buffers.append(buffer)
+        elif self._tool_buffers:
+            # Continue existing tool call
+            buffer = self._tool_buffers[-1]
+        else:
+            return
+
+        if arguments:
+            buffer.argument_parts.append(arguments)
+            self._count(arguments)
+
     def get_message(self) -> Message:
         """
         Get the complete message.
@@ -113,19 +203,23 @@ class StreamCollector:
             Complete Message object
         """
         tool_calls = None
-        if self.tool_calls:
+        if self._tool_buffers:
             tool_calls = [
                 ToolCall(
-                    id=str(tc.get("id", "")),
-                    type=str(tc.get("type", "function")),
-                    function=tc.get("function", {}),  # type: ignore[arg-type]
+                    id=buffer.id,
+                    type=buffer.type,
+                    function={
+                        "name": buffer.name,
+                        "arguments": "".join(buffer.argument_parts),
+                    },
                 )
-                for tc in self.tool_calls
+                for buffer in self._tool_buffers
             ]
 
+        content = self.content
         return Message(
             role=MessageRole.ASSISTANT,
-            content=self.content if self.content else None,
+            content=content if content else None,
             tool_calls=tool_calls,
         )
 
@@ -0,0 +1,211 @@
+"""Shared HTTP transport for LLM clients.
+
+Every ``OpenRouterClient`` used to open its own connection pool, so each
+client (the main agent, subagents, workflow steps) paid its own TCP and
+TLS handshakes. Clients now share one HTTP/2 connection pool per event
+loop; HTTP/2 multiplexes concurrent requests over a single connection.
+
+Each client gets a ``PooledTransport`` handle on the shared pool. The
+handle records whether each request reused a connection, using
+httpcore's ``trace`` request extension, and closing it leaves the pool
+open for other clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from code_forge.core.logging import get_logger
+
+logger = get_logger("llm")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool configuration.
+
+    Attributes:
+        http2: Negotiate HTTP/2 (falls back to HTTP/1.1 if unavailable).
+        max_connections: Maximum open connections.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+    """
+
+    http2: bool = True
+    max_connections: int = 32
+    max_keepalive_connections: int = 16
+    keepalive_expiry: float = 120.0
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse statistics.
+
+    Attributes:
+        requests: Requests sent.
+        new_connections: Requests that opened a connection.
+        reused_connections: Requests sent on an open connection.
+        http2_requests: Requests sent over HTTP/2.
+        connect_ms: Total time spent in TCP connect and TLS handshakes.
+        warmups: Connections opened ahead of time by warmup().
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    http2_requests: int = 0
+    connect_ms: float = 0.0
+    warmups: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests that reused a connection."""
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {**dataclasses.asdict(self), "reuse_rate": self.reuse_rate}
+
+
+def _http2_available() -> bool:
+    """Check whether the h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Shared pools, per event loop (connections cannot move between loops)
+_pools: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[PoolSettings, httpx.AsyncHTTPTransport]
+] = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_shared_pool(settings: PoolSettings | None = None) -> httpx.AsyncHTTPTransport:
+    """Get the shared connection pool of the running event loop.
+
+    Args:
+        settings: Pool configuration. Uses defaults if None.
+
+    Returns:
+        The shared transport for these settings.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    settings = settings or PoolSettings()
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pools = _pools.setdefault(loop, {})
+        pool = pools.get(settings)
+        if pool is None:
+            http2 = settings.http2 and _http2_available()
+            if settings.http2 and not http2:
+                logger.debug("h2 not installed, using HTTP/1.1")
+            pool = httpx.AsyncHTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+            )
+            pools[settings] = pool
+        return pool
+
+
+async def close_shared_pools() -> None:
+    """Close the shared connection pools of the running event loop."""
+    with _pools_lock:
+        pools = _pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.aclose()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Per-client handle on a shared connection pool.
+
+    Records connection reuse for every request. Closing the handle does
+    not close the pool.
+    """
+
+    def __init__(
+        self,
+        settings: PoolSettings | None = None,
+        pool: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize transport handle.
+
+        Args:
+            settings: Settings of the shared pool to use.
+            pool: Transport to send requests through instead of the
+                shared pool (e.g. a mock transport in tests).
+        """
+        self.settings = settings or PoolSettings()
+        self.stats = ConnectionStats()
+        self._pool = pool
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> httpx.AsyncBaseTransport:
+        """The transport requests are sent through."""
+        return self._pool or get_shared_pool(self.settings)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request and record whether it opened a connection."""
+        connect_started: float | None = None
+        connect_ms = 0.0
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            nonlocal connect_started, connect_ms
+            if name == "connection.connect_tcp.started":
+                connect_started = time.perf_counter()
+            elif (
+                name in ("connection.connect_tcp.complete", "connection.start_tls.complete")
+                and connect_started is not None
+            ):
+                connect_ms = (time.perf_counter() - connect_started) * 1000
+            if outer_trace is not None:
+                await outer_trace(name, info)
+
+        request.extensions["trace"] = trace
+        response = await self.pool.handle_async_request(request)
+
+        new = connect_started is not None
+        http2 = response.extensions.get("http_version") == b"HTTP/2"
+        with self._lock:
+            self.stats.requests += 1
+            if new:
+                self.stats.new_connections += 1
+                self.stats.connect_ms += connect_ms
+            else:
+                self.stats.reused_connections += 1
+            if http2:
+                self.stats.http2_requests += 1
+
+        if new:
+            logger.debug(
+                f"{request.method} {request.url.path}: new connection ({connect_ms:.0f}ms connect)"
+            )
+        else:
+            logger.debug(f"{request.method} {request.url.path}: reused connection")
+        return response
+
+    def record_warmup(self) -> None:
+        """Count a connection opened by warmup."""
+        with self._lock:
+            self.stats.warmups += 1
+
+    async def aclose(self) -> None:
+        """Release the handle; the shared pool stays open."""
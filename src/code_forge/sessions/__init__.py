@@ -26,6 +26,7 @@ from .index import SessionIndex, SessionSummary
 from .manager import SessionManager
 from .models import Session, SessionMessage, ToolInvocation
 from .repository import SessionRepository
+from .sqlite_store import SessionSearchHit, SQLiteSessionRepository, SQLiteSessionStore
 from .storage import (
     SessionCorruptedError,
     SessionNotFoundError,
@@ -34,6 +35,8 @@ from .storage import (
 )
 
 __all__ = [
+    "SQLiteSessionRepository",
+    "SQLiteSessionStore",
     "Session",
     "SessionCorruptedError",
     "SessionIndex",
@@ -41,6 +44,7 @@ __all__ = [
     "SessionMessage",
     "SessionNotFoundError",
     "SessionRepository",
+    "SessionSearchHit",
     "SessionStorage",
     "SessionStorageError",
     "SessionSummary",
@@ -0,0 +1,301 @@
+"""Write-behind session auto-save.
+
+Saving a session serializes it and writes to disk, which is too slow to
+do on the event loop while a response is streaming. The saver here
+tracks whether a session changed since it was last saved, coalesces
+bursts of changes into one write, and performs the write on a worker
+thread against a copy-on-write snapshot of the session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .models import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SaveMetrics:
+    """Auto-save statistics.
+
+    Attributes:
+        saves: Writes completed.
+        failures: Writes that raised.
+        skipped_clean: Save requests skipped because nothing changed.
+        coalesced: Changes folded into a write with other changes.
+        last_ms: Duration of the last write.
+        max_ms: Longest write.
+        total_ms: Total write time.
+        snapshot_ms: Total time spent snapshotting on the caller's thread.
+    """
+
+    saves: int = 0
+    failures: int = 0
+    skipped_clean: int = 0
+    coalesced: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+    snapshot_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean write duration."""
+        return self.total_ms / self.saves if self.saves else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {**dataclasses.asdict(self), "mean_ms": self.mean_ms}
+
+
+def snapshot_session(session: Session) -> Session:
+    """Copy a session for saving on another thread.
+
+    Lists and dictionaries are copied so later appends on the owning
+    thread do not affect the snapshot. Messages and tool invocations are
+    shared, since they are not modified once added, and so is history a
+    lazy resume left on disk.
+
+    Args:
+        session: Session to copy.
+
+    Returns:
+        Snapshot of the session.
+    """
+    snapshot = dataclasses.replace(
+        session,
+        messages=list(session.messages),
+        tool_history=list(session.tool_history),
+        tags=list(session.tags),
+        metadata=dict(session.metadata),
+    )
+    snapshot._unloaded = session._unloaded
+    return snapshot
+
+
+def session_fingerprint(session: Session) -> tuple[Any, ...]:
+    """Cheap value that changes whenever a session is modified.
+
+    Session mutators update ``updated_at``; lengths and totals catch
+    direct list or field changes that bypass them.
+
+    Args:
+        session: The session.
+
+    Returns:
+        Fingerprint tuple.
+    """
+    return (
+        session.updated_at,
+        len(session.messages),
+        len(session.tool_history),
+        session.title,
+        session.total_prompt_tokens,
+        session.total_completion_tokens,
+        len(session.tags),
+    )
+
+
+class WriteBehindSaver:
+    """Coalescing background saver.
+
+    Changes are reported with ``mark_dirty``. A save is due once no
+    change arrived for ``delay`` seconds, or ``max_delay`` seconds after
+    the first unsaved change, so a steady stream of messages still gets
+    written regularly. Writes run one at a time on a worker thread.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Session], None],
+        delay: float = 2.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        """Initialize saver.
+
+        Args:
+            write: Persists a session snapshot; runs on the worker thread.
+            delay: Quiet period after the last change before saving.
+            max_delay: Maximum time a change stays unsaved.
+        """
+        self._write = write
+        self.delay = delay
+        self.max_delay = max_delay
+        self.metrics = SaveMetrics()
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-save")
+        self._lock = threading.Lock()
+        self._saved: dict[str, tuple[Any, ...]] = {}
+        self._first_change: dict[str, float] = {}
+        self._last_change: dict[str, float] = {}
+        self._changes: dict[str, int] = {}
+        self._inflight: Future[None] | None = None
+
+    def mark_dirty(self, session: Session) -> None:
+        """Record a change to a session.
+
+        Args:
+            session: The changed session.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._first_change.setdefault(session.id, now)
+            self._last_change[session.id] = now
+            self._changes[session.id] = self._changes.get(session.id, 0) + 1
+
+    def mark_saved(self, session: Session) -> None:
+        """Record that a session was saved outside the saver.
+
+        Args:
+            session: The saved session.
+        """
+        with self._lock:
+            self._saved[session.id] = session_fingerprint(session)
+            self._clear_changes(session.id)
+
+    def forget(self, session_id: str) -> None:
+        """Drop state for a session that is closed or deleted.
+
+        Args:
+            session_id: The session ID.
+        """
+        with self._lock:
+            self._saved.pop(session_id, None)
+            self._clear_changes(session_id)
+
+    def _clear_changes(self, session_id: str) -> None:
+        self._first_change.pop(session_id, None)
+        self._last_change.pop(session_id, None)
+        self._changes.pop(session_id, None)
+
+    def is_dirty(self, session: Session) -> bool:
+        """Check whether a session changed since it was last saved.
+
+        Args:
+            session: The session.
+
+        Returns:
+            True if the session has unsaved changes.
+        """
+        with self._lock:
+            return self._saved.get(session.id) != session_fingerprint(session)
+
+    def is_due(self, session: Session, now: float | None = None) -> bool:
+        """Check whether a save should start now.
+
+        Args:
+            session: The session.
+            now: Current monotonic time.
+
+        Returns:
+            True if changes are pending, settled or overdue, and no write
+            is in flight.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self._inflight is not None and not self._inflight.done():
+                return False
+            first = self._first_change.get(session.id)
+            if first is None:
+                # Changes not reported through mark_dirty
+                return self._saved.get(session.id) != session_fingerprint(session)
+            last = self._last_change[session.id]
+            return now - last >= self.delay or now - first >= self.max_delay
+
+    def submit(self, session: Session) -> Future[None] | None:
+        """Start saving a snapshot of a session on the worker thread.
+
+        Must be called from the thread that modifies the session.
+
+        Args:
+            session: The session to save.
+
+        Returns:
+            Future of the write, or None if the session is unchanged.
+        """
+        fingerprint = session_fingerprint(session)
+        with self._lock:
+            if self._saved.get(session.id) == fingerprint:
+                self.metrics.skipped_clean += 1
+                self._clear_changes(session.id)
+                return None
+
+            start = time.perf_counter()
+            snapshot = snapshot_session(session)
+            self.metrics.snapshot_ms += (time.perf_counter() - start) * 1000
+
+            changes = self._changes.get(session.id, 0)
+            if changes > 1:
+                self.metrics.coalesced += changes - 1
+            self._clear_changes(session.id)
+
+            future = self._executor.submit(self._run, snapshot, fingerprint)
+            self._inflight = future
+            return future
+
+    def _run(self, snapshot: Session, fingerprint: tuple[Any, ...]) -> None:
+        """Write a snapshot and record metrics (worker thread)."""
+        start = time.perf_counter()
+        try:
+            self._write(snapshot)
+        except Exception:
+            with self._lock:
+                self.metrics.failures += 1
+                # Retry on the next due check
+                self._first_change.setdefault(snapshot.id, time.monotonic())
+                self._last_change.setdefault(snapshot.id, time.monotonic())
+            raise
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._saved[snapshot.id] = fingerprint
+            self.metrics.saves += 1
+            self.metrics.last_ms = elapsed
+            self.metrics.max_ms = max(self.metrics.max_ms, elapsed)
+            self.metrics.total_ms += elapsed
+
+    async def save(self, session: Session) -> bool:
+        """Save a session off the event loop.
+
+        Args:
+            session: The session to save.
+
+        Returns:
+            True if a write happened, False if the session was unchanged.
+
+        Raises:
+            Exception: Whatever the write function raised.
+        """
+        future = self.submit(session)
+        if future is None:
+            return False
+        await asyncio.wrap_future(future)
+        return True
+
+    def wait(self) -> None:
+        """Block until the in-flight write, if any, has finished."""
+        with self._lock:
+            future = self._inflight
+        if future is None:
+            return
+        try:
+            future.result()
+        except Exception as e:
+            logger.debug(f"Background session save failed: {e}")
+
+    def close(self) -> None:
+        """Finish the in-flight write and stop the worker thread."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,285 @@
+"""Content-addressed blob store for large session payloads.
+
+Tool results and messages that exceed a size threshold are stored once,
+compressed, under their SHA-256 hash. The session file holds a small
+reference in their place:
+
+    {"__blob__": "<sha256 hex>", "length": <characters>}
+
+Identical payloads (the same file read ten times) share one blob, and
+blobs no session references any more are removed by ``collect_garbage``.
+
+A store belongs to one session storage directory, next to the sessions
+that reference it, so project-local storage (``.forge/sessions``) has its
+own store and the default directory one store shared by its sessions.
+
+Blobs are compressed with zstd when the optional ``zstandard`` package
+is installed (``pip install 'code-forge[compression]'``), otherwise with
+zlib. The codec is recorded in the file extension, so stores written
+with either codec stay readable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Key marking a blob reference in serialized sessions
+BLOB_KEY = "__blob__"
+
+ZSTD_EXTENSION = ".zst"
+ZLIB_EXTENSION = ".zz"
+
+# Finds references in raw session files without parsing them
+_REF_PATTERN = re.compile(rf'"{BLOB_KEY}":\s*"([0-9a-f]{{64}})"')
+
+
+def _zstd() -> Any:
+    """Get the zstandard module, or None if it is not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Check whether a value is a blob reference.
+
+    Args:
+        value: Any JSON value.
+
+    Returns:
+        True if the value is a blob reference dictionary.
+    """
+    return isinstance(value, dict) and isinstance(value.get(BLOB_KEY), str)
+
+
+class BlobStore:
+    """Compressed, content-addressed storage of large strings.
+
+    Blobs live in ``<root>/<first two hex digits>/<hash><ext>``.
+
+    Thread-safe: blobs are immutable and written atomically.
+    """
+
+    def __init__(self, root: Path, threshold: int | None = 16 * 1024) -> None:
+        """Initialize blob store.
+
+        Args:
+            root: Directory holding the blobs (created on first write).
+            threshold: Minimum string length, in characters, stored as
+                a blob. None stores nothing; existing blobs stay readable.
+        """
+        self.root = root
+        self.threshold = threshold
+        self._cache: dict[str, str] = {}
+
+    def _path(self, digest: str, extension: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{extension}"
+
+    def put(self, text: str) -> str:
+        """Store a string.
+
+        Args:
+            text: Content to store.
+
+        Returns:
+            Hex digest identifying the blob.
+
+        Raises:
+            OSError: If the blob cannot be written.
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        existing = self._find(digest)
+        if existing is not None:
+            # Referenced again: restart its garbage collection grace period
+            try:
+                os.utime(existing)
+                return digest
+            except OSError:
+                pass  # Rewrite it instead
+
+        zstd = _zstd()
+        if zstd is not None:
+            payload = zstd.ZstdCompressor(level=3).compress(data)
+            path = self._path(digest, ZSTD_EXTENSION)
+        else:
+            payload = zlib.compress(data, 6)
+            path = self._path(digest, ZLIB_EXTENSION)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            Path(temp_path).replace(path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                Path(temp_path).unlink()
+            raise
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Read a blob.
+
+        Args:
+            digest: Blob digest.
+
+        Returns:
+            Stored string.
+
+        Raises:
+            KeyError: If the blob does not exist.
+            OSError: If the blob cannot be read or decompressed.
+        """
+        cached = self._cache.get(digest)
+        if cached is not None:
+            return cached
+
+        path = self._find(digest)
+        if path is None:
+            raise KeyError(digest)
+
+        payload = path.read_bytes()
+        if path.suffix == ZSTD_EXTENSION:
+            zstd = _zstd()
+            if zstd is None:
+                raise OSError(
+                    f"Blob {digest[:12]} is zstd-compressed. "
+                    "Install with: pip install 'code-forge[compression]'"
+                )
+            data: bytes = zstd.ZstdDecompressor().decompress(payload)
+        else:
+            data = zlib.decompress(payload)
+        text = data.decode("utf-8")
+
+        # Small bounded cache: the same blob is often referenced many times
+        if len(self._cache) >= 64:
+            self._cache.clear()
+        self._cache[digest] = text
+        return text
+
+    def _find(self, digest: str) -> Path | None:
+        for extension in (ZSTD_EXTENSION, ZLIB_EXTENSION):
+            path = self._path(digest, extension)
+            if path.exists():
+                return path
+        return None
+
+    def externalize(self, value: Any) -> Any:
+        """Replace large strings in a JSON value with blob references.
+
+        Args:
+            value: Serialized message, tool invocation or session.
+
+        Returns:
+            Copy of the value with large strings moved to the store.
+        """
+        if self.threshold is None:
+            return value
+        if isinstance(value, str):
+            if len(value) < self.threshold:
+                return value
+            return {BLOB_KEY: self.put(value), "length": len(value)}
+        if isinstance(value, dict):
+            return {key: self.externalize(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.externalize(item) for item in value]
+        return value
+
+    def hydrate(self, value: Any) -> Any:
+        """Replace blob references in a JSON value with their content.
+
+        Args:
+            value: Value read from a session file.
+
+        Returns:
+            Value with references resolved.
+
+        Raises:
+            KeyError: If a referenced blob is missing.
+        """
+        if isinstance(value, dict):
+            if is_blob_ref(value):
+                return self.get(value[BLOB_KEY])
+            return {key: self.hydrate(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.hydrate(item) for item in value]
+        return value
+
+    def digests(self) -> list[str]:
+        """List stored blob digests."""
+        if not self.root.exists():
+            return []
+        return [
+            path.name.split(".", 1)[0]
+            for path in self.root.glob("??/*")
+            if path.suffix in (ZSTD_EXTENSION, ZLIB_EXTENSION)
+        ]
+
+    def collect_garbage(self, files: list[Path], grace_seconds: float = 3600.0) -> int:
+        """Remove blobs not referenced by any of the given files.
+
+        Blobs younger than ``grace_seconds`` are kept, since a concurrent
+        save may have written them before writing its session file.
+
+        Args:
+            files: Every file that may hold references (sessions,
+                journals, backups).
+            grace_seconds: Minimum age of a removed blob.
+
+        Returns:
+            Number of blobs removed.
+        """
+        if not self.root.exists():
+            return 0
+
+        referenced: set[str] = set()
+        for path in files:
+            try:
+                referenced.update(_REF_PATTERN.findall(path.read_text(encoding="utf-8")))
+            except (OSError, UnicodeDecodeError) as e:
+                # Keep everything rather than risk deleting live blobs
+                logger.warning(f"Skipping blob GC, cannot read {path.name}: {e}")
+                return 0
+
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for path in self.root.glob("??/*"):
+            digest = path.name.split(".", 1)[0]
+            if digest in referenced:
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove blob {path.name}: {e}")
+            self._cache.pop(digest, None)
+
+        if removed:
+            logger.info(f"Removed {removed} unreferenced blobs")
+        return removed
+
+    def get_size(self) -> int:
+        """Get the total size of stored blobs in bytes."""
+        if not self.root.exists():
+            return 0
+        total = 0
+        for path in self.root.glob("??/*"):
+            with contextlib.suppress(OSError):
+                total += path.stat().st_size
+        return total
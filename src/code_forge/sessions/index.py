@@ -5,6 +5,7 @@ from __future__ import annotations
 import builtins
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -13,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .models import Session
-    from .storage import SessionStorage
+    from .storage import FileSignature, SessionStorage
 
 # Alias builtins.list to avoid shadowing by method
 _list = builtins.list
@@ -108,10 +109,20 @@ class SessionIndex:
     Maintains an in-memory index backed by a JSON file for
     fast session listing without loading full session files.
 
+    Each entry records the file signature (mtime and size of the session
+    file and its journal) it was built from. ``refresh()`` compares these
+    against one directory scan and reloads only sessions that changed,
+    were added or were removed by another process.
+
+    The index is updated from the session saver's worker thread as well
+    as the caller's, so changes and writes hold ``_lock``.
+
     Attributes:
         storage: The SessionStorage instance.
         _index: In-memory index data.
+        _signatures: File signature each entry was built from.
         _dirty: Whether index needs to be saved.
+        _lock: Guards the index data against concurrent updates.
     """
 
     INDEX_FILE = "index.json"
@@ -126,8 +137,10 @@ class SessionIndex:
         """
         self.storage = storage
         self._index: dict[str, SessionSummary] = {}
+        self._signatures: dict[str, FileSignature] = {}
         self._dirty = False
         self._last_save_time: float = 0.0
+        self._lock = threading.RLock()
         self._load_index()
 
     @property
@@ -156,59 +169,126 @@ class SessionIndex:
                 summary_data["id"] = session_id
                 self._index[session_id] = SessionSummary.from_dict(summary_data)
 
+            # Entries without a signature are treated as changed by refresh()
+            for session_id, signature in data.get("signatures", {}).items():
+                if isinstance(signature, _list) and len(signature) == 4:
+                    self._signatures[session_id] = (
+                        int(signature[0]),
+                        int(signature[1]),
+                        int(signature[2]),
+                        int(signature[3]),
+                    )
+
             logger.debug(f"Loaded index with {len(self._index)} sessions")
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
             logger.warning(f"Failed to load index, rebuilding: {e}")
             self.rebuild()
 
     def _save_index(self) -> None:
         """Save index to disk."""
-        data = {
-            "version": self.INDEX_VERSION,
-            "sessions": {
-                sid: summary.to_dict() for sid, summary in self._index.items()
-            },
-        }
-
-        try:
-            with self.index_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            self._dirty = False
-            logger.debug(f"Saved index with {len(self._index)} sessions")
-        except OSError as e:
-            logger.error(f"Failed to save index: {e}")
+        with self._lock:
+            data = {
+                "version": self.INDEX_VERSION,
+                "sessions": {
+                    sid: summary.to_dict() for sid, summary in self._index.items()
+                },
+                "signatures": {
+                    sid: _list(signature) for sid, signature in self._signatures.items()
+                },
+            }
+
+            try:
+                with self.index_path.open("w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                self._dirty = False
+                logger.debug(f"Saved index with {len(self._index)} sessions")
+            except OSError as e:
+                logger.error(f"Failed to save index: {e}")
 
     def rebuild(self) -> None:
         """Rebuild the index from session files.
 
-        Reads all session files to create fresh index data.
+        Reads all session files to create fresh index data. Prefer
+        ``refresh()``, which only reads sessions that changed.
         Logs warnings for any corrupted sessions that cannot be loaded.
         """
-        self._index.clear()
+        with self._lock:
+            self._index.clear()
+            self._signatures.clear()
+            self._repair(self.storage.scan_signatures())
+
+            self._dirty = True
+            self._save_index()
+        logger.info(f"Rebuilt index with {len(self._index)} sessions")
+
+    def refresh(self) -> int:
+        """Bring the index in line with the session files on disk.
+
+        Compares the recorded file signatures with a directory scan and
+        reloads only sessions that were added or changed since they were
+        indexed; entries of deleted sessions are dropped.
+
+        Returns:
+            Number of index entries repaired.
+        """
+        signatures = self.storage.scan_signatures()
+
+        with self._lock:
+            removed = [
+                sid
+                for sid in set(self._index) | set(self._signatures)
+                if sid not in signatures
+            ]
+            for session_id in removed:
+                self._index.pop(session_id, None)
+                self._signatures.pop(session_id, None)
+
+            changed = {
+                sid: signature
+                for sid, signature in signatures.items()
+                if self._signatures.get(sid) != signature
+            }
+            self._repair(changed)
+
+            repaired = len(removed) + len(changed)
+            if repaired:
+                self._dirty = True
+                self.save_if_dirty(force=True)
+            logger.debug(f"Refreshed index, repaired {repaired} entries")
+        return repaired
+
+    def _repair(self, signatures: dict[str, FileSignature]) -> None:
+        """Reload the given sessions into the index.
+
+        Sessions are opened lazily, so only their metadata is read.
+
+        Args:
+            signatures: Signatures of the sessions to reload.
+        """
+        from .storage import SessionStorageError
+
         corrupted_count = 0
 
-        for session_id in self.storage.list_session_ids():
-            session = self.storage.load_or_none(session_id)
-            if session:
-                self._index[session_id] = SessionSummary.from_session(session)
+        for session_id, signature in signatures.items():
+            try:
+                summary = self.storage.open_lazy(session_id, tail=0).summary()
+            except SessionStorageError as e:
+                logger.warning(f"Failed to load session {session_id}: {e}")
+                summary = None
+            if summary:
+                self._index[session_id] = summary
             else:
                 # Session file exists but couldn't be loaded (corrupted)
+                self._index.pop(session_id, None)
                 corrupted_count += 1
-                logger.warning(
-                    f"Skipped corrupted session during rebuild: {session_id}"
-                )
-
-        self._dirty = True
-        self._save_index()
+                logger.warning(f"Skipped corrupted session in index: {session_id}")
+            # Recorded for corrupted sessions too, so they are only retried
+            # once the file changes again
+            self._signatures[session_id] = signature
 
         if corrupted_count > 0:
-            logger.warning(
-                f"Rebuilt index with {len(self._index)} sessions "
-                f"({corrupted_count} corrupted sessions skipped)"
-            )
-        else:
-            logger.info(f"Rebuilt index with {len(self._index)} sessions")
+            logger.warning(f"{corrupted_count} corrupted sessions skipped")
 
     def add(self, session: Session) -> None:
         """Add or update a session in the index.
@@ -216,8 +296,15 @@ class SessionIndex:
         Args:
             session: The session to add.
         """
-        self._index[session.id] = SessionSummary.from_session(session)
-        self._dirty = True
+        summary = SessionSummary.from_session(session)
+        signature = self.storage.file_signature(session.id)
+        with self._lock:
+            self._index[session.id] = summary
+            if signature is not None:
+                self._signatures[session.id] = signature
+            else:
+                self._signatures.pop(session.id, None)
+            self._dirty = True
 
     def update(self, session: Session) -> None:
         """Update a session in the index.
@@ -236,11 +323,13 @@ class SessionIndex:
         Returns:
             True if session was in index.
         """
-        if session_id in self._index:
-            del self._index[session_id]
-            self._dirty = True
-            return True
-        return False
+        with self._lock:
+            self._signatures.pop(session_id, None)
+            if session_id in self._index:
+                del self._index[session_id]
+                self._dirty = True
+                return True
+            return False
 
     def get(self, session_id: str) -> SessionSummary | None:
         """Get a session summary by ID.
@@ -287,7 +376,8 @@ class SessionIndex:
             List of SessionSummary objects.
         """
         # Filter sessions
-        summaries = _list(self._index.values())
+        with self._lock:
+            summaries = _list(self._index.values())
 
         if tags:
             summaries = [
@@ -349,23 +439,24 @@ class SessionIndex:
         Returns:
             True if index was saved, False if skipped.
         """
-        if not self._dirty:
-            return False
-
-        current_time = time.monotonic()
-        time_since_last = current_time - self._last_save_time
-
-        if not force and time_since_last < self.SAVE_DEBOUNCE_SECONDS:
-            logger.debug(
-                "Skipping index save (%.1fs since last save, debounce=%.1fs)",
-                time_since_last,
-                self.SAVE_DEBOUNCE_SECONDS,
-            )
-            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+
+            current_time = time.monotonic()
+            time_since_last = current_time - self._last_save_time
+
+            if not force and time_since_last < self.SAVE_DEBOUNCE_SECONDS:
+                logger.debug(
+                    "Skipping index save (%.1fs since last save, debounce=%.1fs)",
+                    time_since_last,
+                    self.SAVE_DEBOUNCE_SECONDS,
+                )
+                return False
 
-        self._save_index()
-        self._last_save_time = current_time
-        return True
+            self._save_index()
+            self._last_save_time = current_time
+            return True
 
     def force_save(self) -> bool:
         """Force save the index immediately, bypassing debounce.
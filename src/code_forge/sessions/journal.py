@@ -0,0 +1,311 @@
+"""Append-only session journal.
+
+Sessions grow by appending messages and tool invocations, so rewriting
+the whole session file on every save costs I/O proportional to the
+session size. The journal records only what changed since the last
+snapshot as JSON lines:
+
+    {"journal": "<generation>"}            header, hash of the snapshot
+    {"type": "message", "data": {...}}     appended SessionMessage
+    {"type": "tool", "data": {...}}        appended ToolInvocation
+    {"type": "meta", "data": {...}}        title/usage/tags/metadata update
+
+A session is loaded by reading the snapshot and replaying the journal
+whose generation matches the snapshot's content hash. A torn last line
+(crash mid-append) is ignored, so a crash never loses more than the write
+in flight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import Session
+
+logger = logging.getLogger(__name__)
+
+EVENT_MESSAGE = "message"
+EVENT_TOOL = "tool"
+EVENT_META = "meta"
+
+
+@dataclass
+class JournalState:
+    """What has been persisted for a session.
+
+    Attributes:
+        generation: Generation of the snapshot the journal belongs to.
+        message_count: Messages persisted (snapshot plus journal).
+        last_message_id: ID of the last persisted message.
+        tool_count: Tool invocations persisted.
+        last_tool_id: ID of the last persisted tool invocation.
+        meta: Serialized metadata as last persisted.
+        journal_size: Expected journal file size in bytes.
+        snapshot_size: Snapshot file size in bytes.
+    """
+
+    generation: str
+    message_count: int = 0
+    last_message_id: str | None = None
+    tool_count: int = 0
+    last_tool_id: str | None = None
+    meta: str = ""
+    journal_size: int = 0
+    snapshot_size: int = 0
+
+
+def snapshot_generation(snapshot: bytes) -> str:
+    """Get the generation of a snapshot.
+
+    The generation is a content hash, so a journal written for one
+    snapshot is never replayed onto another (e.g. after a crash between
+    snapshot and journal rewrite, or a recovery from backup).
+
+    Args:
+        snapshot: Snapshot file contents.
+
+    Returns:
+        Generation ID.
+    """
+    return hashlib.sha256(snapshot).hexdigest()[:32]
+
+
+def session_meta(session: Session) -> dict[str, Any]:
+    """Get the mutable scalar fields of a session.
+
+    Args:
+        session: The session.
+
+    Returns:
+        Dictionary of fields carried by meta events.
+    """
+    return {
+        "title": session.title,
+        "updated_at": session.updated_at.isoformat(),
+        "working_dir": session.working_dir,
+        "model": session.model,
+        "total_prompt_tokens": session.total_prompt_tokens,
+        "total_completion_tokens": session.total_completion_tokens,
+        "tags": session.tags,
+        "metadata": session.metadata,
+    }
+
+
+def dump_meta(session: Session) -> str:
+    """Serialize the meta fields of a session as kept in JournalState.
+
+    Args:
+        session: The session.
+
+    Returns:
+        Canonical JSON of ``session_meta(session)``.
+    """
+    return json.dumps(session_meta(session), sort_keys=True, ensure_ascii=False)
+
+
+def state_for(
+    session: Session,
+    generation: str,
+    journal_size: int,
+    snapshot_size: int,
+) -> JournalState:
+    """Build the journal state for a fully persisted session.
+
+    Args:
+        session: The session as persisted.
+        generation: Current generation.
+        journal_size: Journal file size in bytes.
+        snapshot_size: Snapshot file size in bytes.
+
+    Returns:
+        JournalState matching the session.
+    """
+    return JournalState(
+        generation=generation,
+        message_count=len(session.messages),
+        last_message_id=session.messages[-1].id if session.messages else None,
+        tool_count=len(session.tool_history),
+        last_tool_id=session.tool_history[-1].id if session.tool_history else None,
+        meta=dump_meta(session),
+        journal_size=journal_size,
+        snapshot_size=snapshot_size,
+    )
+
+
+def diff_session(session: Session, state: JournalState) -> list[dict[str, Any]] | None:
+    """Compute journal events for changes since the last save.
+
+    Messages and tool history are treated as append-only. If persisted
+    entries were removed or replaced the journal cannot express the
+    change and None is returned, meaning a snapshot is required. History
+    a lazy resume left on disk counts as persisted and is not read.
+
+    Args:
+        session: Session to save.
+        state: What has been persisted so far.
+
+    Returns:
+        Events to append (possibly empty), or None if a snapshot is needed.
+    """
+    unloaded = session._unloaded
+    messages = _appended(
+        session.messages,
+        unloaded.message_count if unloaded is not None else 0,
+        state.message_count,
+        state.last_message_id,
+    )
+    tools = _appended(
+        session.tool_history,
+        unloaded.tool_count if unloaded is not None else 0,
+        state.tool_count,
+        state.last_tool_id,
+    )
+    if messages is None or tools is None:
+        return None
+
+    events: list[dict[str, Any]] = [{"type": EVENT_MESSAGE, "data": m.to_dict()} for m in messages]
+    events.extend({"type": EVENT_TOOL, "data": t.to_dict()} for t in tools)
+
+    meta = dump_meta(session)
+    if meta != state.meta:
+        events.append({"type": EVENT_META, "data": session_meta(session)})
+
+    return events
+
+
+def _appended(
+    entries: list[Any],
+    offset: int,
+    count: int,
+    last_id: str | None,
+) -> list[Any] | None:
+    """Get the entries added after the persisted ones.
+
+    Args:
+        entries: Entries in memory, following ``offset`` entries on disk.
+        offset: Entries not loaded into memory.
+        count: Entries persisted.
+        last_id: ID of the last persisted entry.
+
+    Returns:
+        New entries, or None if persisted entries were removed or replaced.
+    """
+    persisted = count - offset
+    if persisted < 0 or len(entries) < persisted:
+        return None
+    if persisted and entries[persisted - 1].id != last_id:
+        return None
+    return entries[persisted:]
+
+
+def encode_events(events: list[dict[str, Any]]) -> bytes:
+    """Encode events as JSON lines.
+
+    Args:
+        events: Events to encode.
+
+    Returns:
+        UTF-8 encoded lines, each terminated by a newline.
+    """
+    return "".join(
+        json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for event in events
+    ).encode("utf-8")
+
+
+def encode_header(generation: str) -> bytes:
+    """Encode the journal header line.
+
+    Args:
+        generation: Generation of the paired snapshot.
+
+    Returns:
+        UTF-8 encoded header line.
+    """
+    return (json.dumps({"journal": generation}) + "\n").encode("utf-8")
+
+
+def read_journal(path: Path, generation: str) -> tuple[list[dict[str, Any]], int, bool]:
+    """Read journal events for a snapshot generation.
+
+    Args:
+        path: Journal file path.
+        generation: Generation of the loaded snapshot.
+
+    Returns:
+        Tuple of (events, size in bytes of the valid prefix, clean). Events
+        are empty if the journal is missing or belongs to another
+        generation. ``clean`` is False if a torn or corrupt line was
+        skipped, in which case the journal must not be appended to.
+    """
+    if not path.exists():
+        return [], 0, True
+
+    data = path.read_bytes()
+    lines = data.split(b"\n")
+    # A complete journal ends with a newline, leaving an empty last item
+    tail = lines.pop()
+
+    try:
+        header = json.loads(lines[0]) if lines else None
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get("journal") != generation:
+        return [], 0, True
+
+    events: list[dict[str, Any]] = []
+    offset = len(lines[0]) + 1
+    for line in lines[1:]:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring corrupt journal entry in {path.name}")
+            return events, offset, False
+        if isinstance(event, dict):
+            events.append(event)
+        offset += len(line) + 1
+
+    if tail:
+        logger.warning(f"Ignoring incomplete journal entry in {path.name}")
+        return events, offset, False
+
+    return events, offset, True
+
+
+def apply_events(session: Session, events: list[dict[str, Any]]) -> None:
+    """Replay journal events onto a session.
+
+    Args:
+        session: Session loaded from the snapshot.
+        events: Events from read_journal.
+    """
+    from .models import SessionMessage, ToolInvocation
+
+    for event in events:
+        kind = event.get("type")
+        data = event.get("data")
+        if not isinstance(data, dict):
+            continue
+        if kind == EVENT_MESSAGE:
+            session.messages.append(SessionMessage.from_dict(data))
+        elif kind == EVENT_TOOL:
+            session.tool_history.append(ToolInvocation.from_dict(data))
+        elif kind == EVENT_META:
+            for key in ("title", "working_dir", "model", "tags", "metadata"):
+                if key in data:
+                    setattr(session, key, data[key])
+            session.total_prompt_tokens = data.get(
+                "total_prompt_tokens", session.total_prompt_tokens
+            )
+            session.total_completion_tokens = data.get(
+                "total_completion_tokens", session.total_completion_tokens
+            )
+            if isinstance(data.get("updated_at"), str):
+                session.updated_at = datetime.fromisoformat(data["updated_at"])
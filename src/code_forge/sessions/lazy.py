@@ -0,0 +1,562 @@
+"""Lazy session loading.
+
+Loading a session parses every message and tool invocation, although
+resuming or listing a long session only needs its metadata and the most
+recent messages. Snapshots are therefore written with one message or
+tool invocation per line, and a sidecar offset index records where each
+one is:
+
+    <id>.offsets
+    {"version": 1, "generation": "<snapshot generation>",
+     "snapshot": [size, mtime_ns], "session": {...metadata...},
+     "messages": [start, end, ...], "tools": [start, end, ...]}
+
+A ``LazySession`` reads the sidecar, locates entries appended to the
+journal since the snapshot by their line prefix (parsing only metadata
+events), and reads messages from their byte spans when asked.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from .blobs import BLOB_KEY
+from .journal import (
+    EVENT_MESSAGE,
+    EVENT_META,
+    EVENT_TOOL,
+    JournalState,
+    apply_events,
+    dump_meta,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from .index import SessionSummary
+    from .models import Session, SessionMessage, ToolInvocation
+    from .storage import SessionStorage
+
+logger = logging.getLogger(__name__)
+
+OFFSETS_VERSION = 1
+
+# Session fields written one entry per line, with offsets in the sidecar
+PAGED_FIELDS = {"messages": "messages", "tool_history": "tools"}
+
+# Entry sources
+SOURCE_SNAPSHOT = 0
+SOURCE_JOURNAL = 1
+
+# (source, start, end) byte span of an entry
+EntryRef = tuple[int, int, int]
+
+
+def _event_prefix(kind: str) -> bytes:
+    """Get the bytes every journal line of an event type starts with."""
+    return f'{{"type":"{kind}","data":'.encode()
+
+
+_MESSAGE_PREFIX = _event_prefix(EVENT_MESSAGE)
+_TOOL_PREFIX = _event_prefix(EVENT_TOOL)
+_META_PREFIX = _event_prefix(EVENT_META)
+
+
+def encode_snapshot(data: dict[str, Any]) -> tuple[bytes, dict[str, list[int]]]:
+    """Encode a serialized session with one paged entry per line.
+
+    Args:
+        data: Session dictionary.
+
+    Returns:
+        Tuple of (snapshot bytes, flat [start, end, ...] byte spans for
+        each key of PAGED_FIELDS' values).
+    """
+    marker = uuid.uuid4().hex
+    placeholders = {field: json.dumps(f"{marker}:{field}") for field in PAGED_FIELDS}
+    head = {
+        key: f"{marker}:{key}" if key in PAGED_FIELDS else value for key, value in data.items()
+    }
+    text = json.dumps(head, indent=2, ensure_ascii=False)
+
+    spans: dict[str, list[int]] = {name: [] for name in PAGED_FIELDS.values()}
+    out = bytearray()
+    pos = 0
+    for index, field in sorted(
+        (text.index(placeholder), field)
+        for field, placeholder in placeholders.items()
+        if field in data
+    ):
+        out += text[pos:index].encode("utf-8")
+        target = spans[PAGED_FIELDS[field]]
+        items = data[field]
+        if not items:
+            out += b"[]"
+        else:
+            out += b"["
+            for i, item in enumerate(items):
+                out += b",\n    " if i else b"\n    "
+                start = len(out)
+                out += json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                target += (start, len(out))
+            out += b"\n  ]"
+        pos = index + len(placeholders[field])
+    out += text[pos:].encode("utf-8")
+
+    return bytes(out), spans
+
+
+def encode_offsets(
+    generation: str,
+    snapshot: tuple[int, int],
+    data: dict[str, Any],
+    spans: dict[str, list[int]],
+) -> bytes:
+    """Encode the sidecar offset index of a snapshot.
+
+    Args:
+        generation: Snapshot generation.
+        snapshot: (size, mtime_ns) of the written snapshot file.
+        data: Session dictionary the snapshot was encoded from.
+        spans: Spans returned by encode_snapshot.
+
+    Returns:
+        Sidecar file contents.
+    """
+    head = {key: value for key, value in data.items() if key not in PAGED_FIELDS}
+    return json.dumps(
+        {
+            "version": OFFSETS_VERSION,
+            "generation": generation,
+            "snapshot": list(snapshot),
+            "session": head,
+            **spans,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def scan_journal(
+    path: Path, generation: str
+) -> tuple[list[EntryRef], list[EntryRef], list[dict[str, Any]], int, bool]:
+    """Locate journal entries without parsing messages.
+
+    Args:
+        path: Journal file path.
+        generation: Generation of the snapshot.
+
+    Returns:
+        Tuple of (message refs, tool refs, meta events, size in bytes of
+        the valid prefix, clean). Empty if the journal is missing or
+        belongs to another generation. Scanning stops at the first
+        incomplete or unrecognized line, like read_journal, and ``clean``
+        is then False.
+
+    Raises:
+        OSError: If the journal cannot be read.
+    """
+    messages: list[EntryRef] = []
+    tools: list[EntryRef] = []
+    meta: list[dict[str, Any]] = []
+
+    if not path.exists():
+        return messages, tools, meta, 0, True
+    data = path.read_bytes()
+
+    end = data.find(b"\n")
+    try:
+        header = json.loads(data[:end]) if end >= 0 else None
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get("journal") != generation:
+        return messages, tools, meta, 0, True
+
+    start = end + 1
+    while (end := data.find(b"\n", start)) >= 0:
+        if data.startswith(_MESSAGE_PREFIX, start):
+            messages.append((SOURCE_JOURNAL, start, end))
+        elif data.startswith(_TOOL_PREFIX, start):
+            tools.append((SOURCE_JOURNAL, start, end))
+        elif data.startswith(_META_PREFIX, start):
+            try:
+                meta.append(json.loads(data[start:end]))
+            except json.JSONDecodeError:
+                break
+        else:
+            break
+        start = end + 1
+
+    return messages, tools, meta, start, start == len(data)
+
+
+class LazySession:
+    """Read-only view of a stored session that loads messages on demand.
+
+    Opening the view reads the session metadata and the last few
+    messages. Older messages and the tool history are read from disk when
+    requested, so memory use does not grow with the session length.
+
+    The view is a snapshot in time: entries saved after it was opened are
+    not visible. It cannot be saved; use ``materialize()`` to get a full
+    Session.
+
+    Attributes:
+        session: Session metadata. Its message and tool lists are empty.
+        recent: The last messages, loaded when the view was opened.
+    """
+
+    def __init__(
+        self,
+        storage: SessionStorage,
+        session: Session,
+        messages: list[EntryRef],
+        tools: list[EntryRef],
+        *,
+        snapshot: tuple[int, int],
+        tail: int,
+    ) -> None:
+        """Initialize view. Use ``SessionStorage.open_lazy()`` instead.
+
+        Args:
+            storage: Storage the session was read from.
+            session: Session metadata with empty message and tool lists.
+            messages: Spans of all messages.
+            tools: Spans of all tool invocations.
+            snapshot: (size, mtime_ns) of the snapshot the spans refer to.
+            tail: Number of recent messages to load now.
+        """
+        self._storage = storage
+        self.session = session
+        self._messages = messages
+        self._tools = tools
+        self._snapshot = snapshot
+        # Set for sessions without an offset index, which are read whole
+        self._loaded: Session | None = None
+        self.recent = self.get_messages(max(len(messages) - tail, 0)) if tail > 0 else []
+
+    @classmethod
+    def from_session(cls, storage: SessionStorage, session: Session, tail: int) -> LazySession:
+        """Create a view of a fully loaded session.
+
+        Used for sessions written before offset indexes existed.
+
+        Args:
+            storage: Storage the session was read from.
+            session: The loaded session.
+            tail: Number of recent messages to expose in ``recent``.
+
+        Returns:
+            View backed by the loaded session.
+        """
+        from .models import Session
+
+        head = Session.from_dict({**session.to_dict(), "messages": [], "tool_history": []})
+        view = cls(storage, head, [], [], snapshot=(0, 0), tail=0)
+        view._loaded = session
+        view.recent = session.messages[-tail:] if tail > 0 else []
+        return view
+
+    @property
+    def id(self) -> str:
+        """Session ID."""
+        return self.session.id
+
+    @property
+    def title(self) -> str:
+        """Session title."""
+        return self.session.title
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Session metadata dictionary."""
+        return self.session.metadata
+
+    @property
+    def message_count(self) -> int:
+        """Total number of messages."""
+        if self._loaded is not None:
+            return len(self._loaded.messages)
+        return len(self._messages)
+
+    @property
+    def tool_count(self) -> int:
+        """Total number of tool invocations."""
+        if self._loaded is not None:
+            return len(self._loaded.tool_history)
+        return len(self._tools)
+
+    def get_messages(self, start: int = 0, stop: int | None = None) -> list[SessionMessage]:
+        """Read a range of messages.
+
+        Args:
+            start: Index of the first message.
+            stop: Index after the last message. None reads to the end.
+
+        Returns:
+            Messages in the range.
+
+        Raises:
+            SessionStorageError: If the session was rewritten since the
+                view was opened, or cannot be read.
+        """
+        from .models import SessionMessage
+
+        if self._loaded is not None:
+            return self._loaded.messages[start:stop]
+        return [SessionMessage.from_dict(d) for d in self._read(self._messages[start:stop])]
+
+    def iter_messages(self, page_size: int = 100) -> Iterator[SessionMessage]:
+        """Iterate over all messages, reading one page at a time.
+
+        Args:
+            page_size: Messages read per page.
+
+        Yields:
+            Messages from oldest to newest.
+        """
+        for start in range(0, self.message_count, page_size):
+            yield from self.get_messages(start, start + page_size)
+
+    def get_tool_history(
+        self, start: int = 0, stop: int | None = None
+    ) -> list[ToolInvocation]:
+        """Read a range of tool invocations.
+
+        Args:
+            start: Index of the first invocation.
+            stop: Index after the last invocation. None reads to the end.
+
+        Returns:
+            Tool invocations in the range.
+
+        Raises:
+            SessionStorageError: If the session was rewritten since the
+                view was opened, or cannot be read.
+        """
+        from .models import ToolInvocation
+
+        if self._loaded is not None:
+            return self._loaded.tool_history[start:stop]
+        return [ToolInvocation.from_dict(d) for d in self._read(self._tools[start:stop])]
+
+    def summary(self) -> SessionSummary:
+        """Get the index summary of the session."""
+        from .index import SessionSummary
+
+        summary = SessionSummary.from_session(self.session)
+        summary.message_count = self.message_count
+        return summary
+
+    def materialize(self) -> Session:
+        """Load the full session.
+
+        Returns:
+            The Session as stored now.
+        """
+        return self._storage.load(self.id)
+
+    def reopen(self, tail: int = 0) -> LazySession:
+        """Open a new view of the session as stored now.
+
+        Args:
+            tail: Number of recent messages to load.
+
+        Returns:
+            New LazySession.
+        """
+        return self._storage.open_lazy(self.id, tail)
+
+    def _read(self, refs: list[EntryRef]) -> list[dict[str, Any]]:
+        """Read and decode entries, one read per contiguous run."""
+        from .storage import SessionStorageError
+
+        if not refs:
+            return []
+        paths = {
+            SOURCE_SNAPSHOT: self._storage.get_path(self.id),
+            SOURCE_JOURNAL: self._storage.get_journal_path(self.id),
+        }
+
+        values: list[dict[str, Any]] = []
+        try:
+            st = paths[SOURCE_SNAPSHOT].stat()
+            if (st.st_size, st.st_mtime_ns) != self._snapshot:
+                raise SessionStorageError(f"Session {self.id} was rewritten since it was opened")
+
+            run_start = 0
+            for i in range(1, len(refs) + 1):
+                if i < len(refs) and refs[i][0] == refs[run_start][0]:
+                    continue
+                source = refs[run_start][0]
+                base = refs[run_start][1]
+                with paths[source].open("rb") as f:
+                    f.seek(base)
+                    chunk = f.read(refs[i - 1][2] - base)
+                for _, start, end in refs[run_start:i]:
+                    raw = chunk[start - base : end - base]
+                    value = json.loads(raw)
+                    if source == SOURCE_JOURNAL:
+                        value = value["data"]
+                    if BLOB_KEY.encode() in raw:
+                        value = self._storage.blobs.hydrate(value)
+                    values.append(value)
+                run_start = i
+        except (OSError, ValueError, KeyError) as e:
+            raise SessionStorageError(f"Failed to read session {self.id}: {e}") from e
+
+        return values
+
+
+class UnloadedHistory:
+    """History of a resumed session that was not loaded yet.
+
+    A resumed session starts with only its most recent messages and none
+    of its tool invocations. Older messages are read in pages from the
+    lazy view when asked for. Saves append what was added since resuming
+    to the journal; the whole history is only loaded into the session
+    when a save has to rewrite the snapshot.
+
+    Attributes:
+        view: Lazy view the entries are read from.
+        message_count: Messages left on disk.
+        tool_count: Tool invocations left on disk.
+    """
+
+    def __init__(self, view: LazySession) -> None:
+        """Initialize from the view the session was resumed from.
+
+        Args:
+            view: Lazy view of the stored session.
+        """
+        self.view = view
+        self.message_count = view.message_count - len(view.recent)
+        self.tool_count = view.tool_count
+
+    def get_messages(self, start: int, stop: int) -> list[SessionMessage]:
+        """Read a range of the messages left on disk.
+
+        Args:
+            start: Index of the first message.
+            stop: Index after the last message.
+
+        Returns:
+            Messages in the range.
+
+        Raises:
+            SessionStorageError: If the session cannot be read.
+        """
+        from .storage import SessionStorageError
+
+        stop = min(stop, self.message_count)
+        try:
+            return self.view.get_messages(start, stop)
+        except SessionStorageError:
+            # Rewritten since it was opened; persisted entries keep their
+            # positions in the new snapshot
+            self.view = self.view.reopen()
+            return self.view.get_messages(start, stop)
+
+    def read(self) -> tuple[list[SessionMessage], list[ToolInvocation]]:
+        """Read the messages and tool invocations left on disk.
+
+        Returns:
+            Tuple of (older messages, tool history).
+
+        Raises:
+            SessionStorageError: If the session cannot be read.
+        """
+        from .storage import SessionStorageError
+
+        try:
+            return (
+                self.view.get_messages(0, self.message_count),
+                self.view.get_tool_history(0, self.tool_count),
+            )
+        except SessionStorageError:
+            self.view = self.view.reopen()
+            return (
+                self.view.get_messages(0, self.message_count),
+                self.view.get_tool_history(0, self.tool_count),
+            )
+
+
+def open_lazy(
+    storage: SessionStorage, session_id: str, tail: int
+) -> tuple[LazySession, JournalState | None] | None:
+    """Open a lazy view from the sidecar offset index.
+
+    Args:
+        storage: Session storage.
+        session_id: The session ID.
+        tail: Number of recent messages to load.
+
+    Returns:
+        Tuple of (view, journal state of what is stored). The state is
+        None if the journal cannot be appended to, so the next save must
+        write a snapshot. None if the sidecar is missing or does not
+        match the snapshot on disk.
+
+    Raises:
+        OSError: If the files cannot be read.
+        ValueError: If the sidecar or journal is malformed.
+        KeyError: If a referenced blob is missing.
+    """
+    from .models import Session
+
+    try:
+        offsets = json.loads(storage.get_offsets_path(session_id).read_bytes())
+    except FileNotFoundError:
+        return None
+
+    st = storage.get_path(session_id).stat()
+    snapshot = (st.st_size, st.st_mtime_ns)
+    if (
+        not isinstance(offsets, dict)
+        or offsets.get("version") != OFFSETS_VERSION
+        or tuple(offsets.get("snapshot", ())) != snapshot
+    ):
+        logger.debug(f"Stale offset index for session {session_id}")
+        return None
+
+    messages: list[EntryRef] = [
+        (SOURCE_SNAPSHOT, start, end)
+        for start, end in zip(offsets["messages"][::2], offsets["messages"][1::2], strict=True)
+    ]
+    tools: list[EntryRef] = [
+        (SOURCE_SNAPSHOT, start, end)
+        for start, end in zip(offsets["tools"][::2], offsets["tools"][1::2], strict=True)
+    ]
+
+    journal_messages, journal_tools, meta, journal_size, clean = scan_journal(
+        storage.get_journal_path(session_id), offsets["generation"]
+    )
+    messages.extend(journal_messages)
+    tools.extend(journal_tools)
+
+    head = storage.blobs.hydrate(offsets["session"])
+    session = Session.from_dict({**head, "messages": [], "tool_history": []})
+    apply_events(session, storage.blobs.hydrate(meta))
+
+    view = LazySession(storage, session, messages, tools, snapshot=snapshot, tail=tail)
+    if not clean or not journal_size:
+        # Missing, stale or torn journal: the next save writes a snapshot
+        return view, None
+
+    last_message = view.recent[-1:] or view.get_messages(len(messages) - 1)
+    last_tool = view.get_tool_history(len(tools) - 1) if tools else []
+    state = JournalState(
+        generation=offsets["generation"],
+        message_count=len(messages),
+        last_message_id=last_message[0].id if last_message else None,
+        tool_count=len(tools),
+        last_tool_id=last_tool[0].id if last_tool else None,
+        meta=dump_meta(session),
+        journal_size=journal_size,
+        snapshot_size=snapshot[0],
+    )
+    return view, state
@@ -11,7 +11,9 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from .autosave import SaveMetrics, WriteBehindSaver
 from .index import SessionIndex, SessionSummary
+from .lazy import UnloadedHistory
 from .models import Session, SessionMessage, ToolInvocation
 from .storage import SessionNotFoundError, SessionStorage
 
@@ -28,6 +30,7 @@ def _cleanup_managers() -> None:
             if manager.current_session:
                 manager.save()
                 logger.debug(f"Saved session {manager.current_session.id} at exit")
+            manager.storage.sync()
         except Exception as e:
             logger.warning(f"Failed to save session at exit: {e}")
 
@@ -41,6 +44,11 @@ class SessionManager:
     Central manager for creating, resuming, saving, and listing
     sessions. Provides auto-save functionality and session hooks.
 
+    Auto-save is write-behind: changes made through the manager mark the
+    session dirty, and once changes settle (or have waited for the
+    auto-save interval) a snapshot is written on a worker thread so the
+    event loop is never blocked by serialization or disk I/O.
+
     Attributes:
         storage: SessionStorage instance.
         index: SessionIndex instance.
@@ -50,16 +58,23 @@ class SessionManager:
     _instance: SessionManager | None = None
     _instance_lock: threading.Lock = threading.Lock()
 
+    # Messages loaded when a session is resumed
+    RESUME_TAIL = 50
+
     def __init__(
         self,
         storage: SessionStorage | None = None,
         auto_save_interval: float = 60.0,
+        auto_save_delay: float = 2.0,
     ) -> None:
         """Initialize session manager.
 
         Args:
             storage: SessionStorage instance. Creates default if None.
-            auto_save_interval: Auto-save interval in seconds. 0 to disable.
+            auto_save_interval: Longest time a change stays unsaved, in
+                seconds. 0 to disable auto-save.
+            auto_save_delay: Quiet period after the last change before
+                auto-saving, in seconds.
         """
         self.storage = storage or SessionStorage()
         self.index = SessionIndex(self.storage)
@@ -67,6 +82,11 @@ class SessionManager:
 
         self._auto_save_interval = auto_save_interval
         self._auto_save_task: asyncio.Task[None] | None = None
+        self._saver = WriteBehindSaver(
+            self._write_snapshot,
+            delay=auto_save_delay,
+            max_delay=auto_save_interval if auto_save_interval > 0 else 60.0,
+        )
         self._hooks: dict[str, list[Callable[..., Any]]] = {
             "session:start": [],
             "session:end": [],
@@ -94,7 +114,7 @@ class SessionManager:
         """Reset the singleton instance (for testing)."""
         with cls._instance_lock:
             if cls._instance is not None:
-                cls._instance.close()
+                cls._instance.shutdown()
             cls._instance = None
 
     def create(
@@ -131,6 +151,7 @@ class SessionManager:
 
         # Save immediately
         self.storage.save(session)
+        self._saver.mark_saved(session)
         self.index.add(session)
         self.index.save_if_dirty()
 
@@ -147,6 +168,14 @@ class SessionManager:
     def resume(self, session_id: str) -> Session:
         """Resume an existing session.
 
+        Only the metadata and the last ``RESUME_TAIL`` messages are read.
+        The rest of the history stays on disk: ``messages`` holds the
+        recent messages and ``tool_history`` only new invocations, while
+        ``message_count``, ``get_messages()`` and ``iter_messages()``
+        cover every message and read older ones from disk in pages. Saves
+        append what was added; the history is only loaded into the
+        session when a save has to rewrite the snapshot.
+
         Args:
             session_id: The session ID to resume.
 
@@ -155,14 +184,16 @@ class SessionManager:
 
         Raises:
             SessionNotFoundError: If session doesn't exist.
+            SessionStorageError: If the session cannot be read.
         """
-        session = self.storage.load(session_id)
+        view = self.storage.open_lazy(session_id, tail=self.RESUME_TAIL)
+        session = view.session
+        session.messages = list(view.recent)
+        if view.message_count > len(view.recent) or view.tool_count:
+            session._unloaded = UnloadedHistory(view)
 
-        # Update access time
-        session._mark_updated()
-        self.storage.save(session)
-        self.index.update(session)
-        self.index.save_if_dirty()
+        # Nothing to save until the session changes
+        self._saver.mark_saved(session)
 
         # Set as current and start auto-save
         self.current_session = session
@@ -180,6 +211,7 @@ class SessionManager:
         Returns:
             The resumed Session, or None if no sessions exist.
         """
+        self.index.refresh()
         recent = self.index.get_recent(count=1)
         if not recent:
             return None
@@ -187,8 +219,8 @@ class SessionManager:
         try:
             return self.resume(recent[0].id)
         except SessionNotFoundError:
-            # Index was stale, rebuild and try again
-            self.index.rebuild()
+            # Session removed since the refresh, repair and try again
+            self.index.refresh()
             recent = self.index.get_recent(count=1)
             if recent:
                 return self.resume(recent[0].id)
@@ -227,13 +259,56 @@ class SessionManager:
             logger.warning("No session to save")
             return
 
+        # Let a background write finish first so it cannot land after this one
+        self._saver.wait()
         self.storage.save(session)
+        self._saver.mark_saved(session)
+        self._update_index(session)
+        self._after_save(session)
+
+    async def save_async(self, session: Session | None = None) -> bool:
+        """Save a session without blocking the event loop.
+
+        A snapshot of the session is written on a worker thread. Nothing
+        is written if the session has not changed since its last save.
+
+        Args:
+            session: The session to save. Uses current if None.
+
+        Returns:
+            True if the session was written.
+        """
+        if session is None:
+            session = self.current_session
+
+        if session is None:
+            return False
+
+        if not await self._saver.save(session):
+            return False
+        self._after_save(session)
+        return True
+
+    def _write_snapshot(self, snapshot: Session) -> None:
+        """Persist an auto-save snapshot (runs on the saver's worker thread)."""
+        self.storage.save(snapshot)
+        self._update_index(snapshot)
+
+    def _update_index(self, session: Session) -> None:
+        """Record a saved session in the index and write it if due."""
         self.index.update(session)
         self.index.save_if_dirty()
 
+    def _after_save(self, session: Session) -> None:
+        """Fire hooks after a save."""
         self._fire_hook("session:save", session)
         logger.debug(f"Saved session {session.id}")
 
+    @property
+    def save_metrics(self) -> SaveMetrics:
+        """Auto-save write counts and latencies."""
+        return self._saver.metrics
+
     def close(self, session: Session | None = None) -> None:
         """Close a session.
 
@@ -248,8 +323,9 @@ class SessionManager:
         if session is None:
             return
 
-        # Save final state
+        # Save final state and flush journal appends to disk
         self.save(session)
+        self.storage.sync()
 
         # Fire hooks
         self._fire_hook("session:end", session)
@@ -261,6 +337,16 @@ class SessionManager:
 
         logger.info(f"Closed session {session.id}")
 
+    def shutdown(self) -> None:
+        """Close the current session and stop the background save worker.
+
+        The manager cannot save sessions afterwards.
+        """
+        if self.current_session is not None:
+            self.close()
+        self._saver.wait()
+        self._saver.close()
+
     def delete(self, session_id: str) -> bool:
         """Delete a session.
 
@@ -276,7 +362,9 @@ class SessionManager:
             self.current_session = None
 
         # Remove from storage and index
+        self._saver.wait()
         deleted = self.storage.delete(session_id)
+        self._saver.forget(session_id)
         self.index.remove(session_id)
         self.index.save_if_dirty()
 
@@ -308,6 +396,7 @@ class SessionManager:
         Returns:
             List of SessionSummary objects.
         """
+        self.index.refresh()
         return self.index.list(
             limit=limit,
             offset=offset,
@@ -356,6 +445,7 @@ class SessionManager:
             raise ValueError("No session available")
 
         message = session.add_message_from_dict(role, content, **kwargs)
+        self._saver.mark_dirty(session)
 
         self._fire_hook("session:message", session, message)
 
@@ -394,7 +484,7 @@ class SessionManager:
         if session is None:
             raise ValueError("No session available")
 
-        return session.record_tool_call(
+        invocation = session.record_tool_call(
             tool_name=tool_name,
             arguments=arguments,
             result=result,
@@ -402,6 +492,8 @@ class SessionManager:
             success=success,
             error=error,
         )
+        self._saver.mark_dirty(session)
+        return invocation
 
     def update_usage(
         self,
@@ -421,6 +513,7 @@ class SessionManager:
 
         if session:
             session.update_usage(prompt_tokens, completion_tokens)
+            self._saver.mark_dirty(session)
 
     def generate_title(self, session: Session) -> str:
         """Generate a title for a session.
@@ -434,8 +527,8 @@ class SessionManager:
         Returns:
             The generated title.
         """
-        # Find first user message
-        for msg in session.messages:
+        # Find first user message, reading older messages page by page
+        for msg in session.iter_messages():
             if msg.role == "user" and msg.content:
                 # Use first line, truncated
                 title = msg.content.split("\n")[0]
@@ -459,6 +552,7 @@ class SessionManager:
         if session:
             session.title = title
             session._mark_updated()
+            self._saver.mark_dirty(session)
 
     def add_tag(self, tag: str, session: Session | None = None) -> None:
         """Add a tag to a session.
@@ -473,6 +567,7 @@ class SessionManager:
         if session and tag not in session.tags:
             session.tags.append(tag)
             session._mark_updated()
+            self._saver.mark_dirty(session)
 
     def remove_tag(self, tag: str, session: Session | None = None) -> bool:
         """Remove a tag from a session.
@@ -490,6 +585,7 @@ class SessionManager:
         if session and tag in session.tags:
             session.tags.remove(tag)
             session._mark_updated()
+            self._saver.mark_dirty(session)
             return True
         return False
 
@@ -548,14 +644,19 @@ class SessionManager:
             return
 
         self._stop_auto_save()
+        delay = self._saver.delay
+        poll_interval = (
+            min(delay, self._auto_save_interval) if delay > 0 else self._auto_save_interval
+        )
 
         async def auto_save_loop() -> None:
             try:
                 while True:
-                    await asyncio.sleep(self._auto_save_interval)
-                    if self.current_session:
+                    await asyncio.sleep(poll_interval)
+                    session = self.current_session
+                    if session and self._saver.is_due(session):
                         try:
-                            self.save(self.current_session)
+                            await self.save_async(session)
                         except Exception as e:
                             # Log but don't crash auto-save loop
                             logger.warning(f"Auto-save failed: {e}")
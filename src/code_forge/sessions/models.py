@@ -6,7 +6,12 @@ import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .lazy import UnloadedHistory
 
 
 @dataclass
@@ -188,6 +193,11 @@ class Session:
     tags: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Older history of a lazily resumed session, still on disk
+    _unloaded: UnloadedHistory | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def add_message(self, message: SessionMessage) -> None:
         """Add a message to the session.
 
@@ -294,8 +304,69 @@ class Session:
 
     @property
     def message_count(self) -> int:
-        """Number of messages in the session."""
-        return len(self.messages)
+        """Number of messages in the session, including any not loaded yet."""
+        older = self._unloaded.message_count if self._unloaded is not None else 0
+        return older + len(self.messages)
+
+    @property
+    def history_loaded(self) -> bool:
+        """Whether all messages and tool invocations are in memory."""
+        return self._unloaded is None
+
+    def get_messages(self, start: int = 0, stop: int | None = None) -> list[SessionMessage]:
+        """Get a range of messages.
+
+        Indexes count every message of the session. ``messages`` of a
+        lazily resumed session starts at its most recent messages; older
+        ones are read from disk here without loading the whole history.
+
+        Args:
+            start: Index of the first message; negative counts from the end.
+            stop: Index after the last message. None reads to the end.
+
+        Returns:
+            Messages in the range.
+
+        Raises:
+            SessionStorageError: If older messages cannot be read.
+        """
+        older = self._unloaded.message_count if self._unloaded is not None else 0
+        start, stop, _ = slice(start, stop).indices(older + len(self.messages))
+        result: list[SessionMessage] = []
+        if self._unloaded is not None and start < older:
+            result = self._unloaded.get_messages(start, min(stop, older))
+        if stop > older:
+            result.extend(self.messages[max(start - older, 0) : stop - older])
+        return result
+
+    def iter_messages(self, page_size: int = 100) -> Iterator[SessionMessage]:
+        """Iterate over all messages, reading older ones one page at a time.
+
+        Args:
+            page_size: Messages read per page.
+
+        Yields:
+            Messages from oldest to newest.
+        """
+        for start in range(0, self.message_count, page_size):
+            yield from self.get_messages(start, start + page_size)
+
+    def load_history(self) -> None:
+        """Load the history a lazy resume left on disk into the session.
+
+        Raises:
+            SessionStorageError: If the session cannot be read.
+        """
+        if self._unloaded is not None:
+            self._restore_history(*self._unloaded.read())
+
+    def _restore_history(
+        self, messages: list[SessionMessage], tools: list[ToolInvocation]
+    ) -> None:
+        """Put the history read from disk before what was added since resuming."""
+        self.messages[:0] = messages
+        self.tool_history[:0] = tools
+        self._unloaded = None
 
     def _mark_updated(self) -> None:
         """Update the updated_at timestamp."""
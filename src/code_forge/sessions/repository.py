@@ -7,6 +7,7 @@ It implements the ISessionRepository interface for dependency injection and test
 from __future__ import annotations
 
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import TYPE_CHECKING
@@ -14,16 +15,15 @@ from typing import TYPE_CHECKING
 from code_forge.core.interfaces import ISessionRepository
 from code_forge.core.types import SessionId
 
-from .index import SessionSummary
+from .index import SessionIndex, SessionSummary
+from .models import Session
 from .storage import SessionStorage
 
 if TYPE_CHECKING:
     from code_forge.core.types import SessionSummary as CoreSessionSummary
 
-    from .models import Session
 
-
-class SessionRepository(ISessionRepository):
+class SessionRepository(ISessionRepository[Session]):
     """Async repository for session persistence.
 
     Wraps SessionStorage to provide an async interface that implements
@@ -46,12 +46,22 @@ class SessionRepository(ISessionRepository):
         """
         self._storage = storage or SessionStorage()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._index: SessionIndex | None = None
+        self._index_lock = threading.Lock()
 
     @property
     def storage(self) -> SessionStorage:
         """Get underlying storage instance."""
         return self._storage
 
+    def _recent(self, limit: int) -> list[SessionSummary]:
+        """List recent sessions from the index (runs in the executor)."""
+        with self._index_lock:
+            if self._index is None:
+                self._index = SessionIndex(self._storage)
+            self._index.refresh()
+            return self._index.get_recent(count=limit)
+
     async def save(self, session: Session) -> None:
         """Persist session to storage.
 
@@ -92,27 +102,11 @@ class SessionRepository(ISessionRepository):
             List of session summaries, sorted by last activity (newest first).
         """
         loop = asyncio.get_running_loop()
-
-        # Get all session IDs
-        session_ids = await loop.run_in_executor(
+        return await loop.run_in_executor(
             self._executor,
-            self._storage.list_session_ids,
+            partial(self._recent, limit),
         )
 
-        # Load sessions and build summaries
-        summaries: list[SessionSummary] = []
-        for session_id in session_ids:
-            session = await loop.run_in_executor(
-                self._executor,
-                partial(self._storage.load_or_none, session_id),
-            )
-            if session is not None:
-                summaries.append(SessionSummary.from_session(session))
-
-        # Sort by updated_at (newest first) and limit
-        summaries.sort(key=lambda s: s.updated_at, reverse=True)
-        return summaries[:limit]
-
     async def delete(self, session_id: SessionId) -> bool:
         """Delete session.
 
@@ -0,0 +1,701 @@
+"""SQLite session backend with full-text search.
+
+An alternative to the JSON file store for large session histories.
+Summary fields are stored in indexed columns so listing, filtering and
+pagination run in SQL, and message content and tool invocations are
+indexed with FTS5 so past sessions can be searched by what was said
+or done in them.
+
+Example:
+    from code_forge.sessions import SQLiteSessionRepository
+
+    async with SQLiteSessionRepository() as repo:
+        await repo.save(session)
+        hits = await repo.search("flaky auth test")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import json
+import logging
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from code_forge.core.interfaces import ISessionRepository
+
+from .index import SessionSummary
+from .models import Session
+from .storage import SessionStorage, SessionStorageError
+
+if TYPE_CHECKING:
+    from code_forge.core.types import SessionId
+
+    from .models import SessionMessage, ToolInvocation
+
+# Alias builtins.list to avoid shadowing by method
+_list = builtins.list
+
+logger = logging.getLogger(__name__)
+
+# Kinds of indexed documents
+DOC_MESSAGE = "message"
+DOC_TOOL = "tool"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    updated_ts REAL NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    working_dir TEXT NOT NULL DEFAULT '',
+    model TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_ts);
+CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_ts);
+CREATE INDEX IF NOT EXISTS idx_sessions_title ON sessions(title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_sessions_working_dir ON sessions(working_dir, updated_ts);
+
+CREATE TABLE IF NOT EXISTS session_tags (
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (session_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_session_tags_tag ON session_tags(tag);
+
+CREATE TABLE IF NOT EXISTS session_docs (
+    rowid INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    ref TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_session_docs_ref ON session_docs(session_id, ref);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS session_fts USING fts5(
+    content, content='session_docs', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS session_docs_ai AFTER INSERT ON session_docs BEGIN
+    INSERT INTO session_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS session_docs_ad AFTER DELETE ON session_docs BEGIN
+    INSERT INTO session_fts(session_fts, rowid, content)
+    VALUES ('delete', old.rowid, old.content);
+END;
+"""
+
+# Sort keys accepted by list(), mapped to indexed columns
+_SORT_COLUMNS = {
+    "updated_at": "updated_ts",
+    "created_at": "created_ts",
+    "title": "title COLLATE NOCASE",
+    "message_count": "message_count",
+    "total_tokens": "total_tokens",
+}
+
+# Columns read by _summary_from_row, in order
+_SUMMARY_COLUMNS = (
+    "id, title, created_at, updated_at, message_count, total_tokens, tags, working_dir, model"
+)
+
+
+@dataclass
+class SessionSearchHit:
+    """A session matching a full-text search.
+
+    Attributes:
+        summary: Summary of the matching session.
+        snippet: Best matching excerpt, with matches in brackets.
+        kind: Whether the excerpt is from a message or a tool invocation.
+        ref: ID of the matching message or tool invocation.
+        score: BM25 rank (lower is better).
+    """
+
+    summary: SessionSummary
+    snippet: str
+    kind: str
+    ref: str
+    score: float
+
+
+def _timestamp(value: datetime) -> float:
+    """Sortable timestamp of a datetime."""
+    return value.timestamp()
+
+
+def _message_doc(message: SessionMessage) -> str:
+    """Searchable text of a message."""
+    parts = [message.content]
+    for call in message.tool_calls or []:
+        function = call.get("function") or {}
+        parts.append(f"{function.get('name', '')} {function.get('arguments', '')}")
+    return "\n".join(part for part in parts if part)
+
+
+def _tool_doc(invocation: ToolInvocation) -> str:
+    """Searchable text of a tool invocation."""
+    parts = [invocation.tool_name, json.dumps(invocation.arguments, ensure_ascii=False)]
+    if invocation.result is not None:
+        parts.append(json.dumps(invocation.result, ensure_ascii=False, default=str))
+    if invocation.error:
+        parts.append(invocation.error)
+    return "\n".join(parts)
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into an FTS5 match expression.
+
+    Words are quoted (so punctuation and FTS5 operators in user input
+    cannot cause syntax errors) and OR-ed together; BM25 ranking puts
+    documents matching more of the words first.
+
+    Args:
+        query: Free-text search query.
+
+    Returns:
+        FTS5 match expression, or an empty string if there are no words.
+    """
+    words = re.findall(r"\w+", query)
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class SQLiteSessionStore:
+    """Synchronous SQLite session store.
+
+    One connection is shared between threads and serialized with a lock.
+    The full session is stored as JSON; summary fields, tags and
+    searchable documents are kept in indexed tables. Documents are
+    updated incrementally: saving a session only inserts messages and
+    tool invocations not yet indexed.
+
+    Attributes:
+        db_path: Path to the database file.
+        fts_enabled: Whether SQLite was built with FTS5. Without it,
+            search falls back to substring matching.
+    """
+
+    DB_FILE = "sessions.db"
+    SNIPPET_TOKENS = 12
+    MAX_DOC_CHARS = 20000  # Bound index growth from huge tool results
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        """Initialize store, creating the schema if needed.
+
+        Args:
+            db_path: Database file, or ":memory:". Defaults to
+                ``sessions.db`` in the default session directory.
+
+        Raises:
+            SessionStorageError: If the database cannot be opened.
+        """
+        if db_path is None:
+            db_path = SessionStorage.get_default_dir() / self.DB_FILE
+        if str(db_path) != ":memory:":
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(_SCHEMA)
+            self.fts_enabled = self._create_fts()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to open session database: {e}") from e
+
+    def _create_fts(self) -> bool:
+        """Create the FTS5 index, returning False if FTS5 is unavailable."""
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, session search uses substring match: {e}")
+            return False
+        return True
+
+    def save(self, session: Session) -> None:
+        """Insert or update a session.
+
+        Args:
+            session: The session to save.
+
+        Raises:
+            SessionStorageError: If the write fails.
+        """
+        try:
+            data = session.to_json(indent=0)
+        except Exception as e:
+            raise SessionStorageError(f"Failed to serialize session: {e}") from e
+
+        docs = [
+            (m.id, DOC_MESSAGE, _message_doc(m)[: self.MAX_DOC_CHARS])
+            for m in session.messages
+        ]
+        docs.extend(
+            (t.id, DOC_TOOL, _tool_doc(t)[: self.MAX_DOC_CHARS])
+            for t in session.tool_history
+        )
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._upsert(session, data)
+                    self._sync_docs(session.id, docs)
+            except sqlite3.Error as e:
+                raise SessionStorageError(f"Failed to save session: {e}") from e
+
+    def _upsert(self, session: Session, data: str) -> None:
+        """Write the session row and its tags."""
+        self._conn.execute(
+            """
+            INSERT INTO sessions (
+                id, title, created_at, updated_at, created_ts, updated_ts,
+                message_count, total_tokens, working_dir, model, tags, data
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title = excluded.title,
+                created_at = excluded.created_at,
+                updated_at = excluded.updated_at,
+                created_ts = excluded.created_ts,
+                updated_ts = excluded.updated_ts,
+                message_count = excluded.message_count,
+                total_tokens = excluded.total_tokens,
+                working_dir = excluded.working_dir,
+                model = excluded.model,
+                tags = excluded.tags,
+                data = excluded.data
+            """,
+            (
+                session.id,
+                session.title,
+                session.created_at.isoformat(),
+                session.updated_at.isoformat(),
+                _timestamp(session.created_at),
+                _timestamp(session.updated_at),
+                session.message_count,
+                session.total_tokens,
+                session.working_dir,
+                session.model,
+                json.dumps(session.tags, ensure_ascii=False),
+                data,
+            ),
+        )
+        self._conn.execute("DELETE FROM session_tags WHERE session_id = ?", (session.id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO session_tags (session_id, tag) VALUES (?, ?)",
+            [(session.id, tag) for tag in session.tags],
+        )
+
+    def _sync_docs(self, session_id: str, docs: _list[tuple[str, str, str]]) -> None:
+        """Index new documents and drop documents no longer in the session."""
+        indexed = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT ref FROM session_docs WHERE session_id = ?", (session_id,)
+            )
+        }
+        current = {ref for ref, _, _ in docs}
+
+        stale = indexed - current
+        if stale:
+            self._conn.executemany(
+                "DELETE FROM session_docs WHERE session_id = ? AND ref = ?",
+                [(session_id, ref) for ref in stale],
+            )
+        self._conn.executemany(
+            "INSERT INTO session_docs (session_id, ref, kind, content) VALUES (?, ?, ?, ?)",
+            [
+                (session_id, ref, kind, content)
+                for ref, kind, content in docs
+                if ref not in indexed
+            ],
+        )
+
+    def load(self, session_id: str) -> Session | None:
+        """Load a session.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The session, or None if not found or unreadable.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return Session.from_json(row[0])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to load session {session_id}: {e}")
+            return None
+
+    def delete(self, session_id: str) -> bool:
+        """Delete a session and its indexed documents.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            True if the session existed.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def exists(self, session_id: str) -> bool:
+        """Check whether a session exists.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            True if the session exists.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def count(self) -> int:
+        """Get the number of stored sessions."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return int(row[0])
+
+    def list(
+        self,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "updated_at",
+        descending: bool = True,
+        tags: _list[str] | None = None,
+        search: str | None = None,
+        working_dir: str | None = None,
+    ) -> _list[SessionSummary]:
+        """List sessions with filtering and pagination done in SQL.
+
+        Takes the same arguments as SessionIndex.list.
+
+        Args:
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
+            sort_by: Field to sort by (updated_at, created_at, title,
+                message_count, total_tokens).
+            descending: Sort in descending order.
+            tags: Filter to sessions with all these tags.
+            search: Case-insensitive substring of the title.
+            working_dir: Filter to sessions in this directory.
+
+        Returns:
+            List of SessionSummary objects.
+        """
+        where: _list[str] = []
+        params: _list[Any] = []
+
+        if tags:
+            unique_tags = sorted(set(tags))
+            placeholders = ", ".join("?" * len(unique_tags))
+            where.append(
+                f"id IN (SELECT session_id FROM session_tags WHERE tag IN ({placeholders}) "
+                "GROUP BY session_id HAVING COUNT(*) = ?)"
+            )
+            params.extend([*unique_tags, len(unique_tags)])
+        if search:
+            where.append("title LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(search)}%")
+        if working_dir:
+            where.append("working_dir = ?")
+            params.append(working_dir)
+
+        column = _SORT_COLUMNS.get(sort_by, _SORT_COLUMNS["updated_at"])
+        direction = "DESC" if descending else "ASC"
+        sql = f"SELECT {_SUMMARY_COLUMNS} FROM sessions"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {column} {direction} LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_summary_from_row(row) for row in rows]
+
+    def get_recent(self, count: int = 10) -> _list[SessionSummary]:
+        """Get the most recently updated sessions.
+
+        Args:
+            count: Number of sessions to return.
+
+        Returns:
+            List of SessionSummary objects.
+        """
+        return self.list(limit=count)
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> _list[SessionSearchHit]:
+        """Search message content and tool invocations.
+
+        Returns one hit per session, ranked by its best matching document.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
+
+        Returns:
+            Matching sessions, best first.
+        """
+        if self.fts_enabled:
+            match = build_match_query(query)
+            if not match:
+                return []
+            sql = f"""
+                WITH hits AS MATERIALIZED (
+                    SELECT d.session_id, d.ref, d.kind,
+                           snippet(session_fts, 0, '[', ']', '...', {self.SNIPPET_TOKENS})
+                               AS snippet,
+                           session_fts.rank AS score
+                    FROM session_fts JOIN session_docs d ON d.rowid = session_fts.rowid
+                    WHERE session_fts MATCH ?
+                ),
+                best AS (
+                    SELECT session_id, ref, kind, snippet, MIN(score) AS score
+                    FROM hits GROUP BY session_id
+                )
+                SELECT best.ref, best.kind, best.snippet, best.score, {_SUMMARY_COLUMNS}
+                FROM best JOIN sessions s ON s.id = best.session_id
+                ORDER BY best.score LIMIT ? OFFSET ?
+            """
+            params: _list[Any] = [match, limit, offset]
+        else:
+            if not query.strip():
+                return []
+            sql = f"""
+                WITH best AS (
+                    SELECT session_id, MIN(rowid) AS rowid FROM session_docs
+                    WHERE content LIKE ? ESCAPE '\\' GROUP BY session_id
+                )
+                SELECT d.ref, d.kind, substr(d.content, 1, 200), 0.0, {_SUMMARY_COLUMNS}
+                FROM best
+                JOIN session_docs d ON d.rowid = best.rowid
+                JOIN sessions s ON s.id = best.session_id
+                ORDER BY s.updated_ts DESC LIMIT ? OFFSET ?
+            """
+            params = [f"%{_escape_like(query.strip())}%", limit, offset]
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Session search failed: {e}") from e
+
+        return [
+            SessionSearchHit(
+                summary=_summary_from_row(row[4:]),
+                snippet=row[2],
+                kind=row[1],
+                ref=row[0],
+                score=float(row[3]),
+            )
+            for row in rows
+        ]
+
+    def import_storage(self, storage: SessionStorage) -> int:
+        """Copy all sessions from a JSON file store.
+
+        Args:
+            storage: Source storage.
+
+        Returns:
+            Number of sessions imported.
+        """
+        imported = 0
+        for session_id in storage.list_session_ids():
+            session = storage.load_or_none(session_id)
+            if session is not None:
+                self.save(session)
+                imported += 1
+        return imported
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards in user input."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _summary_from_row(row: tuple[Any, ...] | sqlite3.Row) -> SessionSummary:
+    """Build a summary from the _SUMMARY_COLUMNS of a row."""
+    return SessionSummary(
+        id=row[0],
+        title=row[1],
+        created_at=datetime.fromisoformat(row[2]),
+        updated_at=datetime.fromisoformat(row[3]),
+        message_count=row[4],
+        total_tokens=row[5],
+        tags=json.loads(row[6]),
+        working_dir=row[7],
+        model=row[8],
+    )
+
+
+class SQLiteSessionRepository(ISessionRepository[Session]):
+    """Async repository backed by SQLiteSessionStore.
+
+    Drop-in alternative to SessionRepository that adds SQL-side listing
+    and full-text search. Database calls run in a thread pool.
+
+    Attributes:
+        store: The underlying sync store.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteSessionStore | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize repository.
+
+        Args:
+            store: SQLiteSessionStore instance. Creates default if None.
+            max_workers: Maximum thread pool workers for async operations.
+        """
+        self._store = store or SQLiteSessionStore()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def store(self) -> SQLiteSessionStore:
+        """Get underlying store instance."""
+        return self._store
+
+    async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a store call in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def save(self, session: Session) -> None:
+        """Persist session to the database.
+
+        Args:
+            session: The session to save.
+
+        Raises:
+            SessionStorageError: If save fails.
+        """
+        await self._run(self._store.save, session)
+
+    async def load(self, session_id: SessionId) -> Session | None:
+        """Load session by ID.
+
+        Args:
+            session_id: The ID of the session to load.
+
+        Returns:
+            The session if found, None otherwise.
+        """
+        result: Session | None = await self._run(self._store.load, str(session_id))
+        return result
+
+    async def list_recent(self, limit: int = 10) -> list[SessionSummary]:
+        """List recent sessions with summaries.
+
+        Args:
+            limit: Maximum number of sessions to return.
+
+        Returns:
+            List of session summaries, sorted by last activity (newest first).
+        """
+        result: list[SessionSummary] = await self._run(self._store.get_recent, limit)
+        return result
+
+    async def list_sessions(self, **kwargs: Any) -> list[SessionSummary]:
+        """List sessions with filtering and pagination.
+
+        Args:
+            **kwargs: Arguments of SQLiteSessionStore.list.
+
+        Returns:
+            List of session summaries.
+        """
+        result: list[SessionSummary] = await self._run(self._store.list, **kwargs)
+        return result
+
+    async def search(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> list[SessionSearchHit]:
+        """Search sessions by message content and tool invocations.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
+
+        Returns:
+            Matching sessions, best first.
+        """
+        result: list[SessionSearchHit] = await self._run(
+            self._store.search, query, limit, offset
+        )
+        return result
+
+    async def delete(self, session_id: SessionId) -> bool:
+        """Delete session.
+
+        Args:
+            session_id: The ID of the session to delete.
+
+        Returns:
+            True if deleted, False if not found.
+        """
+        result: bool = await self._run(self._store.delete, str(session_id))
+        return result
+
+    async def exists(self, session_id: SessionId) -> bool:
+        """Check if session exists.
+
+        Args:
+            session_id: The ID to check.
+
+        Returns:
+            True if session exists.
+        """
+        result: bool = await self._run(self._store.exists, str(session_id))
+        return result
+
+    def close(self) -> None:
+        """Shutdown the thread pool and close the database."""
+        self._executor.shutdown(wait=True)
+        self._store.close()
+
+    async def __aenter__(self) -> SQLiteSessionRepository:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        self.close()
@@ -13,7 +13,7 @@ import tempfile
 import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Platform-specific file locking imports
 if platform.system() == "Windows":
@@ -21,11 +21,31 @@ if platform.system() == "Windows":
 else:
     import fcntl
 
+from .blobs import BLOB_KEY, BlobStore
+from .journal import (
+    EVENT_MESSAGE,
+    EVENT_TOOL,
+    JournalState,
+    apply_events,
+    diff_session,
+    encode_events,
+    encode_header,
+    read_journal,
+    snapshot_generation,
+    state_for,
+)
+from .lazy import encode_offsets, encode_snapshot
+
 if TYPE_CHECKING:
+    from .index import SessionIndex
+    from .lazy import LazySession
     from .models import Session
 
 logger = logging.getLogger(__name__)
 
+# (mtime_ns, size) of a session file followed by those of its journal
+FileSignature = tuple[int, int, int, int]
+
 
 class SessionStorageError(Exception):
     """Error during session storage operations."""
@@ -116,25 +136,51 @@ def _file_lock(file_path: Path, timeout: float = 10.0):
 class SessionStorage:
     """Handles session persistence to disk.
 
-    Sessions are stored as JSON files in a configurable directory.
-    Supports atomic writes and backup before overwrite.
+    Sessions are stored as a JSON snapshot plus an append-only JSONL
+    journal of changes since the snapshot (see ``journal``). Saves append
+    new messages, tool invocations and metadata to the journal; the
+    snapshot is rewritten (atomic write, backup before overwrite) only
+    when the journal outgrows it or history was rewritten.
     Includes automatic backup rotation to prevent unbounded disk usage.
 
     Attributes:
         storage_dir: Directory where sessions are stored.
+        journal: Whether saves append to the journal.
+        fsync_interval: Minimum seconds between journal fsyncs.
+        blobs: Store for large strings in saved sessions.
     """
 
     DEFAULT_DIR_NAME = "sessions"
     SESSION_EXTENSION = ".json"
     BACKUP_EXTENSION = ".backup"
+    JOURNAL_EXTENSION = ".journal"
+    OFFSETS_EXTENSION = ".offsets"
     MAX_BACKUPS = 100  # Maximum number of backup files to keep
     BACKUP_MAX_AGE_DAYS = 7  # Maximum age of backup files in days
+    # Compact once the journal exceeds the snapshot and this many bytes
+    JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+    BLOB_DIR_NAME = "blobs"
 
-    def __init__(self, storage_dir: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        storage_dir: Path | str | None = None,
+        journal: bool = True,
+        fsync_interval: float = 1.0,
+        blob_threshold: int | None = 16 * 1024,
+    ) -> None:
         """Initialize session storage.
 
         Args:
             storage_dir: Directory for session files. Uses default if None.
+            journal: Append changes to a journal instead of rewriting
+                the session file on every save.
+            fsync_interval: Minimum seconds between journal fsyncs. Appends
+                in between are flushed to the OS and synced by the next
+                fsync, snapshot or sync() call. 0 syncs every save.
+            blob_threshold: Strings of at least this many characters
+                (tool output, file contents) are stored once in the blob
+                store and referenced from the session. None stores
+                everything inline.
         """
         if storage_dir is None:
             storage_dir = self.get_default_dir()
@@ -142,6 +188,12 @@ class SessionStorage:
             storage_dir = Path(storage_dir)
 
         self.storage_dir = storage_dir
+        self.journal = journal
+        self.fsync_interval = fsync_interval
+        self._journal_states: dict[str, JournalState] = {}
+        self._unsynced: set[str] = set()
+        self._last_fsync = 0.0
+        self.blobs = BlobStore(storage_dir / self.BLOB_DIR_NAME, blob_threshold)
         self._ensure_directory()
 
     def _ensure_directory(self) -> None:
@@ -203,6 +255,28 @@ class SessionStorage:
         """
         return self.storage_dir / f"{session_id}{self.BACKUP_EXTENSION}"
 
+    def get_journal_path(self, session_id: str) -> Path:
+        """Get the journal file path for a session.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            Path to the journal file.
+        """
+        return self.storage_dir / f"{session_id}{self.JOURNAL_EXTENSION}"
+
+    def get_offsets_path(self, session_id: str) -> Path:
+        """Get the offset index path for a session.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            Path to the sidecar offset index used by lazy loading.
+        """
+        return self.storage_dir / f"{session_id}{self.OFFSETS_EXTENSION}"
+
     def exists(self, session_id: str) -> bool:
         """Check if a session exists in storage.
 
@@ -217,8 +291,11 @@ class SessionStorage:
     def save(self, session: Session) -> None:
         """Save a session to storage.
 
-        Uses atomic write (write to temp file, then rename) for safety.
-        Creates a backup of the existing file before overwrite.
+        Appends changes since the last save to the session journal. Writes
+        a full snapshot instead when there is no known persisted state, the
+        journal was changed by another writer, history was rewritten, or
+        the journal has outgrown the snapshot. History a lazy resume left
+        on disk is only loaded into the session for a snapshot.
         File locking ensures concurrent writes don't corrupt data.
 
         Args:
@@ -229,50 +306,231 @@ class SessionStorage:
             TimeoutError: If lock cannot be acquired within 10 seconds.
         """
         session_path = self.get_path(session.id)
-        backup_path = self.get_backup_path(session.id)
 
         # Acquire file lock to prevent concurrent writes
         with _file_lock(session_path):
-            # Create backup if file exists
-            if session_path.exists():
-                try:
-                    shutil.copy2(session_path, backup_path)
-                except OSError as e:
-                    logger.warning(f"Failed to create backup: {e}")
+            if self._save_locked(session):
+                return
 
-            # Serialize session
-            try:
-                json_data = session.to_json()
-            except Exception as e:
-                raise SessionStorageError(f"Failed to serialize session: {e}") from e
+        # A snapshot needs the full history; read it without holding the
+        # lock, which reading may take again
+        session.load_history()
+        with _file_lock(session_path):
+            self._save_locked(session)
+
+    def _save_locked(self, session: Session) -> bool:
+        """Append or snapshot a session while holding its file lock.
+
+        Returns:
+            False if a snapshot is needed but the history is not loaded.
+        """
+        from .models import Session
+
+        events = self._journal_events(session)
+        if events is None:
+            if isinstance(session, Session) and not session.history_loaded:
+                return False
+            self._write_snapshot(session)
+        elif events:
+            self._append_journal(session.id, events)
+
+        logger.debug(f"Saved session {session.id}")
+        return True
+
+    def compact(self, session: Session) -> None:
+        """Write a full snapshot of a session and reset its journal.
 
-            # Atomic write: write to temp file, then rename
+        Args:
+            session: The session to compact.
+
+        Raises:
+            SessionStorageError: If the snapshot cannot be written.
+        """
+        session.load_history()
+        with _file_lock(self.get_path(session.id)):
+            self._write_snapshot(session)
+
+    def sync(self) -> None:
+        """Fsync journal appends not yet synced to disk."""
+        for session_id in list(self._unsynced):
+            path = self.get_journal_path(session_id)
             try:
-                fd, temp_path = tempfile.mkstemp(
-                    suffix=self.SESSION_EXTENSION,
-                    dir=self.storage_dir,
-                )
-                try:
-                    with os.fdopen(fd, "w", encoding="utf-8") as f:
-                        f.write(json_data)
+                with path.open("rb+") as f:
+                    os.fsync(f.fileno())
+            except OSError as e:
+                logger.warning(f"Failed to sync journal {path.name}: {e}")
+            self._unsynced.discard(session_id)
+        self._last_fsync = time.monotonic()
 
-                    # Rename temp file to target (atomic on POSIX)
-                    Path(temp_path).replace(session_path)
+    def _journal_events(self, session: Session) -> list[dict[str, Any]] | None:
+        """Get journal events for a save, or None if a snapshot is needed."""
+        if not self.journal:
+            return None
 
-                    # Set secure permissions
-                    with contextlib.suppress(OSError):
-                        session_path.chmod(0o600)
+        state = self._journal_states.get(session.id)
+        if state is None:
+            return None
 
-                except Exception:
-                    # Clean up temp file on failure
-                    with contextlib.suppress(OSError):
-                        Path(temp_path).unlink()
-                    raise
+        # Another writer (or a recovery) changed the files since our last save
+        try:
+            journal_size = self.get_journal_path(session.id).stat().st_size
+        except OSError:
+            return None
+        if journal_size != state.journal_size:
+            return None
+
+        events = diff_session(session, state)
+        if events is None:
+            return None
+
+        if state.journal_size > max(state.snapshot_size, self.JOURNAL_COMPACT_MIN_BYTES):
+            return None
+
+        return events
+
+    def _append_journal(self, session_id: str, events: list[dict[str, Any]]) -> None:
+        """Append events to a session journal as one write."""
+        state = self._journal_states[session_id]
+        path = self.get_journal_path(session_id)
+        try:
+            data = encode_events(self.blobs.externalize(events))
+        except OSError as e:
+            raise SessionStorageError(f"Failed to store session payload: {e}") from e
+
+        try:
+            with path.open("ab") as f:
+                f.write(data)
+                f.flush()
+                self._unsynced.add(session_id)
+                if time.monotonic() - self._last_fsync >= self.fsync_interval:
+                    os.fsync(f.fileno())
+                    self._unsynced.discard(session_id)
+                    if self._unsynced:
+                        self.sync()
+                    self._last_fsync = time.monotonic()
+        except OSError as e:
+            # Unknown how much was written; the next save writes a snapshot
+            self._journal_states.pop(session_id, None)
+            raise SessionStorageError(f"Failed to append to session journal: {e}") from e
+
+        self._advance_state(state, events, len(data))
+
+    @staticmethod
+    def _advance_state(
+        state: JournalState,
+        events: list[dict[str, Any]],
+        size: int,
+    ) -> None:
+        """Update persisted state after appending events."""
+        for event in events:
+            data = event["data"]
+            if event["type"] == EVENT_MESSAGE:
+                state.message_count += 1
+                state.last_message_id = data["id"]
+            elif event["type"] == EVENT_TOOL:
+                state.tool_count += 1
+                state.last_tool_id = data["id"]
+            else:
+                state.meta = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        state.journal_size += size
+
+    def _write_snapshot(self, session: Session) -> None:
+        """Write a full snapshot and start a new journal generation.
+
+        Uses atomic write (write to temp file, then rename) for safety and
+        creates a backup of the existing snapshot before overwrite. The
+        offset index and journal are replaced after the snapshot, so a
+        crash in between leaves a stale offset index or journal that
+        open_lazy() and load() ignore.
+        """
+        session_path = self.get_path(session.id)
+        backup_path = self.get_backup_path(session.id)
 
+        # Create backup if file exists
+        if session_path.exists():
+            try:
+                shutil.copy2(session_path, backup_path)
             except OSError as e:
-                raise SessionStorageError(f"Failed to save session: {e}") from e
+                logger.warning(f"Failed to create backup: {e}")
+
+        from .models import Session
+
+        # Serialize session
+        data: dict[str, Any] | None = None
+        try:
+            if isinstance(session, Session):
+                data = self.blobs.externalize(session.to_dict())
+                snapshot, spans = encode_snapshot(data)
+            else:
+                snapshot = session.to_json().encode("utf-8")
+        except Exception as e:
+            raise SessionStorageError(f"Failed to serialize session: {e}") from e
+
+        # Only model sessions can be diffed; anything else is saved whole
+        journaled = self.journal and isinstance(session, Session)
+        generation = snapshot_generation(snapshot)
+        header = encode_header(generation)
+
+        try:
+            self._atomic_write(session_path, snapshot)
+            if data is not None:
+                st = session_path.stat()
+                offsets = encode_offsets(generation, (st.st_size, st.st_mtime_ns), data, spans)
+                self._atomic_write(self.get_offsets_path(session.id), offsets)
+            if journaled:
+                self._atomic_write(self.get_journal_path(session.id), header)
+        except OSError as e:
+            self._journal_states.pop(session.id, None)
+            raise SessionStorageError(f"Failed to save session: {e}") from e
+
+        self._unsynced.discard(session.id)
+        if journaled:
+            self._journal_states[session.id] = state_for(
+                session,
+                generation,
+                journal_size=len(header),
+                snapshot_size=len(snapshot),
+            )
+        else:
+            self._journal_states.pop(session.id, None)
+
+    def _hydrate(self, value: Any) -> Any:
+        """Resolve blob references in a value read from disk.
+
+        Raises:
+            SessionStorageError: If a referenced blob is missing or unreadable.
+        """
+        try:
+            return self.blobs.hydrate(value)
+        except (KeyError, OSError) as e:
+            raise SessionStorageError(f"Missing or unreadable session blob: {e}") from e
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        """Write a file atomically with owner-only permissions.
+
+        Raises:
+            OSError: If the write fails.
+        """
+        fd, temp_path = tempfile.mkstemp(
+            suffix=f"{path.suffix}.tmp",
+            dir=self.storage_dir,
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            # Rename temp file to target (atomic on POSIX)
+            Path(temp_path).replace(path)
+
+            # Set secure permissions
+            with contextlib.suppress(OSError):
+                path.chmod(0o600)
 
-            logger.debug(f"Saved session {session.id}")
+        except Exception:
+            # Clean up temp file on failure
+            with contextlib.suppress(OSError):
+                Path(temp_path).unlink()
+            raise
 
     def load(self, session_id: str, auto_recover: bool = True) -> Session:
         """Load a session from storage.
@@ -307,7 +565,11 @@ class SessionStorage:
                 with session_path.open(encoding="utf-8") as f:
                     json_data = f.read()
 
-                session = Session.from_json(json_data)
+                data = json.loads(json_data)
+                if BLOB_KEY in json_data:
+                    data = self._hydrate(data)
+                session = Session.from_dict(data)
+                self._replay_journal(session, json_data.encode("utf-8"))
                 logger.debug(f"Loaded session {session_id}")
                 return session
 
@@ -334,6 +596,77 @@ class SessionStorage:
                 f"Backup recovery {'failed' if auto_recover else 'disabled'}."
             ) from json_decode_error
 
+    def _replay_journal(self, session: Session, snapshot: bytes) -> None:
+        """Apply the journal paired with a snapshot and record saved state.
+
+        Args:
+            session: Session loaded from the snapshot.
+            snapshot: Snapshot file contents.
+        """
+        generation = snapshot_generation(snapshot)
+
+        path = self.get_journal_path(session.id)
+        try:
+            events, size, clean = read_journal(path, generation)
+        except OSError as e:
+            logger.warning(f"Failed to read journal for {session.id}: {e}")
+            events, size, clean = [], 0, False
+
+        if events:
+            events = self._hydrate(events)
+        apply_events(session, events)
+
+        if clean and size and self.get_offsets_path(session.id).exists():
+            self._journal_states[session.id] = state_for(
+                session, generation, journal_size=size, snapshot_size=len(snapshot)
+            )
+        else:
+            # Missing, stale or torn journal, or no offset index: the next
+            # save writes a snapshot
+            self._journal_states.pop(session.id, None)
+
+    def open_lazy(self, session_id: str, tail: int = 50) -> LazySession:
+        """Open a session without loading its full history.
+
+        Reads the metadata and the last ``tail`` messages using the
+        session's offset index; older messages are read on demand. Sessions
+        without a valid offset index are loaded whole.
+
+        Args:
+            session_id: The session ID to open.
+            tail: Number of recent messages to load.
+
+        Returns:
+            Read-only LazySession view.
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist.
+            SessionStorageError: If the session cannot be read.
+        """
+        from .lazy import LazySession, open_lazy
+
+        session_path = self.get_path(session_id)
+        if not session_path.exists():
+            raise SessionNotFoundError(f"Session not found: {session_id}")
+
+        opened = None
+        with _file_lock(session_path):
+            try:
+                opened = open_lazy(self, session_id, tail)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Failed to open session {session_id} lazily: {e}")
+            if opened is not None:
+                view, state = opened
+                # Lets a resumed session append without loading its history
+                if state is None:
+                    self._journal_states.pop(session_id, None)
+                else:
+                    self._journal_states[session_id] = state
+
+        if opened is None:
+            return LazySession.from_session(self, self.load(session_id), tail)
+        return view
+
     def load_or_none(self, session_id: str) -> Session | None:
         """Load a session, returning None if not found or corrupted.
 
@@ -352,7 +685,7 @@ class SessionStorage:
     def delete(self, session_id: str) -> bool:
         """Delete a session from storage.
 
-        Also removes any backup file.
+        Also removes any backup, journal and offset index file.
 
         Args:
             session_id: The session ID to delete.
@@ -377,6 +710,13 @@ class SessionStorage:
             with contextlib.suppress(OSError):
                 backup_path.unlink()
 
+        for path in (self.get_journal_path(session_id), self.get_offsets_path(session_id)):
+            if path.exists():
+                with contextlib.suppress(OSError):
+                    path.unlink()
+        self._journal_states.pop(session_id, None)
+        self._unsynced.discard(session_id)
+
         return deleted
 
     def list_session_ids(self) -> list[str]:
@@ -396,6 +736,67 @@ class SessionStorage:
 
         return session_ids
 
+    def file_signature(self, session_id: str) -> FileSignature | None:
+        """Get the on-disk signature of a session.
+
+        The signature changes whenever the session file or its journal is
+        written, so it can be compared to detect changes without reading
+        the files.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            Signature, or None if the session file does not exist.
+        """
+        try:
+            st = self.get_path(session_id).stat()
+        except OSError:
+            return None
+        try:
+            jst = self.get_journal_path(session_id).stat()
+            journal = (jst.st_mtime_ns, jst.st_size)
+        except OSError:
+            journal = (0, 0)
+        return (st.st_mtime_ns, st.st_size, *journal)
+
+    def scan_signatures(self) -> dict[str, FileSignature]:
+        """Get the signature of every session with one directory scan.
+
+        Returns:
+            Mapping of session ID to signature.
+        """
+        files: dict[str, tuple[int, int]] = {}
+        journals: dict[str, tuple[int, int]] = {}
+
+        try:
+            entries = list(os.scandir(self.storage_dir))
+        except OSError as e:
+            logger.warning(f"Failed to scan session directory: {e}")
+            return {}
+
+        for entry in entries:
+            stem, _, ext = entry.name.rpartition(".")
+            if f".{ext}" == self.SESSION_EXTENSION:
+                target = files
+            elif f".{ext}" == self.JOURNAL_EXTENSION:
+                target = journals
+            else:
+                continue
+            # Skip the index file (index.json -> stem is "index")
+            if stem == "index":
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            target[stem] = (st.st_mtime_ns, st.st_size)
+
+        return {
+            session_id: (*sig, *journals.get(session_id, (0, 0)))
+            for session_id, sig in files.items()
+        }
+
     def recover_from_backup(self, session_id: str) -> bool:
         """Recover a session from its backup file.
 
@@ -413,6 +814,8 @@ class SessionStorage:
 
         try:
             shutil.copy2(backup_path, session_path)
+            self.get_offsets_path(session_id).unlink(missing_ok=True)
+            self._journal_states.pop(session_id, None)
             logger.info(f"Recovered session {session_id} from backup")
             return True
         except OSError as e:
@@ -420,59 +823,88 @@ class SessionStorage:
             return False
 
     def get_storage_size(self) -> int:
-        """Get total size of all session files in bytes.
+        """Get total size of all session, journal, offset and blob files in bytes.
 
         Returns:
             Total size in bytes.
         """
-        total = 0
-        for path in self.storage_dir.glob(f"*{self.SESSION_EXTENSION}"):
-            with contextlib.suppress(OSError):
-                total += path.stat().st_size
+        total = self.blobs.get_size()
+        for pattern in (
+            f"*{self.SESSION_EXTENSION}",
+            f"*{self.JOURNAL_EXTENSION}",
+            f"*{self.OFFSETS_EXTENSION}",
+        ):
+            for path in self.storage_dir.glob(pattern):
+                with contextlib.suppress(OSError):
+                    total += path.stat().st_size
         return total
 
     def cleanup_old_sessions(
         self,
         max_age_days: int = 30,
         keep_minimum: int = 10,
+        index: SessionIndex | None = None,
     ) -> list[str]:
         """Delete sessions older than a certain age.
 
+        Session dates come from the session index, so only sessions changed
+        since the index was last written are read.
+
         Args:
             max_age_days: Maximum age in days.
             keep_minimum: Minimum number of sessions to keep.
+            index: Index of this storage. Loaded from disk if None.
 
         Returns:
             List of deleted session IDs.
         """
+        from .index import SessionIndex
 
-        cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
+        if index is None:
+            index = SessionIndex(self)
+        index.refresh()
 
-        # Load all sessions with their dates
-        sessions_with_dates: list[tuple[str, datetime]] = []
-
-        for session_id in self.list_session_ids():
-            session = self.load_or_none(session_id)
-            if session:
-                sessions_with_dates.append((session_id, session.updated_at))
+        cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
 
-        # Sort by date (newest first)
-        sessions_with_dates.sort(key=lambda x: x[1], reverse=True)
+        # Sessions by date (newest first)
+        summaries = index.list(limit=len(index))
 
         # Delete old sessions, keeping minimum
         deleted = []
-        for i, (session_id, updated_at) in enumerate(sessions_with_dates):
-            if i < keep_minimum:
-                continue  # Keep minimum sessions
-
-            if updated_at < cutoff and self.delete(session_id):
-                deleted.append(session_id)
+        for summary in summaries[keep_minimum:]:
+            if summary.updated_at < cutoff and self.delete(summary.id):
+                index.remove(summary.id)
+                deleted.append(summary.id)
 
         if deleted:
+            index.save_if_dirty(force=True)
             logger.info(f"Cleaned up {len(deleted)} old sessions")
+            self.collect_garbage()
 
         return deleted
 
+    def collect_garbage(self, grace_seconds: float = 3600.0) -> int:
+        """Remove blobs no session, journal or backup references.
+
+        Args:
+            grace_seconds: Keep blobs younger than this, which a save in
+                progress may have written before its session file.
+
+        Returns:
+            Number of blobs removed.
+        """
+        files = [
+            path
+            for extension in (
+                self.SESSION_EXTENSION,
+                self.JOURNAL_EXTENSION,
+                self.BACKUP_EXTENSION,
+                self.OFFSETS_EXTENSION,
+            )
+            for path in self.storage_dir.glob(f"*{extension}")
+        ]
+        return self.blobs.collect_garbage(files, grace_seconds=grace_seconds)
+
     def cleanup_old_backups(self) -> int:
         """Remove old backup files to prevent unbounded disk usage.
 
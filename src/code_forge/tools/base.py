@@ -21,6 +21,7 @@ from pydantic import BaseModel, Field
 
 from code_forge.core.errors import CodeForgeError
 from code_forge.core.logging import get_logger
+from code_forge.tools.registry import cached_for_tool
 
 logger = get_logger("tools")
 
@@ -239,6 +240,15 @@ class BaseTool(ABC):
         """List of accepted parameters."""
         ...
 
+    @property
+    def is_read_only(self) -> bool:
+        """Whether the tool only reads state.
+
+        Read-only tools requested in the same turn may run concurrently.
+        Override to return True for tools without side effects.
+        """
+        return False
+
     @abstractmethod
     async def _execute(self, context: ExecutionContext, **kwargs: Any) -> ToolResult:
         """Internal execution method - override in subclasses.
@@ -390,9 +400,14 @@ class BaseTool(ABC):
     def to_openai_schema(self) -> dict[str, Any]:
         """Generate OpenAI-compatible function/tool schema.
 
+        The schema is built once per registry generation; do not modify it.
+
         Returns:
             Dictionary conforming to OpenAI's function calling format.
         """
+        return cached_for_tool(self, "openai", self._build_openai_schema)
+
+    def _build_openai_schema(self) -> dict[str, Any]:
         properties: dict[str, Any] = {}
         required: list[str] = []
 
@@ -417,9 +432,14 @@ class BaseTool(ABC):
     def to_anthropic_schema(self) -> dict[str, Any]:
         """Generate Anthropic-compatible tool schema.
 
+        The schema is built once per registry generation; do not modify it.
+
         Returns:
             Dictionary conforming to Anthropic's tool format.
         """
+        return cached_for_tool(self, "anthropic", self._build_anthropic_schema)
+
+    def _build_anthropic_schema(self) -> dict[str, Any]:
         properties: dict[str, Any] = {}
         required: list[str] = []
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -15,6 +16,12 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.execution.output import (
+    OutputBuffer,
+    OutputListener,
+    output_listener,
+    pump_stream,
+)
 from code_forge.tools.execution.shell_manager import ShellManager
 from code_forge.undo.bash_detector import BashFileDetector
 
@@ -28,6 +35,10 @@ class BashTool(BaseTool):
     Supports foreground execution with timeout and
     background execution for long-running commands.
 
+    Foreground output is read into bounded head and tail buffers as it
+    arrives, and each line is passed to the ``output_listener`` of the
+    calling task, if one is set.
+
     Timeout Units:
         - The `timeout` parameter uses MILLISECONDS (LLM API convention)
         - Internally converted to seconds for asyncio.wait_for()
@@ -192,9 +203,22 @@ Usage notes:
                 cwd=working_dir,
             )
 
+            # Bounded buffers keep memory flat however much is printed
+            stdout = OutputBuffer(self.MAX_OUTPUT_SIZE)
+            stderr = OutputBuffer(self.MAX_OUTPUT_SIZE)
+            listener = output_listener.get()
+            pumps = [
+                pump_stream(stream, buffer, self._line_reporter(listener, name))
+                for name, stream, buffer in (
+                    ("stdout", process.stdout, stdout),
+                    ("stderr", process.stderr, stderr),
+                )
+                if stream is not None
+            ]
+
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout_sec
+                await asyncio.wait_for(
+                    asyncio.gather(*pumps, process.wait()), timeout=timeout_sec
                 )
             except TimeoutError:
                 process.kill()
@@ -205,20 +229,20 @@ Usage notes:
                     timeout_ms=timeout_ms,
                 )
 
-            # Decode output
-            stdout_str = stdout.decode("utf-8", errors="replace")
-            stderr_str = stderr.decode("utf-8", errors="replace")
-
             # Combine output
-            output = stdout_str
-            if stderr_str:
-                output += f"\n[stderr]\n{stderr_str}"
+            output = stdout.text()
+            if len(stderr):
+                output += f"\n[stderr]\n{stderr.text()}"
 
-            # Truncate if needed
-            truncated = False
+            # Truncate if needed, keeping the start and the end
+            truncated = stdout.truncated or stderr.truncated
             if len(output) > self.MAX_OUTPUT_SIZE:
-                output = output[: self.MAX_OUTPUT_SIZE]
-                output += f"\n\n[Output truncated at {self.MAX_OUTPUT_SIZE} characters]"
+                half = self.MAX_OUTPUT_SIZE // 2
+                omitted = len(output) - 2 * half
+                output = (
+                    f"{output[:half]}\n\n[Output truncated: {omitted} characters omitted]"
+                    f"\n\n{output[-half:]}"
+                )
                 truncated = True
 
             # Determine success
@@ -262,6 +286,15 @@ Usage notes:
                 command=command,
             )
 
+    @staticmethod
+    def _line_reporter(
+        listener: OutputListener | None, stream_name: str
+    ) -> Callable[[str], None] | None:
+        """Bind a stream name to the output listener, if one is set."""
+        if listener is None:
+            return None
+        return lambda line: listener(stream_name, line)
+
     def _check_dangerous_command(self, command: str) -> str | None:
         """Check if command matches dangerous patterns.
 
@@ -0,0 +1,219 @@
+"""Bounded capture of shell command output.
+
+A command can print far more than a tool result can hold, so output is
+kept in an ``OutputBuffer``: the first bytes written plus a ring of the
+most recent ones, with everything in between dropped. Positions in a
+stream are byte cursors that only grow, so incremental readers keep
+their place when old output is dropped.
+
+Tools can also report output lines as they arrive to the listener set
+in ``output_listener`` for the current task.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Receives (stream name, line) for each line of output
+OutputListener = Callable[[str, str], None]
+
+output_listener: ContextVar[OutputListener | None] = ContextVar(
+    "output_listener", default=None
+)
+
+OMITTED_MARKER = "\n[... {count} bytes omitted ...]\n"
+
+# Bytes requested per read from a process pipe
+READ_CHUNK_SIZE = 64 * 1024
+
+# Longer lines are reported in pieces
+MAX_LINE_BYTES = 8192
+
+
+class OutputBuffer:
+    """Byte-bounded buffer keeping the head and tail of a stream.
+
+    The first ``head_bytes`` written are kept as they are; later output
+    goes to a ring of chunks trimmed from the front, so memory stays
+    within ``max_bytes`` however much is written.
+    """
+
+    def __init__(self, max_bytes: int, head_bytes: int | None = None) -> None:
+        """Initialize buffer.
+
+        Args:
+            max_bytes: Maximum bytes retained.
+            head_bytes: Bytes of the start of the stream retained
+                (default: half of ``max_bytes``).
+        """
+        self.max_bytes = max_bytes
+        self.head_bytes = max_bytes // 2 if head_bytes is None else min(head_bytes, max_bytes)
+        self._head = bytearray()
+        self._tail: deque[bytes] = deque()
+        self._tail_size = 0
+        self._total = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes written so far; the cursor at the end of the stream."""
+        return self._total
+
+    @property
+    def dropped_bytes(self) -> int:
+        """Bytes written but no longer retained."""
+        return self._total - len(self._head) - self._tail_size
+
+    @property
+    def truncated(self) -> bool:
+        """Whether any output was dropped."""
+        return self.dropped_bytes > 0
+
+    def __len__(self) -> int:
+        """Get the number of bytes retained."""
+        return len(self._head) + self._tail_size
+
+    def write(self, data: bytes) -> None:
+        """Append output, dropping the oldest tail bytes when full.
+
+        Args:
+            data: Bytes read from the stream.
+        """
+        self._total += len(data)
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if not data:
+            return
+
+        limit = self.max_bytes - self.head_bytes
+        if len(data) >= limit:
+            # Replaces the whole ring
+            self._tail.clear()
+            self._tail_size = 0
+            data = data[len(data) - limit :]
+            if not data:
+                return
+        self._tail.append(data)
+        self._tail_size += len(data)
+
+        excess = self._tail_size - limit
+        while excess > 0:
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                self._tail_size -= len(first)
+                excess -= len(first)
+            else:
+                self._tail[0] = first[excess:]
+                self._tail_size -= excess
+                excess = 0
+
+    def read(self, cursor: int = 0) -> tuple[str, int]:
+        """Decode the output written after a cursor.
+
+        Dropped bytes are replaced with a marker. An incomplete UTF-8
+        character at the end is left for the next read.
+
+        Args:
+            cursor: Byte position to read from, as returned by a previous
+                read (0 for the start of the stream).
+
+        Returns:
+            Decoded text and the cursor to continue from.
+        """
+        position = start = min(max(cursor, 0), self._total)
+        text: list[str] = []
+        data = b""
+        if position < len(self._head):
+            data = bytes(self._head[position:])
+            position = len(self._head)
+
+        tail_start = self._total - self._tail_size
+        if position < tail_start:
+            text.append(data.decode("utf-8", errors="replace"))
+            text.append(OMITTED_MARKER.format(count=tail_start - position))
+            data = b""
+            position = start = tail_start
+
+        data += self._tail_from(position - tail_start)
+        end = _complete_utf8_length(data)
+        text.append(data[:end].decode("utf-8", errors="replace"))
+        return "".join(text), start + end
+
+    def text(self) -> str:
+        """Decode all retained output, with a marker where bytes were dropped."""
+        head = self._head.decode("utf-8", errors="replace")
+        tail = b"".join(self._tail).decode("utf-8", errors="replace")
+        if self.truncated:
+            return head + OMITTED_MARKER.format(count=self.dropped_bytes) + tail
+        return head + tail
+
+    def _tail_from(self, offset: int) -> bytes:
+        """Get the tail bytes after an offset into the ring."""
+        remaining = self._tail_size - offset
+        if remaining <= 0:
+            return b""
+        # Walk back from the newest chunk so small reads stay cheap
+        chunks: list[bytes] = []
+        for chunk in reversed(self._tail):
+            if len(chunk) >= remaining:
+                chunks.append(chunk[len(chunk) - remaining :])
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(reversed(chunks))
+
+
+def _complete_utf8_length(data: bytes) -> int:
+    """Get the length of ``data`` without a trailing partial UTF-8 character."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 == 0x80:
+            # Continuation byte; keep looking for the lead byte
+            continue
+        if byte >= 0xF0:
+            needed = 4
+        elif byte >= 0xE0:
+            needed = 3
+        elif byte >= 0xC0:
+            needed = 2
+        else:
+            needed = 1
+        return len(data) - back if needed > back else len(data)
+    return len(data)
+
+
+async def pump_stream(
+    stream: asyncio.StreamReader,
+    buffer: OutputBuffer,
+    on_line: Callable[[str], None] | None = None,
+) -> None:
+    """Copy a process stream into a buffer until EOF.
+
+    Args:
+        stream: Process stdout or stderr.
+        buffer: Buffer receiving the output.
+        on_line: Called with each complete line (without its newline)
+            as it arrives.
+    """
+    pending = b""
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        buffer.write(chunk)
+        if on_line is None:
+            continue
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            on_line(line.rstrip(b"\r").decode("utf-8", errors="replace"))
+        if len(pending) > MAX_LINE_BYTES:
+            on_line(pending.decode("utf-8", errors="replace"))
+            pending = b""
+    if on_line is not None and pending:
+        on_line(pending.rstrip(b"\r").decode("utf-8", errors="replace"))
@@ -6,12 +6,13 @@ import asyncio
 import os
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar
 
+from code_forge.core.constants import SHELL_BUFFER_SIZE
 from code_forge.core.logging import get_logger
+from code_forge.tools.execution.output import OutputBuffer
 
 if TYPE_CHECKING:
     from asyncio.subprocess import Process
@@ -37,12 +38,13 @@ class ShellProcess:
     Tracks process state, output buffers, and provides
     methods for reading output and controlling the process.
 
-    Uses deque-based chunk storage for O(1) append operations instead
-    of O(n) string concatenation. The stdout_buffer and stderr_buffer
-    properties compute the full string lazily when accessed.
+    Output is kept in byte-bounded ``OutputBuffer``s holding the head and
+    tail of each stream. ``last_read_stdout`` and ``last_read_stderr`` are
+    byte cursors into the streams; they only grow, so incremental reads
+    stay correct when old output is dropped.
     """
 
-    # Maximum buffer size (10MB) to prevent memory exhaustion
+    # Maximum buffer size per stream (10MB) to prevent memory exhaustion
     MAX_BUFFER_SIZE: ClassVar[int] = 10 * 1024 * 1024
 
     id: str
@@ -59,48 +61,46 @@ class ShellProcess:
     started_at: float | None = None
     completed_at: float | None = None
 
-    # Private chunk storage for O(1) appends (not exposed in init/repr)
-    _stdout_chunks: deque[str] = field(default_factory=deque, init=False, repr=False)
-    _stderr_chunks: deque[str] = field(default_factory=deque, init=False, repr=False)
-    _stdout_size: int = field(default=0, init=False, repr=False)
-    _stderr_size: int = field(default=0, init=False, repr=False)
+    # Private output storage (not exposed in init/repr)
+    _stdout: OutputBuffer = field(
+        default_factory=lambda: OutputBuffer(ShellProcess.MAX_BUFFER_SIZE),
+        init=False,
+        repr=False,
+    )
+    _stderr: OutputBuffer = field(
+        default_factory=lambda: OutputBuffer(ShellProcess.MAX_BUFFER_SIZE),
+        init=False,
+        repr=False,
+    )
 
     @property
     def stdout_buffer(self) -> str:
-        """Get stdout buffer as string (computed from chunks)."""
-        return "".join(self._stdout_chunks)
+        """Get retained stdout as a string."""
+        return self._stdout.text()
 
     @property
     def stderr_buffer(self) -> str:
-        """Get stderr buffer as string (computed from chunks)."""
-        return "".join(self._stderr_chunks)
+        """Get retained stderr as a string."""
+        return self._stderr.text()
 
-    def _append_to_buffer(self, buffer_name: str, data: str) -> None:
+    def _append_to_buffer(self, buffer_name: str, data: str | bytes) -> None:
         """Append data to buffer with size limit.
 
-        Uses deque-based storage for O(1) appends. When max size is reached,
-        removes oldest chunks to make room for new data.
+        When the buffer is full, the oldest output after its head is
+        dropped to make room for new data.
 
         Args:
             buffer_name: 'stdout' or 'stderr'
             data: Data to append
         """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
         if buffer_name == "stdout":
-            self._stdout_chunks.append(data)
-            self._stdout_size += len(data)
-            # Trim oldest chunks if over limit
-            while self._stdout_size > self.MAX_BUFFER_SIZE and self._stdout_chunks:
-                removed = self._stdout_chunks.popleft()
-                self._stdout_size -= len(removed)
-                self.stdout_truncated = True
+            self._stdout.write(data)
+            self.stdout_truncated = self._stdout.truncated
         else:
-            self._stderr_chunks.append(data)
-            self._stderr_size += len(data)
-            # Trim oldest chunks if over limit
-            while self._stderr_size > self.MAX_BUFFER_SIZE and self._stderr_chunks:
-                removed = self._stderr_chunks.popleft()
-                self._stderr_size -= len(removed)
-                self.stderr_truncated = True
+            self._stderr.write(data)
+            self.stderr_truncated = self._stderr.truncated
 
     def get_new_output(self, include_stderr: bool = True) -> str:
         """Get output since last read.
@@ -111,12 +111,10 @@ class ShellProcess:
         Returns:
             New output since last read.
         """
-        stdout = self.stdout_buffer[self.last_read_stdout :]
-        self.last_read_stdout = len(self.stdout_buffer)
+        stdout, self.last_read_stdout = self._stdout.read(self.last_read_stdout)
 
         if include_stderr:
-            stderr = self.stderr_buffer[self.last_read_stderr :]
-            self.last_read_stderr = len(self.stderr_buffer)
+            stderr, self.last_read_stderr = self._stderr.read(self.last_read_stderr)
             if stderr:
                 stdout += f"\n[stderr]\n{stderr}"
 
@@ -125,8 +123,9 @@ class ShellProcess:
     def get_all_output(self) -> str:
         """Get all output from the process."""
         output = self.stdout_buffer
-        if self.stderr_buffer:
-            output += f"\n[stderr]\n{self.stderr_buffer}"
+        stderr = self.stderr_buffer
+        if stderr:
+            output += f"\n[stderr]\n{stderr}"
         return output
 
     async def read_output(self) -> bool:
@@ -147,10 +146,10 @@ class ShellProcess:
             while True:
                 try:
                     data = await asyncio.wait_for(
-                        self.process.stdout.read(4096), timeout=0.05
+                        self.process.stdout.read(SHELL_BUFFER_SIZE), timeout=0.05
                     )
                     if data:
-                        self._append_to_buffer("stdout", data.decode("utf-8", errors="replace"))
+                        self._append_to_buffer("stdout", data)
                         read_any = True
                     else:
                         # Empty data means EOF
@@ -175,10 +174,10 @@ class ShellProcess:
             while True:
                 try:
                     data = await asyncio.wait_for(
-                        self.process.stderr.read(4096), timeout=0.05
+                        self.process.stderr.read(SHELL_BUFFER_SIZE), timeout=0.05
                     )
                     if data:
-                        self._append_to_buffer("stderr", data.decode("utf-8", errors="replace"))
+                        self._append_to_buffer("stderr", data)
                         read_any = True
                     else:
                         # Empty data means EOF
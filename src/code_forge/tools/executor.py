@@ -46,6 +46,8 @@ class ToolExecutor:
         """
         self._registry = registry or ToolRegistry()
         self._executions: list[ToolExecution] = []
+        # Schema lists by format, with the registry generation they match
+        self._schemas: dict[str, tuple[int, list[dict[str, Any]]]] = {}
 
     async def execute(
         self, tool_name: str, context: ExecutionContext, **kwargs: Any
@@ -107,15 +109,23 @@ class ToolExecutor:
         Raises:
             ValueError: If the format is not recognized.
         """
+        generation = self._registry.generation
+        cached = self._schemas.get(format)
+        if cached is not None and cached[0] == generation:
+            return list(cached[1])
+
         tools = self._registry.list_all()
 
         if format == "openai":
-            return [t.to_openai_schema() for t in tools]
+            schemas = [t.to_openai_schema() for t in tools]
         elif format == "anthropic":
-            return [t.to_anthropic_schema() for t in tools]
+            schemas = [t.to_anthropic_schema() for t in tools]
         else:
             raise ValueError(f"Unknown schema format: {format}")
 
+        self._schemas[format] = (generation, schemas)
+        return list(schemas)
+
     def get_schemas_by_category(
         self, category: ToolCategory, format: str = "openai"
     ) -> list[dict[str, Any]]:
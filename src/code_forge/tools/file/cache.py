@@ -0,0 +1,645 @@
+"""Shared read-through cache of file contents.
+
+Read, Grep and Edit used to hit the filesystem independently, and
+parallel subagents re-read the same files over and over. The file cache
+keeps recently read files in memory for the whole process, together
+with what is derived from them: decoded lines, line offsets and the
+detected encoding (the chardet pass is expensive).
+
+An entry is only served while the file's mtime, size and inode match
+the ones it was read with, so files changed by other processes are
+re-read. Write and Edit invalidate their files explicitly, and a
+watchdog (inotify on Linux) watcher can be started to drop entries as
+soon as files change. Entries are evicted least recently used first
+once the cache grows past its byte budget, which counts the decoded text
+and line tables of an entry as well as its raw bytes.
+
+Files too large to cache get a sparse line index instead: the offset of
+a line start roughly every 64KB, built by counting newlines over a
+memory map. Reading lines 100000-100100 of a large log then seeks close
+to line 100000 and reads only what is returned.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import itertools
+import mmap
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import chardet
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from code_forge.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from watchdog.observers.api import BaseObserver
+
+logger = get_logger("tools.file.cache")
+
+# Codec names for chardet results Python spells differently
+_ENCODING_MAP = {
+    "ascii": "utf-8",  # ASCII is subset of UTF-8
+    "iso-8859-1": "latin-1",
+    "windows-1252": "cp1252",
+}
+
+
+def detect_encoding(raw_data: bytes) -> tuple[str, float]:
+    """Detect the encoding of file contents.
+
+    Args:
+        raw_data: Contents of the file.
+
+    Returns:
+        Tuple of (encoding, confidence). Falls back to UTF-8 if
+        detection fails.
+    """
+    if not raw_data:
+        # Empty file, default to UTF-8
+        return "utf-8", 1.0
+
+    # Check for BOM markers first (chardet sometimes misses these)
+    if raw_data.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig", 1.0
+    if raw_data.startswith(b"\xff\xfe"):
+        return "utf-16-le", 1.0
+    if raw_data.startswith(b"\xfe\xff"):
+        return "utf-16-be", 1.0
+
+    result = chardet.detect(raw_data)
+    encoding = result.get("encoding")
+    confidence = result.get("confidence", 0.0)
+    if encoding:
+        encoding = encoding.lower()
+        return _ENCODING_MAP.get(encoding, encoding), confidence
+
+    return "utf-8", 0.0
+
+
+def translate_newlines(text: str) -> str:
+    """Apply universal newline translation, as text-mode ``open()`` does."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class CachedFile:
+    """Contents of a file as read at one point in time.
+
+    Derived values are computed on first use and kept with the entry;
+    the memory each one takes is reported to ``on_grow``. Instances are
+    shared between threads and must not be mutated.
+    """
+
+    __slots__ = (
+        "_encoding",
+        "_line_offsets",
+        "_lines",
+        "_lock",
+        "_on_grow",
+        "_text",
+        "data",
+        "inode",
+        "mtime_ns",
+        "path",
+        "size",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        data: bytes,
+        stat: os.stat_result,
+        on_grow: Callable[[CachedFile, int], None] | None = None,
+    ) -> None:
+        """Initialize entry.
+
+        Args:
+            path: Absolute path of the file.
+            data: Contents of the file.
+            stat: Status of the file when it was read.
+            on_grow: Called with the entry and the bytes taken by a
+                derived value when one is computed.
+        """
+        self.path = path
+        self.data = data
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.inode = stat.st_ino
+        self._on_grow = on_grow
+        self._lock = threading.Lock()
+        self._encoding: tuple[str, float] | None = None
+        self._text: str | None = None
+        self._lines: list[str] | None = None
+        self._line_offsets: list[int] | None = None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Check whether the file is unchanged since it was read."""
+        return (
+            stat.st_mtime_ns == self.mtime_ns
+            and stat.st_size == self.size
+            and stat.st_ino == self.inode
+        )
+
+    @property
+    def encoding(self) -> tuple[str, float]:
+        """Detected encoding and confidence of the contents."""
+        if self._encoding is None:
+            with self._lock:
+                if self._encoding is None:
+                    self._encoding = detect_encoding(self.data)
+        return self._encoding
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Decode the contents with universal newline translation.
+
+        Args:
+            encoding: Codec to decode with.
+            errors: Codec error handling.
+
+        Returns:
+            The text ``open(path, encoding=encoding).read()`` would return.
+
+        Raises:
+            UnicodeDecodeError: If the contents cannot be decoded.
+        """
+        return translate_newlines(self.data.decode(encoding, errors))
+
+    @property
+    def text(self) -> str:
+        """The UTF-8 text (invalid bytes replaced), with newlines translated.
+
+        Same as ``open(path, encoding="utf-8", errors="replace").read()``.
+        """
+        if self._text is None:
+            with self._lock:
+                if self._text is not None:
+                    return self._text
+                self._text = self.decode("utf-8", "replace")
+            self._grew(sys.getsizeof(self._text))
+        return self._text
+
+    @property
+    def lines(self) -> list[str]:
+        """Lines of ``text``, with line endings.
+
+        Same as ``open(path, encoding="utf-8", errors="replace").readlines()``.
+        """
+        if self._lines is None:
+            lines = _split_lines(self.text)
+            with self._lock:
+                if self._lines is not None:
+                    return self._lines
+                self._lines = lines
+            self._grew(_list_size(lines))
+        return self._lines
+
+    @property
+    def line_offsets(self) -> list[int]:
+        """Offsets in ``text`` at which each line starts."""
+        if self._line_offsets is None:
+            offsets = [0]
+            offsets.extend(itertools.accumulate(len(line) for line in self.lines[:-1]))
+            with self._lock:
+                if self._line_offsets is not None:
+                    return self._line_offsets
+                self._line_offsets = offsets
+            self._grew(_list_size(offsets))
+        return self._line_offsets
+
+    def line_index(self, offset: int) -> int:
+        """Get the 0-based line containing an offset in ``text``."""
+        return bisect.bisect_right(self.line_offsets, offset) - 1
+
+    def _grew(self, nbytes: int) -> None:
+        if self._on_grow is not None:
+            self._on_grow(self, nbytes)
+
+
+def _list_size(items: list[Any]) -> int:
+    """Estimate the memory taken by a list and the objects in it."""
+    return sys.getsizeof(items) + sum(map(sys.getsizeof, items))
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split translated text after each newline, keeping the line endings.
+
+    Unlike ``str.splitlines``, form feeds and other separators do not end
+    lines, matching iteration over a text-mode file.
+    """
+    lines = text.split("\n")
+    last = lines.pop()
+    result = [line + "\n" for line in lines]
+    if last:
+        result.append(last)
+    return result
+
+
+class LineIndex:
+    """Sparse index of the line starts of a file.
+
+    Records the offset of a line start about every ``CHUNK_SIZE`` bytes,
+    so any line is found by seeking to the nearest recorded line and
+    skipping at most one chunk. Lines end at ``\\n``.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    __slots__ = ("_lines", "_offsets", "inode", "mtime_ns", "path", "size", "total_lines")
+
+    def __init__(
+        self,
+        path: str,
+        stat: os.stat_result,
+        offsets: array[int],
+        lines: array[int],
+        total_lines: int,
+    ) -> None:
+        """Initialize index.
+
+        Args:
+            path: Absolute path of the file.
+            stat: Status of the file when it was indexed.
+            offsets: Offsets of the recorded line starts, ascending.
+            lines: 0-based numbers of the recorded lines.
+            total_lines: Number of lines in the file.
+        """
+        self.path = path
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.inode = stat.st_ino
+        self.total_lines = total_lines
+        self._offsets = offsets
+        self._lines = lines
+
+    @classmethod
+    def build(cls, path: str) -> LineIndex:
+        """Index a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            Index of the file's current contents.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        offsets = array("Q", [0])
+        lines = array("Q", [0])
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            if size == 0:
+                return cls(path, stat, offsets, lines, 0)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                position = 0
+                newlines = 0
+                while True:
+                    # Count a chunk, then move its end to the next line start
+                    chunk_end = position + cls.CHUNK_SIZE - 1
+                    newlines += data[position:chunk_end].count(b"\n")
+                    boundary = data.find(b"\n", chunk_end)
+                    if boundary == -1:
+                        break
+                    newlines += 1
+                    position = boundary + 1
+                    if position >= size:
+                        break
+                    offsets.append(position)
+                    lines.append(newlines)
+                # An unterminated last line counts too
+                total_lines = newlines + (data[size - 1] != ord("\n"))
+        return cls(path, stat, offsets, lines, total_lines)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Check whether the file is unchanged since it was indexed."""
+        return (
+            stat.st_mtime_ns == self.mtime_ns
+            and stat.st_size == self.size
+            and stat.st_ino == self.inode
+        )
+
+    def read_lines(self, start: int, count: int) -> list[str]:
+        """Read lines of the file as UTF-8 text, invalid bytes replaced.
+
+        Args:
+            start: 0-based number of the first line.
+            count: Maximum number of lines.
+
+        Returns:
+            The lines, with line endings.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if start >= self.total_lines or count <= 0:
+            return []
+        result: list[str] = []
+        with (
+            open(self.path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            size = len(data)
+            i = bisect.bisect_right(self._lines, start) - 1
+            position = self._offsets[i]
+            for _ in range(start - self._lines[i]):
+                found = data.find(b"\n", position)
+                if found == -1:
+                    return result
+                position = found + 1
+            while len(result) < count and position < size:
+                found = data.find(b"\n", position)
+                end = size if found == -1 else found + 1
+                result.append(data[position:end].decode("utf-8", "replace"))
+                position = end
+        return result
+
+
+@dataclass
+class FileCacheStats:
+    """File cache statistics.
+
+    Attributes:
+        hits: Reads answered from memory.
+        misses: Reads that went to the filesystem.
+        evictions: Entries removed to stay within the byte budget.
+        invalidations: Entries dropped because their file changed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads answered from memory."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {**dataclasses.asdict(self), "hit_rate": self.hit_rate}
+
+
+class FileCache:
+    """Size-bounded, LRU cache of file contents validated by file status.
+
+    Thread-safe.
+    """
+
+    DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+    DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
+    # Line indexes of large files kept (each is a few KB per 100MB)
+    MAX_LINE_INDEXES = 64
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            max_bytes: Total size of the entries, derived values
+                included, above which old entries are evicted.
+            max_file_size: Files larger than this are never cached.
+        """
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.stats = FileCacheStats()
+        self._entries: OrderedDict[str, CachedFile] = OrderedDict()
+        self._indexes: OrderedDict[str, LineIndex] = OrderedDict()
+        # Bytes counted for each entry
+        self._charged: dict[str, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._watcher: BaseObserver | None = None
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normpath(os.path.abspath(path))
+
+    def get(self, path: str) -> CachedFile | None:
+        """Get the current contents of a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The cached or freshly read contents, or None if the file is
+            larger than ``max_file_size``.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        key = self._key(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.matches(stat):
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+            if entry is not None:
+                self._remove(key)
+                self.stats.invalidations += 1
+            self.stats.misses += 1
+
+        if stat.st_size > self.max_file_size:
+            return None
+
+        with open(key, "rb") as f:
+            # Status of the open file, in case it was replaced meanwhile
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        if len(data) != stat.st_size:
+            # Changed while being read; serve it but do not keep it
+            return CachedFile(key, data, stat)
+
+        entry = CachedFile(key, data, stat, on_grow=self._grow)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._charged[key] = len(data)
+            self._size += len(data)
+            self._evict()
+        return entry
+
+    def _grow(self, entry: CachedFile, nbytes: int) -> None:
+        """Count a derived value computed for an entry."""
+        with self._lock:
+            if self._entries.get(entry.path) is not entry:
+                # Already dropped from the cache
+                return
+            self._charged[entry.path] += nbytes
+            self._size += nbytes
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        self._size -= self._charged.pop(key)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until within budget."""
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+
+    def line_index(self, path: str) -> LineIndex:
+        """Get the current line index of a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The cached or freshly built index.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        key = self._key(path)
+        stat = os.stat(key)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.matches(stat):
+                self._indexes.move_to_end(key)
+                return index
+
+        index = LineIndex.build(key)
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.MAX_LINE_INDEXES:
+                self._indexes.popitem(last=False)
+        return index
+
+    def invalidate(self, path: str) -> bool:
+        """Drop the entry of a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            True if an entry was dropped.
+        """
+        key = self._key(path)
+        with self._lock:
+            self._indexes.pop(key, None)
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            self.stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+            self._charged.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Estimated memory of the cached entries, derived values included."""
+        with self._lock:
+            return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+        with self._lock:
+            return self._key(path) in self._entries
+
+    def watch(self, root: str) -> bool:
+        """Start dropping entries as soon as files under a directory change.
+
+        Entries are validated on every read anyway; the watcher only frees
+        memory of changed files early and catches changes that keep mtime
+        and size.
+
+        Args:
+            root: Directory to watch recursively.
+
+        Returns:
+            True if a watcher was started.
+        """
+        if self._watcher is not None:
+            logger.debug("File cache watcher already running")
+            return False
+        if not os.path.isdir(root):
+            return False
+
+        watcher = Observer()
+        watcher.schedule(  # type: ignore[no-untyped-call]
+            _InvalidationHandler(self), root, recursive=True
+        )
+        try:
+            watcher.start()  # type: ignore[no-untyped-call]
+        except OSError as e:
+            # inotify watch limits are easily exhausted on large trees
+            logger.warning(f"Cannot watch {root} for file changes: {e}")
+            return False
+        self._watcher = watcher
+        logger.debug(f"Watching {root} for file cache invalidation")
+        return True
+
+    def stop_watching(self, timeout: float | None = 10.0) -> None:
+        """Stop the watcher, if running.
+
+        Args:
+            timeout: Maximum seconds to wait for the watcher thread.
+        """
+        watcher, self._watcher = self._watcher, None
+        if watcher is None:
+            return
+        watcher.stop()  # type: ignore[no-untyped-call]
+        watcher.join(timeout=timeout)
+
+
+class _InvalidationHandler(FileSystemEventHandler):
+    """Drops cache entries of files reported changed."""
+
+    def __init__(self, cache: FileCache) -> None:
+        super().__init__()
+        self._cache = cache
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory:
+            return
+        self._cache.invalidate(os.fsdecode(event.src_path))
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            self._cache.invalidate(os.fsdecode(dest_path))
+
+
+_file_cache: FileCache | None = None
+_file_cache_lock = threading.Lock()
+
+
+def get_file_cache() -> FileCache:
+    """Get the file cache shared by all file tools in this process."""
+    global _file_cache  # noqa: PLW0603
+    if _file_cache is None:
+        with _file_cache_lock:
+            if _file_cache is None:
+                _file_cache = FileCache()
+    return _file_cache
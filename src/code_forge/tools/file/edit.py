@@ -6,8 +6,6 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
-import chardet
-
 from code_forge.tools.base import (
     BaseTool,
     ExecutionContext,
@@ -15,6 +13,7 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.file.cache import detect_encoding, get_file_cache
 from code_forge.tools.file.utils import validate_path_security
 
 if TYPE_CHECKING:
@@ -26,6 +25,8 @@ logger = logging.getLogger(__name__)
 def detect_file_encoding(file_path: str) -> tuple[str, float]:
     """Detect the encoding of a file.
 
+    The result is kept in the shared file cache until the file changes.
+
     Args:
         file_path: Path to the file to detect encoding for.
 
@@ -35,41 +36,11 @@ def detect_file_encoding(file_path: str) -> tuple[str, float]:
         Falls back to UTF-8 if detection fails.
     """
     try:
-        with open(file_path, "rb") as f:
-            raw_data = f.read()
-
-        if not raw_data:
-            # Empty file, default to UTF-8
-            return "utf-8", 1.0
-
-        # Check for BOM markers first (chardet sometimes misses these)
-        if raw_data.startswith(b"\xef\xbb\xbf"):
-            return "utf-8-sig", 1.0
-        if raw_data.startswith(b"\xff\xfe"):
-            return "utf-16-le", 1.0
-        if raw_data.startswith(b"\xfe\xff"):
-            return "utf-16-be", 1.0
-
-        # Use chardet for detection
-        result = chardet.detect(raw_data)
-        encoding = result.get("encoding")
-        confidence = result.get("confidence", 0.0)
-
-        if encoding:
-            # Normalize encoding name
-            encoding = encoding.lower()
-            # Map some common chardet names to Python codec names
-            encoding_map = {
-                "ascii": "utf-8",  # ASCII is subset of UTF-8
-                "iso-8859-1": "latin-1",
-                "windows-1252": "cp1252",
-            }
-            encoding = encoding_map.get(encoding, encoding)
-            return encoding, confidence
-
-        # Fallback to UTF-8
-        return "utf-8", 0.0
-
+        cached = get_file_cache().get(file_path)
+        if cached is None:
+            with open(file_path, "rb") as f:
+                return detect_encoding(f.read())
+        return cached.encoding
     except OSError:
         # Can't read file, fall back to UTF-8
         return "utf-8", 0.0
@@ -188,8 +159,12 @@ Usage:
             )
 
             # Read with detected encoding
-            with open(file_path, encoding=encoding) as f:
-                content = f.read()
+            cached = get_file_cache().get(file_path)
+            if cached is not None:
+                content = cached.decode(encoding)
+            else:
+                with open(file_path, encoding=encoding) as f:
+                    content = f.read()
 
             count = content.count(old_string)
 
@@ -225,8 +200,11 @@ Usage:
                 replacements = 1
 
             # Write back with same encoding
-            with open(file_path, "w", encoding=encoding) as f:
-                f.write(new_content)
+            try:
+                with open(file_path, "w", encoding=encoding) as f:
+                    f.write(new_content)
+            finally:
+                get_file_cache().invalidate(file_path)
 
             # Commit undo entry after successful write
             if undo_manager:
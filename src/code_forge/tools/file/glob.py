@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
-import glob as glob_module
+import heapq
 import os
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -16,12 +18,15 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.file.walk import PathGlob
 
 
 class GlobTool(BaseTool):
     """Find files matching a glob pattern.
 
-    Returns files sorted by modification time (newest first).
+    Returns files sorted by modification time (newest first). The pattern
+    is matched while walking, so excluded directories are never entered,
+    and only the ``MAX_RESULTS`` newest files are kept.
     """
 
     # Patterns to exclude by default
@@ -78,6 +83,10 @@ Usage:
     def category(self) -> ToolCategory:
         return ToolCategory.FILE
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -125,51 +134,31 @@ Usage:
                     "Path traversal (..) is not allowed in glob patterns"
                 )
 
-            # Build full pattern (always relative to base_path)
-            full_pattern = os.path.join(base_path, pattern)
-
-            # Run glob in a thread with timeout to avoid blocking
-            def do_glob() -> list[str]:
-                matches = glob_module.glob(full_pattern, recursive=True)
-                # Filter to files only
-                files = [f for f in matches if os.path.isfile(f)]
-                # Security: Ensure all results are within base_path
-                # This catches edge cases where glob might match outside
-                safe_files = []
-                for f in files:
-                    try:
-                        resolved = Path(f).resolve()
-                        if resolved.is_relative_to(resolved_base):
-                            safe_files.append(f)
-                    except (OSError, ValueError):
-                        # Skip files we can't resolve
-                        pass
-                # Exclude common patterns
-                return self._filter_excludes(safe_files)
+            matcher = PathGlob(pattern)
+            cancelled = threading.Event()
 
+            # Walk in a thread with timeout to avoid blocking
             try:
                 loop = asyncio.get_event_loop()
-                files = await asyncio.wait_for(
-                    loop.run_in_executor(None, do_glob),
+                files, total = await asyncio.wait_for(
+                    loop.run_in_executor(
+                        None,
+                        self._newest_matches,
+                        matcher,
+                        base_path,
+                        resolved_base,
+                        cancelled,
+                    ),
                     timeout=self.TIMEOUT_SECONDS,
                 )
             except asyncio.TimeoutError:
+                cancelled.set()
                 return ToolResult.fail(
                     f"Search timed out after {self.TIMEOUT_SECONDS}s. "
                     f"Try a more specific pattern or search in a subdirectory."
                 )
 
-            # Sort by modification time (newest first)
-            try:
-                files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-            except OSError:
-                # If we can't get mtime for some files, just use default order
-                pass
-
-            # Limit results
-            truncated = len(files) > self.MAX_RESULTS
-            if truncated:
-                files = files[: self.MAX_RESULTS]
+            truncated = total > self.MAX_RESULTS
 
             # Format output
             output = "\n".join(files) if files else "No matches found"
@@ -186,33 +175,68 @@ Usage:
             # Don't expose detailed OS error - could leak filesystem info
             return ToolResult.fail("Error searching files: unable to access directory")
 
-    def _filter_excludes(self, files: list[str]) -> list[str]:
-        """Filter out files matching exclude patterns.
+    def _newest_matches(
+        self,
+        matcher: PathGlob,
+        base_path: str,
+        resolved_base: Path,
+        cancelled: threading.Event,
+    ) -> tuple[list[str], int]:
+        """Find the newest files matching a pattern.
+
+        Args:
+            matcher: Compiled pattern.
+            base_path: Directory to search.
+            resolved_base: Canonical form of ``base_path``.
+            cancelled: Set to stop the walk early.
+
+        Returns:
+            Up to ``MAX_RESULTS`` paths, newest first, and the number of
+            matching files.
+        """
+        total = 0
+
+        def candidates() -> Iterator[tuple[float, str]]:
+            nonlocal total
+            for entry in matcher.walk(base_path, prune=self._excluded_names):
+                if cancelled.is_set():
+                    return
+                if self._is_excluded_file(entry.name):
+                    continue
+                try:
+                    # Security: links must not lead outside base_path
+                    if entry.is_symlink() and not Path(
+                        os.path.realpath(entry.path)
+                    ).is_relative_to(resolved_base):
+                        continue
+                    mtime = entry.stat().st_mtime
+                except (OSError, ValueError):
+                    # Skip files we can't resolve
+                    continue
+                total += 1
+                yield -mtime, entry.path
+
+        # A bounded heap keeps the newest files without sorting every match
+        newest = heapq.nsmallest(self.MAX_RESULTS, candidates())
+        return [path for _, path in newest], total
+
+    @property
+    def _excluded_names(self) -> frozenset[str]:
+        """Excluded names that are not wildcard patterns."""
+        return frozenset(e for e in self.DEFAULT_EXCLUDES if not e.startswith("*"))
+
+    def _is_excluded_file(self, name: str) -> bool:
+        """Check whether a file name matches an exclude pattern.
 
         Handles two types of patterns:
         - Wildcard patterns (*.pyc): Match file extensions
-        - Directory patterns (node_modules): Match exact directory names in path
+        - Names (.env): Match the exact file name; directories with these
+          names are pruned from the walk
         """
-        result = []
-        for f in files:
-            path = Path(f)
-            parts = path.parts
-            excluded = False
-
-            for exclude in self.DEFAULT_EXCLUDES:
-                if exclude.startswith("*"):
-                    # Wildcard pattern - use fnmatch for proper glob matching
-                    if fnmatch.fnmatch(path.name, exclude):
-                        excluded = True
-                        break
-                elif exclude in parts:
-                    # Directory name - must be exact match in path components
-                    # This correctly handles "node_modules" without matching
-                    # "my_node_modules" or "node_modules_backup"
-                    excluded = True
-                    break
-
-            if not excluded:
-                result.append(f)
-
-        return result
+        for exclude in self.DEFAULT_EXCLUDES:
+            if exclude.startswith("*"):
+                if fnmatch.fnmatch(name, exclude):
+                    return True
+            elif name == exclude:
+                return True
+        return False
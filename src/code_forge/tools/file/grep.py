@@ -1,13 +1,33 @@
-"""Grep tool implementation."""
+"""Grep tool implementation.
+
+Files are found by a walk that prunes ``.git``, ``node_modules`` and
+``.gitignore``d paths, or by ``rg`` when it is installed, and searched on
+a thread pool through the shared file cache. The search stops as soon as
+the requested page of results (``offset + head_limit``) is complete.
+
+In multiline mode the pattern is applied to whole files with ``.``
+matching newlines. Large files are then memory-mapped and decoded
+without splitting them into lines or caching them, and match offsets
+are mapped back to line numbers by counting newlines.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import glob as glob_module
+import bisect
+import mmap
 import os
 import re
+import shutil
+import subprocess
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
+from code_forge.core.logging import get_logger
 from code_forge.tools.base import (
     BaseTool,
     ExecutionContext,
@@ -15,6 +35,32 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.file.cache import CachedFile, get_file_cache, translate_newlines
+from code_forge.tools.file.walk import PRUNED_DIRS, compile_path_glob, walk_files
+
+logger = get_logger("tools.file.grep")
+
+# Constructs whose meaning changes when a pattern is applied to a whole
+# file instead of a single line; such patterns are matched line by line
+_LINE_ONLY_SYNTAX = re.compile(r"\\[AZ]|\(\?<[=!]")
+
+
+@dataclass(frozen=True)
+class _Query:
+    """What to search for and how to report it."""
+
+    regex: re.Pattern[str]
+    # The pattern in multiline mode, to scan whole files for candidate
+    # lines; None if it can only be matched line by line
+    scan: re.Pattern[str] | None
+    output_mode: str
+    # Match whole files instead of single lines
+    multiline: bool
+    show_line_numbers: bool
+    before_context: int
+    after_context: int
+    # Results after which the search stops, None for all
+    limit: int | None
 
 
 class GrepTool(BaseTool):
@@ -26,6 +72,10 @@ class GrepTool(BaseTool):
     MAX_FILE_SIZE: ClassVar[int] = 10 * 1024 * 1024  # 10MB
     DEFAULT_HEAD_LIMIT: ClassVar[int] = 100
     DEFAULT_TIMEOUT: ClassVar[float] = 60.0  # 60 seconds default timeout
+    MAX_WORKERS: ClassVar[int] = 8
+    BINARY_CHECK_BYTES: ClassVar[int] = 1024
+    # Multiline searches of larger files bypass the file cache
+    MMAP_THRESHOLD: ClassVar[int] = 1024 * 1024  # 1MB
 
     # Type to extension mapping
     TYPE_EXTENSIONS: ClassVar[dict[str, list[str]]] = {
@@ -42,6 +92,15 @@ class GrepTool(BaseTool):
         "yaml": ["*.yaml", "*.yml"],
     }
 
+    def __init__(self, use_ripgrep: bool = True) -> None:
+        """Initialize grep tool.
+
+        Args:
+            use_ripgrep: Let ``rg``, if installed, find the files that
+                contain matches. Results are the same either way.
+        """
+        self._use_ripgrep = use_ripgrep
+
     @property
     def name(self) -> str:
         return "Grep"
@@ -52,6 +111,7 @@ class GrepTool(BaseTool):
 
 Usage:
 - Supports full regex syntax (e.g., "log.*Error", "function\\s+\\w+")
+- Skips .gitignored files and directories such as .git and node_modules
 - Filter files with glob parameter (e.g., "*.js", "**/*.tsx")
 - Output modes: "content" shows lines, "files_with_matches" shows paths, "count" shows counts
 - Use -i for case-insensitive, -A/-B/-C for context lines"""
@@ -60,6 +120,10 @@ Usage:
     def category(self) -> ToolCategory:
         return ToolCategory.FILE
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -135,7 +199,8 @@ Usage:
             ToolParameter(
                 name="multiline",
                 type="boolean",
-                description="Enable multiline matching mode",
+                description="Match across lines: the pattern is applied to "
+                "whole files and . matches newlines",
                 required=False,
                 default=False,
             ),
@@ -187,7 +252,7 @@ Usage:
 
         try:
             # Compile regex
-            flags = re.MULTILINE if multiline else 0
+            flags = re.MULTILINE | re.DOTALL if multiline else 0
             if case_insensitive:
                 flags |= re.IGNORECASE
 
@@ -196,20 +261,33 @@ Usage:
             except re.error as e:
                 return ToolResult.fail(f"Invalid regex pattern: {e!s}")
 
-            # Get files to search
-            files = self._get_files(search_path, glob_filter, type_filter)
+            query = _Query(
+                regex=regex,
+                scan=(
+                    None
+                    if multiline or _LINE_ONLY_SYNTAX.search(pattern)
+                    else re.compile(pattern, flags | re.MULTILINE)
+                ),
+                output_mode=output_mode,
+                multiline=multiline,
+                show_line_numbers=show_line_numbers,
+                before_context=before_context,
+                after_context=after_context,
+                limit=offset + head_limit if head_limit else None,
+            )
 
-            # Search files with timeout
+            # Search files with timeout; the flag stops abandoned workers
+            stop = threading.Event()
             try:
-                results = await asyncio.wait_for(
+                results, complete = await asyncio.wait_for(
                     asyncio.to_thread(
-                        self._search_files_sync,
-                        files,
-                        regex,
-                        output_mode,
-                        show_line_numbers,
-                        before_context,
-                        after_context,
+                        self._search_sync,
+                        search_path,
+                        glob_filter,
+                        type_filter,
+                        query,
+                        stop,
+                        timeout,
                     ),
                     timeout=timeout,
                 )
@@ -218,6 +296,8 @@ Usage:
                     f"Search timed out after {timeout} seconds. "
                     "Try narrowing the search path or pattern."
                 )
+            finally:
+                stop.set()
 
             # Apply offset and limit
             total_results = len(results)
@@ -231,136 +311,392 @@ Usage:
             return ToolResult.ok(
                 output,
                 pattern=pattern,
+                # A lower bound if the search stopped early
                 total_matches=total_results,
                 returned_matches=len(results),
                 offset=offset,
                 head_limit=head_limit,
+                search_complete=complete,
             )
 
         except OSError:
             # Don't expose detailed OS error - could leak filesystem info
             return ToolResult.fail("Error searching: unable to access files")
 
-    def _search_files_sync(
+    def _search_sync(
         self,
-        files: list[str],
-        regex: re.Pattern[str],
-        output_mode: str,
-        show_line_numbers: bool,
-        before_context: int,
-        after_context: int,
-    ) -> list[dict[str, Any]]:
-        """Search files synchronously (called via asyncio.to_thread for timeout)."""
+        search_path: str,
+        glob_filter: str | None,
+        type_filter: str | None,
+        query: _Query,
+        stop: threading.Event,
+        timeout: float,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Search for matches (called via asyncio.to_thread for timeout).
+
+        Returns:
+            Results in file path order, and whether all files were searched.
+        """
+        files: Iterable[str] | None = None
+        if self._use_ripgrep and not os.path.isfile(search_path):
+            files = self._ripgrep_files(search_path, query, timeout)
+            if files is not None:
+                include = self._path_filter(glob_filter, type_filter)
+                start = len(os.path.normpath(search_path).rstrip(os.sep)) + 1
+                files = [
+                    f for f in files
+                    if include is None or include(f[start:].replace(os.sep, "/"))
+                ]
+        if files is None:
+            files = self._get_files(search_path, glob_filter, type_filter)
+        return self._search_files(files, query, stop)
+
+    def _search_files(
+        self, files: Iterable[str], query: _Query, stop: threading.Event
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Search files on a thread pool, in order, until enough results."""
         results: list[dict[str, Any]] = []
-        for file_path in files:
-            file_results = self._search_file(
-                file_path,
-                regex,
-                output_mode,
-                show_line_numbers,
-                before_context,
-                after_context,
-            )
-            if file_results:
-                results.extend(file_results)
-        return results
+        file_iter = iter(files)
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+
+        with ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="grep"
+        ) as pool:
+
+            def submit() -> None:
+                # Keep a bounded window of files in flight, in walk order
+                while len(pending) < 2 * self.MAX_WORKERS and not stop.is_set():
+                    file_path = next(file_iter, None)
+                    if file_path is None:
+                        return
+                    pending.append(pool.submit(self._search_file, file_path, query))
+
+            submit()
+            while pending:
+                results.extend(pending.popleft().result())
+                enough = query.limit is not None and len(results) >= query.limit
+                if enough or stop.is_set():
+                    for future in pending:
+                        future.cancel()
+                    remaining = bool(pending) or next(file_iter, None) is not None
+                    return results, not remaining
+                submit()
+
+        return results, True
 
     def _get_files(
         self,
         search_path: str,
         glob_filter: str | None,
         type_filter: str | None,
-    ) -> list[str]:
-        """Get list of files to search."""
+    ) -> Iterator[str]:
+        """Iterate over the files to search, in path order."""
         if os.path.isfile(search_path):
-            return [search_path]
-
-        files: list[str] = []
-
+            yield search_path
+            return
+
+        include = self._path_filter(glob_filter, type_filter)
+        root = os.path.normpath(search_path)
+        start = len(root.rstrip(os.sep)) + 1
+        for entry in walk_files(root):
+            if include is None or include(entry.path[start:].replace(os.sep, "/")):
+                yield entry.path
+
+    def _path_filter(
+        self, glob_filter: str | None, type_filter: str | None
+    ) -> Callable[[str], bool] | None:
+        """Get a check of paths relative to the search root, None for all."""
         if glob_filter:
-            pattern = os.path.join(search_path, "**", glob_filter)
-            files = glob_module.glob(pattern, recursive=True)
+            patterns = [compile_path_glob(glob_filter)]
         elif type_filter and type_filter in self.TYPE_EXTENSIONS:
-            for ext in self.TYPE_EXTENSIONS[type_filter]:
-                pattern = os.path.join(search_path, "**", ext)
-                files.extend(glob_module.glob(pattern, recursive=True))
+            patterns = [compile_path_glob(ext) for ext in self.TYPE_EXTENSIONS[type_filter]]
         else:
-            # Search all files
-            for root, _, filenames in os.walk(search_path):
-                for filename in filenames:
-                    files.append(os.path.join(root, filename))
-
-        # Filter to readable text files
-        return [f for f in files if os.path.isfile(f) and self._is_text_file(f)]
+            return None
+
+        def include(relative_path: str) -> bool:
+            return any(p.fullmatch(relative_path) for p in patterns)
+
+        return include
+
+    def _ripgrep_files(
+        self, search_path: str, query: _Query, timeout: float
+    ) -> list[str] | None:
+        """Find the files that may contain matches with ``rg``.
+
+        ``rg`` only narrows down the files; they are searched like any
+        others, so results are the same with and without it.
+
+        Returns:
+            Candidate files in path order, or None if ``rg`` is not
+            installed or cannot handle the pattern.
+        """
+        rg = shutil.which("rg")
+        if rg is None:
+            return None
+
+        command = [
+            rg,
+            "--files-with-matches",
+            "--null",
+            "--no-config",
+            "--no-messages",
+            "--hidden",
+            # Only .gitignore files, like the built-in walk
+            "--no-require-git",
+            "--no-ignore-dot",
+            "--no-ignore-global",
+            "--no-ignore-exclude",
+            "--max-filesize",
+            str(self.MAX_FILE_SIZE),
+        ]
+        if query.regex.flags & re.IGNORECASE:
+            command.append("--ignore-case")
+        if query.multiline:
+            command.extend(["--multiline", "--multiline-dotall"])
+        for name in sorted(PRUNED_DIRS):
+            command.extend(["--glob", f"!{name}/"])
+        command.extend(["--regexp", query.regex.pattern, "--", os.path.normpath(search_path)])
 
-    def _is_text_file(self, file_path: str) -> bool:
-        """Check if file appears to be text."""
         try:
-            # Check file size
+            completed = subprocess.run(
+                command, capture_output=True, timeout=timeout, check=False
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"rg failed, searching without it: {e}")
+            return None
+        # 0: matches, 1: no matches, 2: error (e.g. unsupported syntax)
+        if completed.returncode not in (0, 1):
+            logger.debug(f"rg exited with {completed.returncode}, searching without it")
+            return None
+
+        paths = completed.stdout.split(b"\0")
+        return sorted(os.fsdecode(p) for p in paths if p)
+
+    def _load(self, file_path: str) -> CachedFile | None:
+        """Get the contents of a text file, None if unsuitable or unreadable."""
+        try:
             if os.path.getsize(file_path) > self.MAX_FILE_SIZE:
-                return False
-
-            # Try to read first chunk
-            with open(file_path, "rb") as f:
-                chunk = f.read(1024)
-                # Check for null bytes (binary indicator)
-                return b"\x00" not in chunk
-        except (OSError, PermissionError):
-            return False
-
-    def _search_file(
-        self,
-        file_path: str,
-        regex: re.Pattern[str],
-        output_mode: str,
-        show_line_numbers: bool,
-        before_context: int,
-        after_context: int,
-    ) -> list[dict[str, Any]]:
+                return None
+            cached = get_file_cache().get(file_path)
+            if cached is None:
+                with open(file_path, "rb") as f:
+                    cached = CachedFile(file_path, f.read(), os.fstat(f.fileno()))
+        except OSError:
+            return None
+        # Null bytes indicate a binary file
+        if b"\x00" in cached.data[: self.BINARY_CHECK_BYTES]:
+            return None
+        return cached
+
+    def _matching_lines(self, cached: CachedFile, query: _Query) -> Iterator[int]:
+        """Iterate over the indexes of lines the pattern matches.
+
+        The whole text is scanned for candidates and only lines a
+        candidate starts in are checked, so files with few matches cost
+        one regex scan instead of one per line.
+        """
+        lines = cached.lines
+        if query.scan is None:
+            for i, line in enumerate(lines):
+                if query.regex.search(line):
+                    yield i
+            return
+        if not lines:
+            return
+
+        text = cached.text
+        offsets = cached.line_offsets
+        position = 0
+        while (match := query.scan.search(text, position)) is not None:
+            i = cached.line_index(match.start())
+            if query.regex.search(lines[i]):
+                yield i
+            if i + 1 >= len(lines):
+                return
+            position = offsets[i + 1]
+
+    def _search_file(self, file_path: str, query: _Query) -> list[dict[str, Any]]:
         """Search a single file for matches."""
         results: list[dict[str, Any]] = []
 
-        try:
-            with open(file_path, encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-        except (OSError, PermissionError):
+        if query.multiline and self._size(file_path) > self.MMAP_THRESHOLD:
+            text = self._map_text(file_path)
+            if text is None:
+                return results
+            return self._search_text(file_path, text, None, query)
+
+        cached = self._load(file_path)
+        if cached is None:
             return results
+        if query.multiline:
+            return self._search_text(file_path, cached.text, cached.line_offsets, query)
 
+        lines = cached.lines
         match_count = 0
 
-        for i, line in enumerate(lines):
-            if regex.search(line):
-                match_count += 1
-
-                if output_mode == "files_with_matches":
-                    # Just need to know this file matches
-                    return [{"file": file_path}]
-                elif output_mode == "count":
-                    continue
-                else:  # content
-                    # Get context lines
-                    start = max(0, i - before_context)
-                    end = min(len(lines), i + after_context + 1)
-
-                    context_lines = []
-                    for j in range(start, end):
-                        prefix = ">" if j == i else " "
-                        line_num = f"{j + 1}:" if show_line_numbers else ""
-                        context_lines.append(
-                            f"{prefix}{line_num}{lines[j].rstrip()}"
-                        )
-
-                    results.append({
-                        "file": file_path,
-                        "line": i + 1,
-                        "content": "\n".join(context_lines),
-                    })
-
-        if output_mode == "count" and match_count > 0:
+        for i in self._matching_lines(cached, query):
+            match_count += 1
+
+            if query.output_mode == "files_with_matches":
+                # Just need to know this file matches
+                return [{"file": file_path}]
+            elif query.output_mode == "count":
+                continue
+            else:  # content
+                # Get context lines
+                start = max(0, i - query.before_context)
+                end = min(len(lines), i + query.after_context + 1)
+
+                context_lines = []
+                for j in range(start, end):
+                    prefix = ">" if j == i else " "
+                    line_num = f"{j + 1}:" if query.show_line_numbers else ""
+                    context_lines.append(
+                        f"{prefix}{line_num}{lines[j].rstrip()}"
+                    )
+
+                results.append({
+                    "file": file_path,
+                    "line": i + 1,
+                    "content": "\n".join(context_lines),
+                })
+                # More results from one file than needed are dropped anyway
+                if query.limit is not None and len(results) >= query.limit:
+                    break
+
+        if query.output_mode == "count" and match_count > 0:
             results.append({"file": file_path, "count": match_count})
 
         return results
 
+    @staticmethod
+    def _size(file_path: str) -> int:
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
+
+    def _map_text(self, file_path: str) -> str | None:
+        """Decode a large text file through a memory map, None if unsuitable.
+
+        Only the decoded text is held in memory, not the raw bytes, lines
+        or a line index.
+        """
+        try:
+            if os.path.getsize(file_path) > self.MAX_FILE_SIZE:
+                return None
+            with (
+                open(file_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+            ):
+                # Null bytes indicate a binary file
+                if b"\x00" in data[: self.BINARY_CHECK_BYTES]:
+                    return None
+                return translate_newlines(str(data, "utf-8", "replace"))
+        except (OSError, ValueError):
+            return None
+
+    def _search_text(
+        self,
+        file_path: str,
+        text: str,
+        line_offsets: list[int] | None,
+        query: _Query,
+    ) -> list[dict[str, Any]]:
+        """Search the whole text of a file with a multiline pattern.
+
+        Args:
+            file_path: File the text is from.
+            text: Contents, with newlines translated.
+            line_offsets: Offsets at which lines start, if precomputed;
+                otherwise newlines are counted between matches.
+            query: Search to run.
+
+        Returns:
+            One result per match, reported at the line it starts on.
+        """
+        results: list[dict[str, Any]] = []
+        match_count = 0
+        # Newlines before `counted`, when counting instead of indexing
+        line = 0
+        counted = 0
+
+        for match in query.regex.finditer(text):
+            match_count += 1
+
+            if query.output_mode == "files_with_matches":
+                return [{"file": file_path}]
+            elif query.output_mode == "count":
+                continue
+
+            start = match.start()
+            # Offset of the last matched character
+            end = max(match.end() - 1, start)
+            if line_offsets is not None:
+                first = bisect.bisect_right(line_offsets, start) - 1
+                last = bisect.bisect_right(line_offsets, end) - 1
+            else:
+                line += text.count("\n", counted, start)
+                counted = start
+                first = line
+                last = first + text.count("\n", start, end)
+
+            results.append({
+                "file": file_path,
+                "line": first + 1,
+                "content": self._context(text, start, end, first, last, query=query),
+            })
+            if query.limit is not None and len(results) >= query.limit:
+                break
+
+        if query.output_mode == "count" and match_count > 0:
+            results.append({"file": file_path, "count": match_count})
+
+        return results
+
+    @staticmethod
+    def _context(
+        text: str, start: int, end: int, first: int, last: int, *, query: _Query
+    ) -> str:
+        """Format the lines of a match and its context lines.
+
+        Args:
+            text: Text that was searched.
+            start: Offset of the first matched character.
+            end: Offset of the last matched character.
+            first: Index of the line the match starts on.
+            last: Index of the line the match ends on.
+            query: Search that matched.
+
+        Returns:
+            Lines of the match marked with ``>``, context lines with a space.
+        """
+        begin = text.rfind("\n", 0, start) + 1
+        first_shown = first
+        for _ in range(query.before_context):
+            if begin == 0:
+                break
+            begin = text.rfind("\n", 0, begin - 1) + 1
+            first_shown -= 1
+
+        stop = text.find("\n", end)
+        if stop == -1:
+            stop = len(text)
+        for _ in range(query.after_context):
+            # No line after a final newline
+            if stop >= len(text) - 1:
+                break
+            stop = text.find("\n", stop + 1)
+            if stop == -1:
+                stop = len(text)
+
+        context_lines = []
+        for j, line_text in enumerate(text[begin:stop].split("\n"), start=first_shown):
+            prefix = ">" if first <= j <= last else " "
+            line_num = f"{j + 1}:" if query.show_line_numbers else ""
+            context_lines.append(f"{prefix}{line_num}{line_text.rstrip()}")
+        return "\n".join(context_lines)
+
     def _format_output(self, results: list[dict[str, Any]], output_mode: str) -> str:
         """Format search results for output."""
         if not results:
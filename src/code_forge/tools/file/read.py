@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import mimetypes
@@ -15,6 +16,7 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.file.cache import get_file_cache
 from code_forge.tools.file.utils import validate_path_security
 
 
@@ -53,6 +55,10 @@ Usage:
     def category(self) -> ToolCategory:
         return ToolCategory.FILE
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     @property
     def parameters(self) -> list[ToolParameter]:
         return [
@@ -141,49 +147,77 @@ Usage:
     async def _read_text(
         self, file_path: str, offset: int, limit: int
     ) -> ToolResult:
-        """Read a text file with line numbers."""
-        lines: list[str] = []
-        line_count = 0
-        total_lines = 0
-
-        with open(file_path, encoding="utf-8", errors="replace") as f:
-            for i, line in enumerate(f, start=1):
-                total_lines = i
-
-                # Skip lines before offset
-                if i < offset:
-                    continue
-
-                # Stop after limit
-                if line_count >= limit:
-                    break
-
-                # Truncate long lines
-                clean_line = line.rstrip("\n\r")
-                if len(clean_line) > self.MAX_LINE_LENGTH:
-                    clean_line = clean_line[: self.MAX_LINE_LENGTH] + "..."
-
-                # Format with line number
-                lines.append(f"{i:6d}\t{clean_line}")
-                line_count += 1
-
-        content = "\n".join(lines)
+        """Read a text file with line numbers, off the event loop."""
+        return await asyncio.to_thread(self._read_text_sync, file_path, offset, limit)
 
+    def _read_text_sync(
+        self, file_path: str, offset: int, limit: int
+    ) -> ToolResult:
+        """Read a text file with line numbers.
+
+        Files too large for the file cache are read through their line
+        index, so only the requested lines are read and decoded.
+        """
+        cache = get_file_cache()
+        cached = cache.get(file_path)
+        if cached is not None:
+            all_lines = cached.lines
+            selected = all_lines[offset - 1 : offset - 1 + limit]
+            total_lines = len(all_lines)
+        else:
+            index = cache.line_index(file_path)
+            selected = index.read_lines(offset - 1, limit)
+            total_lines = index.total_lines
+
+        lines = [
+            self._format_line(i, line) for i, line in enumerate(selected, start=offset)
+        ]
+        return self._text_result(file_path, lines, total_lines, offset, limit)
+
+    def _format_line(self, number: int, line: str) -> str:
+        """Format a line with its number, truncating long lines."""
+        clean_line = line.rstrip("\n\r")
+        if len(clean_line) > self.MAX_LINE_LENGTH:
+            clean_line = clean_line[: self.MAX_LINE_LENGTH] + "..."
+        return f"{number:6d}\t{clean_line}"
+
+    def _text_result(
+        self,
+        file_path: str,
+        lines: list[str],
+        total_lines: int,
+        offset: int,
+        limit: int,
+    ) -> ToolResult:
+        """Build the result of a text read."""
         metadata: dict[str, Any] = {
             "file_path": file_path,
-            "lines_read": line_count,
+            "lines_read": len(lines),
             "total_lines": total_lines,
             "offset": offset,
             "limit": limit,
         }
 
-        # Check if there are more lines after what we read
-        # If we read from offset to offset+limit-1, remaining starts at offset+limit
-        if total_lines > offset + limit:
+        # Lines offset to offset+limit-1 were read; more remain after them
+        last_line = offset + limit - 1
+        if total_lines > last_line:
             metadata["truncated"] = True
-            metadata["remaining_lines"] = total_lines - (offset + limit)
+            metadata["remaining_lines"] = total_lines - last_line
+
+        return ToolResult.ok("\n".join(lines), **metadata)
+
+    @staticmethod
+    def _read_bytes(file_path: str) -> bytes:
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _extract_pdf_pages(file_path: str) -> list[str]:
+        """Extract the text of each page of a PDF."""
+        import pypdf
 
-        return ToolResult.ok(content, **metadata)
+        reader = pypdf.PdfReader(file_path)
+        return [page.extract_text() for page in reader.pages]
 
     async def _read_image(self, file_path: str, mime_type: str) -> ToolResult:
         """Read an image file and return base64 encoded data."""
@@ -195,8 +229,7 @@ Usage:
                 f"(max: {self.MAX_IMAGE_SIZE / 1024 / 1024:.0f}MB)"
             )
 
-        with open(file_path, "rb") as f:
-            data = f.read()
+        data = await asyncio.to_thread(self._read_bytes, file_path)
 
         encoded = base64.b64encode(data).decode("ascii")
 
@@ -220,21 +253,15 @@ Usage:
             )
 
         try:
-            import pypdf
-
-            reader = pypdf.PdfReader(file_path)
-            pages = []
-
-            for i, page in enumerate(reader.pages):
-                text = page.extract_text()
-                pages.append(f"--- Page {i + 1} ---\n{text}")
-
-            content = "\n\n".join(pages)
+            pages = await asyncio.to_thread(self._extract_pdf_pages, file_path)
+            content = "\n\n".join(
+                f"--- Page {i + 1} ---\n{text}" for i, text in enumerate(pages)
+            )
 
             return ToolResult.ok(
                 content,
                 file_path=file_path,
-                page_count=len(reader.pages),
+                page_count=len(pages),
                 is_pdf=True,
             )
         except ImportError:
@@ -253,8 +280,9 @@ Usage:
             )
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                notebook = json.load(f)
+            notebook = json.loads(
+                await asyncio.to_thread(self._read_bytes, file_path)
+            )
         except json.JSONDecodeError as e:
             return ToolResult.fail(
                 f"Invalid notebook format: {file_path} is not valid JSON. "
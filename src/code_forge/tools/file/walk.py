@@ -0,0 +1,420 @@
+"""Directory walking for the file search tools.
+
+``os.walk`` and recursive ``glob`` descend into every directory, so a
+search of a project spends most of its time in ``.git`` and
+``node_modules`` before the results are filtered. The walker here prunes
+such directories, and anything ignored by ``.gitignore`` files, before
+descending into them. It lists each directory once with ``os.scandir``
+and yields files in sorted path order, so results are deterministic.
+
+``PathGlob`` walks the same way for a single glob pattern, matching it
+one directory level at a time so only directories that can still match
+are listed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass
+
+# Directories never worth searching: VCS metadata, dependencies, caches
+PRUNED_DIRS: frozenset[str] = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+})
+
+GITIGNORE = ".gitignore"
+
+
+def translate_glob(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression.
+
+    ``*`` and ``?`` do not match ``/``, ``**`` matches across directories
+    (``**/`` also matches no directory at all), ``[...]`` is a character
+    class and ``{a,b}`` an alternation.
+
+    Args:
+        pattern: Glob pattern over ``/``-separated paths.
+
+    Returns:
+        Regular expression source (without anchors).
+    """
+    parts: list[str] = []
+    i = 0
+    n = len(pattern)
+    depth = 0
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            if i < n and pattern[i] == "*":
+                i += 1
+                if i < n and pattern[i] == "/":
+                    i += 1
+                    parts.append("(?:.*/)?")
+                else:
+                    parts.append(".*")
+            else:
+                parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1 if i < n and pattern[i] in "!^" else i)
+            if end == -1:
+                parts.append(re.escape(c))
+                continue
+            body = pattern[i:end]
+            i = end + 1
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+        elif c == "{" and "}" in pattern[i:]:
+            depth += 1
+            parts.append("(?:")
+        elif c == "," and depth:
+            parts.append("|")
+        elif c == "}" and depth:
+            depth -= 1
+            parts.append(")")
+        elif c == "\\" and i < n:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+        else:
+            parts.append(re.escape(c))
+    return "".join(parts)
+
+
+def compile_path_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob matched against paths relative to a search root.
+
+    Patterns match at any depth, like ``glob(root/**/pattern)``: ``*.py``
+    matches Python files anywhere and ``src/*.py`` matches files directly
+    in any ``src`` directory.
+
+    Args:
+        pattern: Glob pattern.
+
+    Returns:
+        Regex to ``fullmatch`` against ``/``-separated relative paths.
+    """
+    return re.compile("(?:.*/)?" + translate_glob(pattern.lstrip("/")), re.DOTALL)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One pattern of a ``.gitignore`` file.
+
+    Attributes:
+        regex: Matches paths relative to the file's directory.
+        negated: Re-includes matching paths (``!pattern``).
+        directory_only: Only matches directories (``pattern/``).
+    """
+
+    regex: re.Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+def parse_gitignore(text: str) -> list[IgnoreRule]:
+    """Parse the rules of a ``.gitignore`` file.
+
+    Args:
+        text: File contents.
+
+    Returns:
+        Rules in file order.
+    """
+    rules: list[IgnoreRule] = []
+    for raw_line in text.splitlines():
+        line = raw_line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        # A leading backslash escapes a literal "!" or "#"
+        if negated or line.startswith("\\"):
+            line = line[1:]
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # Patterns with an inner slash are relative to the file's directory
+        anchored = "/" in line
+        source = translate_glob(line.lstrip("/"))
+        if not anchored:
+            source = "(?:.*/)?" + source
+        rules.append(IgnoreRule(re.compile(source, re.DOTALL), negated, directory_only))
+    return rules
+
+
+class GitIgnore:
+    """The ``.gitignore`` rules that apply below a directory.
+
+    Rules of deeper files take precedence, and within a file the last
+    matching rule wins.
+    """
+
+    def __init__(self, frames: tuple[_Frame, ...] = ()) -> None:
+        """Initialize rules.
+
+        Args:
+            frames: Rules of each ``.gitignore`` file, outermost first.
+        """
+        self._frames = frames
+
+    @classmethod
+    def for_root(cls, root: str) -> GitIgnore:
+        """Load the rules of a directory and its ancestors in the repository.
+
+        Ancestors are only consulted up to the directory containing
+        ``.git``; outside a repository only the root's own file is used.
+
+        Args:
+            root: Directory a walk starts in.
+
+        Returns:
+            Rules applying to the root's contents.
+        """
+        ancestors: list[str] = []
+        current = os.path.abspath(root)
+        while not os.path.exists(os.path.join(current, ".git")):
+            parent = os.path.dirname(current)
+            if parent == current:
+                ancestors = []
+                break
+            current = parent
+            ancestors.append(current)
+
+        frames: list[_Frame] = []
+        absolute_root = os.path.abspath(root)
+        for ancestor in reversed(ancestors):
+            rules = _load_rules(ancestor)
+            if rules:
+                # Matched against paths below the root, from the ancestor
+                prefix = os.path.relpath(absolute_root, ancestor).replace(os.sep, "/")
+                frames.append(_Frame(root, prefix + "/", rules))
+        return cls(tuple(frames)).descend(root)
+
+    def descend(self, directory: str) -> GitIgnore:
+        """Get the rules for the contents of a subdirectory.
+
+        Args:
+            directory: Directory being entered.
+
+        Returns:
+            These rules plus the directory's ``.gitignore``, if any.
+        """
+        rules = _load_rules(directory)
+        if not rules:
+            return self
+        return GitIgnore((*self._frames, _Frame(directory, "", rules)))
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """Check whether a path is ignored.
+
+        Args:
+            path: Path below the directories the rules were loaded for.
+            is_dir: Whether the path is a directory.
+
+        Returns:
+            True if the last matching rule ignores the path.
+        """
+        for frame in reversed(self._frames):
+            relative = frame.relative(path)
+            for rule in reversed(frame.rules):
+                if rule.directory_only and not is_dir:
+                    continue
+                if rule.regex.fullmatch(relative):
+                    return not rule.negated
+        return False
+
+
+@dataclass(frozen=True)
+class _Frame:
+    """Rules of one ``.gitignore`` file, for paths below ``directory``."""
+
+    directory: str
+    prefix: str
+    rules: tuple[IgnoreRule, ...]
+
+    def relative(self, path: str) -> str:
+        """Get a path relative to the file's directory, ``/``-separated."""
+        start = len(self.directory.rstrip(os.sep)) + 1
+        return self.prefix + path[start:].replace(os.sep, "/")
+
+
+def _load_rules(directory: str) -> tuple[IgnoreRule, ...]:
+    try:
+        with open(os.path.join(directory, GITIGNORE), encoding="utf-8") as f:
+            return tuple(parse_gitignore(f.read()))
+    except (OSError, UnicodeDecodeError):
+        return ()
+
+
+def walk_files(
+    root: str,
+    prune: Collection[str] = PRUNED_DIRS,
+    gitignore: bool = True,
+) -> Iterator[os.DirEntry[str]]:
+    """Walk the files below a directory, pruning excluded directories.
+
+    Files are yielded in sorted order of their full paths. Symbolic links
+    to directories are not followed.
+
+    Args:
+        root: Directory to walk.
+        prune: Names of directories not to descend into.
+        gitignore: Skip paths ignored by ``.gitignore`` files.
+
+    Yields:
+        Directory entries of the files found.
+    """
+    root = os.path.normpath(root)
+    ignore = GitIgnore.for_root(root) if gitignore else None
+    yield from _walk(root, prune, ignore)
+
+
+def _walk(
+    directory: str, prune: Collection[str], ignore: GitIgnore | None
+) -> Iterator[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    # Sorting directories as "name/" keeps the overall order by full path
+    keyed = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        keyed.append((entry.name + "/" if is_dir else entry.name, is_dir, entry))
+    keyed.sort(key=lambda item: item[0])
+
+    for _, is_dir, entry in keyed:
+        if is_dir and entry.name in prune:
+            continue
+        if ignore is not None and ignore.is_ignored(entry.path, is_dir):
+            continue
+        if not is_dir:
+            # Skip sockets, FIFOs and broken links
+            if entry.is_file():
+                yield entry
+        elif not entry.is_symlink():
+            sub_ignore = ignore.descend(entry.path) if ignore is not None else None
+            yield from _walk(entry.path, prune, sub_ignore)
+
+
+class PathGlob:
+    """A glob pattern matched one directory level at a time.
+
+    Follows ``glob.glob(recursive=True)``: ``**`` as a whole component
+    matches zero or more directories, other components match a single
+    name, and wildcards do not match names starting with ``.`` unless the
+    component itself does. Components may also use ``{a,b}``.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """Compile a pattern.
+
+        Args:
+            pattern: Glob pattern relative to the directory walked.
+        """
+        self.pattern = pattern
+        components = [part for part in pattern.split("/") if part not in ("", ".")]
+        # None stands for "**"; the state len(components) is a full match
+        self._matchers: list[Callable[[str], bool] | None] = [
+            None if part == "**" else _component_matcher(part) for part in components
+        ]
+        self._closures: dict[frozenset[int], frozenset[int]] = {}
+
+    def walk(
+        self, root: str, prune: Collection[str] = ()
+    ) -> Iterator[os.DirEntry[str]]:
+        """Walk the files below a directory that match the pattern.
+
+        Only directories some component can still match are listed, and
+        directories named in ``prune`` are never entered. Symbolic links
+        to directories are not followed.
+
+        Args:
+            root: Directory to walk.
+            prune: Names of directories not to descend into.
+
+        Yields:
+            Directory entries of the matching files, in directory order.
+        """
+        if self._matchers:
+            yield from self._walk(root, self._closure(frozenset({0})), prune)
+
+    def _closure(self, states: frozenset[int]) -> frozenset[int]:
+        """Add the states reached by ``**`` matching no directory."""
+        closure = self._closures.get(states)
+        if closure is None:
+            reached = set(states)
+            for start in states:
+                state = start
+                while state < len(self._matchers) and self._matchers[state] is None:
+                    state += 1
+                    reached.add(state)
+            closure = self._closures[states] = frozenset(reached)
+        return closure
+
+    def _walk(
+        self, directory: str, states: frozenset[int], prune: Collection[str]
+    ) -> Iterator[os.DirEntry[str]]:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        final = len(self._matchers)
+        for entry in entries:
+            name = entry.name
+            advanced: set[int] = set()
+            for state in states:
+                if state == final:
+                    continue
+                matcher = self._matchers[state]
+                if matcher is None:
+                    if not name.startswith("."):
+                        advanced.add(state)
+                elif matcher(name):
+                    advanced.add(state + 1)
+            if not advanced:
+                continue
+
+            reached = self._closure(frozenset(advanced))
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if (
+                    name not in prune
+                    and not entry.is_symlink()
+                    and any(state < final for state in reached)
+                ):
+                    yield from self._walk(entry.path, reached, prune)
+            elif final in reached and entry.is_file():
+                yield entry
+
+
+def _component_matcher(component: str) -> Callable[[str], bool]:
+    regex = re.compile(translate_glob(component), re.DOTALL)
+    if component.startswith(".") or not any(c in component for c in "*?[{"):
+        return lambda name: regex.fullmatch(name) is not None
+    return lambda name: not name.startswith(".") and regex.fullmatch(name) is not None
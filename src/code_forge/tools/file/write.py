@@ -12,6 +12,7 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
+from code_forge.tools.file.cache import get_file_cache
 from code_forge.tools.file.utils import validate_path_security
 
 if TYPE_CHECKING:
@@ -129,8 +130,11 @@ Usage:
                 undo_manager.capture_before(file_path)
 
             # Write the file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            try:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+            finally:
+                get_file_cache().invalidate(file_path)
 
             # Commit undo entry after successful write
             if undo_manager:
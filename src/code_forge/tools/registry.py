@@ -5,12 +5,17 @@ This module provides a thread-safe singleton registry for tool management:
 - Look up tools by name
 - List tools by category
 - Prevent duplicate registrations
+- Track a generation counter that derived values (schemas, bound LLMs)
+  are cached against
 """
 
 from __future__ import annotations
 
+import itertools
 import threading
-from typing import TYPE_CHECKING
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from code_forge.core.errors import ToolError
 from code_forge.core.logging import get_logger
@@ -20,6 +25,8 @@ if TYPE_CHECKING:
 
 logger = get_logger("tools.registry")
 
+T = TypeVar("T")
+
 
 class ToolRegistry:
     """Singleton registry for all available tools.
@@ -40,10 +47,13 @@ class ToolRegistry:
     _instance: ToolRegistry | None = None
     _instance_lock: threading.Lock = threading.Lock()
     _initialized: bool = False
+    # Shared across instances so generations stay unique after reset()
+    _generations: itertools.count[int] = itertools.count(1)
 
     # Instance attributes declared at class level for mypy
     _tools: dict[str, BaseTool]
     _lock: threading.RLock
+    _generation: int
 
     def __new__(cls) -> ToolRegistry:
         """Create or return the singleton instance.
@@ -64,8 +74,28 @@ class ToolRegistry:
             return
         self._tools = {}
         self._lock = threading.RLock()
+        self._generation = next(ToolRegistry._generations)
         ToolRegistry._initialized = True
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever tools are registered or removed.
+
+        Values derived from the registered tools (schemas, bound LLMs)
+        can be cached until the generation changes.
+        """
+        return self._generation
+
+    @classmethod
+    def current_generation(cls) -> int:
+        """Get the generation of the singleton, without creating it.
+
+        Returns:
+            The registry generation, or 0 if no registry exists.
+        """
+        instance = cls._instance
+        return getattr(instance, "_generation", 0)
+
     def register(self, tool: BaseTool) -> None:
         """Register a tool.
 
@@ -81,6 +111,7 @@ class ToolRegistry:
             if tool.name in self._tools:
                 raise ToolError(tool.name, "Tool already registered")
             self._tools[tool.name] = tool
+            self._generation = next(ToolRegistry._generations)
             logger.debug(f"Registered tool: {tool.name}")
 
     def register_many(self, tools: list[BaseTool]) -> None:
@@ -107,6 +138,7 @@ class ToolRegistry:
         with self._lock:
             if name in self._tools:
                 del self._tools[name]
+                self._generation = next(ToolRegistry._generations)
                 logger.debug(f"Deregistered tool: {name}")
                 return True
             return False
@@ -199,6 +231,7 @@ class ToolRegistry:
         """
         with self._lock:
             self._tools.clear()
+            self._generation = next(ToolRegistry._generations)
             logger.debug("Cleared all tools from registry")
 
     @classmethod
@@ -212,3 +245,37 @@ class ToolRegistry:
             cls._instance = None
             cls._initialized = False
             logger.debug("Reset ToolRegistry singleton")
+
+
+# Values derived from tool definitions, per tool object
+_tool_cache: weakref.WeakKeyDictionary[Any, dict[str, tuple[int, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_tool_cache_lock = threading.Lock()
+
+
+def cached_for_tool(tool: Any, key: str, build: Callable[[], T]) -> T:
+    """Get a value derived from a tool's definition, building it once.
+
+    The value is rebuilt when the registry generation changes. Callers
+    must not modify the returned value.
+
+    Args:
+        tool: Tool (or schema class) the value is derived from.
+        key: Name of the derived value, e.g. "openai".
+        build: Builds the value.
+
+    Returns:
+        The cached or newly built value.
+    """
+    generation = ToolRegistry.current_generation()
+    with _tool_cache_lock:
+        entry = _tool_cache.get(tool, {}).get(key)
+    if entry is not None and entry[0] == generation:
+        value: T = entry[1]
+        return value
+
+    value = build()
+    with _tool_cache_lock:
+        _tool_cache.setdefault(tool, {})[key] = (generation, value)
+    return value
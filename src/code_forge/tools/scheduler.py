@@ -0,0 +1,113 @@
+"""Scheduling of tool calls requested in one model turn.
+
+Models often request several lookups at once (a handful of Read, Grep
+or WebFetch calls). Running them one after the other costs the sum of
+their latencies. The scheduler runs consecutive read-only calls
+concurrently, up to a concurrency limit, while every mutating call
+(Write, Edit, Bash, ...) runs alone, after all earlier calls finished
+and before any later call starts. Reads therefore never observe a
+partially applied sequence of writes, and results keep call order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default number of read-only calls run at the same time
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def is_read_only_tool(tool: Any) -> bool:
+    """Check whether a tool only reads state.
+
+    Unwraps LangChain adapters. Tools that do not declare
+    ``is_read_only`` are treated as mutating.
+
+    Args:
+        tool: Code-Forge tool, adapter, or any other tool object.
+
+    Returns:
+        True if the tool may run concurrently with other read-only tools.
+    """
+    tool = getattr(tool, "forge_tool", None) or tool
+    return getattr(tool, "is_read_only", False) is True
+
+
+def plan_batches(calls: Sequence[T], is_read_only: Callable[[T], bool]) -> list[list[T]]:
+    """Split tool calls into batches that may run concurrently.
+
+    Consecutive read-only calls form one batch; each mutating call is a
+    batch of its own.
+
+    Args:
+        calls: Tool calls in the order the model requested them.
+        is_read_only: Whether a call only reads state.
+
+    Returns:
+        Batches in call order.
+    """
+    batches: list[list[T]] = []
+    reading = False
+    for call in calls:
+        read_only = is_read_only(call)
+        if read_only and reading:
+            batches[-1].append(call)
+        else:
+            batches.append([call])
+        reading = read_only
+    return batches
+
+
+async def run_batch(
+    batch: Sequence[T],
+    execute: Callable[[T], Awaitable[R]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[R]:
+    """Run a batch of tool calls concurrently.
+
+    Args:
+        batch: Tool calls to run.
+        execute: Runs one call.
+        max_concurrency: Maximum calls running at once.
+
+    Returns:
+        Results in call order.
+    """
+    if len(batch) == 1:
+        return [await execute(batch[0])]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited(call: T) -> R:
+        async with semaphore:
+            return await execute(call)
+
+    return list(await asyncio.gather(*(limited(call) for call in batch)))
+
+
+async def run_scheduled(
+    calls: Sequence[T],
+    execute: Callable[[T], Awaitable[R]],
+    is_read_only: Callable[[T], bool],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[R]:
+    """Run tool calls, concurrently where they only read state.
+
+    Args:
+        calls: Tool calls in the order the model requested them.
+        execute: Runs one call.
+        is_read_only: Whether a call only reads state.
+        max_concurrency: Maximum read-only calls running at once.
+
+    Returns:
+        Results in call order.
+    """
+    results: list[R] = []
+    for batch in plan_batches(calls, is_read_only):
+        results.extend(await run_batch(batch, execute, max_concurrency))
+    return results
@@ -65,6 +65,11 @@ class WebSearchBaseTool(BaseTool):
         """Return tool category for grouping."""
         return ToolCategory.WEB
 
+    @property
+    def is_read_only(self) -> bool:
+        """Return True: the tool has no side effects."""
+        return True
+
     @property
     def parameters(self) -> list[ToolParameter]:
         """Return list of accepted parameters."""
@@ -153,6 +153,60 @@ class TestAgentExecutor:
         assert result.success is True
         assert agent.usage.tool_calls == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_converts_messages_incrementally(self) -> None:
+        """Test earlier messages are not reconverted on later iterations."""
+        llm = self.create_mock_llm()
+        registry = self.create_mock_registry()
+
+        first_response = MagicMock()
+        first_response.content = ""
+        first_response.tool_calls = [{"id": "call_1", "name": "read", "args": {}}]
+        first_response.usage_metadata = {"total_tokens": 50}
+        second_response = MagicMock()
+        second_response.content = "Done"
+        second_response.tool_calls = []
+        second_response.usage_metadata = {"total_tokens": 50}
+        llm.ainvoke = AsyncMock(side_effect=[first_response, second_response])
+
+        mock_tool = MagicMock()
+        mock_tool.name = "read"
+        mock_tool.execute = AsyncMock(return_value=MagicMock(output="file content"))
+        registry.list_tools.return_value = [mock_tool]
+        registry.get.return_value = mock_tool
+
+        executor = AgentExecutor(llm=llm, tool_registry=registry)
+        agent = ConcreteAgentForTesting(
+            task="Read file", config=AgentConfig(agent_type="testable")
+        )
+        await executor.execute(agent)
+
+        first_call = llm.ainvoke.call_args_list[0].args[0]
+        second_call = llm.ainvoke.call_args_list[1].args[0]
+        assert len(second_call) == len(first_call) + 2
+        assert all(a is b for a, b in zip(first_call, second_call, strict=False))
+        assert second_call[-2].tool_calls[0]["id"] == "call_1"
+        assert second_call[-1].tool_call_id == "call_1"
+
+    def test_bound_llm_reused_per_toolset(self) -> None:
+        """Test tools are bound once per toolset and registry generation."""
+        llm = MagicMock()
+        llm.bind_tools = MagicMock(side_effect=lambda _tools: MagicMock())
+        registry = self.create_mock_registry()
+        registry.generation = 1
+        read, grep = MagicMock(), MagicMock()
+        read.name, grep.name = "Read", "Grep"
+        executor = AgentExecutor(llm=llm, tool_registry=registry)
+
+        first = executor._bind_tools([read, grep])
+        assert executor._bind_tools([read, grep]) is first
+        assert executor._bind_tools([read]) is not first
+        assert llm.bind_tools.call_count == 2
+
+        registry.generation = 2
+        assert executor._bind_tools([read, grep]) is not first
+        assert llm.bind_tools.call_count == 3
+
     @pytest.mark.asyncio
     async def test_execute_tool_not_found(self) -> None:
         """Test execution handles tool not found."""
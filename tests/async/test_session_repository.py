@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from code_forge.sessions.models import Session
 from code_forge.sessions.repository import SessionRepository
 from code_forge.sessions.storage import SessionStorage
 
@@ -209,88 +210,82 @@ class TestSessionRepositoryLoad:
 class TestSessionRepositoryListRecent:
     """Tests for async list_recent operation."""
 
-    @pytest.mark.asyncio
-    async def test_list_recent_returns_empty_list(
-        self, repository: SessionRepository, mock_storage: MagicMock
-    ) -> None:
-        """List recent returns empty list when no sessions."""
-        mock_storage.list_session_ids.return_value = []
-
-        result = await repository.list_recent()
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> SessionStorage:
+        """Create a real SessionStorage in a temporary directory."""
+        return SessionStorage(tmp_path)
 
-        assert result == []
+    @pytest.fixture
+    def repo(self, storage: SessionStorage) -> SessionRepository:
+        """Create repository over real storage."""
+        return SessionRepository(storage=storage, max_workers=2)
 
     @pytest.mark.asyncio
-    async def test_list_recent_loads_all_sessions(
-        self, repository: SessionRepository, mock_storage: MagicMock
-    ) -> None:
-        """List recent loads all session IDs from storage."""
-        mock_storage.list_session_ids.return_value = ["s1", "s2", "s3"]
-        mock_storage.load_or_none.return_value = None
-
-        await repository.list_recent()
+    async def test_list_recent_returns_empty_list(self, repo: SessionRepository) -> None:
+        """List recent returns empty list when no sessions."""
+        result = await repo.list_recent()
 
-        assert mock_storage.load_or_none.call_count == 3
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_list_recent_sorts_by_updated_at(
-        self, repository: SessionRepository, mock_storage: MagicMock
+        self, repo: SessionRepository, storage: SessionStorage
     ) -> None:
         """List recent sorts sessions by updated_at descending."""
-        sessions = []
-        for i, days in enumerate([1, 3, 2]):  # Not in order
-            s = MagicMock()
-            s.id = f"session-{i}"
-            s.created_at = datetime.now(UTC)
-            s.updated_at = datetime(2024, 1, days, tzinfo=UTC)
-            sessions.append(s)
+        for day in [1, 3, 2]:  # Not in order
+            session = Session(title=f"Day {day}")
+            session.updated_at = datetime(2024, 1, day, tzinfo=UTC)
+            storage.save(session)
 
-        mock_storage.list_session_ids.return_value = ["s0", "s1", "s2"]
-        mock_storage.load_or_none.side_effect = sessions
-
-        result = await repository.list_recent()
+        result = await repo.list_recent()
 
         # Should be sorted newest first: day 3, day 2, day 1
-        assert result[0].updated_at == datetime(2024, 1, 3, tzinfo=UTC)
-        assert result[1].updated_at == datetime(2024, 1, 2, tzinfo=UTC)
-        assert result[2].updated_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert [s.title for s in result] == ["Day 3", "Day 2", "Day 1"]
 
     @pytest.mark.asyncio
     async def test_list_recent_respects_limit(
-        self, repository: SessionRepository, mock_storage: MagicMock
+        self, repo: SessionRepository, storage: SessionStorage
     ) -> None:
         """List recent respects the limit parameter."""
-        sessions = []
-        for i in range(10):
-            s = MagicMock()
-            s.id = f"session-{i}"
-            s.created_at = datetime.now(UTC)
-            s.updated_at = datetime(2024, 1, i + 1, tzinfo=UTC)
-            sessions.append(s)
+        for _ in range(10):
+            storage.save(Session())
 
-        mock_storage.list_session_ids.return_value = [f"s{i}" for i in range(10)]
-        mock_storage.load_or_none.side_effect = sessions
-
-        result = await repository.list_recent(limit=3)
+        result = await repo.list_recent(limit=3)
 
         assert len(result) == 3
 
     @pytest.mark.asyncio
-    async def test_list_recent_skips_none_sessions(
-        self, repository: SessionRepository, mock_storage: MagicMock
+    async def test_list_recent_skips_corrupt_sessions(
+        self, repo: SessionRepository, storage: SessionStorage
     ) -> None:
-        """List recent skips sessions that return None."""
-        s = MagicMock()
-        s.id = "valid"
-        s.created_at = datetime.now(UTC)
-        s.updated_at = datetime.now(UTC)
+        """List recent skips session files that cannot be loaded."""
+        storage.save(Session(title="valid"))
+        storage.get_path("corrupt").write_text("{not json")
 
-        mock_storage.list_session_ids.return_value = ["valid", "corrupt", "missing"]
-        mock_storage.load_or_none.side_effect = [s, None, None]
+        result = await repo.list_recent()
 
-        result = await repository.list_recent()
+        assert [s.title for s in result] == ["valid"]
 
-        assert len(result) == 1
+    @pytest.mark.asyncio
+    async def test_list_recent_loads_only_changed_sessions(
+        self, repo: SessionRepository, storage: SessionStorage
+    ) -> None:
+        """List recent reads only sessions changed since the last listing."""
+        sessions = [Session(title=f"Session {i}") for i in range(3)]
+        for session in sessions:
+            storage.save(session)
+        await repo.list_recent()
+
+        sessions[0].title = "Renamed"
+        storage.save(sessions[0])
+
+        with patch.object(
+            storage, "open_lazy", wraps=storage.open_lazy
+        ) as open_lazy:
+            result = await repo.list_recent()
+
+        assert open_lazy.call_count == 1
+        assert "Renamed" in [s.title for s in result]
 
 
 # =============================================================================
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -9,6 +11,10 @@ import pytest
 from code_forge.commands.executor import CommandContext
 from code_forge.commands.parser import ParsedCommand
 from code_forge.commands.registry import CommandRegistry
+from code_forge.sessions.models import Session
+
+if TYPE_CHECKING:
+    from code_forge.context.manager import ContextManager
 
 
 @pytest.fixture(autouse=True)
@@ -177,6 +183,31 @@ class TestSessionCommand:
         assert "test-session-123" in result.output
         assert "Test Session" in result.output
 
+    @pytest.mark.asyncio
+    async def test_session_shows_save_metrics(self) -> None:
+        """Test /session shows auto-save latency once saves happened."""
+        from code_forge.commands.builtin.session_commands import SessionCommand
+        from code_forge.sessions.autosave import SaveMetrics
+
+        mock_session = MagicMock()
+        mock_session.tags = []
+
+        mock_manager = MagicMock()
+        mock_manager.has_current = True
+        mock_manager.current_session = mock_session
+        mock_manager.save_metrics = SaveMetrics(
+            saves=2, coalesced=7, last_ms=3.0, max_ms=5.0, total_ms=8.0
+        )
+
+        cmd = SessionCommand()
+        parsed = ParsedCommand(name="session", args=[])
+        context = CommandContext(session_manager=mock_manager)
+
+        result = await cmd.execute(parsed, context)
+        assert "Auto-save: 2 writes" in result.output
+        assert "mean 4.0ms" in result.output
+        assert "7 changes coalesced" in result.output
+
     @pytest.mark.asyncio
     async def test_session_list(self) -> None:
         """Test /session list."""
@@ -788,6 +819,63 @@ class TestContextModeCommand:
         assert "Mode required" in result.error
 
 
+class TestContextProfileCommand:
+    """Tests for /context profile command."""
+
+    @staticmethod
+    def _manager() -> ContextManager:
+        from code_forge.context.manager import ContextManager
+
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "Read the file"})
+        manager.add_tool_exchange("c1", "Read", {"file_path": "/a.py"}, "content")
+        manager.add_message({"role": "assistant", "content": "Done"})
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_profile_table(self) -> None:
+        """Test /context profile shows attribution."""
+        from code_forge.commands.builtin.context_commands import ContextCommand
+
+        cmd = ContextCommand()
+        parsed = ParsedCommand(name="context", args=["profile"])
+        context = CommandContext(context_manager=self._manager())
+
+        result = await cmd.execute(parsed, context)
+        assert result.success is True
+        assert "Context Profile" in result.output
+        assert "Tool Read" in result.output
+
+    @pytest.mark.asyncio
+    async def test_profile_json(self) -> None:
+        """Test /context profile --json returns JSON report."""
+        import json
+
+        from code_forge.commands.builtin.context_commands import ContextProfileCommand
+
+        cmd = ContextProfileCommand()
+        parsed = ParsedCommand(name="profile", args=[], flags={"json"})
+        context = CommandContext(context_manager=self._manager())
+
+        result = await cmd.execute(parsed, context)
+        assert result.success is True
+        assert json.loads(result.output)["totals"]["tools"]["Read"] > 0
+
+    @pytest.mark.asyncio
+    async def test_profile_export(self, tmp_path: Path) -> None:
+        """Test /context profile --output writes a file."""
+        from code_forge.commands.builtin.context_commands import ContextProfileCommand
+
+        cmd = ContextProfileCommand()
+        output = tmp_path / "profile.json"
+        parsed = ParsedCommand(name="profile", args=[], kwargs={"output": str(output)})
+        context = CommandContext(context_manager=self._manager())
+
+        result = await cmd.execute(parsed, context)
+        assert result.success is True
+        assert output.exists()
+
+
 class TestSessionResumeCommand:
     """Tests for /session resume command."""
 
@@ -1089,8 +1177,7 @@ class TestHistoryCommand:
         mock_msg2.content = "Hi there!"
         mock_msg2.tool_calls = None
 
-        mock_session = MagicMock()
-        mock_session.messages = [mock_msg1, mock_msg2]
+        mock_session = Session(messages=[mock_msg1, mock_msg2])
 
         mock_manager = MagicMock()
         mock_manager.has_current = True
@@ -1111,8 +1198,7 @@ class TestHistoryCommand:
         """Test /history with no messages."""
         from code_forge.commands.builtin.debug_commands import HistoryCommand
 
-        mock_session = MagicMock()
-        mock_session.messages = []
+        mock_session = Session(messages=[])
 
         mock_manager = MagicMock()
         mock_manager.has_current = True
@@ -1133,8 +1219,7 @@ class TestHistoryCommand:
 
         messages = [MagicMock(role="user", content=f"msg{i}", tool_calls=None) for i in range(10)]
 
-        mock_session = MagicMock()
-        mock_session.messages = messages
+        mock_session = Session(messages=messages)
 
         mock_manager = MagicMock()
         mock_manager.has_current = True
@@ -1158,8 +1243,7 @@ class TestHistoryCommand:
         mock_msg.content = "Let me check"
         mock_msg.tool_calls = [{"name": "read_file"}, {"name": "write_file"}]
 
-        mock_session = MagicMock()
-        mock_session.messages = [mock_msg]
+        mock_session = Session(messages=[mock_msg])
 
         mock_manager = MagicMock()
         mock_manager.has_current = True
@@ -1291,6 +1375,55 @@ class TestContextShowStatus:
         assert "gpt-4" in result.output
         assert "5,000" in result.output or "5000" in result.output
 
+    @pytest.mark.asyncio
+    async def test_context_shows_connection_stats(self) -> None:
+        """Test /context shows connection reuse of the LLM client."""
+        from code_forge.commands.builtin.context_commands import ContextCommand
+        from code_forge.llm import OpenRouterClient
+
+        mock_manager = MagicMock()
+        mock_manager.get_stats.return_value = {"message_count": 2}
+        mock_manager.get_cache_stats.return_value = None
+        mock_client = MagicMock(spec=OpenRouterClient)
+        mock_client.get_connection_stats.return_value = {
+            "requests": 4,
+            "new_connections": 1,
+            "reused_connections": 3,
+            "http2_requests": 4,
+            "connect_ms": 120.0,
+            "warmups": 1,
+            "reuse_rate": 0.75,
+        }
+        mock_llm = MagicMock()
+        mock_llm.client = mock_client
+
+        cmd = ContextCommand()
+        parsed = ParsedCommand(name="context", args=[])
+        context = CommandContext(context_manager=mock_manager, llm=mock_llm)
+
+        result = await cmd.execute(parsed, context)
+        assert result.success is True
+        assert "Connections:" in result.output
+        assert "Reused: 3 (75.0%)" in result.output
+        assert "Handshake Time: 120 ms" in result.output
+
+    @pytest.mark.asyncio
+    async def test_context_omits_connection_stats_without_client(self) -> None:
+        """Test /context leaves out connections when no client is available."""
+        from code_forge.commands.builtin.context_commands import ContextCommand
+
+        mock_manager = MagicMock()
+        mock_manager.get_stats.return_value = {"message_count": 2}
+        mock_manager.get_cache_stats.return_value = None
+
+        cmd = ContextCommand()
+        parsed = ParsedCommand(name="context", args=[])
+        context = CommandContext(context_manager=mock_manager, llm=MagicMock())
+
+        result = await cmd.execute(parsed, context)
+        assert result.success is True
+        assert "Connections:" not in result.output
+
     @pytest.mark.asyncio
     async def test_context_error_handling(self) -> None:
         """Test /context handles errors gracefully."""
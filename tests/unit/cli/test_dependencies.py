@@ -26,6 +26,16 @@ from code_forge.cli.dependencies import (
 )
 
 
+def mock_tool(name: str = "tool") -> MagicMock:
+    """Create a mock tool with a serializable schema."""
+    tool = MagicMock(name=name)
+    tool.to_openai_schema.return_value = {
+        "type": "function",
+        "function": {"name": name, "description": f"The {name} tool", "parameters": {}},
+    }
+    return tool
+
+
 class TestILLMClientProtocol:
     """Tests for the ILLMClient protocol."""
 
@@ -191,7 +201,7 @@ class TestDependenciesCreate:
             # Set up return values
             mock_tool_reg_instance = MagicMock()
             mock_tool_reg_instance.list_names.return_value = ["read", "write"]
-            mock_tool_reg_instance.get.return_value = MagicMock()
+            mock_tool_reg_instance.get.side_effect = mock_tool
             mock_tool_reg.return_value = mock_tool_reg_instance
 
             mock_adapt.return_value = []
@@ -202,6 +212,46 @@ class TestDependenciesCreate:
 
             assert deps is not None
             assert deps.tool_registry is mock_tool_reg_instance
+            # Tool schemas are counted in the context budget and profile
+            assert deps.context_manager is not None
+            assert deps.context_manager.tracker.budget.tools > 0
+            assert deps.context_manager.profiler.tool_schema_tokens > 0
+
+    def test_create_passes_max_tokens_to_llm(self, mock_config: MagicMock) -> None:
+        """Test that the provider is asked to stop at max_tokens."""
+        mock_config.model.max_tokens = 4096
+
+        with patch(
+            "code_forge.commands.CommandExecutor"
+        ), patch(
+            "code_forge.commands.CommandContext"
+        ), patch(
+            "code_forge.commands.register_builtin_commands"
+        ), patch(
+            "code_forge.tools.ToolRegistry"
+        ) as mock_tool_reg, patch(
+            "code_forge.tools.register_all_tools"
+        ), patch(
+            "code_forge.sessions.SessionManager"
+        ) as mock_session_mgr, patch(
+            "code_forge.modes.setup_modes"
+        ), patch(
+            "code_forge.langchain.tools.adapt_tools_for_langchain"
+        ) as mock_adapt, patch(
+            "code_forge.llm.OpenRouterClient"
+        ), patch(
+            "code_forge.langchain.llm.OpenRouterLLM"
+        ) as mock_llm, patch(
+            "code_forge.langchain.agent.CodeForgeAgent"
+        ):
+
+            mock_tool_reg.return_value.list_names.return_value = []
+            mock_adapt.return_value = []
+            mock_session_mgr.get_instance.return_value = MagicMock()
+
+            Dependencies.create(mock_config, "sk-or-v1-test-key")
+
+            assert mock_llm.call_args.kwargs["max_tokens"] == 4096
 
     def test_create_with_custom_client(self, mock_config: MagicMock) -> None:
         """Test creating dependencies with custom client."""
@@ -249,7 +299,7 @@ class TestDependenciesCreate:
         """Test creating dependencies with custom tool registry."""
         custom_registry = MagicMock()
         custom_registry.list_names.return_value = ["custom_tool"]
-        custom_registry.get.return_value = MagicMock()
+        custom_registry.get.return_value = mock_tool("custom_tool")
 
         with patch(
             "code_forge.commands.CommandExecutor"
@@ -592,7 +642,7 @@ class TestLazyInitialization:
 
             mock_tool_reg_instance = MagicMock()
             mock_tool_reg_instance.list_names.return_value = ["read", "write"]
-            mock_tool_reg_instance.get.side_effect = lambda n: MagicMock(name=n)
+            mock_tool_reg_instance.get.side_effect = mock_tool
             mock_tool_reg.return_value = mock_tool_reg_instance
             mock_session_mgr.get_instance.return_value = MagicMock()
 
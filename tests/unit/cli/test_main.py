@@ -348,3 +348,121 @@ class TestCLIIntegration:
         )
         assert result.returncode == 0
         assert __version__ in result.stdout
+
+
+class TestRunWithAgentToolEvents:
+    """Tests for rendering agent tool events."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tool_starts(self) -> None:
+        """Two TOOL_START events before any TOOL_END should both render."""
+        import io
+
+        from rich.console import Console
+
+        from code_forge.cli.main import run_with_agent
+        from code_forge.config import CodeForgeConfig
+        from code_forge.langchain.agent import AgentEvent, AgentEventType
+
+        async def stream(_text: str):
+            for call_id, name in (("call_1", "Read"), ("call_2", "Grep")):
+                yield AgentEvent(
+                    AgentEventType.TOOL_START,
+                    {"id": call_id, "name": name, "arguments": {}},
+                )
+            for call_id, name in (("call_1", "Read"), ("call_2", "Grep")):
+                yield AgentEvent(
+                    AgentEventType.TOOL_END,
+                    {"id": call_id, "name": name, "result": f"{name} result", "success": True},
+                )
+            yield AgentEvent(AgentEventType.AGENT_END, {})
+
+        output = io.StringIO()
+        repl = MagicMock()
+        repl._console = Console(file=output, force_terminal=True)
+        repl.json_output = False
+        repl.quiet_mode = True
+        deps = MagicMock()
+        deps.rag_manager = None
+        deps.context_manager = None
+        deps.session_context_tracker = None
+        deps.tool_registry.list_names.return_value = []
+        deps.mode_manager.process_response.side_effect = lambda text: text
+        deps.agent.stream = stream
+
+        exit_code = await run_with_agent(
+            repl, CodeForgeConfig(), "test-key", stdin_input="search", deps=deps
+        )
+
+        assert exit_code == 0
+        repl.output.print_error.assert_not_called()
+        assert "Read result" in output.getvalue()
+        assert "Grep result" in output.getvalue()
+        # The spinner was stopped, so another live display can start
+        status = repl._console.status("next")
+        status.start()
+        status.stop()
+
+
+class TestRunWithAgentTeardown:
+    """Tests for cleanup when the agent loop exits."""
+
+    @pytest.mark.asyncio
+    async def test_closes_shared_pools_on_exit(self) -> None:
+        """Shared connection pools are closed when the CLI exits."""
+        from code_forge.cli.main import run_with_agent
+        from code_forge.config import CodeForgeConfig
+        from code_forge.langchain.agent import AgentEvent, AgentEventType
+
+        async def stream(_text: str):
+            yield AgentEvent(AgentEventType.AGENT_END, {})
+
+        repl = MagicMock()
+        repl.json_output = False
+        repl.quiet_mode = True
+        deps = MagicMock()
+        deps.rag_manager = None
+        deps.context_manager = None
+        deps.session_context_tracker = None
+        deps.tool_registry.list_names.return_value = []
+        deps.agent.stream = stream
+
+        with patch(
+            "code_forge.llm.transport.close_shared_pools", new_callable=AsyncMock
+        ) as close_pools:
+            await run_with_agent(
+                repl, CodeForgeConfig(), "test-key", stdin_input="hi", deps=deps
+            )
+
+        close_pools.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_file_cache_watcher_started_and_stopped(self) -> None:
+        """The opt-in file cache watcher runs for the lifetime of the CLI."""
+        from code_forge.cli.main import run_with_agent
+        from code_forge.config import CodeForgeConfig
+        from code_forge.langchain.agent import AgentEvent, AgentEventType
+
+        async def stream(_text: str):
+            yield AgentEvent(AgentEventType.AGENT_END, {})
+
+        repl = MagicMock()
+        repl.json_output = False
+        repl.quiet_mode = True
+        deps = MagicMock()
+        deps.rag_manager = None
+        deps.context_manager = None
+        deps.session_context_tracker = None
+        deps.tool_registry.list_names.return_value = []
+        deps.agent.stream = stream
+        config = CodeForgeConfig.model_validate({"tools": {"watch_file_cache": True}})
+        cache = MagicMock()
+
+        with (
+            patch("code_forge.tools.file.cache.get_file_cache", return_value=cache),
+            patch("code_forge.llm.transport.close_shared_pools", new_callable=AsyncMock),
+        ):
+            await run_with_agent(repl, config, "test-key", stdin_input="hi", deps=deps)
+
+        cache.watch.assert_called_once()
+        cache.stop_watching.assert_called_once()
@@ -17,6 +17,7 @@ from code_forge.config.models import (
     PermissionConfig,
     RoutingVariant,
     SessionConfig,
+    ToolsConfig,
     TransportType,
 )
 
@@ -335,6 +336,14 @@ class TestCodeForgeConfig:
         assert config.display.theme == "dark"
         assert config.api_key is None
 
+    def test_file_cache_watcher_off_by_default(self) -> None:
+        """Test the file cache watcher is opt-in."""
+        config = CodeForgeConfig()
+        assert isinstance(config.tools, ToolsConfig)
+        assert config.tools.watch_file_cache is False
+        config = CodeForgeConfig.model_validate({"tools": {"watch_file_cache": True}})
+        assert config.tools.watch_file_cache is True
+
     def test_nested_config(self) -> None:
         """Test nested configuration."""
         config = CodeForgeConfig(
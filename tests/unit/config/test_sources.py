@@ -314,6 +314,13 @@ class TestEnvironmentSource:
 
         assert data["display"]["streaming"] is False
 
+    def test_load_response_cache(self) -> None:
+        """Test loading response cache mode."""
+        source = EnvironmentSource({"FORGE_RESPONSE_CACHE": "deterministic"})
+        data = source.load()
+
+        assert data["model"]["response_cache"] == "deterministic"
+
     def test_load_multiple_vars(self) -> None:
         """Test loading multiple environment variables."""
         environ = {
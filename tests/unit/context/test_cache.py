@@ -0,0 +1,34 @@
+"""Unit tests for prompt cache support."""
+
+from code_forge.context.cache import PromptCacheStats
+
+
+class TestPromptCacheStats:
+    """Tests for PromptCacheStats."""
+
+    def test_initial_state(self) -> None:
+        """Should start with zero hit rate."""
+        stats = PromptCacheStats()
+        assert stats.hit_rate == 0.0
+        assert stats.get_stats()["requests"] == 0
+
+    def test_record_and_hit_rate(self) -> None:
+        """Should accumulate usage and compute hit rate."""
+        stats = PromptCacheStats()
+        stats.record(1000, cached_tokens=0, cache_write_tokens=800)
+        stats.record(1000, cached_tokens=800)
+
+        result = stats.get_stats()
+        assert result["requests"] == 2
+        assert result["prompt_tokens"] == 2000
+        assert result["cached_tokens"] == 800
+        assert result["cache_write_tokens"] == 800
+        assert result["hit_rate_percent"] == 40.0
+
+    def test_reset(self) -> None:
+        """Should clear all counters."""
+        stats = PromptCacheStats()
+        stats.record(100, cached_tokens=50)
+        stats.reset()
+        assert stats.get_stats()["cached_tokens"] == 0
+        assert stats.hit_rate == 0.0
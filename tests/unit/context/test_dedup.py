@@ -0,0 +1,208 @@
+"""Tests for file read deduplication."""
+
+import json
+from typing import Any
+
+from code_forge.context.dedup import (
+    DEDUP_MARKER,
+    READ_DEFAULT_LIMIT,
+    FileReadDeduplicator,
+    content_hash,
+    is_dedup_stub,
+)
+from code_forge.tools.file.read import ReadTool
+
+
+def tool_exchange(
+    call_id: str,
+    tool: str,
+    result: str,
+    **arguments: Any,
+) -> list[dict[str, Any]]:
+    """Build an assistant tool call and its result."""
+    return [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": tool, "arguments": json.dumps(arguments)},
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": result},
+    ]
+
+
+class TestHelpers:
+    """Tests for module helpers."""
+
+    def test_content_hash_stable(self) -> None:
+        """Test equal content hashes equally."""
+        assert content_hash("abc") == content_hash("abc")
+        assert content_hash("abc") != content_hash("abd")
+
+    def test_is_dedup_stub(self) -> None:
+        """Test stub detection."""
+        assert is_dedup_stub({"role": "tool", "content": f"{DEDUP_MARKER}: x]"})
+        assert not is_dedup_stub({"role": "tool", "content": "file content"})
+
+
+class TestFileReadDeduplicator:
+    """Tests for FileReadDeduplicator."""
+
+    def test_no_tool_calls(self) -> None:
+        """Test messages without tool calls are returned unchanged."""
+        messages = [{"role": "user", "content": "hi"}]
+        result = FileReadDeduplicator().deduplicate(messages)
+        assert result.messages is messages
+        assert result.replaced == 0
+
+    def test_identical_reads(self) -> None:
+        """Test earlier identical read is replaced by a back-reference."""
+        messages = [
+            *tool_exchange("c1", "Read", "line1\nline2", file_path="/a.py"),
+            *tool_exchange("c2", "Read", "line1\nline2", file_path="/a.py"),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 1
+        assert "identical to later call c2" in result.messages[1]["content"]
+        assert result.messages[3] is messages[3]
+        # Input is not modified
+        assert messages[1]["content"] == "line1\nline2"
+
+    def test_changed_reads(self) -> None:
+        """Test earlier read of changed content is superseded."""
+        messages = [
+            *tool_exchange("c1", "Read", "old", file_path="/a.py"),
+            *tool_exchange("c2", "Read", "new", file_path="/a.py"),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 1
+        assert "superseded by later read c2" in result.messages[1]["content"]
+
+    def test_different_ranges_kept(self) -> None:
+        """Test reads of different ranges are both kept."""
+        messages = [
+            *tool_exchange("c1", "Read", "part1", file_path="/a.py", offset=1, limit=10),
+            *tool_exchange("c2", "Read", "part2", file_path="/a.py", offset=11, limit=10),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+        assert result.replaced == 0
+
+    def test_covering_read_supersedes_range(self) -> None:
+        """Test a later read containing an earlier range supersedes it."""
+        messages = [
+            *tool_exchange("c1", "Read", "part", file_path="/a.py", offset=100, limit=10),
+            *tool_exchange("c2", "Read", "default", file_path="/a.py"),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 1
+        assert "superseded by later read c2" in result.messages[1]["content"]
+
+    def test_default_read_does_not_cover_later_lines(self) -> None:
+        """Test a Read without a limit only covers its default line count."""
+        messages = [
+            *tool_exchange("c1", "Read", "tail", file_path="/a.py", offset=2001, limit=10),
+            *tool_exchange("c2", "Read", "head", file_path="/a.py"),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 0
+
+    def test_partial_overlap_kept(self) -> None:
+        """Test a later read that only overlaps an earlier range keeps it."""
+        messages = [
+            *tool_exchange("c1", "Read", "early", file_path="/a.py", offset=1, limit=20),
+            *tool_exchange("c2", "Read", "later", file_path="/a.py", offset=11, limit=20),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 0
+
+    def test_narrower_read_does_not_supersede_default(self) -> None:
+        """Test a later narrower read keeps an earlier default read."""
+        messages = [
+            *tool_exchange("c1", "Read", "default", file_path="/a.py"),
+            *tool_exchange("c2", "Read", "part", file_path="/a.py", offset=1, limit=10),
+        ]
+        result = FileReadDeduplicator().deduplicate(messages)
+
+        assert result.replaced == 0
+
+    def test_default_limit_matches_read_tool(self) -> None:
+        """Test the assumed default limit is the Read tool's."""
+        assert READ_DEFAULT_LIMIT == ReadTool.DEFAULT_LIMIT
+
+    def test_latest_read_kept_after_edit(self) -> None:
+        """Test the only read of a file is kept after the file is edited."""
+        messages = [
+            *tool_exchange("c1", "Read", "content", file_path="/a.py"),
+            *tool_exchange("c2", "Edit", "Edited", file_path="/a.py"),
+        ]
+        assert FileReadDeduplicator().deduplicate(messages).replaced == 0
+
+    def test_edit_supersedes_read_when_enabled(self) -> None:
+        """Test a later edit makes an earlier read stale when opted in."""
+        messages = [
+            *tool_exchange("c1", "Read", "content", file_path="/a.py"),
+            *tool_exchange("c2", "Edit", "Edited", file_path="/a.py"),
+        ]
+        result = FileReadDeduplicator(supersede_on_edit=True).deduplicate(messages)
+
+        assert result.replaced == 1
+        assert "stale after Edit c2" in result.messages[1]["content"]
+
+    def test_failed_edit_ignored(self) -> None:
+        """Test a failed edit does not supersede earlier reads."""
+        messages = [
+            *tool_exchange("c1", "Read", "content", file_path="/a.py"),
+            *tool_exchange("c2", "Edit", "Error: old_string not found", file_path="/a.py"),
+        ]
+        dedup = FileReadDeduplicator(supersede_on_edit=True)
+        assert dedup.deduplicate(messages).replaced == 0
+
+    def test_other_files_untouched(self) -> None:
+        """Test reads of different files are independent."""
+        messages = [
+            *tool_exchange("c1", "Read", "a", file_path="/a.py"),
+            *tool_exchange("c2", "Read", "b", file_path="/b.py"),
+        ]
+        assert FileReadDeduplicator().deduplicate(messages).replaced == 0
+
+    def test_add_matches_new_result_against_index(self) -> None:
+        """Test incremental indexing returns stubs for earlier results only."""
+        dedup = FileReadDeduplicator()
+        first = tool_exchange("c1", "Read", "same", file_path="/a.py")
+        second = tool_exchange("c2", "Read", "same", file_path="/a.py")
+
+        assert [dedup.add(msg) for msg in first] == [{}, {}]
+        assert dedup.add(second[0]) == {}
+        stubs = dedup.add(second[1])
+
+        assert list(stubs) == ["c1"]
+        assert "identical to later call c2" in stubs["c1"]
+
+        # The superseded read left the index
+        third = tool_exchange("c3", "Read", "same", file_path="/a.py")
+        dedup.add(third[0])
+        assert list(dedup.add(third[1])) == ["c2"]
+
+    def test_idempotent(self) -> None:
+        """Test a second pass does not replace stubs again."""
+        messages = [
+            *tool_exchange("c1", "Read", "same", file_path="/a.py"),
+            *tool_exchange("c2", "Read", "same", file_path="/a.py"),
+        ]
+        dedup = FileReadDeduplicator()
+        first = dedup.deduplicate(messages)
+        second = dedup.deduplicate(first.messages)
+
+        assert first.replaced == 1
+        assert second.replaced == 0
+        assert second.messages is first.messages
@@ -342,6 +342,19 @@ class TestContextTracker:
         assert len(tracker.messages) == 0
         assert tracker.budget.conversation == 0
 
+    def test_stream_tokens(self) -> None:
+        """Should include in-flight streamed output in current usage."""
+        tracker = ContextTracker.for_model("claude-3-opus")
+        tracker.add_message({"role": "user", "content": "Hello"})
+        base = tracker.current_tokens()
+
+        assert tracker.add_stream_tokens(5) == 5
+        assert tracker.add_stream_tokens(3) == 8
+        assert tracker.current_tokens() == base + 8
+
+        assert tracker.end_stream() == 8
+        assert tracker.current_tokens() == base
+
 
 class TestModelLimits:
     """Tests for MODEL_LIMITS configuration."""
@@ -17,6 +17,7 @@ from code_forge.context.manager import (
     get_strategy,
 )
 from code_forge.context.strategies import (
+    CacheAwareTruncationStrategy,
     CompositeStrategy,
     SlidingWindowStrategy,
     SmartTruncationStrategy,
@@ -58,6 +59,11 @@ class TestGetStrategy:
         strategy = get_strategy(TruncationMode.SUMMARIZE)
         assert isinstance(strategy, CompositeStrategy)
 
+    def test_cache_aware(self) -> None:
+        """Should return CacheAwareTruncationStrategy."""
+        strategy = get_strategy(TruncationMode.CACHE_AWARE)
+        assert isinstance(strategy, CacheAwareTruncationStrategy)
+
 
 class TestContextManager:
     """Tests for ContextManager."""
@@ -332,6 +338,320 @@ class TestContextManager:
         assert isinstance(result, bool)
 
 
+class TestContextManagerPromptCaching:
+    """Tests for cache-aware context layout."""
+
+    def test_no_markers_in_default_mode(self) -> None:
+        """Should not emit cache_control outside cache-aware mode."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.set_system_prompt("System")
+        manager.add_message({"role": "user", "content": "Hello"})
+
+        context = manager.get_context_for_request()
+
+        assert context[0]["content"] == "System"
+        assert context[1]["content"] == "Hello"
+
+    def test_markers_in_cache_aware_mode(self) -> None:
+        """Should mark system prompt, pinned prefix end and last message."""
+        manager = ContextManager(
+            model="claude-3-opus", mode=TruncationMode.CACHE_AWARE
+        )
+        manager.set_system_prompt("System")
+        for i in range(4):
+            manager.add_message({"role": "user", "content": f"Message {i}"})
+
+        context = manager.get_context_for_request()
+
+        marked = [i for i, m in enumerate(context) if isinstance(m["content"], list)]
+        assert marked == [0, 2, 4]
+        assert context[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        # Stored messages are not modified
+        assert manager.get_messages()[-1]["content"] == "Message 3"
+
+    def test_cache_breakpoint(self) -> None:
+        """Should report the stable prefix end only in cache-aware mode."""
+        default = ContextManager(model="claude-3-opus")
+        default.add_message({"role": "user", "content": "Hello"})
+        cache_aware = ContextManager(
+            model="claude-3-opus", mode=TruncationMode.CACHE_AWARE
+        )
+
+        assert default.cache_breakpoint() is None
+        assert cache_aware.cache_breakpoint() is None
+
+        for i in range(4):
+            cache_aware.add_message({"role": "user", "content": f"Message {i}"})
+        assert cache_aware.cache_breakpoint() == 1
+
+    def test_record_usage(self) -> None:
+        """Should track prompt cache hit rate in stats."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.record_usage(1000, cached_tokens=900, cache_write_tokens=0)
+
+        stats = manager.get_stats()["prompt_cache"]
+        assert stats["requests"] == 1
+        assert stats["hit_rate_percent"] == 90.0
+
+
+class TestContextManagerStreaming:
+    """Tests for streamed output token accounting."""
+
+    def test_stream_tokens_in_usage(self) -> None:
+        """Should count streamed deltas in token usage until the stream ends."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "Hello"})
+        base = manager.token_usage
+
+        manager.begin_stream()
+        manager.add_stream_delta("The answer ")
+        manager.add_stream_delta("is forty two.")
+
+        assert manager.stream_tokens > 0
+        assert manager.token_usage == base + manager.stream_tokens
+        assert not manager.stream_limit_reached
+
+        assert manager.end_stream() > 0
+        assert manager.token_usage == base
+
+    def test_stream_limit(self) -> None:
+        """Should report when a completion reaches its output budget."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.begin_stream(max_output_tokens=5)
+        while not manager.stream_limit_reached:
+            manager.add_stream_delta("word ")
+
+        assert manager.stream_tokens >= 5
+
+        # A new completion starts with a fresh budget
+        manager.begin_stream(max_output_tokens=5)
+        assert not manager.stream_limit_reached
+
+
+class TestContextManagerProfile:
+    """Tests for context profile attribution."""
+
+    def test_attributes_messages(self) -> None:
+        """Should attribute tokens by role, tool name and RAG context."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.set_system_prompt("You are helpful.")
+        manager.set_tool_definitions([{"name": "Read", "description": "Read a file"}])
+        manager.add_message({"role": "user", "content": "Show me app.py"})
+        manager.record_augmentation("relevant project context")
+        manager.add_tool_exchange("c1", "Read", {"file_path": "/app.py"}, "print('hi')")
+        manager.add_message({"role": "assistant", "content": "It prints hi."})
+
+        report = manager.profiler.get_report()
+        assert report["static"]["system_prompt"] > 0
+        assert report["static"]["tool_schemas"] > 0
+        turn = report["turns"][-1]
+        assert turn["turn"] == 1
+        assert turn["user"] > 0
+        assert turn["rag"] > 0
+        assert turn["assistant"] > 0
+        assert turn["tools"]["Read"] > 0
+
+    def test_augmentation_in_next_message(self) -> None:
+        """Should split an augmented user message between RAG and user."""
+        manager = ContextManager(model="claude-3-opus")
+        context = "relevant project context " * 20
+        rag_tokens = manager.record_augmentation(context, in_next_message=True)
+        manager.add_message({"role": "user", "content": f"{context}\n\nUser query: hi"})
+
+        turn = manager.profiler.get_report()["turns"][-1]
+        assert turn["rag"] == rag_tokens
+        assert 0 < turn["user"] < rag_tokens
+
+    def test_failed_tool_marked_as_error(self) -> None:
+        """Should prefix failed tool results with Error:."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_tool_exchange("c1", "Edit", {"file_path": "/a.py"}, "not found", False)
+        assert manager.get_messages()[-1]["content"] == "Error: not found"
+
+    def test_records_truncation(self) -> None:
+        """Should record truncation cost in the profile."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "Hello"})
+        manager.tracker.budget.total = 200
+        manager.tracker.budget.response_reserve = 0
+        for i in range(20):
+            manager.add_message({"role": "assistant", "content": f"word{i} " * 20})
+
+        totals = manager.profiler.get_report()["totals"]
+        assert totals["compressions"] > 0
+        assert totals["tokens_removed"] > 0
+
+
+class TestContextManagerToolGroups:
+    """Tests for keeping tool calls and results together on truncation."""
+
+    @staticmethod
+    def _assert_valid_history(messages: list[dict[str, Any]]) -> None:
+        issued: set[str] = set()
+        for msg in messages:
+            assert msg["role"] != "system"
+            if msg["role"] == "assistant":
+                issued = {call["id"] for call in msg.get("tool_calls") or []}
+            elif msg["role"] == "tool":
+                assert msg["tool_call_id"] in issued
+                issued.discard(msg["tool_call_id"])
+            else:
+                assert not issued, "tool calls without results"
+
+    @pytest.mark.parametrize("mode", list(TruncationMode))
+    def test_truncation_keeps_tool_groups(self, mode: TruncationMode) -> None:
+        """Should never leave tool calls without results or mid-history system messages."""
+        manager = ContextManager(model="claude-3-opus", mode=mode, auto_truncate=False)
+        manager.add_message({"role": "user", "content": "Start"})
+        for i in range(15):
+            manager.add_tool_exchange(f"c{i}", "Read", {"file_path": f"/f{i}.py"}, "x " * 200)
+            manager.add_message({"role": "assistant", "content": f"Read f{i}"})
+
+        manager.truncate(1500)
+
+        self._assert_valid_history(manager.get_messages())
+
+    def test_keeps_trailing_group_in_flight(self) -> None:
+        """Should keep a final tool call whose result has not arrived."""
+        from code_forge.context.tool_calls import drop_incomplete_tool_groups
+
+        call = {"id": "c1", "type": "function", "function": {"name": "Read", "arguments": "{}"}}
+        messages = [
+            {"role": "user", "content": "Read it"},
+            {"role": "assistant", "content": "", "tool_calls": [call]},
+        ]
+
+        assert drop_incomplete_tool_groups(messages) is messages
+
+    def test_drops_orphaned_results(self) -> None:
+        """Should drop results whose call and calls whose results were removed."""
+        from code_forge.context.tool_calls import drop_incomplete_tool_groups
+
+        call = {"id": "c1", "type": "function", "function": {"name": "Read", "arguments": "{}"}}
+        messages = [
+            {"role": "user", "content": "Read it"},
+            {"role": "assistant", "content": "", "tool_calls": [call]},
+            {"role": "user", "content": "Never mind"},
+            {"role": "tool", "tool_call_id": "c0", "content": "stale"},
+            {"role": "assistant", "content": "OK"},
+        ]
+
+        assert drop_incomplete_tool_groups(messages) == [
+            messages[0],
+            messages[2],
+            messages[4],
+        ]
+
+
+class TestContextManagerDeduplication:
+    """Tests for file read deduplication in the context manager."""
+
+    @staticmethod
+    def _read(call_id: str, content: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {
+                            "name": "Read",
+                            "arguments": '{"file_path": "/src/app.py"}',
+                        },
+                    }
+                ],
+            },
+            {"role": "tool", "tool_call_id": call_id, "content": content},
+        ]
+
+    def test_repeated_read_replaced(self) -> None:
+        """Should stub earlier copies of a re-read file."""
+        content = " ".join(f"line{i}" for i in range(200))
+        manager = ContextManager(model="claude-3-opus", dedupe_batch_tokens=0)
+        manager.add_messages(self._read("c1", content))
+        tokens_single = manager.token_usage
+        manager.add_messages(self._read("c2", content))
+
+        messages = manager.get_messages()
+        assert messages[1]["content"].startswith("[Deduplicated")
+        assert messages[3]["content"] == content
+        assert manager.token_usage < tokens_single * 2
+
+        stats = manager.get_stats()["deduplication"]
+        assert stats["results_replaced"] == 1
+        assert stats["tokens_saved"] > 0
+
+    def test_stubs_batched_until_truncation(self) -> None:
+        """Should keep history unchanged until queued stubs save enough."""
+        content = " ".join(f"line{i}" for i in range(200))
+        manager = ContextManager(model="claude-3-opus", dedupe_batch_tokens=100000)
+        manager.add_messages(self._read("c1", content))
+        manager.add_messages(self._read("c2", content))
+
+        assert manager.get_messages()[1]["content"] == content
+        assert manager.revision == 0
+
+        manager.truncate()
+
+        assert manager.get_messages()[1]["content"].startswith("[Deduplicated")
+        assert manager.get_stats()["deduplication"]["results_replaced"] == 1
+
+    def test_disabled(self) -> None:
+        """Should keep all copies when deduplication is disabled."""
+        manager = ContextManager(model="claude-3-opus", dedupe_reads=False)
+        manager.add_messages(self._read("c1", "content"))
+        manager.add_messages(self._read("c2", "content"))
+
+        assert manager.get_messages()[1]["content"] == "content"
+        assert manager.get_stats()["deduplication"]["results_replaced"] == 0
+
+
+class TestContextManagerRevision:
+    """Tests for history revision tracking."""
+
+    def test_append_keeps_revision(self) -> None:
+        """Should not change revision when messages are added."""
+        manager = ContextManager(model="claude-3-opus")
+        revision = manager.revision
+        manager.add_message({"role": "user", "content": "Hello"})
+        assert manager.revision == revision
+
+    def test_reset_changes_revision(self) -> None:
+        """Should change revision on reset."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "Hello"})
+        revision = manager.revision
+        manager.reset()
+        assert manager.revision != revision
+
+    def test_truncate_changes_revision(self) -> None:
+        """Should change revision when truncation removes messages."""
+        manager = ContextManager(model="claude-3-opus", auto_truncate=False)
+        for i in range(20):
+            manager.add_message({"role": "user", "content": f"word{i} " * 20})
+        revision = manager.revision
+
+        manager.truncate(target_tokens=100)
+
+        assert len(manager.get_messages()) < 20
+        assert manager.revision != revision
+
+    def test_replace_messages(self) -> None:
+        """Should replace history and recount tokens."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "word " * 100})
+        revision = manager.revision
+        tokens = manager.token_usage
+
+        manager.replace_messages([{"role": "user", "content": "short"}])
+
+        assert manager.get_messages() == [{"role": "user", "content": "short"}]
+        assert manager.token_usage < tokens
+        assert manager.revision != revision
+
+
 class TestContextManagerIntegration:
     """Integration tests for ContextManager."""
 
@@ -0,0 +1,119 @@
+"""Tests for context profiler."""
+
+import json
+from pathlib import Path
+
+from code_forge.context.events import CompressionEvent, CompressionEventType
+from code_forge.context.profiler import (
+    CATEGORY_ASSISTANT,
+    CATEGORY_RAG,
+    CATEGORY_TOOL,
+    CATEGORY_USER,
+    CompressionRecord,
+    ContextProfiler,
+)
+
+
+class TestContextProfiler:
+    """Tests for ContextProfiler."""
+
+    def test_records_per_turn(self) -> None:
+        """Test tokens are attributed to the current turn."""
+        profiler = ContextProfiler()
+        profiler.begin_turn()
+        profiler.record(CATEGORY_USER, 10)
+        profiler.record(CATEGORY_RAG, 100)
+        profiler.record(CATEGORY_TOOL, 50, "Read")
+        profiler.record(CATEGORY_TOOL, 30, "Read")
+        profiler.record(CATEGORY_TOOL, 20, "Bash")
+        profiler.record(CATEGORY_ASSISTANT, 40)
+        profiler.begin_turn()
+        profiler.record(CATEGORY_USER, 5)
+
+        turns = profiler.get_turns()
+        assert [t.turn for t in turns] == [1, 2]
+        assert turns[0].tools == {"Read": 80, "Bash": 20}
+        assert turns[0].total == 250
+        assert turns[1].user == 5
+
+    def test_records_before_first_turn(self) -> None:
+        """Test messages before any user turn go to turn 0."""
+        profiler = ContextProfiler()
+        profiler.record(CATEGORY_ASSISTANT, 7)
+        assert profiler.get_turns()[0].turn == 0
+
+    def test_compression_events(self) -> None:
+        """Test truncation events are recorded, warnings ignored."""
+        profiler = ContextProfiler()
+        profiler.begin_turn()
+        profiler.on_compression_event(
+            CompressionEvent(
+                event_type=CompressionEventType.TRUNCATION,
+                tokens_before=1000,
+                tokens_after=600,
+                messages_before=10,
+                messages_after=6,
+                strategy="smart",
+            )
+        )
+        profiler.on_compression_event(
+            CompressionEvent(
+                event_type=CompressionEventType.WARNING,
+                tokens_before=1000,
+                tokens_after=1000,
+                messages_before=10,
+                messages_after=10,
+            )
+        )
+
+        turn = profiler.get_turns()[0]
+        assert len(turn.compressions) == 1
+        assert turn.compressions[0].detail == "smart"
+        assert turn.tokens_removed == 400
+
+    def test_report_totals(self) -> None:
+        """Test report aggregates turns and static costs."""
+        profiler = ContextProfiler()
+        profiler.set_system_prompt(300)
+        profiler.set_tool_schemas(1200)
+        for _ in range(2):
+            profiler.begin_turn()
+            profiler.record(CATEGORY_USER, 10)
+            profiler.record(CATEGORY_TOOL, 50, "Read")
+        profiler.record_compression(
+            CompressionRecord(kind="tool_result", tokens_before=900, tokens_after=100)
+        )
+
+        report = profiler.get_report()
+        assert report["static"] == {"system_prompt": 300, "tool_schemas": 1200}
+        assert report["totals"]["user"] == 20
+        assert report["totals"]["tools"] == {"Read": 100}
+        assert report["totals"]["tokens_removed"] == 800
+        assert report["turns"][1]["compressions"][0]["tokens_removed"] == 800
+
+    def test_max_turns(self) -> None:
+        """Test oldest turns are dropped."""
+        profiler = ContextProfiler(max_turns=3)
+        for _ in range(5):
+            profiler.begin_turn()
+        assert [t.turn for t in profiler.get_turns()] == [3, 4, 5]
+
+    def test_export_json(self, tmp_path: Path) -> None:
+        """Test JSON export round-trips the report."""
+        profiler = ContextProfiler()
+        profiler.begin_turn()
+        profiler.record(CATEGORY_USER, 10)
+
+        path = profiler.export_json(tmp_path / "out" / "profile.json")
+
+        assert json.loads(path.read_text()) == profiler.get_report()
+
+    def test_reset(self) -> None:
+        """Test reset clears turns but keeps static costs."""
+        profiler = ContextProfiler()
+        profiler.set_system_prompt(100)
+        profiler.begin_turn()
+        profiler.reset()
+
+        assert profiler.get_turns() == []
+        assert profiler.get_report()["static"]["system_prompt"] == 100
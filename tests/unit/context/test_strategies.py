@@ -1,12 +1,15 @@
 """Unit tests for truncation strategies."""
 
+import json
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 from code_forge.context.strategies import (
+    CacheAwareTruncationStrategy,
     CompositeStrategy,
+    RelevanceEvictionStrategy,
     SelectiveTruncationStrategy,
     SlidingWindowStrategy,
     SmartTruncationStrategy,
@@ -14,6 +17,8 @@ from code_forge.context.strategies import (
     TruncationStrategy,
 )
 from code_forge.context.tokens import ApproximateCounter, TokenCounter
+from code_forge.context.tool_calls import drop_incomplete_tool_groups, index_tool_calls
+from code_forge.context.tracker import SessionContextTracker
 
 
 def make_messages(count: int, content_size: int = 10) -> list[dict[str, Any]]:
@@ -24,6 +29,14 @@ def make_messages(count: int, content_size: int = 10) -> list[dict[str, Any]]:
     ]
 
 
+def make_word_messages(count: int, words: int = 50) -> list[dict[str, Any]]:
+    """Create test messages with realistic token counts."""
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"word{i} " * words}
+        for i in range(count)
+    ]
+
+
 class TestSlidingWindowStrategy:
     """Tests for SlidingWindowStrategy."""
 
@@ -344,6 +357,252 @@ class TestSelectiveTruncationStrategy:
         assert len(result) >= 1
 
 
+class TestCacheAwareTruncationStrategy:
+    """Tests for CacheAwareTruncationStrategy."""
+
+    def test_empty_messages(self) -> None:
+        """Should return empty list for empty input."""
+        strategy = CacheAwareTruncationStrategy()
+        assert strategy.truncate([], 1000, ApproximateCounter()) == []
+
+    def test_no_truncation_when_under_budget(self) -> None:
+        """Should return messages unchanged when within budget."""
+        strategy = CacheAwareTruncationStrategy()
+        messages = make_messages(6)
+
+        result = strategy.truncate(messages, 100000, ApproximateCounter())
+        assert result is messages
+
+    def test_invalid_headroom(self) -> None:
+        """Should reject headroom outside [0, 1)."""
+        with pytest.raises(ValueError):
+            CacheAwareTruncationStrategy(headroom=1.0)
+
+    def test_keeps_pinned_prefix_and_marker(self) -> None:
+        """Should keep system, pinned messages and a fixed marker."""
+        strategy = CacheAwareTruncationStrategy(preserve_first=2)
+        counter = ApproximateCounter()
+        messages = [{"role": "system", "content": "System"}] + make_word_messages(40)
+
+        result = strategy.truncate(messages, 1000, counter)
+
+        assert result[0] == messages[0]
+        assert result[1:3] == messages[1:3]
+        assert strategy.is_marker(result[3])
+        assert result[-1] == messages[-1]
+        assert counter.count_messages(result) <= 1000
+
+    def test_truncates_below_low_water_mark(self) -> None:
+        """Should free headroom so later turns don't truncate again."""
+        strategy = CacheAwareTruncationStrategy(headroom=0.5)
+        counter = ApproximateCounter()
+        messages = make_word_messages(40)
+
+        result = strategy.truncate(messages, 2000, counter)
+        assert counter.count_messages(result) <= 1000
+
+    def test_cuts_at_user_turn(self) -> None:
+        """Should start the retained tail at a user message."""
+        strategy = CacheAwareTruncationStrategy(preserve_first=1)
+        messages: list[dict[str, Any]] = [{"role": "user", "content": "Start"}]
+        for i in range(20):
+            messages.append({"role": "user", "content": f"question {i} " * 20})
+            messages.append({"role": "assistant", "content": "calling tool"})
+            messages.append({"role": "tool", "content": "result " * 50})
+
+        result = strategy.truncate(messages, 1500, ApproximateCounter())
+        marker_idx = strategy.prefix_length(result)
+
+        assert result[marker_idx]["role"] == "user"
+
+    def test_long_agent_turn_keeps_request(self) -> None:
+        """Should keep the user request and whole tool groups within one turn."""
+        strategy = CacheAwareTruncationStrategy(preserve_first=2)
+        counter = ApproximateCounter()
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+            {"role": "user", "content": "Refactor the parser"},
+        ]
+        for i in range(185):
+            messages += make_tool_exchange(
+                f"c{i}", "Read", f"/src/f{i}.py", "line of code " * 100
+            )
+
+        result = strategy.truncate(messages, 20000, counter)
+
+        assert strategy.is_marker(result[2])
+        assert result[3] == messages[2]
+        assert result[4]["role"] == "assistant"
+        assert result[-2:] == messages[-2:]
+        assert drop_incomplete_tool_groups(result) is result
+        assert len(result) > 10
+        assert counter.count_messages(result) <= 20000
+
+    def test_prefix_stable_across_truncations(self) -> None:
+        """Should produce an identical prefix on repeated truncation."""
+        strategy = CacheAwareTruncationStrategy(preserve_first=2)
+        counter = ApproximateCounter()
+        messages = make_word_messages(40)
+
+        first = strategy.truncate(messages, 1500, counter)
+        prefix_len = strategy.prefix_length(first)
+        grown = first + make_word_messages(30)
+        second = strategy.truncate(grown, 1500, counter)
+
+        assert second[:prefix_len] == first[:prefix_len]
+        assert sum(1 for m in second if strategy.is_marker(m)) == 1
+
+    def test_prefix_length_without_marker(self) -> None:
+        """Should report pinned messages as prefix before truncation."""
+        strategy = CacheAwareTruncationStrategy(preserve_first=2)
+        messages = [{"role": "system", "content": "S"}] + make_messages(5)
+
+        assert strategy.prefix_length(messages) == 3
+        assert strategy.prefix_length([]) == 0
+
+
+def make_tool_exchange(
+    call_id: str, tool: str, file_path: str, result: str, **arguments: Any
+) -> list[dict[str, Any]]:
+    """Create an assistant tool call followed by its result."""
+    return [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {
+                        "name": tool,
+                        "arguments": json.dumps({"file_path": file_path, **arguments}),
+                    },
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": result},
+    ]
+
+
+class TestRelevanceEvictionStrategy:
+    """Tests for RelevanceEvictionStrategy."""
+
+    def test_empty_messages(self) -> None:
+        """Should return empty list for empty input."""
+        strategy = RelevanceEvictionStrategy()
+        assert strategy.truncate([], 1000, ApproximateCounter()) == []
+
+    def test_no_eviction_under_budget(self) -> None:
+        """Should return messages unchanged when within budget."""
+        strategy = RelevanceEvictionStrategy()
+        messages = make_word_messages(5)
+        assert strategy.truncate(messages, 100000, ApproximateCounter()) is messages
+
+    def test_stale_read_evicted_first(self) -> None:
+        """Should stub a file read superseded by a later read."""
+        strategy = RelevanceEvictionStrategy()
+        counter = ApproximateCounter()
+        big = "line of code " * 300
+        messages: list[dict[str, Any]] = [{"role": "user", "content": "Look at a.py"}]
+        messages += make_tool_exchange("c1", "Read", "/src/a.py", big)
+        messages += make_tool_exchange("c2", "Read", "/src/b.py", big)
+        messages += make_tool_exchange("c3", "Read", "/src/a.py", big)
+        messages.append({"role": "assistant", "content": "Done reading"})
+        messages.append({"role": "user", "content": "Now fix it"})
+
+        target = counter.count_messages(messages) - 100
+        result = strategy.truncate(messages, target, counter)
+
+        assert len(result) == len(messages)
+        assert "superseded" in result[2]["content"]
+        assert result[4]["content"] == big
+        assert result[6]["content"] == big
+
+    def test_narrower_read_does_not_stale_earlier_read(self) -> None:
+        """Should keep a full read current after a narrower re-read."""
+        strategy = RelevanceEvictionStrategy()
+        messages = make_tool_exchange("c1", "Read", "/a.py", "full")
+        messages += make_tool_exchange("c2", "Read", "/a.py", "part", offset=10, limit=5)
+
+        stale = strategy._stale_results(messages, index_tool_calls(messages))
+
+        assert stale == {}
+
+    def test_failed_calls_do_not_stale_results(self) -> None:
+        """Should ignore failed reads and edits of the same file."""
+        strategy = RelevanceEvictionStrategy()
+        messages = make_tool_exchange("c1", "Read", "/a.py", "code")
+        messages += make_tool_exchange("c2", "Edit", "/a.py", "Error: not found")
+        messages += make_tool_exchange("c3", "Read", "/a.py", "Error: denied")
+
+        assert strategy._stale_results(messages, index_tool_calls(messages)) == {}
+
+        messages += make_tool_exchange("c4", "Edit", "/a.py", "Edited")
+        stale = strategy._stale_results(messages, index_tool_calls(messages))
+
+        assert stale == {1: "/a.py", 3: "/a.py", 5: "/a.py"}
+
+    def test_entity_overlap_keeps_relevant(self) -> None:
+        """Should prefer evicting results unrelated to current entities."""
+        tracker = SessionContextTracker()
+        tracker.increment_turn()
+        tracker.extract_entities_from_text("please update 'src/keep.py'")
+        strategy = RelevanceEvictionStrategy(session_tracker=tracker, preserve_last=1)
+        counter = ApproximateCounter()
+        big = "line of code " * 300
+        messages: list[dict[str, Any]] = [{"role": "user", "content": "start"}]
+        messages += make_tool_exchange("c1", "Read", "src/keep.py", big)
+        messages += make_tool_exchange("c2", "Read", "src/other.py", big)
+        messages.append({"role": "user", "content": "please update 'src/keep.py'"})
+
+        target = counter.count_messages(messages) - 100
+        result = strategy.truncate(messages, target, counter)
+        results = {m.get("tool_call_id"): m["content"] for m in result if m["role"] == "tool"}
+
+        assert results["c1"] == big
+        assert "evicted" in results["c2"]
+
+    def test_current_request_and_tool_calls_preserved(self) -> None:
+        """Should never evict the current request or assistant tool calls."""
+        strategy = RelevanceEvictionStrategy(preserve_last=1)
+        counter = ApproximateCounter()
+        messages = make_word_messages(10)
+        messages += make_tool_exchange("c1", "Read", "/x.py", "word " * 100)
+
+        result = strategy.truncate(messages, 1, counter)
+
+        # Everything but the request, tool calls and last message is evictable
+        assert result == [messages[8], *messages[10:]]
+
+    def test_long_agent_turn_stubs_older_results(self) -> None:
+        """Should stub older tool results inside the current turn."""
+        strategy = RelevanceEvictionStrategy(preserve_last=4)
+        counter = ApproximateCounter()
+        big = "line of code " * 100
+        messages: list[dict[str, Any]] = [{"role": "user", "content": "Refactor"}]
+        for i in range(50):
+            messages += make_tool_exchange(f"c{i}", "Read", f"/src/f{i}.py", big)
+
+        target = counter.count_messages(messages) // 2
+        result = strategy.truncate(messages, target, counter)
+
+        assert len(result) == len(messages)
+        assert result[0] == messages[0]
+        assert "evicted" in result[2]["content"]
+        assert result[-1]["content"] == big
+        assert counter.count_messages(result) <= target
+
+    def test_preserves_system(self) -> None:
+        """Should keep system messages."""
+        strategy = RelevanceEvictionStrategy()
+        messages = [{"role": "system", "content": "System"}] + make_word_messages(20)
+
+        result = strategy.truncate(messages, 50, ApproximateCounter())
+
+        assert result[0] == messages[0]
+
+
 class TestCompositeStrategy:
     """Tests for CompositeStrategy."""
 
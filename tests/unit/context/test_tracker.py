@@ -195,6 +195,20 @@ class TestSessionContextTracker:
         assert recent[0] == "c.py"  # Most recent first
         assert recent[1] == "b.py"
 
+    def test_get_current_entities(self) -> None:
+        """Test getting entities from the most recent turns."""
+        tracker = SessionContextTracker()
+        tracker.track_entity(EntityType.FILE, "a.py")
+        tracker.increment_turn()
+        tracker.increment_turn()
+        tracker.track_entity(EntityType.FILE, "b.py")
+        tracker.track_entity(EntityType.FUNCTION, "main")
+        tracker.track_entity(EntityType.FUNCTION, "main")
+
+        current = tracker.get_current_entities()
+        assert [e.value for e in current] == ["main", "b.py"]
+        assert len(tracker.get_current_entities(window=2)) == 3
+
     def test_get_recent_operations(self) -> None:
         """Test getting recent operations."""
         tracker = SessionContextTracker()
@@ -1,6 +1,7 @@
 """Unit tests for agent executor."""
 
 from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 import time
 
 import pytest
@@ -27,6 +28,7 @@ class TestAgentEventType:
         assert AgentEventType.LLM_END == "llm_end"
         assert AgentEventType.TOOL_START == "tool_start"
         assert AgentEventType.TOOL_END == "tool_end"
+        assert AgentEventType.TOOL_OUTPUT == "tool_output"
         assert AgentEventType.AGENT_END == "agent_end"
         assert AgentEventType.ERROR == "error"
 
@@ -290,6 +292,63 @@ class TestCodeForgeAgentRun:
         assert result.tool_calls[0].success is False
         assert "Unknown tool" in result.tool_calls[0].result
 
+    @pytest.mark.asyncio
+    async def test_read_only_tools_run_concurrently(self) -> None:
+        """Test read-only calls overlap, writes wait, and results keep call order."""
+        import asyncio
+
+        mock_llm = MagicMock()
+        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+        mock_llm.ainvoke = AsyncMock(
+            side_effect=[
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"id": "call_1", "name": "slow_read", "args": {"x": 1}},
+                        {"id": "call_2", "name": "fast_read", "args": {"x": 2}},
+                        {"id": "call_3", "name": "write", "args": {"x": 3}},
+                    ],
+                ),
+                AIMessage(content="Done"),
+            ]
+        )
+        events: list[str] = []
+
+        class ReadTool:
+            is_read_only = True
+
+            def __init__(self, name: str, delay: float) -> None:
+                self.name = name
+                self.delay = delay
+
+            async def ainvoke(self, args):
+                events.append(f"start {self.name}")
+                await asyncio.sleep(self.delay)
+                events.append(f"end {self.name}")
+                return self.name
+
+        class WriteTool:
+            name = "write"
+
+            async def ainvoke(self, args):
+                events.append("write")
+                return "written"
+
+        tools = [ReadTool("slow_read", 0.05), ReadTool("fast_read", 0.0), WriteTool()]
+        agent = CodeForgeAgent(llm=mock_llm, tools=tools)
+        result = await agent.run("Read then write")
+
+        assert events == [
+            "start slow_read",
+            "start fast_read",
+            "end fast_read",
+            "end slow_read",
+            "write",
+        ]
+        assert [r.result for r in result.tool_calls] == ["slow_read", "fast_read", "written"]
+        tool_messages = [m for m in result.messages if m.tool_call_id]
+        assert [m.tool_call_id for m in tool_messages] == ["call_1", "call_2", "call_3"]
+
 
 class TestCodeForgeAgentReset:
     """Tests for CodeForgeAgent.reset() method."""
@@ -430,6 +489,55 @@ class TestCodeForgeAgentStream:
         assert AgentEventType.TOOL_START in event_types
         assert AgentEventType.TOOL_END in event_types
 
+    @pytest.mark.asyncio
+    async def test_stream_tool_output(self) -> None:
+        """Test output lines reported by a tool are streamed as events."""
+        from langchain_core.messages import AIMessageChunk
+
+        from code_forge.tools.execution.output import output_listener
+
+        mock_llm = MagicMock()
+        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+        call_count = [0]
+
+        async def mock_stream(*args, **kwargs):
+            call_count[0] += 1
+            if call_count[0] == 1:
+                yield AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {"index": 0, "id": "call_1", "name": "test_tool", "args": "{}"}
+                    ],
+                )
+            else:
+                yield AIMessageChunk(content="Done")
+
+        mock_llm.astream = mock_stream
+
+        class MockTool:
+            name = "test_tool"
+
+            async def ainvoke(self, args):
+                listener = output_listener.get()
+                for line in ("building", "done"):
+                    listener("stdout", line)
+                    await asyncio.sleep(0)
+                return "tool result"
+
+        agent = CodeForgeAgent(llm=mock_llm, tools=[MockTool()], stream_tool_output=True)
+
+        events = [event async for event in agent.stream("Use tool")]
+
+        event_types = [e.type for e in events]
+        output = [e.data for e in events if e.type == AgentEventType.TOOL_OUTPUT]
+        assert [d["line"] for d in output] == ["building", "done"]
+        assert output[0]["id"] == "call_1"
+        assert output[0]["stream"] == "stdout"
+        assert event_types.index(AgentEventType.TOOL_OUTPUT) < event_types.index(
+            AgentEventType.TOOL_END
+        )
+        assert output_listener.get() is None
+
     @pytest.mark.asyncio
     async def test_stream_timeout(self) -> None:
         """Test streaming with timeout."""
@@ -503,6 +611,40 @@ class TestCodeForgeAgentStream:
         chunk_events = [e for e in events if e.type == AgentEventType.LLM_CHUNK]
         assert len(chunk_events) >= 1
 
+    @pytest.mark.asyncio
+    async def test_stream_native(self) -> None:
+        """Test native streaming reads client chunks without LangChain wrapping."""
+        from code_forge.langchain.llm import OpenRouterLLM
+        from code_forge.llm.models import StreamChunk, StreamDelta
+
+        async def mock_stream(request):
+            yield StreamChunk(
+                id="c", model="m", index=0,
+                delta=StreamDelta(reasoning_content="Hmm"), finish_reason=None,
+            )
+            yield StreamChunk(
+                id="c", model="m", index=0,
+                delta=StreamDelta(content="Hello"), finish_reason="stop",
+                usage=TokenUsage(prompt_tokens=3, completion_tokens=1, total_tokens=4),
+            )
+
+        mock_client = MagicMock()
+        mock_client.stream = mock_stream
+        llm = OpenRouterLLM(client=mock_client, model="m")
+
+        agent = CodeForgeAgent(llm=llm, tools=[], native_streaming=True)
+        with patch.object(OpenRouterLLM, "astream") as astream:
+            events = [event async for event in agent.stream("Test")]
+
+        astream.assert_not_called()
+        chunk_events = [e.data for e in events if e.type == AgentEventType.LLM_CHUNK]
+        assert chunk_events == [
+            {"content": "Hmm", "is_reasoning": True},
+            {"content": "Hello"},
+        ]
+        end_event = next(e for e in events if e.type == AgentEventType.AGENT_END)
+        assert end_event.data["prompt_tokens"] == 3
+
 
 class TestCodeForgeAgentRunEdgeCases:
     """Edge case tests for CodeForgeAgent.run() method."""
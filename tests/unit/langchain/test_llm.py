@@ -485,6 +485,33 @@ class TestOpenRouterLLMStreaming:
         # Verify callback was called
         mock_run_manager.on_llm_new_token.assert_called_with("Token")
 
+    @pytest.mark.asyncio
+    async def test_astream_native(self) -> None:
+        """Test native streaming yields client chunks unchanged."""
+        from code_forge.llm.models import StreamChunk, StreamDelta
+
+        chunk = StreamChunk(
+            id="chunk-1",
+            model="test-model",
+            index=0,
+            delta=StreamDelta(content="Token"),
+            finish_reason="stop",
+        )
+        requests = []
+
+        async def mock_stream(request):
+            requests.append(request)
+            yield chunk
+
+        mock_client = MagicMock()
+        mock_client.stream = mock_stream
+
+        llm = OpenRouterLLM(client=mock_client, model="test-model")
+        chunks = [c async for c in llm.astream_native([HumanMessage(content="Hello")])]
+
+        assert chunks == [chunk]
+        assert requests[0].stream is True
+
 
 class TestOpenRouterLLMSyncGenerate:
     """Tests for synchronous _generate method."""
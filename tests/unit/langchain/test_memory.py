@@ -3,12 +3,15 @@
 import pytest
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 
+from code_forge.context.manager import ContextManager, TruncationMode
 from code_forge.langchain.memory import (
+    ContextMemory,
     ConversationMemory,
     SlidingWindowMemory,
     SummaryMemory,
 )
-from code_forge.llm.models import Message, MessageRole
+from code_forge.langchain.messages import langchain_messages_to_forge
+from code_forge.llm.models import CompletionRequest, Message, MessageRole
 
 
 class TestConversationMemory:
@@ -189,6 +192,238 @@ class TestConversationMemory:
         assert len(msgs) == 2
 
 
+class TestLangChainConversionCache:
+    """Tests for incremental conversion in to_langchain_messages."""
+
+    def test_reuses_converted_messages(self) -> None:
+        """Test earlier messages are not converted again."""
+        memory = ConversationMemory()
+        memory.set_system_message(Message.system("Be helpful"))
+        memory.add_message(Message.user("Hello"))
+
+        first = memory.to_langchain_messages()
+        memory.add_message(Message.assistant("Hi!"))
+        second = memory.to_langchain_messages()
+
+        assert len(second) == 3
+        assert second[0] is first[0]
+        assert second[1] is first[1]
+        assert isinstance(second[2], AIMessage)
+
+    def test_returns_new_list(self) -> None:
+        """Test callers can modify the returned list."""
+        memory = ConversationMemory()
+        memory.add_message(Message.user("Hello"))
+
+        memory.to_langchain_messages().append(HumanMessage(content="extra"))
+
+        assert len(memory.to_langchain_messages()) == 1
+
+    def test_system_message_change_invalidates(self) -> None:
+        """Test a new system message is picked up."""
+        memory = ConversationMemory()
+        memory.set_system_message(Message.system("Old"))
+        memory.add_message(Message.user("Hello"))
+        memory.to_langchain_messages()
+
+        memory.set_system_message(Message.system("New"))
+        lc_msgs = memory.to_langchain_messages()
+
+        assert lc_msgs[0].content == "New"
+        assert len(lc_msgs) == 2
+
+    def test_trim_invalidates(self) -> None:
+        """Test trimmed messages are dropped from the cache."""
+        memory = ConversationMemory()
+        for i in range(10):
+            memory.add_message(Message.user("x" * 40 + str(i)))
+        memory.to_langchain_messages()
+
+        memory.trim(max_tokens=25)
+        lc_msgs = memory.to_langchain_messages()
+
+        assert [m.content for m in lc_msgs] == [m.content for m in memory.messages]
+
+    def test_max_messages_invalidates(self) -> None:
+        """Test messages dropped by max_messages leave the cache."""
+        memory = ConversationMemory(max_messages=2)
+        memory.add_message(Message.user("one"))
+        memory.add_message(Message.user("two"))
+        memory.to_langchain_messages()
+
+        memory.add_message(Message.user("three"))
+
+        assert [m.content for m in memory.to_langchain_messages()] == ["two", "three"]
+
+    def test_reassigned_history_detected(self) -> None:
+        """Test replacing the message list is detected."""
+        memory = ConversationMemory()
+        memory.add_message(Message.user("one"))
+        memory.add_message(Message.user("two"))
+        memory.to_langchain_messages()
+
+        memory.messages = [Message.user("other"), Message.user("two"), Message.user("three")]
+
+        assert [m.content for m in memory.to_langchain_messages()] == ["other", "two", "three"]
+
+    def test_summary_memory_reuses_summary_message(self) -> None:
+        """Test an unchanged summary keeps the cache valid."""
+        memory = SummaryMemory()
+        memory.summary = "Earlier discussion"
+        memory.add_message(Message.user("Hello"))
+
+        first = memory.to_langchain_messages()
+        second = memory.to_langchain_messages()
+
+        assert second[0] is first[0]
+        assert "Earlier discussion" in str(second[0].content)
+
+
+class TestContextMemory:
+    """Tests for ContextMemory backed by a ContextManager."""
+
+    def test_messages_stored_in_context_manager(self) -> None:
+        """Test added messages are stored and counted once, by the manager."""
+        manager = ContextManager(model="claude-3-opus")
+        memory = ContextMemory(manager)
+        memory.set_system_message(Message.system("Be helpful"))
+        memory.add_message(Message.user("Hello"))
+        memory.add_message(Message.assistant("Hi!"))
+
+        assert manager.get_messages() == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi!"},
+        ]
+        assert manager.tracker.system_prompt == "Be helpful"
+        assert manager.token_usage > 0
+        assert [m.content for m in memory.get_messages()] == ["Be helpful", "Hello", "Hi!"]
+
+    def test_tool_messages_round_trip(self) -> None:
+        """Test tool calls and results survive the manager's dict format."""
+        from code_forge.langchain.messages import langchain_to_forge
+        from langchain_core.messages import ToolMessage
+
+        memory = ContextMemory(ContextManager(model="claude-3-opus"))
+        memory.add_message(Message.user("Read it"))
+        memory.add_message(
+            langchain_to_forge(
+                AIMessage(
+                    content="",
+                    tool_calls=[{"id": "c1", "name": "Read", "args": {"file_path": "/a"}}],
+                )
+            )
+        )
+        memory.add_message(Message.tool_result("c1", "content"))
+
+        lc_msgs = memory.to_langchain_messages()
+        assert lc_msgs[1].tool_calls[0]["args"] == {"file_path": "/a"}
+        assert isinstance(lc_msgs[2], ToolMessage)
+        assert lc_msgs[2].tool_call_id == "c1"
+
+    def test_sees_existing_history(self) -> None:
+        """Test messages added to the manager directly are visible."""
+        manager = ContextManager(model="claude-3-opus")
+        manager.add_message({"role": "user", "content": "Earlier"})
+
+        memory = ContextMemory(manager)
+        manager.add_message({"role": "assistant", "content": "Reply"})
+
+        assert [m.content for m in memory.messages] == ["Earlier", "Reply"]
+
+    def test_manager_reset_clears_agent_history(self) -> None:
+        """Test resetting the manager (e.g. /clear) clears what the agent sends."""
+        manager = ContextManager(model="claude-3-opus")
+        memory = ContextMemory(manager)
+        memory.set_system_message(Message.system("Be helpful"))
+        memory.add_message(Message.user("Hello"))
+        memory.to_langchain_messages()
+
+        manager.reset()
+
+        lc_msgs = memory.to_langchain_messages()
+        assert len(lc_msgs) == 1
+        assert isinstance(lc_msgs[0], SystemMessage)
+
+    def test_manager_truncation_visible(self) -> None:
+        """Test the agent sees the manager's truncated history."""
+        manager = ContextManager(model="claude-3-opus", auto_truncate=False)
+        memory = ContextMemory(manager)
+        for i in range(20):
+            memory.add_message(Message.user(f"word{i} " * 20))
+        memory.to_langchain_messages()
+
+        manager.truncate(target_tokens=100)
+
+        contents = [m.content for m in memory.to_langchain_messages()]
+        assert contents == [m["content"] for m in manager.get_messages()]
+        assert len(contents) < 20
+
+    def test_trim_uses_manager_strategy(self) -> None:
+        """Test trim truncates the stored history."""
+        manager = ContextManager(model="claude-3-opus", auto_truncate=False)
+        memory = ContextMemory(manager)
+        for i in range(20):
+            memory.add_message(Message.user(f"word{i} " * 20))
+
+        memory.trim(max_tokens=100)
+
+        assert len(manager.get_messages()) == len(memory) < 20
+
+    def test_clear_history(self) -> None:
+        """Test clearing history resets the manager but keeps the system message."""
+        manager = ContextManager(model="claude-3-opus")
+        memory = ContextMemory(manager)
+        memory.set_system_message(Message.system("Be helpful"))
+        memory.add_message(Message.user("Hello"))
+
+        memory.clear_history()
+
+        assert manager.get_messages() == []
+        assert memory.system_message is not None
+
+    def test_max_messages(self) -> None:
+        """Test max_messages trims the stored history."""
+        manager = ContextManager(model="claude-3-opus")
+        memory = ContextMemory(manager)
+        memory.max_messages = 2
+        for text in ["one", "two", "three"]:
+            memory.add_message(Message.user(text))
+
+        assert [m["content"] for m in manager.get_messages()] == ["two", "three"]
+
+    def test_cache_breakpoint_reaches_request(self) -> None:
+        """Test the stable prefix end is a breakpoint of the completion request."""
+        manager = ContextManager(model="claude-3-opus", mode=TruncationMode.CACHE_AWARE)
+        memory = ContextMemory(manager)
+        memory.set_system_message(Message.system("Be helpful"))
+        for i in range(4):
+            memory.add_message(Message.user(f"Message {i}"))
+
+        lc_msgs = memory.to_langchain_messages()
+        request = CompletionRequest(
+            model="m", messages=langchain_messages_to_forge(lc_msgs), prompt_caching=True
+        )
+        payload = request.to_dict()["messages"]
+
+        marked = [i for i, m in enumerate(payload) if isinstance(m["content"], list)]
+        assert marked == [0, 2, 4]
+        # The cached conversion is not modified
+        assert all("cache_control" not in m.additional_kwargs for m in memory._lc_cache)
+
+    def test_from_langchain_messages(self) -> None:
+        """Test importing LangChain messages replaces the stored history."""
+        manager = ContextManager(model="claude-3-opus")
+        memory = ContextMemory(manager)
+        memory.add_message(Message.user("Old"))
+
+        memory.from_langchain_messages(
+            [SystemMessage(content="Be helpful"), HumanMessage(content="New")]
+        )
+
+        assert manager.get_messages() == [{"role": "user", "content": "New"}]
+        assert memory.system_message is not None
+
+
 class TestSlidingWindowMemory:
     """Tests for SlidingWindowMemory class."""
 
@@ -87,6 +87,13 @@ class TestLangchainToForge:
         assert oc_msg.role == MessageRole.ASSISTANT
         assert oc_msg.content is None
 
+    def test_convert_cache_control_flag(self) -> None:
+        """Test a cache_control flag marks the message as a cache breakpoint."""
+        marked = HumanMessage(content="Hello", additional_kwargs={"cache_control": True})
+
+        assert langchain_to_forge(marked).cache_control is True
+        assert langchain_to_forge(HumanMessage(content="Hello")).cache_control is False
+
     def test_convert_unsupported_message_type(self) -> None:
         """Test that unsupported message types raise ValueError."""
 
@@ -80,6 +80,29 @@ class TestLangChainToolAdapter:
         assert "file_path" in fields
         assert "encoding" in fields
 
+    def test_args_schema_shared_per_tool(self) -> None:
+        """Test adapters of the same tool share one args_schema model."""
+
+        class MockTool:
+            name = "mock_tool"
+            description = "A mock tool"
+            category = ToolCategory.FILE
+            parameters = [
+                ToolParameter(
+                    name="file_path",
+                    type="string",
+                    description="Path to the file",
+                    required=True,
+                ),
+            ]
+
+        tool = MockTool()
+        first = LangChainToolAdapter(forge_tool=tool)
+        second = LangChainToolAdapter(forge_tool=tool)
+
+        assert first.args_schema is second.args_schema
+        assert LangChainToolAdapter(forge_tool=MockTool()).args_schema is not first.args_schema
+
     def test_args_schema_type_mapping(self) -> None:
         """Test that parameter types are correctly mapped."""
 
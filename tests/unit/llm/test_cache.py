@@ -0,0 +1,203 @@
+"""Unit tests for the LLM response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from code_forge.llm.cache import ResponseCache
+from code_forge.llm.client import OpenRouterClient
+from code_forge.llm.models import CompletionRequest, Message
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PAYLOAD = {"model": "m", "messages": [{"role": "user", "content": "Hi"}], "temperature": 0}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    """Create a cache in a temporary directory."""
+    return ResponseCache(tmp_path / "responses")
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_key(self, cache: ResponseCache) -> None:
+        """Test keys are canonical and only deterministic requests are cached."""
+        reordered = dict(reversed(PAYLOAD.items()))
+        assert cache.key(PAYLOAD) == cache.key(reordered)
+        assert cache.key({**PAYLOAD, "stream": True}) != cache.key(PAYLOAD)
+        assert cache.key({**PAYLOAD, "temperature": 0.7}) is None
+
+        cache.deterministic_only = False
+        assert cache.key({**PAYLOAD, "temperature": 0.7}) is not None
+
+    def test_completion_round_trip(self, cache: ResponseCache) -> None:
+        """Test stored completions are returned and counted."""
+        key = cache.key(PAYLOAD)
+        assert key is not None
+        assert cache.get_completion(key) is None
+
+        cache.put_completion(key, {"id": "gen-1"})
+
+        assert cache.get_completion(key) == {"id": "gen-1"}
+        assert cache.stats.to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "writes": 1,
+            "evictions": 0,
+            "hit_rate": 0.5,
+        }
+
+    def test_stream_round_trip(self, cache: ResponseCache) -> None:
+        """Test stream payloads are returned in order."""
+        payloads = [b'{"a": 1}', b'{"a": 2}']
+        cache.put_stream("ab" * 32, payloads)
+        assert cache.get_stream("ab" * 32) == payloads
+
+    def test_ttl(self, cache: ResponseCache) -> None:
+        """Test expired entries are misses and removed."""
+        cache.put_completion("ab" * 32, {"id": "old"})
+        path = next(cache.root.glob("??/*"))
+        os.utime(path, (0, 0))
+
+        assert cache.get_completion("ab" * 32) is None
+        assert not path.exists()
+        assert cache.stats.evictions == 1
+
+    def test_ttl_counts_from_write(self, cache: ResponseCache) -> None:
+        """Test hits do not extend the lifetime of an entry."""
+        assert cache.ttl is not None
+        cache.put_completion("ab" * 32, {"id": "old"})
+        path = next(cache.root.glob("??/*"))
+        written = time.time() - cache.ttl + 60
+        os.utime(path, (written, written))
+
+        assert cache.get_completion("ab" * 32) == {"id": "old"}
+        assert path.stat().st_mtime == pytest.approx(written)
+
+        # Expires on schedule although it was just used
+        os.utime(path, (time.time(), written - 120))
+        assert cache.get_completion("ab" * 32) is None
+
+    def test_size_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used entries are evicted over the size limit."""
+        cache = ResponseCache(tmp_path, max_bytes=250)
+        body = {"content": "x" * 100}
+        for i, key in enumerate(("aa" * 32, "bb" * 32)):
+            cache.put_completion(key, body)
+            written = time.time() - 100 + i
+            os.utime(cache.root / key[:2] / f"{key}.json", (written, written))
+        # Reading refreshes the first entry, so the second is evicted
+        assert cache.get_completion("aa" * 32) == body
+
+        cache.put_completion("cc" * 32, body)
+
+        assert cache.get_completion("bb" * 32) is None
+        assert cache.get_completion("aa" * 32) == body
+        assert cache.get_completion("cc" * 32) == body
+
+
+def sse_body(*, done: bool = True) -> bytes:
+    """Build an SSE body of two content deltas."""
+    events = [
+        {"id": "gen-1", "model": "m", "choices": [{"index": 0, "delta": {"content": "Hel"}}]},
+        {"id": "gen-1", "model": "m", "choices": [{"index": 0, "delta": {"content": "lo"}}]},
+    ]
+    body = b"".join(b"data: " + json.dumps(e).encode() + b"\n\n" for e in events)
+    return body + b"data: [DONE]\n\n" if done else body
+
+
+class TestClientResponseCache:
+    """Tests for response caching in OpenRouterClient."""
+
+    def make_client(self, cache: ResponseCache, body: bytes) -> tuple[OpenRouterClient, list[int]]:
+        """Create a client counting the requests that reach the API."""
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if json.loads(request.content).get("stream"):
+                return httpx.Response(200, content=body)
+            return httpx.Response(
+                200,
+                json={
+                    "id": "gen-1",
+                    "model": "m",
+                    "created": 0,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "Hello"},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                },
+            )
+
+        client = OpenRouterClient(
+            api_key="test", transport=httpx.MockTransport(handler), response_cache=cache
+        )
+        return client, calls
+
+    @staticmethod
+    def request(temperature: float = 0.0) -> CompletionRequest:
+        """Build a request."""
+        return CompletionRequest(
+            model="m", messages=[Message.user("Hi")], temperature=temperature
+        )
+
+    @staticmethod
+    async def collect(stream: AsyncIterator[object]) -> list[object]:
+        """Collect a stream."""
+        return [chunk async for chunk in stream]
+
+    @pytest.mark.asyncio
+    async def test_complete_replayed(self, cache: ResponseCache) -> None:
+        client, calls = self.make_client(cache, b"")
+        try:
+            first = await client.complete(self.request())
+            second = await client.complete(self.request())
+            await client.complete(self.request(temperature=1.0))
+        finally:
+            await client.close()
+
+        assert second == first
+        assert len(calls) == 2
+        assert client.get_response_cache_stats()["hits"] == 1
+        # Replayed responses cost nothing
+        assert client.get_usage().total_tokens == 4
+
+    @pytest.mark.asyncio
+    async def test_stream_replayed(self, cache: ResponseCache) -> None:
+        client, calls = self.make_client(cache, sse_body())
+        try:
+            first = await self.collect(client.stream(self.request()))
+            second = await self.collect(client.stream(self.request()))
+        finally:
+            await client.close()
+
+        assert second == first
+        assert len(first) == 2
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_stream_not_cached(self, cache: ResponseCache) -> None:
+        client, calls = self.make_client(cache, sse_body(done=False))
+        try:
+            await self.collect(client.stream(self.request()))
+            await self.collect(client.stream(self.request()))
+        finally:
+            await client.close()
+
+        assert len(calls) == 2
+        assert cache.stats.writes == 0
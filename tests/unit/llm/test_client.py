@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -19,7 +20,9 @@ from code_forge.llm.errors import (
     ProviderError,
     RateLimitError,
 )
+from code_forge.llm.latency import COMPLETION, LatencyTable
 from code_forge.llm.models import CompletionRequest, Message
+from code_forge.llm.routing import HedgeSettings
 
 
 class TestOpenRouterClientInit:
@@ -176,6 +179,48 @@ class TestOpenRouterClientComplete:
             assert usage.completion_tokens == 10
             assert usage.total_tokens == 30
 
+    @pytest.mark.asyncio
+    async def test_complete_tracks_cached_tokens(self) -> None:
+        mock_response_data = {
+            "id": "gen-test",
+            "model": "test/model",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Response"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 200,
+                "completion_tokens": 10,
+                "total_tokens": 210,
+                "prompt_tokens_details": {"cached_tokens": 150},
+            },
+            "created": 1705312345,
+        }
+
+        client = OpenRouterClient(api_key="test")
+
+        with patch.object(client, "_get_client") as mock_get_client:
+            mock_http_client = AsyncMock()
+            mock_response = MagicMock()
+            mock_response.is_success = True
+            mock_response.json.return_value = mock_response_data
+            mock_http_client.request = AsyncMock(return_value=mock_response)
+            mock_get_client.return_value = mock_http_client
+
+            request = CompletionRequest(
+                model="test/model", messages=[Message.user("Hello")]
+            )
+
+            await client.complete(request)
+
+            assert client.get_usage().cached_tokens == 150
+            stats = client.get_cache_stats()
+            assert stats["cached_tokens"] == 150
+            assert stats["hit_rate_percent"] == 75.0
+
     @pytest.mark.asyncio
     async def test_complete_resolves_alias(self) -> None:
         mock_response_data = {
@@ -554,3 +599,169 @@ class TestOpenRouterClientGetClient:
 
         # Cleanup
         await client.close()
+
+
+class TestOpenRouterClientHedging:
+    """Tests for hedged requests."""
+
+    MODEL = "openai/gpt-4o"
+
+    def make_client(self, delays: dict[str, float]) -> tuple[OpenRouterClient, list[str]]:
+        """Create a client whose responses start after a per-model delay."""
+        table = LatencyTable()
+        for _ in range(20):
+            table.record(self.MODEL, 0.01, ok=True)
+        sent: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            model = payload["model"]
+            sent.append(model)
+            await asyncio.sleep(delays[model])
+            if not payload.get("stream"):
+                return httpx.Response(200, json={"model": model})
+            event = {"id": "gen-1", "model": model, "choices": [{"index": 0, "delta": {}}]}
+            body = b"data: " + json.dumps(event).encode() + b"\n\ndata: [DONE]\n\n"
+            return httpx.Response(200, content=body)
+
+        client = OpenRouterClient(
+            api_key="test",
+            max_retries=1,
+            hedging=HedgeSettings(enabled=True, min_delay=0.01),
+            latency_table=table,
+            transport=httpx.MockTransport(handler),
+        )
+        return client, sent
+
+    async def stream_model(self, client: OpenRouterClient, model: str) -> str:
+        """Stream a request and return the model that answered."""
+        request = CompletionRequest(model=model, messages=[Message.user("Hi")])
+        try:
+            chunks = [chunk async for chunk in client.stream(request)]
+        finally:
+            await client.close()
+        return chunks[0].model
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self) -> None:
+        client, sent = self.make_client({self.MODEL: 0.0})
+
+        assert await self.stream_model(client, self.MODEL) == self.MODEL
+        assert sent == [self.MODEL]
+        assert client.get_hedge_stats() == {"hedges": 0, "wins": 0}
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged(self) -> None:
+        alternate = f"{self.MODEL}:nitro"
+        client, sent = self.make_client({self.MODEL: 5.0, alternate: 0.0})
+
+        assert await self.stream_model(client, self.MODEL) == alternate
+        assert sent == [self.MODEL, alternate]
+        assert client.get_hedge_stats() == {"hedges": 1, "wins": 1}
+        stats = client.latency.get(alternate)
+        assert stats is not None
+        assert len(stats.samples) == 1
+        # The cancelled primary keeps a sample of at least the hedge delay
+        primary = client.latency.get(self.MODEL)
+        assert primary is not None
+        assert len(primary.samples) == 21
+        assert primary.samples[-1] >= 0.01
+        assert len(primary.outcomes) == 20
+
+    @pytest.mark.asyncio
+    async def test_no_samples_not_hedged(self) -> None:
+        client, sent = self.make_client({"other/model": 0.05})
+
+        await self.stream_model(client, "other/model")
+
+        assert sent == ["other/model"]
+
+    @pytest.mark.asyncio
+    async def test_completion_not_hedged(self) -> None:
+        alternate = f"{self.MODEL}:nitro"
+        client, sent = self.make_client({self.MODEL: 0.05, alternate: 0.0})
+        http_client = await client._get_client()
+        try:
+            await client._make_request(
+                http_client, "POST", "/chat/completions", {"model": self.MODEL}
+            )
+        finally:
+            await client.close()
+
+        assert sent == [self.MODEL]
+        assert client.get_hedge_stats() == {"hedges": 0, "wins": 0}
+        # Full response times stay out of the first-byte series
+        ttfb = client.latency.get(self.MODEL)
+        completion = client.latency.get(self.MODEL, COMPLETION)
+        assert ttfb is not None
+        assert len(ttfb.samples) == 20
+        assert completion is not None
+        assert len(completion.samples) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_recorded(self) -> None:
+        client = OpenRouterClient(api_key="test", max_retries=1)
+        http_client = AsyncMock()
+        http_client.request = AsyncMock(side_effect=httpx.HTTPError("down"))
+
+        with pytest.raises(LLMError):
+            await client._make_request(
+                http_client, "POST", "/chat/completions", {"model": self.MODEL}
+            )
+
+        stats = client.latency.get(self.MODEL, COMPLETION)
+        assert stats is not None
+        assert stats.error_rate == 1.0
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    """Response body delivered in fixed-size pieces."""
+
+    def __init__(self, body: bytes, size: int) -> None:
+        self.body = body
+        self.size = size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for i in range(0, len(self.body), self.size):
+            yield self.body[i : i + self.size]
+
+
+class TestOpenRouterClientStreaming:
+    """Tests for streaming completions."""
+
+    @staticmethod
+    def sse_body() -> bytes:
+        """Build an SSE body with a keep-alive, deltas, usage and a bad line."""
+        events = [
+            {"id": "gen-1", "model": "m", "choices": [{"index": 0, "delta": {"content": "Hé"}}]},
+            {"id": "gen-1", "model": "m", "choices": [{"index": 0, "delta": {"content": "llo"}}]},
+            {
+                "id": "gen-1",
+                "model": "m",
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+            },
+        ]
+        lines = [b": OPENROUTER PROCESSING\n\n", b"data: {broken\n\n"]
+        lines += [b"data: " + json.dumps(e).encode() + b"\r\n\r\n" for e in events]
+        lines.append(b"data: [DONE]\n\n")
+        return b"".join(lines)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 5, 4096])
+    async def test_stream_chunks(self, size: int) -> None:
+        body = self.sse_body()
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=_ChunkedBody(body, size))
+
+        client = OpenRouterClient(api_key="test", transport=httpx.MockTransport(handler))
+        request = CompletionRequest(model="m", messages=[Message.user("Hi")])
+        try:
+            chunks = [chunk async for chunk in client.stream(request)]
+        finally:
+            await client.close()
+
+        assert "".join(c.delta.content or "" for c in chunks) == "Héllo"
+        assert chunks[-1].finish_reason == "stop"
+        assert client.get_usage().prompt_tokens == 5
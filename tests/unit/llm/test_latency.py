@@ -0,0 +1,95 @@
+"""Unit tests for the per-model latency table."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from code_forge.llm.latency import COMPLETION, LatencyTable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestLatencyTable:
+    """Tests for LatencyTable."""
+
+    def test_hedge_delay_needs_samples(self) -> None:
+        table = LatencyTable()
+        for i in range(1, 10):
+            table.record("m", i / 10, ok=True)
+
+        assert table.hedge_delay("m", 0.9, min_samples=10, floor=0.0) is None
+
+        table.record("m", 1.0, ok=True)
+        assert table.hedge_delay("m", 0.9, min_samples=10, floor=0.0) == 0.9
+        assert table.hedge_delay("m", 0.9, min_samples=10, floor=2.0) == 2.0
+        assert table.hedge_delay("unknown", 0.9, min_samples=1, floor=0.0) is None
+
+    def test_rolling_window(self) -> None:
+        table = LatencyTable(window=3)
+        for seconds in (10.0, 1.0, 1.0, 1.0):
+            table.record("m", seconds, ok=True)
+
+        stats = table.get("m")
+        assert stats is not None
+        assert list(stats.samples) == [1.0, 1.0, 1.0]
+
+    def test_rank_penalizes_errors(self) -> None:
+        table = LatencyTable()
+        table.record("fast-flaky", 0.5, ok=True)
+        table.record("fast-flaky", None, ok=False)
+        table.record("fast-flaky", None, ok=False)
+        table.record("fast-flaky", None, ok=False)
+        table.record("steady", 1.0, ok=True)
+
+        assert table.rank(["fast-flaky", "steady", "new"]) == ["new", "steady", "fast-flaky"]
+        assert table.to_dict()["fast-flaky"]["error_rate"] == 0.75
+
+    def test_series_kept_apart(self) -> None:
+        table = LatencyTable()
+        for _ in range(10):
+            table.record("m", 0.2, ok=True)
+            table.record("m", 30.0, ok=True, series=COMPLETION)
+
+        assert table.hedge_delay("m", 0.9, min_samples=10, floor=0.0) == 0.2
+        assert table.to_dict()["m"]["p90"] == 0.2
+        assert table.to_dict(COMPLETION)["m"]["p90"] == 30.0
+
+    def test_censored_sample_raises_percentile(self) -> None:
+        table = LatencyTable()
+        for _ in range(9):
+            table.record("m", 0.2, ok=True)
+        table.record_censored("m", 5.0)
+
+        stats = table.get("m")
+        assert stats is not None
+        assert len(stats.outcomes) == 9
+        assert table.hedge_delay("m", 1.0, min_samples=10, floor=0.0) == 5.0
+
+    def test_persistence(self, tmp_path: Path) -> None:
+        path = tmp_path / "latency.json"
+        table = LatencyTable(path)
+        table.record("m", 0.25, ok=True)
+        table.record("m", None, ok=False)
+        table.record("m", 3.0, ok=True, series=COMPLETION)
+        table.save_if_due(force=True)
+
+        loaded = LatencyTable(path).get("m")
+        assert loaded is not None
+        assert list(loaded.samples) == [0.25]
+        assert loaded.error_rate == 0.5
+        completion = LatencyTable(path).get("m", COMPLETION)
+        assert completion is not None
+        assert list(completion.samples) == [3.0]
+
+    def test_version_1_table_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "latency.json"
+        path.write_text('{"version": 1, "models": {"m": {"samples": [1.0], "outcomes": [1]}}}')
+
+        assert LatencyTable(path).to_dict() == {}
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "latency.json"
+        path.write_text("not json")
+
+        assert LatencyTable(path).to_dict() == {}
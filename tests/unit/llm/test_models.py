@@ -251,6 +251,74 @@ class TestCompletionRequest:
         assert result["transforms"] == ["middle-out"]
         assert result["route"] == "fallback"
 
+    def test_no_cache_control_by_default(self) -> None:
+        request = CompletionRequest(
+            model="test/model",
+            messages=[Message.system("System"), Message.user("Hello!")],
+        )
+        result = request.to_dict()
+        assert result["messages"][0]["content"] == "System"
+        assert result["messages"][1]["content"] == "Hello!"
+
+    def test_marked_messages_without_prompt_caching(self) -> None:
+        marked = Message.user("Marked")
+        marked.cache_control = True
+        parts = Message.from_dict(
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Part", "cache_control": {"type": "ephemeral"}}
+                ],
+            }
+        )
+        request = CompletionRequest(model="test/model", messages=[marked, parts])
+        result = request.to_dict()
+        assert result["messages"][0]["content"] == "Marked"
+        assert result["messages"][1]["content"] == [{"type": "text", "text": "Part"}]
+        assert "cache_control" not in str(result)
+        # Request messages are not mutated
+        assert marked.cache_control is True
+        assert "cache_control" in parts.content[0]
+
+    def test_prompt_caching_marks_breakpoints(self) -> None:
+        tool = ToolDefinition(
+            name="test", description="test tool", parameters={"type": "object"}
+        )
+        request = CompletionRequest(
+            model="anthropic/claude-3.5-sonnet",
+            messages=[
+                Message.system("System"),
+                Message.user("First"),
+                Message.assistant("Reply"),
+                Message.user("Second"),
+            ],
+            tools=[tool],
+            prompt_caching=True,
+        )
+        result = request.to_dict()
+        ephemeral = {"type": "ephemeral"}
+        assert result["tools"][-1]["cache_control"] == ephemeral
+        assert result["messages"][0]["content"][0]["cache_control"] == ephemeral
+        assert result["messages"][1]["content"] == "First"
+        assert result["messages"][3]["content"][0]["cache_control"] == ephemeral
+        # Request messages are not mutated
+        assert request.messages[0].cache_control is False
+
+    def test_prompt_caching_limits_breakpoints(self) -> None:
+        messages = [Message.system("System")]
+        for i in range(6):
+            msg = Message.user(f"Message {i}")
+            msg.cache_control = True
+            messages.append(msg)
+        tool = ToolDefinition(name="t", description="d", parameters={})
+        request = CompletionRequest(
+            model="test/model", messages=messages, tools=[tool], prompt_caching=True
+        )
+        result = request.to_dict()
+        marked = [m for m in result["messages"] if isinstance(m["content"], list)]
+        assert len(marked) == 3
+        assert result["messages"][-1] in marked
+
 
 class TestTokenUsage:
     """Tests for TokenUsage dataclass."""
@@ -267,6 +335,28 @@ class TestTokenUsage:
         assert usage.prompt_tokens == 0
         assert usage.completion_tokens == 0
         assert usage.total_tokens == 0
+        assert usage.cached_tokens == 0
+        assert usage.cache_write_tokens == 0
+
+    def test_from_dict_openai_cached_tokens(self) -> None:
+        data = {
+            "prompt_tokens": 100,
+            "completion_tokens": 5,
+            "total_tokens": 105,
+            "prompt_tokens_details": {"cached_tokens": 80},
+        }
+        usage = TokenUsage.from_dict(data)
+        assert usage.cached_tokens == 80
+
+    def test_from_dict_anthropic_cache_fields(self) -> None:
+        data = {
+            "prompt_tokens": 100,
+            "cache_read_input_tokens": 60,
+            "cache_creation_input_tokens": 40,
+        }
+        usage = TokenUsage.from_dict(data)
+        assert usage.cached_tokens == 60
+        assert usage.cache_write_tokens == 40
 
 
 class TestCompletionChoice:
@@ -6,6 +6,7 @@ from code_forge.llm.routing import (
     MODEL_ALIASES,
     RouteVariant,
     apply_variant,
+    hedge_candidates,
     parse_model_id,
     resolve_model_alias,
 )
@@ -143,3 +144,20 @@ class TestModelAliases:
     def test_all_values_have_provider_prefix(self) -> None:
         for alias, full_id in MODEL_ALIASES.items():
             assert "/" in full_id, f"Alias {alias} should map to provider/model format"
+
+
+class TestHedgeCandidates:
+    """Tests for hedge_candidates function."""
+
+    def test_default_variants(self) -> None:
+        assert hedge_candidates("openai/gpt-4o") == ["openai/gpt-4o:nitro"]
+        assert hedge_candidates("openai/gpt-4o:nitro") == ["openai/gpt-4o"]
+
+    def test_behavior_changing_variants_not_hedged(self) -> None:
+        assert hedge_candidates("openai/gpt-4o:online") == []
+
+    def test_configured_alternates(self) -> None:
+        alternates = ("gpt-4o", "claude-3.5-sonnet")
+        assert hedge_candidates("openai/gpt-4o", alternates) == [
+            "anthropic/claude-3.5-sonnet"
+        ]
@@ -0,0 +1,52 @@
+"""Unit tests for SSE decoding."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from code_forge.llm.sse import DONE, SSEDecoder, iter_sse_data, loads
+
+BODY = (
+    b": OPENROUTER PROCESSING\n\n"
+    b'data: {"text": "h\xc3\xa9llo"}\r\n\r\n'
+    b'data:{"text": "b"}\n\n'
+    b"event: ping\n"
+    b"data: [DONE]\n\n"
+)
+PAYLOADS = [b'{"text": "h\xc3\xa9llo"}', b'{"text": "b"}', DONE]
+
+
+class TestSSEDecoder:
+    """Tests for SSEDecoder."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, len(BODY)])
+    def test_any_chunking(self, size: int) -> None:
+        """Test payloads are the same however the body is split."""
+        decoder = SSEDecoder()
+        payloads = []
+        for i in range(0, len(BODY), size):
+            payloads.extend(decoder.feed(BODY[i : i + size]))
+        payloads.extend(decoder.flush())
+
+        assert payloads == PAYLOADS
+        assert loads(payloads[0]) == {"text": "héllo"}
+
+    def test_flush_unterminated_line(self) -> None:
+        """Test a final line without a newline is returned by flush."""
+        decoder = SSEDecoder()
+        assert decoder.feed(b'data: {"a": 1}') == []
+        assert decoder.flush() == [b'{"a": 1}']
+        assert decoder.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_data() -> None:
+    """Test iterating over the payloads of a byte stream."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield BODY[:10]
+        yield BODY[10:]
+
+    assert [payload async for payload in iter_sse_data(chunks())] == PAYLOADS
@@ -3,7 +3,7 @@
 import pytest
 
 from code_forge.llm.models import MessageRole, StreamChunk, TokenUsage
-from code_forge.llm.streaming import StreamCollector
+from code_forge.llm.streaming import StreamCollector, estimate_tokens
 
 
 class TestStreamCollector:
@@ -307,3 +307,86 @@ class TestStreamCollector:
         collector.add_chunk(chunk)
 
         assert collector.model == "anthropic/claude-3-opus"
+
+    @staticmethod
+    def _content_chunk(text: str) -> StreamChunk:
+        return StreamChunk.from_dict(
+            {
+                "id": "gen-1",
+                "model": "test",
+                "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+            }
+        )
+
+    def test_content_readable_mid_stream(self) -> None:
+        collector = StreamCollector()
+        collector.add_chunk(self._content_chunk("Hello"))
+        assert collector.content == "Hello"
+        collector.add_chunk(self._content_chunk(" World"))
+        assert collector.content == "Hello World"
+        assert collector.get_message().content == "Hello World"
+
+    def test_output_tokens_estimated(self) -> None:
+        collector = StreamCollector()
+        collector.add_chunk(self._content_chunk("abcdefgh"))
+        collector.add_chunk(self._content_chunk("ij"))
+        assert collector.output_tokens == estimate_tokens("abcdefgh") + estimate_tokens("ij")
+
+    def test_output_tokens_custom_counter(self) -> None:
+        collector = StreamCollector(token_counter=lambda text: len(text.split()))
+        collector.add_chunk(self._content_chunk("one two three"))
+        assert collector.output_tokens == 3
+
+    def test_output_tokens_prefers_usage(self) -> None:
+        collector = StreamCollector()
+        collector.add_chunk(self._content_chunk("Hi"))
+        collector.add_chunk(
+            StreamChunk.from_dict(
+                {
+                    "id": "gen-1",
+                    "model": "test",
+                    "choices": [],
+                    "usage": {
+                        "prompt_tokens": 10,
+                        "completion_tokens": 42,
+                        "total_tokens": 52,
+                    },
+                }
+            )
+        )
+        assert collector.output_tokens == 42
+
+    def test_budget_exceeded(self) -> None:
+        collector = StreamCollector(max_output_tokens=3, token_counter=lambda _: 1)
+        collector.add_chunk(self._content_chunk("a"))
+        collector.add_chunk(self._content_chunk("b"))
+        assert not collector.budget_exceeded
+        collector.add_chunk(self._content_chunk("c"))
+        assert collector.budget_exceeded
+
+    def test_tool_call_arguments_counted(self) -> None:
+        collector = StreamCollector(token_counter=len)
+        collector.add_chunk(
+            StreamChunk.from_dict(
+                {
+                    "id": "gen-1",
+                    "model": "test",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": {
+                                "tool_calls": [
+                                    {
+                                        "index": 0,
+                                        "id": "call_1",
+                                        "function": {"name": "Read", "arguments": "{}"},
+                                    }
+                                ]
+                            },
+                            "finish_reason": None,
+                        }
+                    ],
+                }
+            )
+        )
+        assert collector.output_tokens == 2
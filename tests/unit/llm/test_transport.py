@@ -0,0 +1,148 @@
+"""Unit tests for the shared LLM transport."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from code_forge.llm.client import OpenRouterClient
+from code_forge.llm.transport import (
+    ConnectionStats,
+    PooledTransport,
+    PoolSettings,
+    close_shared_pools,
+    get_shared_pool,
+)
+
+
+class FakePool(httpx.AsyncBaseTransport):
+    """Transport that reports a new connection for the first request."""
+
+    def __init__(self) -> None:
+        self.connected = False
+        self.requests: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if not self.connected:
+            trace = request.extensions["trace"]
+            await trace("connection.connect_tcp.started", {})
+            await trace("connection.start_tls.complete", {})
+            self.connected = True
+        return httpx.Response(200, json={}, extensions={"http_version": b"HTTP/2"})
+
+
+class TestConnectionStats:
+    """Tests for ConnectionStats."""
+
+    def test_reuse_rate(self) -> None:
+        """Test reuse rate is derived from the counters."""
+        assert ConnectionStats().reuse_rate == 0.0
+        stats = ConnectionStats(requests=4, new_connections=1, reused_connections=3)
+        assert stats.reuse_rate == 0.75
+        assert stats.to_dict()["reuse_rate"] == 0.75
+
+
+class TestSharedPool:
+    """Tests for the per-loop shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_shared_per_settings(self) -> None:
+        """Test clients with the same settings share one pool."""
+        try:
+            pool = get_shared_pool()
+            assert get_shared_pool(PoolSettings()) is pool
+            assert get_shared_pool(PoolSettings(http2=False)) is not pool
+        finally:
+            await close_shared_pools()
+
+        assert get_shared_pool() is not pool
+        await close_shared_pools()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool(self) -> None:
+        """Test separate clients send through the same pool."""
+        first = OpenRouterClient(api_key="a")
+        second = OpenRouterClient(api_key="b")
+        try:
+            assert first._transport.pool is second._transport.pool
+        finally:
+            await first.close()
+            await second.close()
+            await close_shared_pools()
+
+
+class TestPooledTransport:
+    """Tests for PooledTransport."""
+
+    @pytest.mark.asyncio
+    async def test_records_reuse(self) -> None:
+        """Test new and reused connections are counted per request."""
+        pool = FakePool()
+        transport = PooledTransport(pool=pool)
+        outer: list[str] = []
+
+        async def outer_trace(name: str, _info: dict[str, Any]) -> None:
+            outer.append(name)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://example.com/", extensions={"trace": outer_trace})
+            await client.get("https://example.com/")
+            await client.get("https://example.com/")
+
+        stats = transport.stats
+        assert stats.requests == 3
+        assert stats.new_connections == 1
+        assert stats.reused_connections == 2
+        assert stats.http2_requests == 3
+        assert outer == ["connection.connect_tcp.started", "connection.start_tls.complete"]
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_pool_open(self) -> None:
+        """Test closing a client does not close the shared pool."""
+        client = OpenRouterClient(api_key="test")
+        try:
+            pool = client._transport.pool
+            await client._get_client()
+            await client.close()
+            assert isinstance(pool, httpx.AsyncHTTPTransport)
+            assert get_shared_pool() is pool
+        finally:
+            await close_shared_pools()
+
+
+class TestWarmup:
+    """Tests for OpenRouterClient.warmup."""
+
+    @pytest.mark.asyncio
+    async def test_warmup(self) -> None:
+        """Test warmup connects once and later requests reuse it."""
+        pool = FakePool()
+        client = OpenRouterClient(api_key="test", transport=pool)
+        try:
+            assert await client.warmup()
+            await client.list_models()
+        finally:
+            await client.close()
+
+        assert pool.requests[0].method == "HEAD"
+        stats = client.get_connection_stats()
+        assert stats["warmups"] == 1
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure(self) -> None:
+        """Test warmup errors are swallowed."""
+
+        def fail(_request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("offline")
+
+        client = OpenRouterClient(api_key="test", transport=httpx.MockTransport(fail))
+        try:
+            assert not await client.warmup()
+        finally:
+            await client.close()
+        assert client.get_connection_stats()["warmups"] == 0
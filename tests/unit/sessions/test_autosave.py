@@ -0,0 +1,143 @@
+"""Unit tests for write-behind session auto-save."""
+
+from __future__ import annotations
+
+import pytest
+
+from code_forge.sessions.autosave import (
+    WriteBehindSaver,
+    session_fingerprint,
+    snapshot_session,
+)
+from code_forge.sessions.models import Session, SessionMessage
+
+
+class TestHelpers:
+    """Tests for snapshot and fingerprint helpers."""
+
+    def test_snapshot_is_independent(self) -> None:
+        """Test later appends do not affect a snapshot."""
+        session = Session(tags=["a"])
+        session.add_message_from_dict("user", "one")
+        snapshot = snapshot_session(session)
+
+        session.add_message_from_dict("user", "two")
+        session.tags.append("b")
+
+        assert len(snapshot.messages) == 1
+        assert snapshot.tags == ["a"]
+        assert snapshot.id == session.id
+
+    def test_fingerprint_changes(self) -> None:
+        """Test fingerprint follows direct modifications."""
+        session = Session()
+        before = session_fingerprint(session)
+        session.messages.append(SessionMessage(content="x"))
+        assert session_fingerprint(session) != before
+
+
+class TestWriteBehindSaver:
+    """Tests for WriteBehindSaver."""
+
+    @pytest.fixture
+    def written(self) -> list[Session]:
+        """Collect written snapshots."""
+        return []
+
+    @pytest.fixture
+    def saver(self, written: list[Session]) -> WriteBehindSaver:
+        """Create a saver that records writes."""
+        saver = WriteBehindSaver(written.append, delay=1.0, max_delay=10.0)
+        yield saver
+        saver.close()
+
+    def test_clean_session_skipped(
+        self, saver: WriteBehindSaver, written: list[Session]
+    ) -> None:
+        """Test unchanged sessions are not written twice."""
+        session = Session()
+        future = saver.submit(session)
+        assert future is not None
+        future.result()
+
+        assert saver.submit(session) is None
+        assert len(written) == 1
+        assert saver.metrics.skipped_clean == 1
+        assert not saver.is_dirty(session)
+
+    def test_mark_saved(self, saver: WriteBehindSaver) -> None:
+        """Test sessions saved elsewhere are not dirty."""
+        session = Session()
+        saver.mark_saved(session)
+        assert not saver.is_dirty(session)
+
+        session.add_message_from_dict("user", "hi")
+        assert saver.is_dirty(session)
+
+    def test_due_after_quiet_period(self, saver: WriteBehindSaver) -> None:
+        """Test a save is due once changes settle."""
+        session = Session()
+        saver.mark_saved(session)
+        session.add_message_from_dict("user", "hi")
+        saver.mark_dirty(session)
+
+        last = saver._last_change[session.id]
+        assert not saver.is_due(session, now=last + 0.5)
+        assert saver.is_due(session, now=last + 1.0)
+
+    def test_due_after_max_delay(self, saver: WriteBehindSaver) -> None:
+        """Test continuous changes are saved after max_delay."""
+        session = Session()
+        saver.mark_dirty(session)
+        first = saver._first_change[session.id]
+        saver._last_change[session.id] = first + 9.9
+
+        assert not saver.is_due(session, now=first + 9.95)
+        assert saver.is_due(session, now=first + 10.0)
+
+    def test_coalesced_and_latency_metrics(
+        self, saver: WriteBehindSaver, written: list[Session]
+    ) -> None:
+        """Test a burst of changes is one write with recorded latency."""
+        session = Session()
+        for i in range(3):
+            session.add_message_from_dict("user", str(i))
+            saver.mark_dirty(session)
+
+        future = saver.submit(session)
+        assert future is not None
+        future.result()
+
+        assert len(written) == 1
+        assert saver.metrics.saves == 1
+        assert saver.metrics.coalesced == 2
+        assert saver.metrics.max_ms >= saver.metrics.last_ms >= 0
+        assert saver.metrics.to_dict()["mean_ms"] == saver.metrics.mean_ms
+
+    def test_failed_write_stays_dirty(self) -> None:
+        """Test a failing write is counted and retried later."""
+
+        def fail(session: Session) -> None:
+            raise OSError("disk full")
+
+        saver = WriteBehindSaver(fail, delay=0.0)
+        try:
+            session = Session()
+            future = saver.submit(session)
+            assert future is not None
+            with pytest.raises(OSError):
+                future.result()
+
+            assert saver.metrics.failures == 1
+            assert saver.is_dirty(session)
+            assert saver.is_due(session)
+        finally:
+            saver.close()
+
+    @pytest.mark.asyncio
+    async def test_async_save(self, saver: WriteBehindSaver, written: list[Session]) -> None:
+        """Test save awaits the background write."""
+        session = Session()
+        assert await saver.save(session)
+        assert not await saver.save(session)
+        assert len(written) == 1
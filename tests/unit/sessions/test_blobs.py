@@ -0,0 +1,151 @@
+"""Unit tests for the content-addressed blob store."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from code_forge.sessions import blobs
+from code_forge.sessions.blobs import BLOB_KEY, BlobStore, is_blob_ref
+from code_forge.sessions.models import Session
+from code_forge.sessions.storage import SessionStorage, SessionStorageError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BIG = "x = 1\n" * 1000
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BlobStore:
+    """Create a blob store with a small threshold."""
+    return BlobStore(tmp_path / "blobs", threshold=100)
+
+
+class TestBlobStore:
+    """Tests for BlobStore."""
+
+    def test_put_and_get(self, store: BlobStore) -> None:
+        """Test round trip and deduplication."""
+        digest = store.put(BIG)
+        assert store.put(BIG) == digest
+        assert store.digests() == [digest]
+
+        store._cache.clear()
+        assert store.get(digest) == BIG
+        assert store.get_size() < len(BIG)
+
+    def test_get_missing(self, store: BlobStore) -> None:
+        """Test unknown digests raise KeyError."""
+        with pytest.raises(KeyError):
+            store.get("0" * 64)
+
+    def test_zlib_fallback(self, store: BlobStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test blobs are written with zlib when zstandard is missing."""
+        monkeypatch.setattr(blobs, "_zstd", lambda: None)
+        digest = store.put(BIG)
+
+        assert next(store.root.glob("??/*")).suffix == blobs.ZLIB_EXTENSION
+        store._cache.clear()
+        assert store.get(digest) == BIG
+
+    def test_externalize_and_hydrate(self, store: BlobStore) -> None:
+        """Test only large strings are replaced by references."""
+        value = {"content": BIG, "name": "Read", "items": [BIG, 1]}
+        stored = store.externalize(value)
+
+        assert is_blob_ref(stored["content"])
+        assert stored["content"]["length"] == len(BIG)
+        assert stored["name"] == "Read"
+        assert stored["items"][0] == stored["content"]
+        assert store.hydrate(stored) == value
+
+    def test_threshold_none(self, tmp_path: Path) -> None:
+        """Test a disabled store keeps values inline."""
+        store = BlobStore(tmp_path / "blobs", threshold=None)
+        assert store.externalize({"content": BIG}) == {"content": BIG}
+        assert store.digests() == []
+
+    def test_collect_garbage(self, store: BlobStore, tmp_path: Path) -> None:
+        """Test unreferenced blobs past the grace period are removed."""
+        kept = store.put(BIG)
+        dropped = store.put(BIG + "changed")
+        session_file = tmp_path / "session.json"
+        session_file.write_text(json.dumps({"content": {BLOB_KEY: kept}}))
+
+        assert store.collect_garbage([session_file]) == 0
+
+        assert store.collect_garbage([session_file], grace_seconds=0) == 1
+        assert store.digests() == [kept]
+        with pytest.raises(KeyError):
+            store.get(dropped)
+
+    def test_put_existing_refreshes_grace_period(self, store: BlobStore) -> None:
+        """Test storing an existing blob again protects it from collection."""
+        digest = store.put(BIG)
+        path = next(p for p in store.root.rglob("*") if p.name.startswith(digest))
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+
+        assert store.put(BIG) == digest
+        # Only referenced by a session that is not saved yet
+        assert store.collect_garbage([]) == 0
+        assert store.get(digest) == BIG
+
+    def test_collect_garbage_unreadable_file(self, store: BlobStore, tmp_path: Path) -> None:
+        """Test nothing is removed when a reference file cannot be read."""
+        store.put(BIG)
+        assert store.collect_garbage([tmp_path / "missing.json"], grace_seconds=0) == 0
+        assert len(store.digests()) == 1
+
+
+class TestStorageBlobs:
+    """Tests for blob use in SessionStorage."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> SessionStorage:
+        """Create storage with a small blob threshold."""
+        return SessionStorage(tmp_path, blob_threshold=100)
+
+    def test_snapshot_and_journal_round_trip(self, storage: SessionStorage) -> None:
+        """Test large payloads are stored once and restored on load."""
+        session = Session()
+        session.add_message_from_dict("user", BIG)
+        storage.save(session)
+        session.record_tool_call("Read", {"file_path": "/a.py"}, result=BIG)
+        storage.save(session)
+
+        assert BIG not in storage.get_path(session.id).read_text()
+        assert BIG not in storage.get_journal_path(session.id).read_text()
+        assert len(storage.blobs.digests()) == 1
+
+        loaded = SessionStorage(storage.storage_dir, blob_threshold=None).load(session.id)
+        assert loaded.to_dict() == session.to_dict()
+
+    def test_missing_blob(self, storage: SessionStorage) -> None:
+        """Test a missing blob is reported as a storage error."""
+        session = Session()
+        session.add_message_from_dict("user", BIG)
+        storage.compact(session)
+        for path in storage.blobs.root.glob("??/*"):
+            path.unlink()
+        storage.blobs._cache.clear()
+
+        with pytest.raises(SessionStorageError, match="blob"):
+            storage.load(session.id)
+
+    def test_garbage_collected_with_sessions(self, storage: SessionStorage) -> None:
+        """Test blobs of deleted sessions are collected."""
+        session = Session()
+        session.add_message_from_dict("user", BIG)
+        storage.compact(session)
+        storage.delete(session.id)
+
+        for path in storage.blobs.root.glob("??/*"):
+            os.utime(path, (0, 0))
+        assert storage.collect_garbage() == 1
+        assert storage.blobs.digests() == []
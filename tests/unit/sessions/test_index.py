@@ -5,7 +5,7 @@ from __future__ import annotations
 import tempfile
 from datetime import UTC, datetime, timedelta, tzinfo
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -13,6 +13,9 @@ from code_forge.sessions.index import SessionIndex, SessionSummary
 from code_forge.sessions.models import Session
 from code_forge.sessions.storage import SessionStorage
 
+if TYPE_CHECKING:
+    from code_forge.sessions.lazy import LazySession
+
 
 class TestSessionSummary:
     """Tests for SessionSummary dataclass."""
@@ -425,6 +428,75 @@ class TestSessionIndex:
         assert s1.id in index
         assert s2.id in index
 
+    def test_refresh_adds_new_sessions(
+        self, index: SessionIndex, storage: SessionStorage
+    ) -> None:
+        """Test refresh indexes sessions saved by another writer."""
+        session = Session(title="External")
+        storage.save(session)
+
+        assert index.refresh() == 1
+        assert index.get(session.id) is not None
+        assert index.refresh() == 0
+
+    def test_refresh_reloads_only_changed(
+        self, index: SessionIndex, storage: SessionStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test refresh reloads sessions whose files changed."""
+        sessions = [Session(title=f"Session {i}") for i in range(3)]
+        for session in sessions:
+            storage.save(session)
+        index.refresh()
+
+        sessions[1].title = "Renamed"
+        storage.save(sessions[1])
+
+        loaded: list[str] = []
+        original = storage.open_lazy
+
+        def tracking_open(session_id: str, tail: int = 50) -> LazySession:
+            loaded.append(session_id)
+            return original(session_id, tail)
+
+        monkeypatch.setattr(storage, "open_lazy", tracking_open)
+
+        assert index.refresh() == 1
+        assert loaded == [sessions[1].id]
+        summary = index.get(sessions[1].id)
+        assert summary is not None
+        assert summary.title == "Renamed"
+
+    def test_refresh_removes_deleted(
+        self, index: SessionIndex, storage: SessionStorage
+    ) -> None:
+        """Test refresh drops entries whose files are gone."""
+        session = Session()
+        storage.save(session)
+        index.add(session)
+
+        storage.get_path(session.id).unlink()
+
+        assert index.refresh() == 1
+        assert session.id not in index
+
+    def test_add_records_signature(
+        self, index: SessionIndex, storage: SessionStorage
+    ) -> None:
+        """Test sessions indexed after saving are not reloaded by refresh."""
+        session = Session()
+        storage.save(session)
+        index.add(session)
+
+        assert index.refresh() == 0
+
+    def test_signatures_persisted(self, storage: SessionStorage) -> None:
+        """Test a reloaded index does not re-read unchanged sessions."""
+        index = SessionIndex(storage)
+        storage.save(Session())
+        index.refresh()
+
+        assert SessionIndex(storage).refresh() == 0
+
     def test_save_if_dirty_saves_when_dirty(
         self, index: SessionIndex, storage: SessionStorage
     ) -> None:
@@ -0,0 +1,221 @@
+"""Unit tests for the append-only session journal."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from code_forge.sessions.journal import (
+    EVENT_MESSAGE,
+    EVENT_META,
+    EVENT_TOOL,
+    diff_session,
+    encode_events,
+    encode_header,
+    read_journal,
+    snapshot_generation,
+    state_for,
+)
+from code_forge.sessions.models import Session
+from code_forge.sessions.storage import SessionStorage
+
+
+class TestJournalHelpers:
+    """Tests for journal module functions."""
+
+    def test_diff_appended_messages(self) -> None:
+        """Test only messages added since the last save are emitted."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        state = state_for(session, "gen", journal_size=0, snapshot_size=0)
+
+        session.add_message_from_dict("assistant", "two")
+        session.record_tool_call("Read", {"file_path": "/a.py"})
+        events = diff_session(session, state)
+
+        assert events is not None
+        kinds = [event["type"] for event in events]
+        assert kinds == [EVENT_MESSAGE, EVENT_TOOL, EVENT_META]
+        assert events[0]["data"]["content"] == "two"
+
+    def test_diff_unchanged(self) -> None:
+        """Test an unchanged session produces no events."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        state = state_for(session, "gen", journal_size=0, snapshot_size=0)
+        assert diff_session(session, state) == []
+
+    def test_diff_rewritten_history(self) -> None:
+        """Test removed or replaced messages require a snapshot."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        session.add_message_from_dict("user", "two")
+        state = state_for(session, "gen", journal_size=0, snapshot_size=0)
+
+        session.messages.pop()
+        assert diff_session(session, state) is None
+
+        session.add_message_from_dict("user", "replacement")
+        assert diff_session(session, state) is None
+
+    def test_read_journal_generation_mismatch(self, tmp_path: Path) -> None:
+        """Test a journal of another snapshot is ignored."""
+        path = tmp_path / "s.journal"
+        path.write_bytes(encode_header("old") + encode_events([{"type": EVENT_META}]))
+
+        events, size, clean = read_journal(path, "new")
+        assert events == []
+        assert size == 0
+        assert clean
+
+    def test_read_journal_torn_tail(self, tmp_path: Path) -> None:
+        """Test an incomplete last line is skipped."""
+        path = tmp_path / "s.journal"
+        valid = encode_header("gen") + encode_events([{"type": EVENT_META, "data": {}}])
+        path.write_bytes(valid + b'{"type": "mess')
+
+        events, size, clean = read_journal(path, "gen")
+        assert len(events) == 1
+        assert size == len(valid)
+        assert not clean
+
+    def test_snapshot_generation(self) -> None:
+        """Test generation follows snapshot content."""
+        assert snapshot_generation(b"a") == snapshot_generation(b"a")
+        assert snapshot_generation(b"a") != snapshot_generation(b"b")
+
+
+class TestStorageJournal:
+    """Tests for journaled saves in SessionStorage."""
+
+    @pytest.fixture
+    def storage(self) -> SessionStorage:
+        """Create a SessionStorage with temporary directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield SessionStorage(Path(tmpdir))
+
+    def test_append_does_not_rewrite_snapshot(self, storage: SessionStorage) -> None:
+        """Test saves after the first only append to the journal."""
+        session = Session(title="Journal")
+        session.add_message_from_dict("user", "hello")
+        storage.save(session)
+        snapshot = storage.get_path(session.id).read_bytes()
+        journal_size = storage.get_journal_path(session.id).stat().st_size
+
+        session.add_message_from_dict("assistant", "hi")
+        storage.save(session)
+
+        assert storage.get_path(session.id).read_bytes() == snapshot
+        assert storage.get_journal_path(session.id).stat().st_size > journal_size
+
+    def test_load_replays_journal(self, storage: SessionStorage) -> None:
+        """Test load applies journal events on top of the snapshot."""
+        session = Session(title="Before")
+        session.add_message_from_dict("user", "hello")
+        storage.save(session)
+
+        session.add_message_from_dict("assistant", "hi")
+        session.record_tool_call("Read", {"file_path": "/a.py"})
+        session.title = "After"
+        session.update_usage(10, 5)
+        storage.save(session)
+
+        loaded = SessionStorage(storage.storage_dir).load(session.id)
+        assert [m.content for m in loaded.messages] == ["hello", "hi"]
+        assert len(loaded.tool_history) == 1
+        assert loaded.title == "After"
+        assert loaded.total_tokens == 15
+
+    def test_torn_tail_forces_snapshot(self, storage: SessionStorage) -> None:
+        """Test a torn append is dropped and the next save compacts."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        storage.save(session)
+        session.add_message_from_dict("user", "two")
+        storage.save(session)
+
+        journal = storage.get_journal_path(session.id)
+        with journal.open("ab") as f:
+            f.write(b'{"type": "message", "da')
+
+        reader = SessionStorage(storage.storage_dir)
+        loaded = reader.load(session.id)
+        assert [m.content for m in loaded.messages] == ["one", "two"]
+
+        loaded.add_message_from_dict("user", "three")
+        reader.save(loaded)
+        data = json.loads(reader.get_path(session.id).read_text())
+        assert len(data["messages"]) == 3
+        assert reader.get_journal_path(session.id).read_bytes().count(b"\n") == 1
+
+    def test_stale_journal_ignored(self, storage: SessionStorage) -> None:
+        """Test a journal from an older snapshot is not replayed."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        storage.save(session)
+        session.add_message_from_dict("user", "two")
+        storage.save(session)
+        journal = storage.get_journal_path(session.id).read_bytes()
+
+        session.add_message_from_dict("user", "three")
+        storage.compact(session)
+        # Simulate a crash between snapshot write and journal reset
+        storage.get_journal_path(session.id).write_bytes(journal)
+
+        loaded = SessionStorage(storage.storage_dir).load(session.id)
+        assert [m.content for m in loaded.messages] == ["one", "two", "three"]
+
+    def test_rewritten_history_writes_snapshot(self, storage: SessionStorage) -> None:
+        """Test removing messages rewrites the snapshot."""
+        session = Session()
+        session.add_message_from_dict("user", "one")
+        session.add_message_from_dict("user", "two")
+        storage.save(session)
+
+        session.messages.pop()
+        storage.save(session)
+
+        data = json.loads(storage.get_path(session.id).read_text())
+        assert len(data["messages"]) == 1
+        assert len(storage.load(session.id).messages) == 1
+
+    def test_compacts_when_journal_outgrows_snapshot(
+        self, storage: SessionStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the journal is folded into a snapshot once it grows large."""
+        monkeypatch.setattr(SessionStorage, "JOURNAL_COMPACT_MIN_BYTES", 0)
+        session = Session()
+        storage.save(session)
+
+        for i in range(20):
+            session.add_message_from_dict("user", "x" * 200 + str(i))
+            storage.save(session)
+
+        snapshot_size = storage.get_path(session.id).stat().st_size
+        assert storage.get_journal_path(session.id).stat().st_size <= snapshot_size
+        assert len(storage.load(session.id).messages) == 20
+
+    def test_journal_disabled(self) -> None:
+        """Test every save writes a snapshot when journaling is off."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(Path(tmpdir), journal=False)
+            session = Session()
+            storage.save(session)
+            session.add_message_from_dict("user", "one")
+            storage.save(session)
+
+            assert not storage.get_journal_path(session.id).exists()
+            data = json.loads(storage.get_path(session.id).read_text())
+            assert len(data["messages"]) == 1
+
+    def test_delete_removes_journal(self, storage: SessionStorage) -> None:
+        """Test delete removes the journal file."""
+        session = Session()
+        storage.save(session)
+        assert storage.get_journal_path(session.id).exists()
+
+        storage.delete(session.id)
+        assert not storage.get_journal_path(session.id).exists()
@@ -0,0 +1,145 @@
+"""Unit tests for lazy session loading."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from code_forge.context.tracker import SessionContextTracker
+from code_forge.sessions.lazy import encode_snapshot
+from code_forge.sessions.models import Session
+from code_forge.sessions.storage import SessionStorage, SessionStorageError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SessionStorage:
+    """Create storage in a temporary directory."""
+    return SessionStorage(tmp_path, blob_threshold=1000)
+
+
+def make_session(count: int) -> Session:
+    """Build a session with numbered messages."""
+    session = Session(title="Long")
+    for i in range(count):
+        session.add_message_from_dict("user" if i % 2 == 0 else "assistant", f"message {i}")
+    return session
+
+
+class TestEncodeSnapshot:
+    """Tests for encode_snapshot."""
+
+    def test_valid_json_with_spans(self) -> None:
+        """Test the snapshot parses back and spans locate each entry."""
+        session = make_session(3)
+        session.record_tool_call("Read", {"file_path": "/ü.py"})
+        data = session.to_dict()
+
+        snapshot, spans = encode_snapshot(data)
+
+        assert json.loads(snapshot) == data
+        starts, ends = spans["messages"][::2], spans["messages"][1::2]
+        for message, start, end in zip(data["messages"], starts, ends, strict=True):
+            assert json.loads(snapshot[start:end]) == message
+        start, end = spans["tools"]
+        assert json.loads(snapshot[start:end]) == data["tool_history"][0]
+
+    def test_empty_lists(self) -> None:
+        """Test sessions without messages encode empty lists."""
+        data = Session().to_dict()
+        snapshot, spans = encode_snapshot(data)
+
+        assert json.loads(snapshot) == data
+        assert spans == {"messages": [], "tools": []}
+
+
+class TestLazySession:
+    """Tests for SessionStorage.open_lazy and LazySession."""
+
+    def test_tail_and_pages(self, storage: SessionStorage) -> None:
+        """Test recent messages are loaded and older ones paged."""
+        session = make_session(10)
+        storage.save(session)
+
+        view = storage.open_lazy(session.id, tail=3)
+
+        assert view.message_count == 10
+        assert [m.content for m in view.recent] == ["message 7", "message 8", "message 9"]
+        assert [m.content for m in view.get_messages(2, 4)] == ["message 2", "message 3"]
+        assert [m.id for m in view.iter_messages(page_size=4)] == [
+            m.id for m in session.messages
+        ]
+        assert view.session.messages == []
+
+    def test_journal_entries(self, storage: SessionStorage) -> None:
+        """Test entries and metadata appended to the journal are visible."""
+        session = make_session(2)
+        storage.save(session)
+        session.add_message_from_dict("user", "x" * 2000)
+        session.record_tool_call("Bash", {"command": "ls"}, result="ok")
+        session.title = "Renamed"
+        session.metadata["key"] = "value"
+        storage.save(session)
+
+        view = storage.open_lazy(session.id, tail=1)
+
+        assert view.title == "Renamed"
+        assert view.metadata == {"key": "value"}
+        assert view.message_count == 3
+        assert view.recent[0].content == "x" * 2000
+        assert view.tool_count == 1
+        assert view.get_tool_history()[0].tool_name == "Bash"
+        assert view.materialize().to_dict() == session.to_dict()
+
+        summary = view.summary()
+        assert summary.message_count == 3
+        assert summary.title == "Renamed"
+
+    def test_context_tracker_reads_metadata(self, storage: SessionStorage) -> None:
+        """Test context can be restored from a view."""
+        session = make_session(1)
+        tracker = SessionContextTracker()
+        tracker.save_to_session(session)
+        storage.save(session)
+
+        assert SessionContextTracker().load_from_session(storage.open_lazy(session.id))
+
+    def test_without_offset_index(self, storage: SessionStorage) -> None:
+        """Test sessions without an offset index are loaded whole."""
+        session = make_session(5)
+        storage.save(session)
+        storage.get_offsets_path(session.id).unlink()
+
+        view = storage.open_lazy(session.id, tail=2)
+        assert view.message_count == 5
+        assert [m.content for m in view.recent] == ["message 3", "message 4"]
+        assert len(view.get_messages()) == 5
+
+        # The next save after a load restores the offset index
+        loaded = storage.load(session.id)
+        loaded.add_message_from_dict("user", "more")
+        storage.save(loaded)
+        assert storage.get_offsets_path(session.id).exists()
+        assert storage.open_lazy(session.id, tail=1).recent[0].content == "more"
+
+    def test_rewritten_snapshot(self, storage: SessionStorage) -> None:
+        """Test paging fails once the snapshot it refers to is replaced."""
+        session = make_session(5)
+        storage.save(session)
+        view = storage.open_lazy(session.id, tail=0)
+
+        session.messages.pop(0)
+        storage.save(session)
+
+        with pytest.raises(SessionStorageError, match="rewritten"):
+            view.get_messages()
+        assert storage.open_lazy(session.id).message_count == 4
+
+    def test_missing_session(self, storage: SessionStorage) -> None:
+        """Test opening an unknown session raises."""
+        with pytest.raises(SessionStorageError):
+            storage.open_lazy("missing")
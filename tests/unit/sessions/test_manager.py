@@ -132,6 +132,153 @@ class TestSessionManager:
         assert resumed.title == "Test"
         assert manager.current_session is resumed
 
+    def make_long_session(self, manager: SessionManager, count: int) -> str:
+        """Create and close a session with numbered messages and one tool call."""
+        manager.create(title="Long")
+        manager.record_tool_call("Read", {"file_path": "/a"})
+        for i in range(count):
+            manager.add_message("user", f"message {i}")
+        session_id = manager.current_session.id
+        manager.close()
+        return session_id
+
+    def test_resume_loads_recent_messages(self, manager: SessionManager) -> None:
+        """Test resuming reads only the last messages and saves append to them."""
+        manager.RESUME_TAIL = 5
+        session_id = self.make_long_session(manager, 20)
+        snapshot = manager.storage.get_path(session_id).read_bytes()
+
+        resumed = manager.resume(session_id)
+        assert [m.content for m in resumed.messages] == [
+            f"message {i}" for i in range(15, 20)
+        ]
+        assert resumed.tool_history == []
+
+        manager.add_message("user", "new")
+        manager.record_tool_call("Grep", {"pattern": "x"})
+        manager.save()
+
+        # Appended to the journal; the history stays on disk
+        assert manager.storage.get_path(session_id).read_bytes() == snapshot
+        assert not resumed.history_loaded
+        assert len(resumed.messages) == 6
+        assert [t.tool_name for t in resumed.tool_history] == ["Grep"]
+        loaded = manager.storage.load(session_id)
+        assert [m.content for m in loaded.messages] == [
+            *(f"message {i}" for i in range(20)),
+            "new",
+        ]
+        assert [t.tool_name for t in loaded.tool_history] == ["Read", "Grep"]
+
+    def test_resume_without_changes_writes_nothing(self, manager: SessionManager) -> None:
+        """Test resuming and closing an unchanged session leaves its files alone."""
+        session_id = self.make_long_session(manager, 10)
+        snapshot = manager.storage.get_path(session_id).read_bytes()
+        journal = manager.storage.get_journal_path(session_id).read_bytes()
+
+        resumed = manager.resume(session_id)
+        assert not manager._saver.is_dirty(resumed)
+        manager.close()
+
+        assert manager.storage.get_path(session_id).read_bytes() == snapshot
+        assert manager.storage.get_journal_path(session_id).read_bytes() == journal
+
+    def test_resume_rewrite_loads_history(self, manager: SessionManager) -> None:
+        """Test a save that rewrites the snapshot loads the history first."""
+        manager.RESUME_TAIL = 5
+        session_id = self.make_long_session(manager, 20)
+
+        resumed = manager.resume(session_id)
+        resumed.messages.pop()
+        manager.save()
+
+        assert resumed.history_loaded
+        assert len(resumed.messages) == 19
+        assert [t.tool_name for t in resumed.tool_history] == ["Read"]
+        loaded = manager.storage.load(session_id)
+        assert [m.content for m in loaded.messages] == [f"message {i}" for i in range(19)]
+        assert len(loaded.tool_history) == 1
+
+    def test_resume_pages_older_messages(self, manager: SessionManager) -> None:
+        """Test a resumed session counts and pages messages not loaded yet."""
+        manager.RESUME_TAIL = 5
+        session_id = self.make_long_session(manager, 20)
+
+        resumed = manager.resume(session_id)
+        manager.add_message("user", "new")
+
+        assert not resumed.history_loaded
+        assert resumed.message_count == 21
+        assert [m.content for m in resumed.get_messages(0, 2)] == ["message 0", "message 1"]
+        assert [m.content for m in resumed.get_messages(14, 16)] == [
+            "message 14",
+            "message 15",
+        ]
+        assert resumed.get_messages(-1)[0].content == "new"
+        assert len(list(resumed.iter_messages(page_size=4))) == 21
+        assert manager.generate_title(resumed) == "message 0"
+        # Paging does not load the history
+        assert len(resumed.messages) == 6
+
+    def test_resume_torn_journal_writes_snapshot(self, manager: SessionManager) -> None:
+        """Test a resumed session with a torn journal is saved whole."""
+        manager.RESUME_TAIL = 5
+        session_id = self.make_long_session(manager, 20)
+        with manager.storage.get_journal_path(session_id).open("ab") as f:
+            f.write(b'{"type":"message","da')
+
+        resumed = manager.resume(session_id)
+        manager.add_message("user", "new")
+        manager.save()
+
+        assert resumed.history_loaded
+        loaded = manager.storage.load(session_id)
+        assert len(loaded.messages) == 21
+        assert loaded.messages[-1].content == "new"
+        assert len(loaded.tool_history) == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_save_async_keeps_history_on_disk(
+        self, manager: SessionManager
+    ) -> None:
+        """Test background saves of a resumed session do not load its history."""
+        manager.RESUME_TAIL = 3
+        session_id = self.make_long_session(manager, 10)
+
+        resumed = manager.resume(session_id)
+        for i in range(3):
+            manager.add_message("user", f"new {i}")
+            assert await manager.save_async()
+        manager._saver.wait()
+
+        loaded = manager.storage.load(session_id)
+        assert len(loaded.messages) == 13
+        assert loaded.messages[-1].content == "new 2"
+        assert len(loaded.tool_history) == 1
+        assert not resumed.history_loaded
+        assert len(resumed.messages) == 6
+
+    @pytest.mark.asyncio
+    async def test_resume_pages_after_snapshot_rewrite(self, manager: SessionManager) -> None:
+        """Test older messages stay readable after a background snapshot rewrite."""
+        manager.RESUME_TAIL = 3
+        session_id = self.make_long_session(manager, 10)
+
+        resumed = manager.resume(session_id)
+        manager.add_message("user", "new")
+        # Unknown journal state forces the save to write a snapshot
+        manager.storage._journal_states.clear()
+        assert await manager.save_async()
+        manager._saver.wait()
+
+        assert not resumed.history_loaded
+        assert [m.content for m in resumed.get_messages(0, 2)] == ["message 0", "message 1"]
+        manager.add_message("user", "newer")
+        manager.save()
+        loaded = manager.storage.load(session_id)
+        assert [m.content for m in loaded.messages[-3:]] == ["message 9", "new", "newer"]
+        assert len(loaded.messages) == 12
+
     def test_resume_not_found(self, manager: SessionManager) -> None:
         """Test resuming non-existent session raises error."""
         with pytest.raises(SessionNotFoundError):
@@ -246,6 +393,17 @@ class TestSessionManager:
 
         assert "end" in events
 
+    def test_shutdown_saves_and_stops_worker(self, manager: SessionManager) -> None:
+        """Test shutdown closes the current session and the save worker."""
+        session = manager.create()
+        session.title = "Before Shutdown"
+        manager.shutdown()
+
+        assert manager.current_session is None
+        assert manager.storage.load(session.id).title == "Before Shutdown"
+        with pytest.raises(RuntimeError):
+            manager._saver._executor.submit(lambda: None)
+
     def test_delete_session(self, manager: SessionManager) -> None:
         """Test deleting a session."""
         session = manager.create()
@@ -597,6 +755,83 @@ class TestSessionManagerAutoSave:
             assert manager._auto_save_task is None
 
 
+    @pytest.mark.asyncio
+    async def test_auto_save_writes_off_loop(self) -> None:
+        """Test auto-save coalesces changes into one background write."""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(Path(tmpdir))
+            manager = SessionManager(
+                storage=storage, auto_save_interval=10, auto_save_delay=0.01
+            )
+            session = manager.create()
+
+            threads: list[str] = []
+            original = storage.save
+
+            def tracking_save(s: Session) -> None:
+                threads.append(threading.current_thread().name)
+                original(s)
+
+            storage.save = tracking_save  # type: ignore[method-assign]
+
+            for i in range(5):
+                manager.add_message("user", f"message {i}")
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if manager.save_metrics.saves:
+                    break
+
+            assert manager.save_metrics.saves == 1
+            assert manager.save_metrics.coalesced == 4
+            assert threads and threads[0].startswith("session-save")
+            assert len(storage.load(session.id).messages) == 5
+            manager._stop_auto_save()
+
+    @pytest.mark.asyncio
+    async def test_save_async_skips_clean_session(self) -> None:
+        """Test save_async does not write an unchanged session."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(Path(tmpdir))
+            manager = SessionManager(storage=storage, auto_save_interval=0)
+            manager.create()
+
+            assert not await manager.save_async()
+            manager.add_message("user", "hello")
+            assert await manager.save_async()
+            assert manager.save_metrics.skipped_clean == 1
+            assert manager.save_metrics.saves == 1
+
+
+    @pytest.mark.asyncio
+    async def test_save_async_updates_index_off_loop(self) -> None:
+        """Test save_async updates the index on the saver's worker thread."""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SessionStorage(Path(tmpdir))
+            manager = SessionManager(storage=storage, auto_save_interval=0)
+            session = manager.create()
+
+            threads: list[str] = []
+            original = manager.index.update
+
+            def tracking_update(s: Session) -> None:
+                threads.append(threading.current_thread().name)
+                original(s)
+
+            manager.index.update = tracking_update  # type: ignore[method-assign]
+
+            manager.add_message("user", "hello")
+            assert await manager.save_async()
+
+            assert threads and threads[0].startswith("session-save")
+            summary = manager.index.get(session.id)
+            assert summary is not None
+            assert summary.message_count == 1
+
+
 class TestSessionManagerEdgeCases:
     """Tests for SessionManager edge cases."""
 
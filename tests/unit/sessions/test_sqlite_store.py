@@ -0,0 +1,201 @@
+"""Unit tests for the SQLite session store."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from code_forge.sessions.models import Session
+from code_forge.sessions.sqlite_store import (
+    DOC_MESSAGE,
+    DOC_TOOL,
+    SQLiteSessionRepository,
+    SQLiteSessionStore,
+    build_match_query,
+)
+from code_forge.sessions.storage import SessionStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_session(title: str, *contents: str, day: int = 1, **kwargs: object) -> Session:
+    """Build a session with user messages."""
+    session = Session(title=title, **kwargs)  # type: ignore[arg-type]
+    for content in contents:
+        session.add_message_from_dict("user", content)
+    session.updated_at = datetime(2024, 1, day, tzinfo=UTC)
+    return session
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SQLiteSessionStore:
+    """Create a store in a temporary directory."""
+    store = SQLiteSessionStore(tmp_path / "sessions.db")
+    yield store
+    store.close()
+
+
+class TestBuildMatchQuery:
+    """Tests for build_match_query."""
+
+    def test_quotes_words(self) -> None:
+        """Test words are quoted and OR-ed."""
+        assert build_match_query("flaky auth") == '"flaky" OR "auth"'
+
+    def test_strips_operators(self) -> None:
+        """Test FTS5 syntax in user input is neutralized."""
+        assert build_match_query('where "did" we fix NEAR(x)?') == (
+            '"where" OR "did" OR "we" OR "fix" OR "NEAR" OR "x"'
+        )
+        assert build_match_query("?!") == ""
+
+
+class TestSQLiteSessionStore:
+    """Tests for SQLiteSessionStore."""
+
+    def test_save_and_load(self, store: SQLiteSessionStore) -> None:
+        """Test round trip of a session."""
+        session = make_session("Round trip", "hello", tags=["a"])
+        session.record_tool_call("Read", {"file_path": "/a.py"}, result={"ok": True})
+        store.save(session)
+
+        loaded = store.load(session.id)
+        assert loaded is not None
+        assert loaded.to_dict() == session.to_dict()
+        assert store.exists(session.id)
+        assert store.count() == 1
+
+    def test_load_missing(self, store: SQLiteSessionStore) -> None:
+        """Test loading an unknown session returns None."""
+        assert store.load("missing") is None
+
+    def test_delete(self, store: SQLiteSessionStore) -> None:
+        """Test delete removes the session and its search documents."""
+        session = make_session("Doomed", "unique needle")
+        store.save(session)
+
+        assert store.delete(session.id)
+        assert not store.delete(session.id)
+        assert not store.exists(session.id)
+        assert store.search("needle") == []
+
+    def test_list_sorting_and_pagination(self, store: SQLiteSessionStore) -> None:
+        """Test list sorts and paginates in SQL."""
+        for day in (2, 1, 3):
+            store.save(make_session(f"Day {day}", day=day))
+
+        titles = [s.title for s in store.list()]
+        assert titles == ["Day 3", "Day 2", "Day 1"]
+
+        page = store.list(limit=1, offset=1)
+        assert [s.title for s in page] == ["Day 2"]
+
+        ascending = store.list(sort_by="title", descending=False)
+        assert [s.title for s in ascending] == ["Day 1", "Day 2", "Day 3"]
+
+    def test_list_filters(self, store: SQLiteSessionStore) -> None:
+        """Test tag, title and working directory filters."""
+        store.save(make_session("Alpha bug", tags=["bug", "urgent"], working_dir="/a"))
+        store.save(make_session("Beta bug", tags=["bug"], working_dir="/b"))
+        store.save(make_session("Gamma 100%", working_dir="/a"))
+
+        assert {s.title for s in store.list(tags=["bug"])} == {"Alpha bug", "Beta bug"}
+        assert [s.title for s in store.list(tags=["bug", "urgent"])] == ["Alpha bug"]
+        assert {s.title for s in store.list(search="BUG")} == {"Alpha bug", "Beta bug"}
+        assert [s.title for s in store.list(search="100%")] == ["Gamma 100%"]
+        assert {s.title for s in store.list(working_dir="/a")} == {"Alpha bug", "Gamma 100%"}
+
+    def test_search_messages(self, store: SQLiteSessionStore) -> None:
+        """Test search ranks sessions by message content."""
+        store.save(make_session("Auth", "We fixed the flaky auth test by mocking time"))
+        store.save(make_session("Other", "Refactored the flaky network layer"))
+        store.save(make_session("Unrelated", "Updated README formatting"))
+
+        hits = store.search("where did we fix the flaky auth test?")
+
+        assert [hit.summary.title for hit in hits] == ["Auth", "Other"]
+        assert hits[0].kind == DOC_MESSAGE
+        assert "[flaky]" in hits[0].snippet
+
+    def test_search_tool_invocations(self, store: SQLiteSessionStore) -> None:
+        """Test tool arguments and errors are searchable."""
+        session = make_session("Tools")
+        invocation = session.record_tool_call(
+            "Bash", {"command": "pytest tests/auth"}, success=False, error="Timeout"
+        )
+        store.save(session)
+
+        hits = store.search("timeout")
+        assert len(hits) == 1
+        assert hits[0].kind == DOC_TOOL
+        assert hits[0].ref == invocation.id
+
+    def test_search_one_hit_per_session(self, store: SQLiteSessionStore) -> None:
+        """Test sessions with several matches are returned once."""
+        store.save(make_session("Many", "needle one", "needle two", "needle three"))
+
+        assert len(store.search("needle")) == 1
+
+    def test_incremental_documents(self, store: SQLiteSessionStore) -> None:
+        """Test saves index new messages and drop removed ones."""
+        session = make_session("Growing", "first message")
+        store.save(session)
+
+        session.add_message_from_dict("assistant", "second reply")
+        store.save(session)
+        assert len(store.search("second")) == 1
+
+        session.messages.pop()
+        store.save(session)
+        assert store.search("second") == []
+        assert len(store.search("first")) == 1
+
+    def test_import_storage(self, store: SQLiteSessionStore, tmp_path: Path) -> None:
+        """Test sessions are imported from the JSON store."""
+        storage = SessionStorage(tmp_path / "json")
+        storage.save(make_session("Imported", "legacy content"))
+
+        assert store.import_storage(storage) == 1
+        assert [hit.summary.title for hit in store.search("legacy")] == ["Imported"]
+
+    def test_persistence(self, tmp_path: Path) -> None:
+        """Test data survives reopening the database."""
+        path = tmp_path / "sessions.db"
+        first = SQLiteSessionStore(path)
+        session = make_session("Persisted", "kept content")
+        first.save(session)
+        first.close()
+
+        second = SQLiteSessionStore(path)
+        try:
+            assert second.load(session.id) is not None
+            assert len(second.search("kept")) == 1
+        finally:
+            second.close()
+
+
+class TestSQLiteSessionRepository:
+    """Tests for the async repository wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_repository_operations(self, store: SQLiteSessionStore) -> None:
+        """Test the ISessionRepository operations and search."""
+        repo = SQLiteSessionRepository(store=store, max_workers=1)
+        session = make_session("Async", "async needle")
+
+        await repo.save(session)
+        assert await repo.exists(session.id)
+        loaded = await repo.load(session.id)
+        assert loaded is not None
+        assert loaded.title == "Async"
+
+        recent = await repo.list_recent(limit=5)
+        assert [s.id for s in recent] == [session.id]
+        assert len(await repo.list_sessions(search="async")) == 1
+        assert len(await repo.search("needle")) == 1
+
+        assert await repo.delete(session.id)
+        repo._executor.shutdown(wait=True)
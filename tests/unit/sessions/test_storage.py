@@ -105,12 +105,12 @@ class TestSessionStorage:
         assert data["title"] == "Test"
 
     def test_save_creates_backup(self, storage: SessionStorage) -> None:
-        """Test save creates backup of existing file."""
+        """Test snapshot rewrite creates backup of existing file."""
         session = Session(title="Original")
         storage.save(session)
 
         session.title = "Updated"
-        storage.save(session)
+        storage.compact(session)
 
         backup_path = storage.get_backup_path(session.id)
         assert backup_path.exists()
@@ -208,7 +208,7 @@ class TestSessionStorage:
         session = Session(title="Original")
         storage.save(session)
         session.title = "Updated"
-        storage.save(session)  # Creates backup
+        storage.compact(session)  # Creates backup
 
         backup_path = storage.get_backup_path(session.id)
         assert backup_path.exists()
@@ -241,7 +241,7 @@ class TestSessionStorage:
         session = Session(title="Original")
         storage.save(session)
         session.title = "Updated"
-        storage.save(session)
+        storage.compact(session)
 
         # Corrupt the main file
         path = storage.get_path(session.id)
@@ -316,6 +316,35 @@ class TestSessionStorage:
         remaining = storage.list_session_ids()
         assert len(remaining) == 3
 
+    def test_cleanup_old_sessions_updates_index(self, storage: SessionStorage) -> None:
+        """Test cleanup uses and updates the session index."""
+        from datetime import timedelta
+
+        from code_forge.sessions.index import SessionIndex
+
+        old_session = Session(title="Old")
+        old_session.updated_at = old_session.updated_at - timedelta(days=60)
+        storage.save(old_session)
+        index = SessionIndex(storage)
+        index.refresh()
+
+        deleted = storage.cleanup_old_sessions(max_age_days=30, keep_minimum=0, index=index)
+
+        assert deleted == [old_session.id]
+        assert old_session.id not in index
+        assert SessionIndex(storage).count() == 0
+
+    def test_scan_signatures(self, storage: SessionStorage) -> None:
+        """Test signatures cover session files and follow journal appends."""
+        session = Session()
+        storage.save(session)
+        before = storage.scan_signatures()
+        assert before == {session.id: storage.file_signature(session.id)}
+
+        session.add_message_from_dict("user", "hello")
+        storage.save(session)
+        assert storage.scan_signatures()[session.id] != before[session.id]
+
     def test_cleanup_old_backups(self, storage: SessionStorage) -> None:
         """Test cleaning up old backups."""
         # Create some backup files
@@ -181,6 +181,44 @@ class TestBashToolOutputTruncation:
         assert result.metadata.get("truncated") is True
         assert "truncated" in result.output.lower()
 
+    @pytest.mark.asyncio
+    async def test_truncation_keeps_head_and_tail(
+        self, tool: BashTool, context: ExecutionContext
+    ) -> None:
+        """Test truncated output keeps the first and last lines."""
+        result = await tool.execute(
+            context, command="seq 1 100000"
+        )
+        assert result.success
+        assert result.output.startswith("1\n2\n3\n")
+        assert result.output.rstrip().endswith("99999\n100000")
+        assert len(result.output) < tool.MAX_OUTPUT_SIZE + 200
+
+
+class TestBashToolOutputStreaming:
+    """Tests for live output reporting."""
+
+    @pytest.mark.asyncio
+    async def test_reports_lines_to_listener(
+        self, tool: BashTool, context: ExecutionContext
+    ) -> None:
+        """Test each output line is passed to the output listener."""
+        from code_forge.tools.execution.output import output_listener
+
+        lines: list[tuple[str, str]] = []
+        token = output_listener.set(lambda stream, line: lines.append((stream, line)))
+        try:
+            result = await tool.execute(
+                context, command="echo one; echo two; echo oops >&2"
+            )
+        finally:
+            output_listener.reset(token)
+
+        assert result.success
+        assert ("stdout", "one") in lines
+        assert ("stdout", "two") in lines
+        assert ("stderr", "oops") in lines
+
 
 class TestBashToolSecurity:
     """Tests for BashTool security features."""
@@ -0,0 +1,99 @@
+"""Tests for bounded shell output capture."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from code_forge.tools.execution.output import OutputBuffer, pump_stream
+
+
+class TestOutputBuffer:
+    """Tests for OutputBuffer."""
+
+    def test_keeps_everything_under_limit(self) -> None:
+        """Test small output is retained in full."""
+        buffer = OutputBuffer(100)
+        buffer.write(b"hello ")
+        buffer.write(b"world")
+
+        assert buffer.text() == "hello world"
+        assert buffer.total_bytes == 11
+        assert not buffer.truncated
+
+    def test_keeps_head_and_tail(self) -> None:
+        """Test the middle of long output is dropped."""
+        buffer = OutputBuffer(20, head_bytes=10)
+        for i in range(100):
+            buffer.write(f"{i:03d}\n".encode())
+
+        assert len(buffer) == 20
+        assert buffer.total_bytes == 400
+        assert buffer.dropped_bytes == 380
+        text = buffer.text()
+        assert text.startswith("000\n001\n00")
+        assert text.endswith("7\n098\n099\n")
+        assert "[... 380 bytes omitted ...]" in text
+
+    def test_large_single_write(self) -> None:
+        """Test one write larger than the buffer keeps its end."""
+        buffer = OutputBuffer(10, head_bytes=2)
+        buffer.write(b"abcdefghijklmnopqrstuvwxyz")
+
+        assert len(buffer) == 10
+        assert buffer.text().endswith("stuvwxyz")
+
+    def test_incremental_reads(self) -> None:
+        """Test cursors return only new output."""
+        buffer = OutputBuffer(100)
+        buffer.write(b"first\n")
+        text, cursor = buffer.read(0)
+        buffer.write(b"second\n")
+
+        assert text == "first\n"
+        assert buffer.read(cursor) == ("second\n", 13)
+        assert buffer.read(13) == ("", 13)
+
+    def test_read_across_dropped_output(self) -> None:
+        """Test a cursor in dropped output skips to the retained tail."""
+        buffer = OutputBuffer(10, head_bytes=0)
+        buffer.write(b"0123456789")
+        _, cursor = buffer.read(0)
+        buffer.write(b"abcdefghijklmno")
+
+        text, cursor = buffer.read(cursor)
+
+        assert text == "\n[... 5 bytes omitted ...]\nfghijklmno"
+        assert cursor == buffer.total_bytes
+
+    def test_read_holds_back_partial_character(self) -> None:
+        """Test a UTF-8 character split across writes is read whole."""
+        encoded = "héllo".encode()
+        buffer = OutputBuffer(100)
+        buffer.write(encoded[:2])
+
+        text, cursor = buffer.read(0)
+        assert (text, cursor) == ("h", 1)
+
+        buffer.write(encoded[2:])
+        assert buffer.read(cursor) == ("éllo", len(encoded))
+
+
+class TestPumpStream:
+    """Tests for pump_stream."""
+
+    @pytest.mark.asyncio
+    async def test_reports_lines(self) -> None:
+        """Test lines are reported as they complete."""
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"one\r\ntw")
+        stream.feed_data(b"o\nthree")
+        stream.feed_eof()
+        buffer = OutputBuffer(100)
+        lines: list[str] = []
+
+        await pump_stream(stream, buffer, lines.append)
+
+        assert lines == ["one", "two", "three"]
+        assert buffer.text() == "one\r\ntwo\nthree"
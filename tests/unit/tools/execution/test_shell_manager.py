@@ -125,6 +125,28 @@ class TestShellProcess:
         assert "out\n" in output
         assert "stderr" not in output
 
+    def test_get_new_output_after_trimming(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test incremental reads stay in place when old output is dropped."""
+        monkeypatch.setattr(ShellProcess, "MAX_BUFFER_SIZE", 20)
+        shell = ShellProcess(
+            id="test_shell",
+            command="echo hello",
+            working_dir="/tmp",
+        )
+        shell._append_to_buffer("stdout", "line 1\n")
+        assert shell.get_new_output() == "line 1\n"
+
+        for i in range(2, 10):
+            shell._append_to_buffer("stdout", f"line {i}\n")
+        output = shell.get_new_output()
+
+        assert shell.stdout_truncated
+        assert "omitted" in output
+        assert output.endswith("line 9\n")
+        assert "line 1" not in output
+        assert shell.last_read_stdout == 63
+        assert shell.get_new_output() == ""
+
     def test_get_all_output(self) -> None:
         """Test get_all_output."""
         shell = ShellProcess(
@@ -0,0 +1,330 @@
+"""Tests for the shared file cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from code_forge.tools.base import ExecutionContext
+from code_forge.tools.file.cache import (
+    CachedFile,
+    FileCache,
+    LineIndex,
+    detect_encoding,
+    get_file_cache,
+)
+from code_forge.tools.file.edit import EditTool
+from code_forge.tools.file.read import ReadTool
+from code_forge.tools.file.write import WriteTool
+
+
+@pytest.fixture
+def cache() -> FileCache:
+    """Create an empty file cache."""
+    return FileCache(max_bytes=1024, max_file_size=512)
+
+
+def _touch_later(path: Path) -> None:
+    """Move the mtime of a file forward so changes are always visible."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFileCache:
+    """Test FileCache reads and validation."""
+
+    def test_read_through(self, cache: FileCache, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"one\ntwo\n")
+
+        first = cache.get(str(path))
+        second = cache.get(str(path))
+
+        assert first is not None
+        assert first.data == b"one\ntwo\n"
+        assert second is first
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_changed_file_is_reread(self, cache: FileCache, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"old")
+        cache.get(str(path))
+
+        path.write_bytes(b"new")
+        _touch_later(path)
+        entry = cache.get(str(path))
+
+        assert entry is not None
+        assert entry.data == b"new"
+        assert cache.stats.invalidations == 1
+
+    def test_large_file_not_cached(self, cache: FileCache, tmp_path: Path) -> None:
+        path = tmp_path / "big.txt"
+        path.write_bytes(b"x" * 600)
+
+        assert cache.get(str(path)) is None
+        assert str(path) not in cache
+
+    def test_missing_file_raises(self, cache: FileCache, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            cache.get(str(tmp_path / "missing.txt"))
+
+    def test_lru_eviction(self, cache: FileCache, tmp_path: Path) -> None:
+        paths = []
+        for name in "abc":
+            path = tmp_path / f"{name}.txt"
+            path.write_bytes(name.encode() * 400)
+            paths.append(str(path))
+
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+
+        assert paths[0] in cache
+        assert paths[1] not in cache
+        assert paths[2] in cache
+        assert cache.size == 800
+        assert cache.stats.evictions == 1
+
+    def test_derived_values_count_toward_size(
+        self, cache: FileCache, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"line\n" * 40)
+
+        entry = cache.get(str(path))
+        assert entry is not None
+        assert cache.size == 200
+        assert len(entry.line_offsets) == 40
+
+        assert cache.size > 200 + len(entry.text) + len(entry.lines)
+        cache.invalidate(str(path))
+        assert cache.size == 0
+
+    def test_derived_values_evict_old_entries(
+        self, cache: FileCache, tmp_path: Path
+    ) -> None:
+        old = tmp_path / "old.txt"
+        old.write_bytes(b"o" * 300)
+        new = tmp_path / "new.txt"
+        new.write_bytes(b"n\n" * 150)
+        cache.get(str(old))
+        entry = cache.get(str(new))
+        assert entry is not None
+        assert str(old) in cache
+
+        assert len(entry.lines) == 150
+
+        assert str(old) not in cache
+        assert str(new) in cache
+        assert cache.stats.evictions == 1
+
+    def test_derived_values_of_dropped_entry_not_counted(
+        self, cache: FileCache, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"data\n")
+        entry = cache.get(str(path))
+        assert entry is not None
+        cache.invalidate(str(path))
+
+        assert entry.lines == ["data\n"]
+
+        assert cache.size == 0
+
+    def test_invalidate(self, cache: FileCache, tmp_path: Path) -> None:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"data")
+        cache.get(str(path))
+
+        assert cache.invalidate(str(path)) is True
+        assert cache.invalidate(str(path)) is False
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_relative_and_absolute_paths_share_entry(
+        self, cache: FileCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "a.txt").write_bytes(b"data")
+        monkeypatch.chdir(tmp_path)
+
+        cache.get("a.txt")
+        cache.get(str(tmp_path / "sub" / ".." / "a.txt"))
+
+        assert len(cache) == 1
+        assert cache.stats.hits == 1
+
+    def test_shared_instance(self) -> None:
+        assert get_file_cache() is get_file_cache()
+
+
+class TestCachedFile:
+    """Test values derived from cached contents."""
+
+    def _entry(self, tmp_path: Path, data: bytes) -> CachedFile:
+        path = tmp_path / "f.txt"
+        path.write_bytes(data)
+        return CachedFile(str(path), data, path.stat())
+
+    def test_lines_match_text_mode_iteration(self, tmp_path: Path) -> None:
+        data = b"a\r\nb\rc\x0cd\ne\xff"
+        entry = self._entry(tmp_path, data)
+
+        with Path(entry.path).open(encoding="utf-8", errors="replace") as f:
+            assert entry.lines == f.readlines()
+
+    def test_decode_translates_newlines(self, tmp_path: Path) -> None:
+        entry = self._entry(tmp_path, b"a\r\nb\n")
+
+        assert entry.decode() == "a\nb\n"
+
+    def test_line_offsets(self, tmp_path: Path) -> None:
+        entry = self._entry(tmp_path, b"ab\r\ncd\n\n\xc3\xa9f")
+
+        assert entry.text == "ab\ncd\n\n\xe9f"
+        assert entry.line_offsets == [0, 3, 6, 7]
+        assert entry.line_index(0) == 0
+        assert entry.line_index(4) == 1
+        assert entry.line_index(8) == 3
+
+    def test_encoding_detected_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        entry = self._entry(tmp_path, b"\xef\xbb\xbfhello")
+        calls = []
+
+        import code_forge.tools.file.cache as cache_module
+
+        def counting(raw: bytes) -> tuple[str, float]:
+            calls.append(raw)
+            return detect_encoding(raw)
+
+        monkeypatch.setattr(cache_module, "detect_encoding", counting)
+
+        assert entry.encoding == ("utf-8-sig", 1.0)
+        assert entry.encoding == ("utf-8-sig", 1.0)
+        assert len(calls) == 1
+
+
+class TestFileToolsShareCache:
+    """Test that file tools read through and invalidate the shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_edit_invalidates_entry(self, tmp_path: Path) -> None:
+        path = tmp_path / "code.py"
+        path.write_text("value = 1\n")
+        context = ExecutionContext(working_dir=str(tmp_path))
+
+        await ReadTool().execute(context, file_path=str(path))
+        assert str(path) in get_file_cache()
+
+        result = await EditTool().execute(
+            context, file_path=str(path), old_string="1", new_string="2"
+        )
+        assert result.success
+        assert str(path) not in get_file_cache()
+
+        result = await ReadTool().execute(context, file_path=str(path))
+        assert "value = 2" in result.output
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_entry(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.txt"
+        path.write_text("before\n")
+        context = ExecutionContext(working_dir=str(tmp_path))
+
+        await ReadTool().execute(context, file_path=str(path))
+        await WriteTool().execute(context, file_path=str(path), content="after\n")
+
+        assert str(path) not in get_file_cache()
+        result = await ReadTool().execute(context, file_path=str(path))
+        assert "after" in result.output
+
+
+class TestFileCacheWatcher:
+    """Test invalidation by the file watcher."""
+
+    def test_watch_missing_directory(self, cache: FileCache, tmp_path: Path) -> None:
+        assert cache.watch(str(tmp_path / "missing")) is False
+
+    def test_watcher_drops_changed_files(
+        self, cache: FileCache, tmp_path: Path
+    ) -> None:
+        import time
+
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"data")
+        cache.get(str(path))
+
+        assert cache.watch(str(tmp_path)) is True
+        try:
+            path.write_bytes(b"more")
+            deadline = time.monotonic() + 5
+            while str(path) in cache and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert str(path) not in cache
+        finally:
+            cache.stop_watching()
+
+
+class TestLineIndex:
+    """Test the sparse line index of large files."""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Record a line start every few bytes to exercise seeking."""
+        monkeypatch.setattr(LineIndex, "CHUNK_SIZE", 16)
+
+    @pytest.mark.usefixtures("small_chunks")
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    def test_reads_any_range(self, tmp_path: Path, trailing_newline: bool) -> None:
+        lines = [f"line {i}\n" for i in range(1, 201)]
+        if not trailing_newline:
+            lines[-1] = lines[-1].rstrip("\n")
+        path = tmp_path / "log.txt"
+        path.write_text("".join(lines))
+
+        index = LineIndex.build(str(path))
+
+        assert index.total_lines == 200
+        for start in (0, 1, 57, 150, 195, 199):
+            assert index.read_lines(start, 5) == lines[start : start + 5]
+        assert index.read_lines(200, 5) == []
+
+    @pytest.mark.usefixtures("small_chunks")
+    def test_long_lines_span_chunks(self, tmp_path: Path) -> None:
+        lines = ["x" * 100 + "\n", "short\n", "y" * 50 + "\n"]
+        path = tmp_path / "wide.txt"
+        path.write_text("".join(lines))
+
+        index = LineIndex.build(str(path))
+
+        assert index.total_lines == 3
+        assert index.read_lines(1, 2) == lines[1:]
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        index = LineIndex.build(str(path))
+
+        assert index.total_lines == 0
+        assert index.read_lines(0, 10) == []
+
+    def test_cache_reuses_and_rebuilds_index(self, cache: FileCache, tmp_path: Path) -> None:
+        path = tmp_path / "log.txt"
+        path.write_text("a\nb\n")
+
+        first = cache.line_index(str(path))
+        assert cache.line_index(str(path)) is first
+
+        path.write_text("a\nb\nc\n")
+        _touch_later(path)
+        second = cache.line_index(str(path))
+
+        assert second is not first
+        assert second.total_lines == 3
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -217,6 +218,112 @@ class TestGlobToolResultLimit:
         assert result.success
         assert result.metadata["count"] == 10
 
+    @pytest.mark.asyncio
+    async def test_keeps_newest_when_limited(
+        self,
+        glob_tool: GlobTool,
+        context: ExecutionContext,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(GlobTool, "MAX_RESULTS", 3)
+        for i in range(10):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text("")
+            os.utime(path, (1_000_000 + i, 1_000_000 + i))
+
+        result = await glob_tool.execute(
+            context, pattern="*.txt", path=str(tmp_path)
+        )
+        assert result.success
+        assert result.metadata["count"] == 3
+        assert result.metadata["truncated"] is True
+        names = [Path(line).name for line in result.output.split("\n")]
+        assert names == ["file9.txt", "file8.txt", "file7.txt"]
+
+
+class TestGlobToolWalk:
+    """Test the pruned walk behind glob matching."""
+
+    @pytest.mark.asyncio
+    async def test_excluded_directories_not_entered(
+        self,
+        glob_tool: GlobTool,
+        context: ExecutionContext,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from code_forge.tools.file import walk
+
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+        (tmp_path / "app.js").write_text("")
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def spy(path: str) -> Any:
+            scanned.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(walk.os, "scandir", spy)
+        result = await glob_tool.execute(
+            context, pattern="**/*.js", path=str(tmp_path)
+        )
+        assert result.success
+        assert result.metadata["count"] == 1
+        assert not any("node_modules" in path for path in scanned)
+
+    @pytest.mark.asyncio
+    async def test_hidden_files_need_explicit_pattern(
+        self, glob_tool: GlobTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        (tmp_path / ".github" / "workflows").mkdir(parents=True)
+        (tmp_path / ".github" / "workflows" / "ci.yml").write_text("")
+        (tmp_path / "config.yml").write_text("")
+
+        wildcard = await glob_tool.execute(
+            context, pattern="**/*.yml", path=str(tmp_path)
+        )
+        explicit = await glob_tool.execute(
+            context, pattern=".github/**/*.yml", path=str(tmp_path)
+        )
+        assert wildcard.metadata["count"] == 1
+        assert "config.yml" in wildcard.output
+        assert explicit.metadata["count"] == 1
+        assert "ci.yml" in explicit.output
+
+    @pytest.mark.asyncio
+    async def test_brace_alternatives(
+        self, glob_tool: GlobTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        (tmp_path / "app.ts").write_text("")
+        (tmp_path / "view.tsx").write_text("")
+        (tmp_path / "main.js").write_text("")
+
+        result = await glob_tool.execute(
+            context, pattern="*.{ts,tsx}", path=str(tmp_path)
+        )
+        assert result.metadata["count"] == 2
+        assert "main.js" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_symlink_outside_base_skipped(
+        self, glob_tool: GlobTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.txt").write_text("")
+        base = tmp_path / "base"
+        base.mkdir()
+        (base / "local.txt").write_text("")
+        (base / "link.txt").symlink_to(outside / "secret.txt")
+
+        result = await glob_tool.execute(
+            context, pattern="*.txt", path=str(base)
+        )
+        assert result.metadata["count"] == 1
+        assert "local.txt" in result.output
+
 
 class TestGlobToolDefaultPath:
     """Test using default working directory."""
@@ -441,3 +441,255 @@ class TestGrepToolOutputModes:
         )
         assert result.success
         assert expected_in_output in result.output
+
+
+class TestGrepToolPruning:
+    """Test that ignored directories and files are not searched."""
+
+    @pytest.mark.asyncio
+    async def test_skips_gitignored_and_dependency_dirs(
+        self, grep_tool: GrepTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "lib.js").write_text("needle")
+        (tmp_path / "debug.log").write_text("needle")
+        (tmp_path / "main.py").write_text("needle")
+
+        result = await grep_tool.execute(context, pattern="needle", path=str(tmp_path))
+
+        assert result.output == str(tmp_path / "main.py")
+
+    @pytest.mark.asyncio
+    async def test_brace_glob_filter(
+        self, grep_tool: GrepTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        (tmp_path / "a.ts").write_text("needle")
+        (tmp_path / "b.tsx").write_text("needle")
+        (tmp_path / "c.js").write_text("needle")
+
+        result = await grep_tool.execute(
+            context, pattern="needle", path=str(tmp_path), glob="*.{ts,tsx}"
+        )
+
+        assert result.output.splitlines() == [str(tmp_path / "a.ts"), str(tmp_path / "b.tsx")]
+
+
+class TestGrepToolEarlyTermination:
+    """Test that the search stops once enough results are found."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_head_limit(
+        self, grep_tool: GrepTool, context: ExecutionContext, tmp_path: Path
+    ) -> None:
+        for i in range(50):
+            (tmp_path / f"file{i:02d}.txt").write_text("needle\n")
+
+        result = await grep_tool.execute(
+            context, pattern="needle", path=str(tmp_path), head_limit=3, offset=2
+        )
+
+        assert result.output.splitlines() == [
+            str(tmp_path / f"file{i:02d}.txt") for i in (2, 3, 4)
+        ]
+        assert result.metadata["search_complete"] is False
+
+    @pytest.mark.asyncio
+    async def test_complete_search(
+        self, grep_tool: GrepTool, context: ExecutionContext, sample_codebase: Path
+    ) -> None:
+        result = await grep_tool.execute(
+            context, pattern="Hello", path=str(sample_codebase)
+        )
+
+        assert result.metadata["search_complete"] is True
+
+
+class TestGrepToolLineSemantics:
+    """Test that whole-file scanning keeps line-by-line matching."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "pattern,expected_lines",
+        [
+            ("^b", [2]),
+            ("b$", [2]),
+            ("a\\sb", []),
+            ("\\Ab", [2]),
+            ("(?<!x)c", [3]),
+            ("x*", [1, 2, 3]),
+        ],
+    )
+    async def test_matches_per_line(
+        self,
+        grep_tool: GrepTool,
+        context: ExecutionContext,
+        tmp_path: Path,
+        pattern: str,
+        expected_lines: list[int],
+    ) -> None:
+        (tmp_path / "f.txt").write_text("a\nb\nc\n")
+
+        result = await grep_tool.execute(
+            context,
+            pattern=pattern,
+            path=str(tmp_path / "f.txt"),
+            output_mode="content",
+            head_limit=0,
+        )
+
+        found = [line for line in range(1, 4) if f">{line}:" in result.output]
+        assert found == expected_lines
+
+
+class TestGrepToolRipgrep:
+    """Test narrowing the files to search with rg."""
+
+    @pytest.mark.asyncio
+    async def test_searches_rg_candidates(
+        self,
+        grep_tool: GrepTool,
+        context: ExecutionContext,
+        sample_codebase: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import subprocess
+
+        from code_forge.tools.file import grep as grep_module
+
+        commands: list[list[str]] = []
+
+        def fake_run(command: list[str], **_: object) -> subprocess.CompletedProcess[bytes]:
+            commands.append(command)
+            main = str(sample_codebase / "src" / "main.py").encode()
+            return subprocess.CompletedProcess(command, 0, stdout=main + b"\0", stderr=b"")
+
+        monkeypatch.setattr(grep_module.shutil, "which", lambda _: "/usr/bin/rg")
+        monkeypatch.setattr(grep_module.subprocess, "run", fake_run)
+
+        result = await grep_tool.execute(
+            context, pattern="Hello", path=str(sample_codebase), output_mode="content"
+        )
+
+        assert commands
+        assert "--files-with-matches" in commands[0]
+        assert result.output.startswith(f"{sample_codebase / 'src' / 'main.py'}:2\n")
+        assert "app.js" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_rg_fails(
+        self,
+        grep_tool: GrepTool,
+        context: ExecutionContext,
+        sample_codebase: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import subprocess
+
+        from code_forge.tools.file import grep as grep_module
+
+        def fake_run(command: list[str], **_: object) -> subprocess.CompletedProcess[bytes]:
+            return subprocess.CompletedProcess(command, 2, stdout=b"", stderr=b"regex parse error")
+
+        monkeypatch.setattr(grep_module.shutil, "which", lambda _: "/usr/bin/rg")
+        monkeypatch.setattr(grep_module.subprocess, "run", fake_run)
+
+        result = await grep_tool.execute(
+            context, pattern="Hello", path=str(sample_codebase)
+        )
+
+        assert "main.py" in result.output
+        assert "app.js" in result.output
+
+
+class TestGrepToolMultiline:
+    """Test matching across lines."""
+
+    @pytest.fixture
+    def source_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "source.py"
+        path.write_text(
+            "import os\n"
+            "\n"
+            "def first(\n"
+            "    a,\n"
+            "):\n"
+            "    pass\n"
+            "\n"
+            "def second(b):\n"
+            "    pass\n"
+        )
+        return path
+
+    @pytest.fixture(params=[False, True], ids=["cached", "mapped"])
+    def mapped(
+        self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> bool:
+        """Run with cached files and with memory-mapped large files."""
+        if request.param:
+            monkeypatch.setattr(GrepTool, "MMAP_THRESHOLD", 0)
+        return bool(request.param)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mapped")
+    async def test_matches_across_lines(
+        self, grep_tool: GrepTool, context: ExecutionContext, source_file: Path
+    ) -> None:
+        result = await grep_tool.execute(
+            context,
+            pattern=r"def \w+\(.*?\):",
+            path=str(source_file),
+            output_mode="content",
+            multiline=True,
+        )
+
+        assert result.metadata["total_matches"] == 2
+        assert result.output == (
+            f"{source_file}:3\n>3:def first(\n>4:    a,\n>5:):\n\n"
+            f"{source_file}:8\n>8:def second(b):"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mapped")
+    async def test_context_lines(
+        self, grep_tool: GrepTool, context: ExecutionContext, source_file: Path
+    ) -> None:
+        result = await grep_tool.execute(
+            context,
+            pattern=r"a,\n\)",
+            path=str(source_file),
+            output_mode="content",
+            multiline=True,
+            **{"-C": 1},
+        )
+
+        assert result.output == f"{source_file}:4\n 3:def first(\n>4:    a,\n>5:):\n 6:    pass"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mapped")
+    async def test_count_and_files_modes(
+        self, grep_tool: GrepTool, context: ExecutionContext, source_file: Path
+    ) -> None:
+        count = await grep_tool.execute(
+            context,
+            pattern=r"\):\n    pass",
+            path=str(source_file),
+            output_mode="count",
+            multiline=True,
+        )
+        files = await grep_tool.execute(
+            context, pattern="first.*second", path=str(source_file), multiline=True
+        )
+
+        assert count.output == f"{source_file}: 2"
+        assert files.output == str(source_file)
+
+    @pytest.mark.asyncio
+    async def test_without_multiline_lines_match_separately(
+        self, grep_tool: GrepTool, context: ExecutionContext, source_file: Path
+    ) -> None:
+        result = await grep_tool.execute(
+            context, pattern="first.*second", path=str(source_file)
+        )
+
+        assert result.output == "No matches found"
@@ -109,6 +109,37 @@ class TestReadToolBasicOperations:
         # Should start at line 20
         assert "   20\t" in result.output
 
+    @pytest.mark.asyncio
+    async def test_read_reports_remaining_lines(
+        self, read_tool: ReadTool, context: ExecutionContext, text_file: Path
+    ) -> None:
+        result = await read_tool.execute(
+            context, file_path=str(text_file), offset=20, limit=5
+        )
+        assert result.metadata["total_lines"] == 100
+        assert result.metadata["truncated"] is True
+        assert result.metadata["remaining_lines"] == 76
+
+    @pytest.mark.asyncio
+    async def test_read_large_file_through_line_index(
+        self,
+        read_tool: ReadTool,
+        context: ExecutionContext,
+        text_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from code_forge.tools.file.cache import get_file_cache
+
+        monkeypatch.setattr(get_file_cache(), "max_file_size", 10)
+        result = await read_tool.execute(
+            context, file_path=str(text_file), offset=99, limit=5
+        )
+        assert result.success
+        assert "Line 100:" in result.output
+        assert result.metadata["lines_read"] == 2
+        assert result.metadata["total_lines"] == 100
+        assert "truncated" not in result.metadata
+
     @pytest.mark.asyncio
     async def test_read_empty_file(
         self, read_tool: ReadTool, context: ExecutionContext, tmp_path: Path
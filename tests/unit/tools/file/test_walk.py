@@ -0,0 +1,169 @@
+"""Tests for the pruned directory walker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from code_forge.tools.file.walk import (
+    PathGlob,
+    compile_path_glob,
+    parse_gitignore,
+    translate_glob,
+    walk_files,
+)
+
+
+def _walk(root: Path, **kwargs: bool) -> list[str]:
+    return [
+        Path(entry.path).relative_to(root).as_posix()
+        for entry in walk_files(str(root), **kwargs)
+    ]
+
+
+class TestTranslateGlob:
+    """Test glob to regex translation."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,expected",
+        [
+            ("*.py", "main.py", True),
+            ("*.py", "src/main.py", False),
+            ("**/*.py", "main.py", True),
+            ("**/*.py", "a/b/main.py", True),
+            ("src/**", "src/a/b.txt", True),
+            ("?.txt", "a.txt", True),
+            ("?.txt", "ab.txt", False),
+            ("[ab].txt", "b.txt", True),
+            ("[!ab].txt", "b.txt", False),
+            ("*.{ts,tsx}", "app.tsx", True),
+            ("*.{ts,tsx}", "app.js", False),
+        ],
+    )
+    def test_matches(self, pattern: str, path: str, expected: bool) -> None:
+        import re
+
+        assert bool(re.fullmatch(translate_glob(pattern), path)) is expected
+
+    def test_path_glob_matches_at_any_depth(self) -> None:
+        regex = compile_path_glob("src/*.py")
+
+        assert regex.fullmatch("src/main.py")
+        assert regex.fullmatch("pkg/src/main.py")
+        assert not regex.fullmatch("src/sub/main.py")
+
+
+class TestParseGitignore:
+    """Test .gitignore parsing."""
+
+    def test_skips_comments_and_blank_lines(self) -> None:
+        rules = parse_gitignore("# comment\n\n*.log\n")
+
+        assert len(rules) == 1
+
+    def test_rule_kinds(self) -> None:
+        negated, directory, anchored = parse_gitignore("!keep.log\nbuild/\n/docs/*.md\n")
+
+        assert negated.negated
+        assert directory.directory_only
+        assert anchored.regex.fullmatch("docs/a.md")
+        assert not anchored.regex.fullmatch("src/docs/a.md")
+
+
+class TestWalkFiles:
+    """Test walking with pruning and .gitignore rules."""
+
+    def test_sorted_by_full_path(self, tmp_path: Path) -> None:
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "x.txt").write_text("")
+        (tmp_path / "b.txt").write_text("")
+        (tmp_path / "a.txt").write_text("")
+
+        paths = _walk(tmp_path)
+
+        assert paths == ["a.txt", "b.txt", "b/x.txt"]
+        assert paths == sorted(paths)
+
+    def test_prunes_default_directories(self, tmp_path: Path) -> None:
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("")
+        (tmp_path / "main.js").write_text("")
+
+        assert _walk(tmp_path) == ["main.js"]
+
+    def test_respects_nested_gitignore(self, tmp_path: Path) -> None:
+        (tmp_path / ".gitignore").write_text("*.log\nout/\n")
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "result.txt").write_text("")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / ".gitignore").write_text("!keep.log\n")
+        (tmp_path / "sub" / "keep.log").write_text("")
+        (tmp_path / "sub" / "drop.log").write_text("")
+        (tmp_path / "app.log").write_text("")
+        (tmp_path / "app.py").write_text("")
+
+        assert _walk(tmp_path) == [".gitignore", "app.py", "sub/.gitignore", "sub/keep.log"]
+
+    def test_gitignore_can_be_disabled(self, tmp_path: Path) -> None:
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "app.log").write_text("")
+
+        assert "app.log" in _walk(tmp_path, gitignore=False)
+
+    def test_applies_repository_gitignore_to_subdirectory(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("/src/generated/\n")
+        (tmp_path / "src" / "generated").mkdir(parents=True)
+        (tmp_path / "src" / "generated" / "api.py").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+
+        assert _walk(tmp_path / "src") == ["main.py"]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "file.txt").write_text("")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+
+        assert _walk(tmp_path) == ["real/file.txt"]
+
+
+class TestPathGlob:
+    """Test glob matching during the walk."""
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        for name in ["a.py", "src/b.py", "src/pkg/c.py", "src/pkg/d.txt", ".hidden/e.py"]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text("")
+        return tmp_path
+
+    def _glob(self, root: Path, pattern: str, **kwargs: Any) -> list[str]:
+        return sorted(
+            Path(entry.path).relative_to(root).as_posix()
+            for entry in PathGlob(pattern).walk(str(root), **kwargs)
+        )
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            ("*.py", ["a.py"]),
+            ("**/*.py", ["a.py", "src/b.py", "src/pkg/c.py"]),
+            ("src/**/*.py", ["src/b.py", "src/pkg/c.py"]),
+            ("src/**", ["src/b.py", "src/pkg/c.py", "src/pkg/d.txt"]),
+            ("src/*/*", ["src/pkg/c.py", "src/pkg/d.txt"]),
+            ("**/pkg/*.txt", ["src/pkg/d.txt"]),
+            (".hidden/*.py", [".hidden/e.py"]),
+            ("src", []),
+        ],
+    )
+    def test_matches_like_recursive_glob(
+        self, tree: Path, pattern: str, expected: list[str]
+    ) -> None:
+        assert self._glob(tree, pattern) == expected
+
+    def test_prunes_directories(self, tree: Path) -> None:
+        assert self._glob(tree, "**/*.py", prune={"pkg"}) == ["a.py", "src/b.py"]
@@ -344,6 +344,25 @@ class TestToolExecutorSchemas:
             assert "description" in schema
             assert "input_schema" in schema
 
+    def test_get_all_schemas_cached(self, executor: ToolExecutor) -> None:
+        """Test schemas are reused until the registry changes."""
+        first = executor.get_all_schemas("openai")
+        second = executor.get_all_schemas("openai")
+
+        assert first == second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_get_all_schemas_after_registry_change(
+        self, executor: ToolExecutor, populated_registry: ToolRegistry
+    ) -> None:
+        """Test schemas follow registry changes."""
+        executor.get_all_schemas("openai")
+        populated_registry.deregister("Echo")
+
+        names = [s["function"]["name"] for s in executor.get_all_schemas("openai")]
+        assert "Echo" not in names
+        assert len(names) == 2
+
     def test_get_all_schemas_unknown_format(self, executor: ToolExecutor) -> None:
         """Test that unknown format raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
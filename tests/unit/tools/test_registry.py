@@ -16,7 +16,7 @@ from code_forge.tools.base import (
     ToolParameter,
     ToolResult,
 )
-from code_forge.tools.registry import ToolRegistry
+from code_forge.tools.registry import ToolRegistry, cached_for_tool
 
 
 # =============================================================================
@@ -333,6 +333,81 @@ class TestToolRegistryClear:
         assert registry.list_all() == []
 
 
+# =============================================================================
+# Generation Tests
+# =============================================================================
+
+
+class TestToolRegistryGeneration:
+    """Tests for the registry generation counter and derived-value cache."""
+
+    def test_changes_on_register_and_deregister(self) -> None:
+        """Test registry changes advance the generation."""
+        registry = ToolRegistry()
+        initial = registry.generation
+
+        registry.register(MockTool("Tool1"))
+        registered = registry.generation
+        registry.deregister("Tool1")
+
+        assert initial != registered != registry.generation
+
+    def test_unchanged_by_lookups(self) -> None:
+        """Test reads keep the generation."""
+        registry = ToolRegistry()
+        registry.register(MockTool("Tool1"))
+        generation = registry.generation
+
+        registry.get("Tool1")
+        registry.list_all()
+        registry.deregister("Missing")
+
+        assert registry.generation == generation
+
+    def test_unique_after_reset(self) -> None:
+        """Test a new registry does not reuse an old generation."""
+        old = ToolRegistry().generation
+        ToolRegistry.reset()
+        assert ToolRegistry().generation != old
+
+    def test_current_generation_without_instance(self) -> None:
+        """Test current_generation does not create the singleton."""
+        assert ToolRegistry.current_generation() == 0
+        assert ToolRegistry._instance is None
+
+    def test_cached_for_tool_reuses_value(self) -> None:
+        """Test derived values are built once per generation."""
+        tool = MockTool("Tool1")
+        calls: list[int] = []
+
+        def build() -> dict[str, Any]:
+            calls.append(1)
+            return {"n": len(calls)}
+
+        first = cached_for_tool(tool, "test", build)
+        second = cached_for_tool(tool, "test", build)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_cached_for_tool_rebuilt_on_registry_change(self) -> None:
+        """Test derived values are rebuilt after the registry changes."""
+        registry = ToolRegistry()
+        tool = MockTool("Tool1")
+        first = cached_for_tool(tool, "test", dict)
+
+        registry.register(MockTool("Tool2"))
+
+        assert cached_for_tool(tool, "test", dict) is not first
+
+    def test_schema_memoized(self) -> None:
+        """Test tool schemas are memoized per tool."""
+        tool = MockTool("Tool1")
+        assert tool.to_openai_schema() is tool.to_openai_schema()
+        assert tool.to_anthropic_schema() is tool.to_anthropic_schema()
+        assert tool.to_openai_schema() is not MockTool("Tool1").to_openai_schema()
+
+
 # =============================================================================
 # Thread Safety Tests
 # =============================================================================
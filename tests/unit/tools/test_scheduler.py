@@ -0,0 +1,97 @@
+"""Tests for code_forge.tools.scheduler module."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from code_forge.langchain.tools import LangChainToolAdapter
+from code_forge.tools import BashTool, GrepTool, ReadTool, WebFetchBaseTool, WriteTool
+from code_forge.tools.scheduler import (
+    is_read_only_tool,
+    plan_batches,
+    run_batch,
+    run_scheduled,
+)
+
+
+def read_only(call: str) -> bool:
+    """Calls named Read* only read."""
+    return call.startswith("Read")
+
+
+class TestIsReadOnlyTool:
+    """Tests for is_read_only_tool."""
+
+    def test_builtin_tools(self) -> None:
+        assert is_read_only_tool(ReadTool())
+        assert is_read_only_tool(GrepTool())
+        assert is_read_only_tool(WebFetchBaseTool())
+        assert not is_read_only_tool(WriteTool())
+        assert not is_read_only_tool(BashTool())
+
+    def test_adapter_and_unknown(self) -> None:
+        assert is_read_only_tool(LangChainToolAdapter(forge_tool=ReadTool()))
+        assert not is_read_only_tool(LangChainToolAdapter(forge_tool=WriteTool()))
+        assert not is_read_only_tool(object())
+        assert not is_read_only_tool(None)
+
+
+class TestPlanBatches:
+    """Tests for plan_batches."""
+
+    def test_writes_split_reads(self) -> None:
+        calls = ["Read1", "Read2", "Write1", "Bash1", "Read3", "Read4"]
+        assert plan_batches(calls, read_only) == [
+            ["Read1", "Read2"],
+            ["Write1"],
+            ["Bash1"],
+            ["Read3", "Read4"],
+        ]
+
+    def test_empty(self) -> None:
+        assert plan_batches([], read_only) == []
+
+
+class TestRunScheduled:
+    """Tests for run_batch and run_scheduled."""
+
+    @pytest.mark.asyncio
+    async def test_reads_concurrent_writes_serialized(self) -> None:
+        """Test reads overlap, writes run alone, and results keep call order."""
+        running: set[str] = set()
+        log: list[tuple[str, frozenset[str]]] = []
+
+        async def execute(call: str) -> str:
+            running.add(call)
+            log.append((call, frozenset(running)))
+            # Later reads finish first
+            await asyncio.sleep(0.01 * (5 - int(call[-1])))
+            running.discard(call)
+            return call.lower()
+
+        calls = ["Read1", "Read2", "Read3", "Write4", "Read5"]
+        results = await run_scheduled(calls, execute, read_only)
+
+        assert results == ["read1", "read2", "read3", "write4", "read5"]
+        seen = dict(log)
+        assert seen["Read3"] == {"Read1", "Read2", "Read3"}
+        assert seen["Write4"] == {"Write4"}
+        assert seen["Read5"] == {"Read5"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self) -> None:
+        active = 0
+        peak = 0
+
+        async def execute(call: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return call
+
+        assert await run_batch(list(range(10)), execute, max_concurrency=3) == list(range(10))
+        assert peak == 3